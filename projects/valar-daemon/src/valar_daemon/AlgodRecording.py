@@ -0,0 +1,385 @@
+"""Record-and-replay of the daemon's algod traffic, e.g. for deterministic performance regression tests.
+
+A recording holds the requests and responses of a single algod client (i.e. a single daemon run),
+including the end of each loop, as gzip-compressed JSON lines.
+"""
+import gzip
+import json
+import base64
+import threading
+from pathlib import Path
+from urllib.error import URLError
+
+from algosdk.v2client.algod import api_version_path_prefix
+
+from valar_daemon.Metrics import get_algod_endpoint_label
+from valar_daemon.InstrumentedAlgodClient import InstrumentedAlgodClient
+
+
+RECORDING_VERSION = 1
+RECORDING_FILENAME_PREFIX = 'algod-recording-'
+RECORDING_FILENAME_SUFFIX = '.jsonl.gz'
+RECORDING_FILENAME_PATTERN = RECORDING_FILENAME_PREFIX + '{:03d}' + RECORDING_FILENAME_SUFFIX
+RECORDING_GLOB_PATTERN = RECORDING_FILENAME_PREFIX + '*' + RECORDING_FILENAME_SUFFIX
+
+
+def get_next_recording_path(
+    record_path: str
+) -> Path:
+    """Get the path of the next recording in a directory, so that each daemon run is kept in its own file.
+
+    Notes
+    -----
+    The index follows the highest existing one, so that no recording is overwritten if earlier ones were removed.
+
+    Parameters
+    ----------
+    record_path : str
+        Directory of the recordings.
+
+    Returns
+    -------
+    Path
+        Path of the next recording, e.g. `algod-recording-002.jsonl.gz` if the last recording is `...-001.jsonl.gz`.
+    """
+    record_path = Path(record_path)
+    index_str_list = [
+        path.name[len(RECORDING_FILENAME_PREFIX):-len(RECORDING_FILENAME_SUFFIX)]
+        for path in record_path.glob(RECORDING_GLOB_PATTERN)
+    ]
+    index_list = [int(index_str) for index_str in index_str_list if index_str.isdigit()]
+    return Path(record_path, RECORDING_FILENAME_PATTERN.format(max(index_list, default=-1) + 1))
+
+
+def get_recording_path_list(
+    record_path: str
+) -> list:
+    """Get the paths of the recordings in a directory, in the order of the daemon runs.
+
+    Parameters
+    ----------
+    record_path : str
+        Directory of the recordings.
+
+    Returns
+    -------
+    list
+        Paths of the recordings.
+    """
+    return sorted(Path(record_path).glob(RECORDING_GLOB_PATTERN))
+
+
+class AlgodRecorder(object):
+    """Writer of the algod requests and responses of a single daemon run.
+
+    Notes
+    -----
+    Each exchange is a JSON line with the method (`m`), path incl. query (`p`), base64 request body (`d`),
+    status code (`s`, 0 for a connection error), and response body (`r` as text or `rb` as base64),
+    where the body of a connection error holds its `errno` and `strerror`.
+    The headers (e.g. the algod token) are not recorded.
+    The file is flushed at the end of each loop, so that a recording remains readable if the daemon is killed.
+
+    Attributes
+    ----------
+    recording_path : Path
+        Path to the recording.
+    num_of_exchanges : int
+        Number of recorded exchanges.
+    num_of_loops : int
+        Number of recorded loops.
+    """
+
+    def __init__(
+        self,
+        recording_path: Path
+    ):
+        """Create the recording.
+
+        Parameters
+        ----------
+        recording_path : Path
+            Path to the recording.
+
+        Raises
+        ------
+        FileExistsError
+            The recording already exists, e.g. written by another daemon run.
+        """
+        self.recording_path = Path(recording_path)
+        self.recording_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.file = gzip.open(self.recording_path, 'xt', encoding='utf-8') # Raises if the recording exists
+        self.num_of_exchanges = 0
+        self.num_of_loops = 0
+        self._write({'version': RECORDING_VERSION})
+
+    def _write(
+        self,
+        entry: dict
+    ) -> None:
+        self.file.write(json.dumps(entry, separators=(',', ':')) + '\n')
+
+    def record_exchange(
+        self,
+        method: str,
+        path: str,
+        data: bytes,
+        status: int,
+        body: bytes
+    ) -> None:
+        """Record a request and its response.
+
+        Parameters
+        ----------
+        method : str
+            Request method.
+        path : str
+            Request path, including the API version and query.
+        data : bytes
+            Request body.
+        status : int
+            Response status code (0 for a connection error).
+        body : bytes
+            Response body (the JSON-encoded `errno` and `strerror` for a connection error).
+        """
+        entry = {'m': method, 'p': path, 's': status}
+        if data is not None:
+            entry['d'] = base64.b64encode(data).decode('utf-8')
+        try:
+            entry['r'] = body.decode('utf-8')
+        except UnicodeDecodeError:
+            entry['rb'] = base64.b64encode(body).decode('utf-8')
+        with self.lock:
+            if self.file is None:
+                return
+            self._write(entry)
+            self.num_of_exchanges += 1
+
+    def record_loop_end(self) -> None:
+        """Record the end of a loop.
+        """
+        with self.lock:
+            if self.file is None:
+                return
+            self._write({'loop': self.num_of_loops})
+            self.num_of_loops += 1
+            self.file.flush()
+
+    def close(self) -> None:
+        """Close the recording.
+        """
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+
+class AlgodRecording(object):
+    """Recorded algod exchanges of a single daemon run, served for replay.
+
+    Notes
+    -----
+    Requests are matched per method and path (incl. query) in the recorded order.
+    A request body (e.g. a signed transaction) is preferably matched exactly, falling back to the next recorded one.
+    Once all responses of a path are served, the last one is repeated.
+
+    Attributes
+    ----------
+    recording_path : Path
+        Path to the recording.
+    num_of_loops : int
+        Number of recorded loops.
+    num_of_exchanges : int
+        Number of recorded exchanges.
+    num_of_misses : int
+        Number of requests whose path was not recorded.
+    num_of_repeats : int
+        Number of requests served with an already served response.
+    request_count_dict : dict
+        Number of served requests, indexed by endpoint label (e.g. `GET /accounts/{address}`).
+    """
+
+    def __init__(
+        self,
+        recording_path: str
+    ):
+        """Load a recording.
+
+        Parameters
+        ----------
+        recording_path : str
+            Path to the recording.
+        """
+        self.recording_path = Path(recording_path)
+        self.lock = threading.Lock()
+        self.exchange_list_dict = dict()
+        self.cursor_dict = dict()
+        self.num_of_loops = 0
+        self.num_of_exchanges = 0
+        self.num_of_misses = 0
+        self.num_of_repeats = 0
+        self.request_count_dict = dict()
+        with gzip.open(self.recording_path, 'rt', encoding='utf-8') as f:
+            try:
+                for line in f:
+                    entry = json.loads(line)
+                    if 'loop' in entry:
+                        self.num_of_loops += 1
+                    elif 'm' in entry:
+                        self.exchange_list_dict.setdefault((entry['m'], entry['p']), []).append(entry)
+                        self.num_of_exchanges += 1
+            except (EOFError, json.JSONDecodeError): # Recording of a killed daemon, cut after the last flush
+                pass
+
+    def get_response(
+        self,
+        method: str,
+        path: str,
+        data: bytes
+    ) -> tuple:
+        """Get the recorded response to a request.
+
+        Parameters
+        ----------
+        method : str
+            Request method.
+        path : str
+            Request path, including the API version and query.
+        data : bytes
+            Request body.
+
+        Returns
+        -------
+        tuple
+            Response status code and body (the JSON-encoded `errno` and `strerror` for a connection error).
+
+        Raises
+        ------
+        KeyError
+            The path was not recorded.
+        """
+        key = (method, path)
+        with self.lock:
+            label = get_algod_endpoint_label(method, path.removeprefix(api_version_path_prefix))
+            self.request_count_dict[label] = self.request_count_dict.get(label, 0) + 1
+            exchange_list = self.exchange_list_dict.get(key, None)
+            if exchange_list is None:
+                self.num_of_misses += 1
+                raise KeyError(f'{method} {path} is not in the recording')
+            cursor = self.cursor_dict.get(key, 0)
+            if cursor >= len(exchange_list):
+                self.num_of_repeats += 1
+                exchange = exchange_list[-1]
+            else:
+                encoded_data = None if data is None else base64.b64encode(data).decode('utf-8')
+                idx = next(
+                    (i for i in range(cursor, len(exchange_list)) if exchange_list[i].get('d', None) == encoded_data),
+                    cursor
+                )
+                exchange = exchange_list.pop(idx)
+                exchange_list.insert(cursor, exchange) # Keep the served exchanges before the cursor
+                self.cursor_dict[key] = cursor + 1
+        if 'rb' in exchange:
+            return exchange['s'], base64.b64decode(exchange['rb'])
+        return exchange['s'], exchange['r'].encode('utf-8')
+
+
+class RecordingAlgodClient(InstrumentedAlgodClient):
+    """Instrumented algod client that additionally records its requests and responses.
+
+    Notes
+    -----
+    The end of a loop is recorded whenever the request statistics are popped, which the daemon does once per loop.
+    """
+
+    def __init__(
+        self,
+        recorder: AlgodRecorder,
+        *args,
+        **kwargs
+    ):
+        """Initialize the recording algod client.
+
+        Parameters
+        ----------
+        recorder : AlgodRecorder
+            Recording writer.
+        *args, **kwargs
+            Arguments of `InstrumentedAlgodClient`.
+        """
+        super().__init__(*args, **kwargs)
+        self.recorder = recorder
+
+    def _transport(
+        self,
+        method: str,
+        requrl: str,
+        data: bytes,
+        header: dict,
+        timeout: float
+    ) -> tuple:
+        try:
+            status, body = super()._transport(method, requrl, data, header, timeout)
+        except URLError as e:
+            reason = {
+                'errno': getattr(e.reason, 'errno', None),
+                'strerror': getattr(e.reason, 'strerror', None) or str(e.reason)
+            }
+            self.recorder.record_exchange(method, requrl, data, 0, json.dumps(reason).encode('utf-8'))
+            raise e
+        self.recorder.record_exchange(method, requrl, data, status, body)
+        return status, body
+
+    def pop_endpoint_stats(self) -> dict:
+        self.recorder.record_loop_end()
+        return super().pop_endpoint_stats()
+
+    def close(self) -> None:
+        super().close()
+        self.recorder.close()
+
+
+class ReplayAlgodClient(InstrumentedAlgodClient):
+    """Instrumented algod client that serves a recording instead of reaching algod.
+
+    Notes
+    -----
+    Recorded connection errors and requests that are not in the recording are raised as `URLError`,
+    i.e. as if algod could not be reached.
+    """
+
+    def __init__(
+        self,
+        recording: AlgodRecording,
+        *args,
+        **kwargs
+    ):
+        """Initialize the replay algod client.
+
+        Parameters
+        ----------
+        recording : AlgodRecording
+            Recording to serve.
+        *args, **kwargs
+            Arguments of `InstrumentedAlgodClient`.
+        """
+        super().__init__(*args, **kwargs)
+        self.recording = recording
+
+    def _transport(
+        self,
+        method: str,
+        requrl: str,
+        data: bytes,
+        header: dict,
+        timeout: float
+    ) -> tuple:
+        try:
+            status, body = self.recording.get_response(method, requrl, data)
+        except KeyError as e:
+            raise URLError(OSError(None, str(e)))
+        if status == 0: # Recorded connection error
+            reason = json.loads(body)
+            raise URLError(OSError(reason['errno'], reason['strerror']))
+        return status, body
@@ -1,40 +1,351 @@
 """App wrapper definitions for caching the state of contracts and keeping reference to the corresponding clients.
 """
 import logging
-from typing import List, Tuple
+import threading
+from typing import List, Tuple, TYPE_CHECKING
 from urllib.error import URLError
 
 from algosdk.encoding import encode_address
+from algosdk.logic import get_application_address
 from algokit_utils.beta.algorand_client import AlgorandClient
 from algosdk.error import AlgodHTTPError
 
 from valar_daemon.Logger import Logger
-from valar_daemon.ValidatorAdClient import (
-    ValidatorAdClient,
-    GlobalState as ValidatorAdGlobalState
-)
-from valar_daemon.DelegatorContractClient import (
-    DelegatorContractClient,
-    GlobalState as DelegatorContractGlobalState
-)
-from valar_daemon.NoticeboardClient import NoticeboardClient
+from valar_daemon.GeneratedClients import valad_module, delco_module, notbd_module
 from valar_daemon.utils import (
     get_delco_fee_and_gating_asa_id,
+    decode_delegation_terms_balance,
     decode_delegation_terms_general,
-    decode_uint64_list
+    decode_noticeboard_terms_timing,
+    decode_uint64_list,
+    calc_fee_operational,
+    get_asset_holding,
+    is_delben_eligible
 )
 from valar_daemon.constants import (
     VALAD_STATE_DELETED_MASK,
-    DELCO_STATE_DELETED_MASK
+    DELCO_STATE_DELETED_MASK,
+    ALGO_ASA_ID
 )
 
+if TYPE_CHECKING:
+    from valar_daemon.ValidatorAdClient import GlobalState as ValidatorAdGlobalState
+    from valar_daemon.DelegatorContractClient import GlobalState as DelegatorContractGlobalState
+
+
+class AppStateCache(object):
+    """ID-keyed cache of app clients and their global state, shared between the app wrappers.
+
+    Notes
+    -----
+    The clients are kept until the app is forgotten, while the global state is fetched at most once per loop.
+    Many delegator contracts share the same noticeboard and validator ad, whose state is thus fetched only once.
+    The global state is fetched outside of the lock, so that workers fetching different apps do not wait on each
+    other, while workers requesting an app that is already being fetched wait for that fetch.
+
+    Attributes
+    ----------
+    algorand_client : AlgorandClient
+        Algorand client.
+    client_dict : dict
+        App clients, keyed by app ID.
+    global_state_dict : dict
+        Global state of the apps, keyed by app ID, fetched since the last reset.
+    fetch_event_dict : dict
+        Events of the global state fetches in progress, keyed by app ID, set once the fetch ends.
+    num_of_algod_calls : int
+        Number of global state calls to algod since the last reset.
+    num_of_requests : int
+        Number of requests for global state since the last reset.
+    """
+
+    def __init__(
+        self,
+        algorand_client: AlgorandClient
+    ):
+        """Initialize the app state cache.
+
+        Parameters
+        ----------
+        algorand_client : AlgorandClient
+            Algorand client.
+        """
+        self.algorand_client = algorand_client
+        self.lock = threading.Lock()
+        self.client_dict = dict()
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard the cached global state, e.g. at the start of a new loop.
+        """
+        with self.lock:
+            self.global_state_dict = dict()
+            self.fetch_event_dict = dict() # Fetches in progress are not cached once done
+            self.num_of_algod_calls = 0
+            self.num_of_requests = 0
+
+    def get_client(
+        self,
+        AppClientClass: type,
+        app_id: int
+    ) -> object:
+        """Get the client of an app, creating it only if not yet cached.
+
+        Parameters
+        ----------
+        AppClientClass : type
+            Generated client class, e.g. `ValidatorAdClient`.
+        app_id : int
+            App ID.
+
+        Returns
+        -------
+        object
+            App client.
+        """
+        with self.lock:
+            app_client = self.client_dict.get(app_id, None)
+            if not isinstance(app_client, AppClientClass):
+                app_client = AppClientClass(
+                    self.algorand_client.client.algod,
+                    app_id=app_id
+                )
+                self.client_dict[app_id] = app_client
+            return app_client
+
+    def get_global_state(
+        self,
+        app_client: object
+    ) -> object:
+        """Get the global state of an app, fetching it only if not yet fetched since the last reset.
+
+        Notes
+        -----
+        Errors (e.g. the app does not exist) are not cached and propagate to the caller.
+        Callers waiting on a failed fetch then fetch the state themselves.
+
+        Parameters
+        ----------
+        app_client : object
+            App client.
+
+        Returns
+        -------
+        object
+            The app's global state.
+        """
+        app_id = app_client.app_id
+        with self.lock:
+            self.num_of_requests += 1
+        while True: # Wait for a fetch in progress or become the fetcher
+            with self.lock:
+                if app_id in self.global_state_dict:
+                    return self.global_state_dict[app_id]
+                fetch_event = self.fetch_event_dict.get(app_id, None)
+                if fetch_event is None:
+                    fetch_event = threading.Event()
+                    self.fetch_event_dict[app_id] = fetch_event
+                    self.num_of_algod_calls += 1
+                    break
+            fetch_event.wait()
+        try:
+            global_state = app_client.get_global_state()
+            with self.lock:
+                if self.fetch_event_dict.get(app_id, None) is fetch_event: # Not reset or forgotten in the meantime
+                    self.global_state_dict[app_id] = global_state
+        finally:
+            with self.lock:
+                if self.fetch_event_dict.get(app_id, None) is fetch_event:
+                    del self.fetch_event_dict[app_id]
+            fetch_event.set()
+        return global_state
+
+    def has_global_state(
+        self,
+        app_id: int
+    ) -> bool:
+        """Check whether the global state of an app was fetched since the last reset.
+
+        Parameters
+        ----------
+        app_id : int
+            App ID.
+
+        Returns
+        -------
+        bool
+        """
+        with self.lock:
+            return app_id in self.global_state_dict
+
+    def set_global_state(
+        self,
+        app_id: int,
+        global_state: object
+    ) -> None:
+        """Set the global state of an app that was fetched outside the cache, e.g. concurrently ahead of its use.
+
+        Parameters
+        ----------
+        app_id : int
+            App ID.
+        global_state : object
+            The app's global state.
+        """
+        with self.lock:
+            self.num_of_algod_calls += 1
+            self.global_state_dict[app_id] = global_state
+
+    def forget_app(
+        self,
+        app_id: int
+    ) -> None:
+        """Drop the client and global state of an app, e.g. when it is no longer tracked.
+
+        Parameters
+        ----------
+        app_id : int
+            App ID.
+        """
+        with self.lock:
+            self.client_dict.pop(app_id, None)
+            self.global_state_dict.pop(app_id, None)
+            self.fetch_event_dict.pop(app_id, None)
+
+    def get_num_of_saved_calls(self) -> int:
+        """Get the number of algod calls that were saved by reusing the cached global state.
+
+        Returns
+        -------
+        int
+            Number of saved algod calls.
+        """
+        return max(0, self.num_of_requests - self.num_of_algod_calls)
+
 
 class AppWrapper(object):
     """Smart contract (app) wrapper."""
 
+    app_client_module = None # Generated client module of the wrapped app, imported on first use
+    app_client_class_name = None # Name of the generated client class of the wrapped app
+    app_client_name = None # Name of the attribute holding the client of the wrapped app
+    static_field_name_list = () # Attributes that do not change during the app's lifetime
+
     def __init__(self):
         pass
 
+    def get_static_fields(self) -> dict:
+        """Get the fields that do not change during the app's lifetime, e.g. for persisting them.
+
+        Returns
+        -------
+        dict
+            Static fields, including the noticeboard ID, indexed by their name.
+        """
+        static_fields = {name: getattr(self, name) for name in self.static_field_name_list}
+        static_fields['notbd_id'] = self.notbd_client.app_id
+        return static_fields
+
+    @classmethod
+    def from_static_fields(
+        cls,
+        algorand_client: AlgorandClient,
+        app_id: int,
+        static_fields: dict,
+        app_state_cache: AppStateCache=None
+    ) -> 'AppWrapper':
+        """Restore an app wrapper from its static fields, skipping the reads and decoding of the referenced apps.
+
+        Notes
+        -----
+        Only the app's own state is fetched, which also confirms that the app still exists.
+
+        Parameters
+        ----------
+        algorand_client : AlgorandClient
+            Algorand client.
+        app_id : int
+            App ID.
+        static_fields : dict
+            Static fields, as returned by `get_static_fields`.
+        app_state_cache : AppStateCache, optional
+            Shared app state cache, by default None.
+
+        Returns
+        -------
+        AppWrapper
+            The restored app wrapper.
+        """
+        app_wrapper = cls.__new__(cls)
+        app_wrapper.app_id = app_id
+        app_wrapper.app_state_cache = app_state_cache
+        setattr(
+            app_wrapper,
+            cls.app_client_name,
+            AppWrapper.get_app_client(
+                algorand_client, getattr(cls.app_client_module, cls.app_client_class_name), app_id, app_state_cache
+            )
+        )
+        app_wrapper.notbd_client = AppWrapper.get_app_client(
+            algorand_client, notbd_module.NoticeboardClient, static_fields['notbd_id'], app_state_cache
+        )
+        for name in cls.static_field_name_list:
+            setattr(app_wrapper, name, static_fields[name])
+        app_wrapper.update_dynamic(propagate_deleted_error=True)
+        return app_wrapper
+
+    @staticmethod
+    def get_app_client(
+        algorand_client: AlgorandClient,
+        AppClientClass: type,
+        app_id: int,
+        app_state_cache: AppStateCache=None
+    ) -> object:
+        """Get an app client, reusing the cached one if a cache is provided.
+
+        Parameters
+        ----------
+        algorand_client : AlgorandClient
+            Algorand client.
+        AppClientClass : type
+            Generated client class, e.g. `ValidatorAdClient`.
+        app_id : int
+            App ID.
+        app_state_cache : AppStateCache, optional
+            Shared app state cache, by default None.
+
+        Returns
+        -------
+        object
+            App client.
+        """
+        if app_state_cache is None:
+            return AppClientClass(algorand_client.client.algod, app_id=app_id)
+        return app_state_cache.get_client(AppClientClass, app_id)
+
+    @staticmethod
+    def get_app_global_state(
+        app_client: object,
+        app_state_cache: AppStateCache=None
+    ) -> object:
+        """Get an app's global state, reusing the state fetched in this loop if a cache is provided.
+
+        Parameters
+        ----------
+        app_client : object
+            App client.
+        app_state_cache : AppStateCache, optional
+            Shared app state cache, by default None.
+
+        Returns
+        -------
+        object
+            The app's global state.
+        """
+        if app_state_cache is None:
+            return app_client.get_global_state()
+        return app_state_cache.get_global_state(app_client)
+
 
 class ValadAppWrapper(AppWrapper):
     """Validator Ad wrapper.
@@ -51,15 +362,24 @@ class ValadAppWrapper(AppWrapper):
         Noticeboard client.
     valown_address: str
         Address of the validator owner.
+    app_state_cache: AppStateCache
+        Shared app state cache, None if the state is always fetched.
     delco_id_list: list
         [dynamic] List of the IDs of connected delegator contracts.
     state: bytes
         [dynamic] State of the validator ad.
     """
+
+    app_client_module = valad_module
+    app_client_class_name = 'ValidatorAdClient'
+    app_client_name = 'valad_client'
+    static_field_name_list = ('valown_address',)
+
     def __init__(
         self,
         algorand_client: AlgorandClient,
-        app_id: int
+        app_id: int,
+        app_state_cache: AppStateCache=None
     ):
         """Validator Ad wrapper, used for storing the client and relevant parameters for the daemon's operation.
 
@@ -69,19 +389,21 @@ class ValadAppWrapper(AppWrapper):
             Algorand client.
         app_id : int
             Validator Ad ID.
+        app_state_cache : AppStateCache, optional
+            Shared app state cache, by default None.
         """
         self.app_id = app_id
-        self.valad_client = ValidatorAdClient(
-            algorand_client.client.algod,
-            app_id=app_id
+        self.app_state_cache = app_state_cache
+        self.valad_client = AppWrapper.get_app_client(
+            algorand_client, valad_module.ValidatorAdClient, app_id, app_state_cache
         )
         # Fetch global state and populate corresponding attributes
         valad_global_state = self.update_dynamic(propagate_deleted_error=True)
-        self.notbd_client = NoticeboardClient(
-            algorand_client.client.algod,
-            app_id=valad_global_state.noticeboard_app_id
+        self.notbd_client = AppWrapper.get_app_client(
+            algorand_client, notbd_module.NoticeboardClient, valad_global_state.noticeboard_app_id, app_state_cache
         )
-        self.notbd_client.get_global_state() # Try to see if it can be connected to (error caught in upper layers)
+        # Try to see if it can be connected to (error caught in upper layers)
+        AppWrapper.get_app_global_state(self.notbd_client, app_state_cache)
         self.valown_address = encode_address(valad_global_state.val_owner.as_bytes)
 
     def update_dynamic(
@@ -110,7 +432,7 @@ class ValadAppWrapper(AppWrapper):
             Given error type.
         """
         try:
-            valad_global_state = self.valad_client.get_global_state()
+            valad_global_state = AppWrapper.get_app_global_state(self.valad_client, self.app_state_cache)
         except AlgodHTTPError as e:
             # Update to show the thing was deleted
             if not propagate_deleted_error and e.code == 404 and e.args[0] == 'application does not exist':
@@ -126,7 +448,7 @@ class ValadAppWrapper(AppWrapper):
 
     @staticmethod
     def get_delco_id_list(
-        valad_global_state: ValidatorAdGlobalState
+        valad_global_state: 'ValidatorAdGlobalState'
     ):
         """Get list of IDs of delcos that are associated with the valad (between, including, ready and live state).
 
@@ -172,40 +494,99 @@ class DelcoAppWrapper(AppWrapper):
         Staking start (partkey validity).
     round_end: int
         Staking end (partkey validity).
+    round_setup_end: int
+        Last round for submitting the partkeys (before they can be reported as not submitted).
+    app_address: str
+        Address of the delegator contract (holder of the fee asset).
+    fee_round: int
+        Operational fee per round in milli base units of the fee asset.
+    fee_round_partner: int
+        Partner's operational fee per round in milli base units of the fee asset.
+    stake_max: int
+        Maximal ALGO balance of the delegator beneficiary.
+    rounds_breach: int
+        Minimal number of rounds between two reported limit breaches.
+    gating_asa_min_list: List[Tuple(int, int)]
+        Gating asset IDs and their minimal balances.
     valown_address: int
         Validator owner address.
     partner_address: int
         Address of the partner that forwarded the delegator.
+    app_state_cache: AppStateCache
+        Shared app state cache, None if the state is always fetched.
     round_ended: int
         [dynamic] Round at which the contract ended.
+    round_breach_last: int
+        [dynamic] Round of the last reported limit breach.
+    round_claim_last: int
+        [dynamic] Round of the last operational fee claim.
+    round_expiry_soon_last: int
+        [dynamic] Round of the last expiry soon report.
+    before_expiry: int
+        [dynamic] Number of rounds before the end when the expiry soon report can be made (noticeboard terms).
+    report_period: int
+        [dynamic] Minimal number of rounds between two expiry soon reports (noticeboard terms).
     state: bytes
         [dynamic] State of the validator ad.
     """
+
+    app_client_module = delco_module
+    app_client_class_name = 'DelegatorContractClient'
+    app_client_name = 'delco_client'
+    static_field_name_list = (
+        'valad_id',
+        'delman_address',
+        'delben_address',
+        'fee_asa_id',
+        'gating_asa_id_list',
+        'round_start',
+        'round_end',
+        'round_setup_end',
+        'app_address',
+        'fee_round',
+        'fee_round_partner',
+        'stake_max',
+        'rounds_breach',
+        'gating_asa_min_list',
+        'valown_address',
+        'partner_address'
+    ) # The noticeboard terms (`before_expiry` and `report_period`) can change and are thus fetched on restore
+
     def __init__(
         self,
         algorand_client,
-        app_id: int
+        app_id: int,
+        app_state_cache: AppStateCache=None
     ):
         """Delegator Contract wrapper, used for storing the client and relevant parameters for the daemon's operation.
 
+        Notes
+        -----
+        With a shared app state cache, the noticeboard and validator ad state is fetched once per loop,
+        regardless of the number of delegator contracts that reference them.
+
         Parameters
         ----------
         algorand_client : AlgorandClient
             Algorand client.
         app_id : int
             Delegator Contract ID.
+        app_state_cache : AppStateCache, optional
+            Shared app state cache, by default None.
         """
         self.app_id = app_id
-        self.delco_client = DelegatorContractClient(
-            algorand_client.client.algod,
-            app_id=app_id
+        self.app_state_cache = app_state_cache
+        self.delco_client = AppWrapper.get_app_client(
+            algorand_client, delco_module.DelegatorContractClient, app_id, app_state_cache
         )
         delco_global_state = self.update_dynamic(propagate_deleted_error=True)
-        self.notbd_client = NoticeboardClient(
-            algorand_client.client.algod,
-            app_id=delco_global_state.noticeboard_app_id
+        self.notbd_client = AppWrapper.get_app_client(
+            algorand_client, notbd_module.NoticeboardClient, delco_global_state.noticeboard_app_id, app_state_cache
+        )
+        # Try to see if it can be connected to (error caught in upper layers)
+        self.update_noticeboard_terms(
+            AppWrapper.get_app_global_state(self.notbd_client, app_state_cache)
         )
-        self.notbd_client.get_global_state() # Try to see if it can be connected to (error caught in upper layers)
         self.valad_id = delco_global_state.validator_ad_app_id
         self.delman_address = encode_address(delco_global_state.del_manager.as_bytes)
         self.delben_address = encode_address(delco_global_state.del_beneficiary.as_bytes)
@@ -214,15 +595,61 @@ class DelcoAppWrapper(AppWrapper):
         self.round_end = delco_global_state.round_end
         # self.round_end = delco_global_state.round_end + 320 # Account for initial 320 round delay
         # self.round_key_delete = self.round_end # Default value - contract end and key deletion can be earlier
-        valad_client = ValidatorAdClient(
-                algorand_client.client.algod,
-                app_id=delco_global_state.validator_ad_app_id
-            )
-        valad_global_state = valad_client.get_global_state()
+        valad_client = AppWrapper.get_app_client(
+            algorand_client, valad_module.ValidatorAdClient, delco_global_state.validator_ad_app_id, app_state_cache
+        )
+        valad_global_state = AppWrapper.get_app_global_state(valad_client, app_state_cache)
         self.valown_address = encode_address(valad_global_state.val_owner.as_bytes)
-        self.partner_address = decode_delegation_terms_general(
+        delegation_terms_general = decode_delegation_terms_general(
             delco_global_state.delegation_terms_general.as_bytes
-        ).partner_address
+        )
+        self.partner_address = delegation_terms_general.partner_address
+        self.round_setup_end = self.round_start + delegation_terms_general.rounds_setup
+        # Terms for predicting whether the live reports could succeed
+        self.app_address = get_application_address(app_id)
+        self.fee_round = delegation_terms_general.fee_round
+        self.fee_round_partner = delegation_terms_general.fee_round_partner
+        delegation_terms_balance = decode_delegation_terms_balance(
+            delco_global_state.delegation_terms_balance.as_bytes
+        )
+        self.stake_max = delegation_terms_balance.stake_max
+        self.rounds_breach = delegation_terms_balance.rounds_breach
+        self.gating_asa_min_list = delegation_terms_balance.gating_asa_list
+
+    @classmethod
+    def from_static_fields(
+        cls,
+        algorand_client: AlgorandClient,
+        app_id: int,
+        static_fields: dict,
+        app_state_cache: AppStateCache=None
+    ) -> 'DelcoAppWrapper':
+        """Restore a delegator contract wrapper from its static fields.
+
+        Parameters
+        ----------
+        algorand_client : AlgorandClient
+            Algorand client.
+        app_id : int
+            Delegator Contract ID.
+        static_fields : dict
+            Static fields, as returned by `get_static_fields`.
+        app_state_cache : AppStateCache, optional
+            Shared app state cache, by default None.
+
+        Returns
+        -------
+        DelcoAppWrapper
+            The restored delegator contract wrapper.
+        """
+        app_wrapper = super().from_static_fields(algorand_client, app_id, static_fields, app_state_cache)
+        # Fetch the noticeboard terms, which are dynamic (reused from the cache if already fetched in this loop)
+        app_wrapper.update_noticeboard_terms(
+            AppWrapper.get_app_global_state(app_wrapper.notbd_client, app_state_cache)
+        )
+        # Restore the pairs of gating asset IDs and minimal balances, which may have been stored as lists
+        app_wrapper.gating_asa_min_list = [tuple(item) for item in app_wrapper.gating_asa_min_list]
+        return app_wrapper
 
     def get_partkey_params(self) -> dict:
         """Get the basic participation key parameters for identifying a specific key.
@@ -241,7 +668,7 @@ class DelcoAppWrapper(AppWrapper):
     def update_dynamic(
             self,
             propagate_deleted_error: bool=True
-        ) -> DelegatorContractGlobalState:
+        ) -> 'DelegatorContractGlobalState':
         """Update the dynamic parts of the delco app.
 
         Notes
@@ -264,7 +691,7 @@ class DelcoAppWrapper(AppWrapper):
             Given error type.
         """
         try:
-            delco_global_state = self.delco_client.get_global_state()
+            delco_global_state = AppWrapper.get_app_global_state(self.delco_client, self.app_state_cache)
         except AlgodHTTPError as e:
             # Update to show the thing was deleted
             if not propagate_deleted_error and e.code == 404 and e.args[0] == 'application does not exist':
@@ -276,8 +703,155 @@ class DelcoAppWrapper(AppWrapper):
             raise e
         self.state = delco_global_state.state.as_bytes
         self.round_ended = delco_global_state.round_ended
+        self.round_breach_last = delco_global_state.round_breach_last
+        self.round_claim_last = delco_global_state.round_claim_last
+        self.round_expiry_soon_last = delco_global_state.round_expiry_soon_last
+        # Noticeboard terms are only refreshed when shared, i.e. fetched at most once per loop
+        if self.app_state_cache is not None and hasattr(self, 'notbd_client'):
+            self.update_noticeboard_terms(
+                AppWrapper.get_app_global_state(self.notbd_client, self.app_state_cache)
+            )
         return delco_global_state
 
+    def update_noticeboard_terms(
+        self,
+        notbd_global_state: object
+    ) -> None:
+        """Update the noticeboard terms relevant for the expiry soon report.
+
+        Parameters
+        ----------
+        notbd_global_state : object
+            The noticeboard's global state.
+        """
+        noticeboard_terms_timing = decode_noticeboard_terms_timing(
+            notbd_global_state.noticeboard_terms_timing.as_bytes
+        )
+        self.before_expiry = noticeboard_terms_timing.before_expiry
+        self.report_period = noticeboard_terms_timing.report_period
+
+    def can_report_expired(
+        self,
+        current_round: int
+    ) -> bool:
+        """Predict whether the contract expired report could succeed.
+
+        Parameters
+        ----------
+        current_round : int
+            Round in which the report would be evaluated.
+
+        Returns
+        -------
+        bool
+        """
+        return self.round_end <= current_round
+
+    def can_report_partkeys_not_submitted(
+        self,
+        current_round: int
+    ) -> bool:
+        """Predict whether the partkeys not submitted report could succeed.
+
+        Parameters
+        ----------
+        current_round : int
+            Round in which the report would be evaluated.
+
+        Returns
+        -------
+        bool
+        """
+        return current_round > self.round_setup_end
+
+    def can_report_expiry_soon(
+        self,
+        current_round: int
+    ) -> bool:
+        """Predict whether the expiry soon report could succeed.
+
+        Parameters
+        ----------
+        current_round : int
+            Round in which the report would be evaluated.
+
+        Returns
+        -------
+        bool
+        """
+        return (
+            current_round + self.before_expiry >= self.round_end and
+            self.round_end > current_round and
+            current_round >= self.round_expiry_soon_last + self.report_period
+        )
+
+    def can_report_breach_limits(
+        self,
+        algorand_client: AlgorandClient,
+        current_round: int
+    ) -> bool:
+        """Predict whether the limit breach report could succeed.
+
+        Notes
+        -----
+        The delegator beneficiary's balances are only fetched if the round-based conditions hold.
+
+        Parameters
+        ----------
+        algorand_client : AlgorandClient
+            Algorand client.
+        current_round : int
+            Round in which the report would be evaluated.
+
+        Returns
+        -------
+        bool
+        """
+        if self.round_end <= current_round:
+            return False
+        if self.round_breach_last + self.rounds_breach >= current_round:
+            return False
+        return not is_delben_eligible(
+            algorand_client,
+            self.delben_address,
+            self.stake_max,
+            self.gating_asa_min_list
+        )
+
+    def can_report_breach_pay(
+        self,
+        algorand_client: AlgorandClient,
+        current_round: int
+    ) -> bool:
+        """Predict whether the payment breach report could succeed.
+
+        Notes
+        -----
+        Only applicable to ASA fees, since ALGO payments can not be frozen or clawed back.
+
+        Parameters
+        ----------
+        algorand_client : AlgorandClient
+            Algorand client.
+        current_round : int
+            Round in which the report would be evaluated.
+
+        Returns
+        -------
+        bool
+        """
+        if self.fee_asa_id == ALGO_ASA_ID:
+            return False
+        balance, is_frozen = get_asset_holding(algorand_client, self.app_address, self.fee_asa_id)
+        if is_frozen:
+            return True
+        round_fee_end = min(current_round, self.round_end)
+        amount = (
+            calc_fee_operational(self.fee_round, round_fee_end, self.round_claim_last) +
+            calc_fee_operational(self.fee_round_partner, round_fee_end, self.round_claim_last)
+        )
+        return balance < amount
+
 
 class AppWrapperList(object):
     """List of app wrappers.
@@ -290,12 +864,17 @@ class AppWrapperList(object):
         Logger.
     AppWrapperClass: AppWrapper
         Either `ValadAppWrapper` or `DelcoAppWrapper`.
+    app_state_cache: AppStateCache
+        Shared app state cache, None if the state is always fetched.
+    static_fields_dict: dict
+        Static fields of apps that are restored instead of constructed when added, indexed by app ID.
     """
     def __init__(
         self,
         algorand_client: AlgorandClient,
         logger: Logger,
-        AppWrapperClass: AppWrapper
+        AppWrapperClass: AppWrapper,
+        app_state_cache: AppStateCache=None
     ):
         """List of app wrappers.
 
@@ -305,11 +884,15 @@ class AppWrapperList(object):
             Algorand client.
         AppWrapperClass : AppWrapper
             Either `ValadAppWrapper` or `DelcoAppWrapper`.
+        app_state_cache : AppStateCache, optional
+            Shared app state cache, by default None.
         """
         self.algorand_client = algorand_client
         self.logger = logger
         self.AppWrapperClass = AppWrapperClass
+        self.app_state_cache = app_state_cache
         self.app_list = []
+        self.static_fields_dict = dict()
 
     def get_app_list(
         self
@@ -333,12 +916,41 @@ class AppWrapperList(object):
         """
         return [app.app_id for app in self.app_list]
 
+    def get_static_fields_dict(
+        self
+    ) -> dict:
+        """Get the static fields of the apps in the list.
+
+        Returns
+        -------
+        dict
+            Static fields of each app, indexed by app ID.
+        """
+        return {app.app_id: app.get_static_fields() for app in self.app_list}
+
+    def restore_static_fields(
+        self,
+        static_fields_dict: dict
+    ) -> None:
+        """Provide the static fields of apps, which are then restored instead of constructed when added.
+
+        Parameters
+        ----------
+        static_fields_dict : dict
+            Static fields of each app, indexed by app ID.
+        """
+        self.static_fields_dict.update(static_fields_dict)
+
     def add_single_app(
         self,
         app_id: int
     ):
         """Add an app to the list.
 
+        Notes
+        -----
+        Apps with provided static fields are restored from them once; if that fails, they are constructed next time.
+
         Parameters
         ----------
         app_id : int
@@ -350,9 +962,15 @@ class AppWrapperList(object):
             Number of added apps (0 or 1).
         """
         app_wrapper = None
+        static_fields = self.static_fields_dict.pop(app_id, None)
         # Try to connect the client and get state; log error if not successful
         try:
-            app_wrapper = self.AppWrapperClass(self.algorand_client, app_id)
+            if static_fields is not None:
+                app_wrapper = self.AppWrapperClass.from_static_fields(
+                    self.algorand_client, app_id, static_fields, self.app_state_cache
+                )
+            else:
+                app_wrapper = self.AppWrapperClass(self.algorand_client, app_id, self.app_state_cache)
         except URLError as e:
             # self.logger.critical(f'For app ID {app_id}, URLError {e.args[0].errno}: {e.args[0].strerror}.')
             self.logger.log_app_create_urlerror(
@@ -391,6 +1009,8 @@ class AppWrapperList(object):
         for i, app in enumerate(self.app_list):
             if app.app_id == app_id:
                 self.app_list.pop(i)
+                if self.app_state_cache is not None:
+                    self.app_state_cache.forget_app(app_id)
                 return True
         return False
 
@@ -410,7 +1030,7 @@ class AppWrapperList(object):
         int
             Number of added apps.
         """
-        existing_app_ids = self.get_id_list()
+        existing_app_ids = set(self.get_id_list()) # Construct wrappers only for new IDs
         num_of_added_apps = 0
         for app_id in app_id_list:
             if app_id not in existing_app_ids: # Only add new apps
@@ -458,7 +1078,8 @@ class ValadAppWrapperList(AppWrapperList):
     def __init__(
         self,
         algorand_client: AlgorandClient,
-        logger: logging.Logger
+        logger: logging.Logger,
+        app_state_cache: AppStateCache=None
     ):
         """List of Validator Ad app wrappers.
 
@@ -468,11 +1089,14 @@ class ValadAppWrapperList(AppWrapperList):
             Algorand client.
         logger : logging.Logger
             Logger.
+        app_state_cache : AppStateCache, optional
+            Shared app state cache, by default None.
         """
         super().__init__(
             algorand_client=algorand_client,
             logger=logger,
-            AppWrapperClass=ValadAppWrapper
+            AppWrapperClass=ValadAppWrapper,
+            app_state_cache=app_state_cache
         )
 
 
@@ -489,7 +1113,8 @@ class DelcoAppWrapperList(AppWrapperList):
     def __init__(
         self,
         algorand_client: AlgorandClient,
-        logger: logging.Logger
+        logger: logging.Logger,
+        app_state_cache: AppStateCache=None
     ):
         """List of Delegator Contract app wrappers.
 
@@ -497,11 +1122,14 @@ class DelcoAppWrapperList(AppWrapperList):
         ----------
         algorand_client : AlgorandClient
             Algorand client.
+        app_state_cache : AppStateCache, optional
+            Shared app state cache, by default None.
         """
         super().__init__(
             algorand_client=algorand_client,
             logger=logger,
-            AppWrapperClass=DelcoAppWrapper
+            AppWrapperClass=DelcoAppWrapper,
+            app_state_cache=app_state_cache
         )
 
     def get_partkey_params_list(self) -> List[dict]:
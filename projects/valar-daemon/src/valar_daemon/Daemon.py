@@ -8,7 +8,8 @@ Some terms are shortened to preserve space:
 import copy
 import time
 from pathlib import Path
-from typing import Tuple, List
+from typing import Tuple, List, Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from urllib.error import URLError, HTTPError
 
@@ -18,11 +19,16 @@ from algokit_utils.beta.account_manager import AddressAndSigner
 from algosdk.atomic_transaction_composer import AccountTransactionSigner      
 from algokit_utils.logic_error import LogicError
 from algosdk.error import AlgodHTTPError
+from algosdk.transaction import SuggestedParams
 
-from valar_daemon.AppWrapper import ValadAppWrapperList, DelcoAppWrapperList, ValadAppWrapper, DelcoAppWrapper
+from valar_daemon.AppWrapper import AppStateCache, ValadAppWrapperList, DelcoAppWrapperList, ValadAppWrapper, DelcoAppWrapper
 from valar_daemon.DaemonConfig import DaemonConfig
 from valar_daemon.PartkeyManager import PartkeyManager, PARTKEY_GENERATION_REQUEST_OK_ADDED
 from valar_daemon.Logger import Logger
+from valar_daemon.Metrics import Metrics, MetricsServer
+from valar_daemon.InstrumentedAlgodClient import InstrumentedAlgodClient
+from valar_daemon.RoundContext import RoundContext
+from valar_daemon.StateStore import StateStore
 from valar_daemon.Timer import Timer
 from valar_daemon.utils import (
     get_algorand_client,
@@ -34,7 +40,9 @@ from valar_daemon.utils import (
     report_contract_expired,
     report_delben_breach_limits,
     report_contract_expiry_soon,
-    claim_used_up_operational_fee
+    claim_used_up_operational_fee,
+    execute_composer,
+    SimulationFailedError
 )
 from valar_daemon.constants import (
     VALAD_NOT_READY_STATUS_CHANGE_OK,
@@ -59,7 +67,8 @@ from valar_daemon.constants import (
     DELCO_LIVE_STATUS_NO_CHANGE,
     CLAIM_OPERATIONAL_FEE_ERROR,
     CLAIM_OPERATIONAL_FEE_SUCCESS,
-    CLAIM_OPERATIONAL_FEE_NOT_LIVE
+    CLAIM_OPERATIONAL_FEE_NOT_LIVE,
+    MAX_TXN_GROUP_SIZE
 ) 
 
 
@@ -73,13 +82,21 @@ class AlgodStatus:
         Flag indicating whether algod is running OK.
     message : str
         Corresponding (error) message, obtained when checking the status.
+    last_round : int
+        Last round reported by algod, None if algod is not OK.
+    status : dict
+        Full status reported by algod, None if algod is not OK.
     """
     is_ok: bool
     message: str
+    last_round: int = None
+    status: dict = None
 
 
 class Daemon(object):
 
+    wait_for_block_timeout_s = 70 # Algod returns the wait-for-block-after call after one minute at the latest
+
 
     def __init__(
         self,
@@ -100,6 +117,12 @@ class Daemon(object):
             Daemon log abstraction.
         algorand_client : AlgorandClient
             Algorand client.
+        round_context : RoundContext
+            Round-scoped algod information, fetched at most once per loop.
+        metrics : Metrics
+            Loop, servicing, algod, and partkey metrics.
+        metrics_server : MetricsServer
+            Local endpoint serving the metrics (None if not served).
         partkey_manager : PartkeyManager
             Participation key management class.
         valman : AddressAndSigner
@@ -108,10 +131,26 @@ class Daemon(object):
             Indicator to stop the Daemon.
         loop_period_s : float
             Period at which contracts are checked.
+        loop_period_rounds : int
+            Period in rounds at which contracts are checked (0 if checked according to `loop_period_s`).
+        loop_deadline_s : float
+            Servicing budget of a loop in seconds (0 if no deadline).
+        loop_deadline_time_s : float
+            Time by which the servicing in the current loop should finish (None if no deadline).
+        deferred_app_id_set : set
+            IDs of apps that were not serviced before the deadline, serviced first in the next loop.
+        num_of_dropped_log_messages : int
+            Number of dropped log messages, as last reported.
+        max_workers : int
+            Number of workers for servicing contracts concurrently.
+        executor : ThreadPoolExecutor
+            Worker pool for servicing contracts concurrently (None if servicing serially).
         valad_app_list : ValadAppWrapperList
             List of Validator Ads and relevant info.
         delco_app_list : DelcoAppWrapperList
             List of Delegator Contract and relevant info.
+        state_store : StateStore
+            Local store of the app wrappers and partkey buffers, kept for fast restarts (None if not kept).
         """
 
         ### Read config ################################################################################################
@@ -127,7 +166,9 @@ class Daemon(object):
         self.logger = Logger(
             log_dirpath=log_path,
             log_max_size_bytes=self.daemon_config.max_log_file_size_B,
-            log_file_count=self.daemon_config.num_of_log_files_per_level
+            log_file_count=self.daemon_config.num_of_log_files_per_level,
+            min_log_level=self.daemon_config.min_log_level,
+            log_json=self.daemon_config.log_json
         )
         # Display config read warning if applicable (e.g. taking a default value, which was not found in the config).
         if config_read_warning is not None:
@@ -137,13 +178,40 @@ class Daemon(object):
         self.algorand_client = get_algorand_client(
             algod_config_server = self.daemon_config.algod_config_server,
             algod_config_token = self.daemon_config.algod_config_token,
+            timeout_s = self.daemon_config.algod_timeout_s,
+            max_retries = self.daemon_config.algod_max_retries,
+            retry_backoff_s = self.daemon_config.algod_retry_backoff_s,
+            connection_pool_size = self.daemon_config.algod_connection_pool_size,
+            record_path = self.daemon_config.algod_record_path,
+            replay_path = self.daemon_config.algod_replay_path
         )
 
+        ### Set up round context #######################################################################################
+        self.round_context = RoundContext(self.algorand_client)
+
+        ### Set up metrics #############################################################################################
+        self.metrics = Metrics()
+        if isinstance(self.algorand_client.client.algod, InstrumentedAlgodClient):
+            self.algorand_client.client.algod.metrics = self.metrics # Record algod requests per endpoint
+        self.metrics_server = None
+        if self.daemon_config.metrics_port > 0: # Opt-in local endpoint
+            try:
+                self.metrics_server = MetricsServer(self.metrics, self.daemon_config.metrics_port)
+                self.metrics_server.start()
+                self.logger.log_metrics_server_started(port=self.metrics_server.port)
+            except OSError as e:
+                self.metrics_server = None
+                self.logger.log_metrics_server_error(port=self.daemon_config.metrics_port, e=e)
+
         ### Set up partkey manager #####################################################################################
         self.partkey_manager = PartkeyManager(
             self.logger,
-            self.algorand_client
+            self.algorand_client,
+            self.round_context,
+            self.metrics
         )
+        if self.daemon_config.partkey_poll_period_s > 0: # Generate keys in between loops
+            self.partkey_manager.start_generation_worker(self.daemon_config.partkey_poll_period_s)
 
         ### Set up validator manager ###################################################################################
         manager_private_key = mnemonic.to_private_key(self.daemon_config.validator_manager_mnemonic)
@@ -156,17 +224,49 @@ class Daemon(object):
         ### Set up loop ################################################################################################
         self.stop_flag = False
         self.loop_period_s = self.daemon_config.loop_period_s
+        self.loop_period_rounds = self.daemon_config.loop_period_rounds
+        self.loop_deadline_s = self.daemon_config.loop_deadline_s
+        self.loop_deadline_time_s = None # Set at the start of each loop if a deadline is configured
+        self.deferred_app_id_set = set()
+        self.num_of_dropped_log_messages = self.logger.get_num_of_dropped_messages()
+
+        ### Set up transaction submission ##############################################################################
+        self.simulate_first = self.daemon_config.simulate_first # Only submit reports that succeed in simulation
+
+        ### Set up concurrent servicing ################################################################################
+        self.max_workers = self.daemon_config.max_workers
+        if self.max_workers > 1:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix='valar-daemon-worker'
+            )
+        else:
+            self.executor = None # Serial servicing by default
 
         ### Initialize up valad and delco lists ########################################################################
+        self.app_state_cache = AppStateCache(self.algorand_client) # Shared by both lists, reset each loop
         self.valad_app_list = ValadAppWrapperList(
             self.algorand_client,
-            self.logger
+            self.logger,
+            self.app_state_cache
         )
         self.delco_app_list = DelcoAppWrapperList(
             self.algorand_client,
-            self.logger
+            self.logger,
+            self.app_state_cache
         )
 
+        ### Restore state (e.g. after reboot) ##########################################################################
+        self.state_store = None
+        if self.daemon_config.persist_state: # Opt-in local state file
+            state_path = StateStore.get_state_path(log_path)
+            try:
+                self.state_store = StateStore(state_path)
+                self.restore_state()
+            except Exception as e:
+                self.state_store = None
+                self.logger.log_state_store_error(state_path=state_path, e=e)
+
         ### Initialize app wrappers ####################################################################################
         self.populate_valad_wrapper_list() # Initialize valad wrappers using config
         self.populate_delco_wrapper_list() # Initialize delco wrappers using the valads
@@ -204,10 +304,12 @@ class Daemon(object):
         AlgodStatus
         """
         try:
-            algorand_client.client.algod.status()
+            status = algorand_client.client.algod.status()
             return AlgodStatus(
                 is_ok=True, 
-                message="Algod is OK."
+                message="Algod is OK.",
+                last_round=status['last-round'],
+                status=status
             )
         except URLError as e:
             return AlgodStatus(
@@ -226,19 +328,102 @@ class Daemon(object):
             )
 
 
+    def service_apps(
+        self,
+        servicing_function: Callable,
+        app_list: List[ValadAppWrapper] | List[DelcoAppWrapper]
+    ) -> None:
+        """Call the servicing function for each app, using the worker pool if concurrent servicing is enabled.
+
+        Notes
+        -----
+        Each app is serviced by a single worker, which preserves the order of operations per app.
+        Returns only after all apps have been serviced.
+        Apps that were deferred in the previous loop are serviced first.
+        Apps that are reached after the loop deadline are not serviced, but deferred to the next loop.
+
+        Parameters
+        ----------
+        servicing_function : Callable
+            Function that takes an app wrapper and services it.
+        app_list : List[ValadAppWrapper] | List[DelcoAppWrapper]
+            App wrappers to service.
+        """
+        app_list = sorted(app_list, key=lambda app: app.app_id not in self.deferred_app_id_set) # Stable sort
+        deferred_app_list = []
+        def service_app_before_deadline(app):
+            if self.is_loop_deadline_exceeded():
+                deferred_app_list.append(app)
+            else:
+                servicing_function(app)
+        self.dispatch_servicing(service_app_before_deadline, app_list)
+        self.deferred_app_id_set.difference_update(app.app_id for app in app_list)
+        self.deferred_app_id_set.update(app.app_id for app in deferred_app_list)
+        if len(deferred_app_list) > 0:
+            self.metrics.inc('deferred_apps_total', len(deferred_app_list))
+            self.logger.log_deferred_apps_after_deadline(
+                num_of_apps=len(deferred_app_list),
+                app_id_list=[app.app_id for app in deferred_app_list]
+            )
+
+
+    def dispatch_servicing(
+        self,
+        service_app: Callable,
+        app_list: List[ValadAppWrapper] | List[DelcoAppWrapper]
+    ) -> None:
+        """Call the function for each app, serially or on the worker pool, returning once all apps are serviced.
+
+        Parameters
+        ----------
+        service_app : Callable
+            Function that takes an app wrapper and services it.
+        app_list : List[ValadAppWrapper] | List[DelcoAppWrapper]
+            App wrappers to service.
+        """
+        if self.executor is None:
+            for app in app_list:
+                service_app(app)
+        else:
+            list(self.executor.map(service_app, app_list)) # Consume to wait for completion and raise errors
+
+
+    def is_loop_deadline_exceeded(
+        self
+    ) -> bool:
+        """Check whether the servicing budget of the current loop is exhausted.
+
+        Returns
+        -------
+        bool
+            True if past the loop deadline, False if not or no deadline is set.
+        """
+        return self.loop_deadline_time_s is not None and time.time() > self.loop_deadline_time_s
+
+
     def maintain_valads(
         self
     ) -> None:
         """Maintain validator ads (try to change state from `NOT READY` to `READY` where applicable).
         """
-        self.logger.log_maintaining_valads(num_of_valads=len(self.valad_app_list.get_app_list()))
-        for valad_app in self.valad_app_list.get_app_list():
-            self.maintain_single_valad(
+        valad_app_list = copy.copy(self.valad_app_list.get_app_list())
+        self.logger.log_maintaining_valads(num_of_valads=len(valad_app_list))
+        start_time_s = time.time()
+        self.service_apps(
+            lambda valad_app: self.maintain_single_valad(
                 self.algorand_client,
                 self.valman,
                 copy.copy(valad_app),
-                self.logger
-            )
+                self.logger,
+                self.round_context
+            ),
+            valad_app_list
+        )
+        self.logger.log_valads_serviced(
+            num_of_valads=len(valad_app_list),
+            duration_s=round(time.time() - start_time_s, 2),
+            max_workers=self.max_workers
+        )
 
 
     @staticmethod
@@ -247,6 +432,7 @@ class Daemon(object):
         valman: AddressAndSigner,
         valad_app: ValadAppWrapper,
         logger: Logger,
+        round_context: RoundContext=None,
     ) -> int:
         """Maintain validator ads (try to change state from `NOT READY` to `READY` where applicable).
 
@@ -260,6 +446,8 @@ class Daemon(object):
             Client and relevant parameters of the validator ad.
         logger : logging.Logger
             Message logger.
+        round_context : RoundContext, optional
+            Round-scoped algod information shared within the loop, by default None.
 
         Returns
         -------
@@ -274,7 +462,8 @@ class Daemon(object):
                     valown_address=valad_app.valown_address,
                     valad_id=valad_app.app_id,
                     valman=valman,
-                    noticeboard_client=valad_app.notbd_client
+                    noticeboard_client=valad_app.notbd_client,
+                    suggested_params=Daemon.get_round_suggested_params(round_context)
                 )
                 return VALAD_NOT_READY_STATUS_CHANGE_OK
             except AttributeError as e:
@@ -288,20 +477,165 @@ class Daemon(object):
     ) -> None:
         """Maintain delegator contracts.
         """
-        self.logger.log_maintaining_delcos(num_of_delcos=len(self.delco_app_list.get_app_list()))
-        for delco_app in self.delco_app_list.get_app_list():
-            self.maintain_single_delco(
+        delco_app_list = copy.copy(self.delco_app_list.get_app_list()) # Ended delcos are removed from the original
+        self.logger.log_maintaining_delcos(num_of_delcos=len(delco_app_list))
+        start_time_s = time.time()
+        # Report expired and not submitted delcos in shared groups, servicing the rest individually
+        batch_reported_delco_id_list = self.report_delcos_in_batches(delco_app_list)
+        self.service_apps(
+            lambda delco_app: self.maintain_single_delco(
                 self.algorand_client,
                 self.valman,
                 copy.copy(delco_app),
                 self.partkey_manager,
                 self.logger,
-            )
+                self.round_context,
+                self.simulate_first,
+                self.metrics
+            ),
+            [delco_app for delco_app in delco_app_list if delco_app.app_id not in batch_reported_delco_id_list]
+        )
+        self.logger.log_delcos_serviced(
+            num_of_delcos=len(delco_app_list),
+            duration_s=round(time.time() - start_time_s, 2),
+            max_workers=self.max_workers
+        )
+        for delco_app in delco_app_list:
             if delco_app.state[0] >> 4 or delco_app.state[0] >> 5:
                 self.delco_app_list.remove_single_app(delco_app.app_id)
                 self.logger.log_removed_ended_or_deleted_delco(app_id=delco_app.app_id)
 
         
+    def report_delcos_in_batches(
+        self,
+        delco_app_list: List[DelcoAppWrapper]
+    ) -> List[int]:
+        """Report expired and not submitted delegator contracts in as few atomic groups as possible.
+
+        Notes
+        -----
+        Only delcos whose report is predicted to succeed are batched, grouped by their noticeboard.
+        Each report is a single app call with its own references, so a group holds up to `MAX_TXN_GROUP_SIZE` reports.
+        Single reports and reports from failed groups are left to the individual state handlers.
+        Delcos that were deferred in the previous loop are batched first.
+        No further groups are submitted after the loop deadline, leaving their delcos to the state handlers, which defer
+        them to the next loop (see `service_apps`).
+
+        Parameters
+        ----------
+        delco_app_list : List[DelcoAppWrapper]
+            Delegator contract app wrappers.
+
+        Returns
+        -------
+        List[int]
+            IDs of the successfully reported delcos.
+        """
+        evaluation_round = self.round_context.get_current_round() + 1 # Evaluated in the next block at the earliest
+        # Collect the candidates for each noticeboard
+        batch_candidate_dict = dict()
+        delco_app_list = sorted(delco_app_list, key=lambda app: app.app_id not in self.deferred_app_id_set)
+        for delco_app in delco_app_list:
+            if (
+                (delco_app.state == DELCO_STATE_LIVE and delco_app.can_report_expired(evaluation_round)) or
+                (delco_app.state == DELCO_STATE_READY and delco_app.can_report_partkeys_not_submitted(evaluation_round))
+            ):
+                batch_candidate_dict.setdefault(delco_app.notbd_client.app_id, []).append(delco_app)
+        # Report in groups of up to the maximum group size
+        batch_reported_delco_id_list = []
+        for batch_candidate_list in batch_candidate_dict.values():
+            for i in range(0, len(batch_candidate_list), MAX_TXN_GROUP_SIZE):
+                batch = batch_candidate_list[i:i+MAX_TXN_GROUP_SIZE]
+                if len(batch) < 2: # Nothing to gain
+                    continue
+                if self.is_loop_deadline_exceeded(): # The remaining delcos are deferred by `service_apps`
+                    return batch_reported_delco_id_list
+                batch_reported_delco_id_list += Daemon.report_single_batch(
+                    self.algorand_client,
+                    self.valman,
+                    batch,
+                    self.logger,
+                    self.round_context,
+                    self.simulate_first
+                )
+        return batch_reported_delco_id_list
+
+
+    @staticmethod
+    def report_single_batch(
+        algorand_client: AlgorandClient,
+        valman: AddressAndSigner,
+        delco_app_list: List[DelcoAppWrapper],
+        logger: Logger,
+        round_context: RoundContext=None,
+        simulate_first: bool=False
+    ) -> List[int]:
+        """Report expired (live) and not submitted (ready) delegator contracts of a single noticeboard in one group.
+
+        Parameters
+        ----------
+        algorand_client : AlgorandClient
+            Algorand client.
+        valman : AddressAndSigner
+            Validator Ad manager.
+        delco_app_list : List[DelcoAppWrapper]
+            Delegator Contract app wrappers, sharing the same noticeboard.
+        logger : Logger
+            Message logger.
+        round_context : RoundContext, optional
+            Round-scoped algod information shared within the loop, by default None.
+        simulate_first : bool, optional
+            Simulate the unsigned group first and only submit it if successful, by default False.
+
+        Returns
+        -------
+        List[int]
+            IDs of the reported delcos, empty if the group failed.
+        """
+        delco_id_list = [delco_app.app_id for delco_app in delco_app_list]
+        try:
+            batch_composer = delco_app_list[0].notbd_client.compose()
+            for delco_app in delco_app_list:
+                if delco_app.state == DELCO_STATE_LIVE:
+                    report_contract_expired(
+                        algorand_client=algorand_client,
+                        valown_address=delco_app.valown_address,
+                        delman_address=delco_app.delman_address,
+                        partner_address=delco_app.partner_address,
+                        valad_id=delco_app.valad_id,
+                        delco_id=delco_app.app_id,
+                        fee_asset_id=delco_app.fee_asa_id,
+                        valman=valman,
+                        noticeboard_client=delco_app.notbd_client,
+                        suggested_params=Daemon.get_round_suggested_params(round_context),
+                        batch_composer=batch_composer
+                    )
+                else:
+                    report_partkeys_not_submitted(
+                        algorand_client=algorand_client,
+                        valown_address=delco_app.valown_address,
+                        delman_address=delco_app.delman_address,
+                        valad_id=delco_app.valad_id,
+                        delco_id=delco_app.app_id,
+                        fee_asset_id=delco_app.fee_asa_id,
+                        valman=valman,
+                        noticeboard_client=delco_app.notbd_client,
+                        suggested_params=Daemon.get_round_suggested_params(round_context),
+                        batch_composer=batch_composer
+                    )
+            execute_composer(batch_composer, simulate_first)
+        except Exception as e: # Whole group failed, left to the individual handlers
+            logger.log_batch_report_failed(delco_id_list=delco_id_list, e=e)
+            return []
+        logger.log_batch_reported(num_of_delcos=len(delco_id_list), delco_id_list=delco_id_list)
+        for delco_app in delco_app_list:
+            if delco_app.state == DELCO_STATE_LIVE:
+                logger.log_contract_expired(delco_app.app_id)
+            else:
+                logger.log_partkeys_not_submitted(app_id=delco_app.app_id)
+        return delco_id_list
+
+
     @staticmethod
     def maintain_single_delco(
         algorand_client: AlgorandClient,
@@ -309,6 +643,9 @@ class Daemon(object):
         delco_app: DelcoAppWrapper,
         partkey_manager: PartkeyManager,
         logger: Logger,
+        round_context: RoundContext=None,
+        simulate_first: bool=False,
+        metrics: Metrics=None,
     ) -> None:
         """Maintain a single delegator contract.
 
@@ -324,50 +661,76 @@ class Daemon(object):
             Participation key manager.
         logger : Logger
             Message logger.
+        round_context : RoundContext, optional
+            Round-scoped algod information shared within the loop, by default None.
+        simulate_first : bool, optional
+            Simulate the unsigned reports first and only submit them if successful, by default False.
+        metrics : Metrics, optional
+            Metrics registry recording the handler durations, by default None.
         """
+        start_time_s = time.time()
+        handler_name = None
         try:
             delco_state = delco_app.state
             logger.log_state_of_delco_with_id(app_id=delco_app.app_id, state=delco_state)
             if delco_state == DELCO_STATE_READY: # Generate and submit keys (add internal state)
+                handler_name = 'delco_ready_state_handler'
                 Daemon.delco_ready_state_handler(
                     algorand_client,
                     valman,
                     delco_app,
                     partkey_manager,
                     logger,
+                    round_context,
+                    simulate_first
                 )
             elif delco_state == DELCO_STATE_SUBMITTED:
+                handler_name = 'delco_submitted_state_handler'
                 Daemon.delco_submitted_state_handler(
                     algorand_client,
                     valman,
                     delco_app,
-                    logger
+                    logger,
+                    round_context,
+                    simulate_first
                 )
             elif delco_state == DELCO_STATE_LIVE:
+                handler_name = 'delco_live_state_handler'
                 Daemon.delco_live_state_handler(
                     algorand_client,
                     valman,
                     delco_app,
-                    logger
+                    logger,
+                    round_context,
+                    simulate_first
                 )
             # Ended contracts no longer visible from validator ad's list -> no need for handler
             elif delco_state[0] >> 4: # Ended contract
+                handler_name = 'delco_ended_state_handler'
                 Daemon.delco_ended_state_handler(
                     algorand_client,
                     partkey_manager,
                     delco_app,
-                    logger
+                    logger,
+                    round_context
                 )
             elif delco_state[0] >> 5: # Deleted contract
+                handler_name = 'delco_deleted_state_handler'
                 Daemon.delco_deleted_state_handler(
                     algorand_client,
                     partkey_manager,
-                    logger
+                    delco_app,
+                    logger,
+                    round_context
                 )
             else:
                 logger.log_unknown_delco_state(state=delco_state)
         except Exception as e:
             logger.error(f'Error while handling delco with ID {delco_app.app_id}: {e}.')
+        duration_s = time.time() - start_time_s
+        logger.log_delco_servicing_time(app_id=delco_app.app_id, duration_s=round(duration_s, 3))
+        if metrics is not None and handler_name is not None:
+            metrics.observe('delco_handler_duration_seconds', duration_s, handler=handler_name)
 
 
     @staticmethod
@@ -377,6 +740,8 @@ class Daemon(object):
         delco_app: DelcoAppWrapper,
         partkey_manager: PartkeyManager,
         logger: Logger,
+        round_context: RoundContext=None,
+        simulate_first: bool=False,
     ) -> int:
         """Handle a ready delegator contract (generate and submit keys).
 
@@ -392,6 +757,10 @@ class Daemon(object):
             Participation key manager.
         logger : Logger
             Message logger.
+        round_context : RoundContext, optional
+            Round-scoped algod information shared within the loop, by default None.
+        simulate_first : bool, optional
+            Simulate the unsigned reports first and only submit them if successful, by default False.
 
         Returns
         -------
@@ -408,13 +777,15 @@ class Daemon(object):
                 delco_id=delco_app.app_id,
                 fee_asset_id=delco_app.fee_asa_id,
                 valman=valman,
-                noticeboard_client=delco_app.notbd_client
+                noticeboard_client=delco_app.notbd_client,
+                suggested_params=Daemon.get_round_suggested_params(round_context),
+                simulate_first=simulate_first
             )
             logger.log_delco_cannot_pay(app_id=delco_app.app_id)
             return DELCO_READY_STATUS_BREACH_PAY
         except AttributeError:
             logger.log_attributeerror_cannot_pay(app_id=delco_app.app_id)
-        except LogicError: # Failed transaction on LocalNet
+        except (LogicError, SimulationFailedError): # Failed transaction on LocalNet
             logger.log_logicerror_cannot_pay(app_id=delco_app.app_id)
         except HTTPError: # Failed transaction on local network
             logger.log_httperror_cannot_pay(app_id=delco_app.app_id)
@@ -430,13 +801,15 @@ class Daemon(object):
                 delco_id=delco_app.app_id,
                 fee_asset_id=delco_app.fee_asa_id,
                 valman=valman,
-                noticeboard_client=delco_app.notbd_client
+                noticeboard_client=delco_app.notbd_client,
+                suggested_params=Daemon.get_round_suggested_params(round_context),
+                simulate_first=simulate_first
             )
             logger.log_partkeys_not_submitted(app_id=delco_app.app_id)
             return DELCO_READY_STATUS_NOT_SUBMITTED
         except AttributeError:
             logger.log_attributeerror_partkeys_not_submitted(app_id=delco_app.app_id)
-        except LogicError: # Failed transaction on LocalNet
+        except (LogicError, SimulationFailedError): # Failed transaction on LocalNet
             logger.log_logicerror_partkeys_not_submitted(app_id=delco_app.app_id)
         except HTTPError: # Failed transaction on local network
             logger.log_httperror_partkeys_not_submitted(app_id=delco_app.app_id)
@@ -477,7 +850,8 @@ class Daemon(object):
                     vote_key_dilution=partkey_params['vote-key-dilution'],
                     vote_pk=partkey_params['vote-participation-key'],
                     selection_pk=partkey_params['selection-participation-key'],
-                    state_proof_pk=partkey_params['state-proof-key']
+                    state_proof_pk=partkey_params['state-proof-key'],
+                    suggested_params=Daemon.get_round_suggested_params(round_context)
                 )
                 logger.log_partkey_params_submitted(app_id=delco_app.app_id)
                 return DELCO_READY_STATUS_SUBMITTED
@@ -501,7 +875,8 @@ class Daemon(object):
             res = partkey_manager.add_partkey_generation_request( # No on-chain operation
                 address=delco_app.delben_address,
                 vote_first_valid=delco_app.round_start,
-                vote_last_valid=delco_app.round_end
+                vote_last_valid=delco_app.round_end,
+                generation_deadline=delco_app.round_setup_end # Prioritize keys closest to a setup breach
             )
             if res == PARTKEY_GENERATION_REQUEST_OK_ADDED:
                 logger.log_requested_partkey_generation(delco_app.app_id)
@@ -517,6 +892,8 @@ class Daemon(object):
         valman: AddressAndSigner,
         delco_app: DelcoAppWrapper,
         logger: Logger,
+        round_context: RoundContext=None,
+        simulate_first: bool=False,
     ) -> None:
         """Handle a delegator contract with submitted keys (report unconfirmed keys).
 
@@ -530,6 +907,10 @@ class Daemon(object):
             Delegator Contract app wrapper.
         logger : Logger
             Message logger.
+        round_context : RoundContext, optional
+            Round-scoped algod information shared within the loop, by default None.
+        simulate_first : bool, optional
+            Simulate the unsigned reports first and only submit them if successful, by default False.
         """
         logger.debug(f'In submitted state handler for delco with ID {delco_app.app_id}.')
         try:
@@ -543,11 +924,13 @@ class Daemon(object):
                 fee_asset_id=delco_app.fee_asa_id,
                 valman=valman,
                 noticeboard_client=delco_app.notbd_client,
+                suggested_params=Daemon.get_round_suggested_params(round_context),
+                simulate_first=simulate_first
             )
             logger.log_partkeys_not_confirmed(delco_app.app_id)
         except AttributeError:
             logger.log_attributeerror_partkeys_not_confirmed(delco_app.app_id)
-        except LogicError:
+        except (LogicError, SimulationFailedError):
             logger.log_logicerror_partkeys_not_confirmed(delco_app.app_id)
         except HTTPError: # Failed transaction on local network
             logger.log_httperror_partkeys_not_confirmed(app_id=delco_app.app_id)
@@ -555,12 +938,56 @@ class Daemon(object):
             logger.log_httperror_cannot_pay(app_id=delco_app.app_id)
 
 
+    @staticmethod
+    def predict_live_report(
+        logger: Logger,
+        app_id: int,
+        report_name: str,
+        predictor: Callable[..., bool],
+        *args
+    ) -> bool:
+        """Predict whether a live delegator contract report could succeed, before building and sending it.
+
+        Notes
+        -----
+        Falls back to trying the report if the prediction fails (e.g. the balance could not be fetched).
+
+        Parameters
+        ----------
+        logger : Logger
+            Message logger.
+        app_id : int
+            Delegator contract ID.
+        report_name : str
+            Name of the report.
+        predictor : Callable[..., bool]
+            Function that checks the report's precondition.
+        *args
+            Arguments passed to the predictor.
+
+        Returns
+        -------
+        bool
+            True if the report should be tried.
+        """
+        try:
+            if predictor(*args):
+                return True
+        except Exception as e:
+            logger.log_live_report_prediction_error(app_id=app_id, report_name=report_name, e=e)
+            return True
+        logger.log_skipped_live_report(app_id=app_id, report_name=report_name)
+        return False
+
+
     @staticmethod
     def delco_live_state_handler(
         algorand_client: AlgorandClient,
         valman: AddressAndSigner,
         delco_app: DelcoAppWrapper,
         logger: Logger,
+        round_context: RoundContext=None,
+        simulate_first: bool=False,
     ) -> int:
         """Handle a live delegator contract (check different limit breaches and expiry).
 
@@ -574,6 +1001,10 @@ class Daemon(object):
             Delegator Contract app wrapper.
         logger : Logger
             Message logger.
+        round_context : RoundContext, optional
+            Round-scoped algod information shared within the loop, by default None.
+        simulate_first : bool, optional
+            Simulate the unsigned reports first and only submit them if successful, by default False.
 
         Returns
         -------
@@ -581,96 +1012,125 @@ class Daemon(object):
             The sub-state status flag.
         """
         logger.log_delco_in_live_handler(app_id=delco_app.app_id)
+        # Only send the reports whose preconditions hold (predicted locally), since most would fail otherwise
+        # Reports are evaluated in the next block at the earliest, i.e. one round after the last round
+        if round_context is None: # Not shared within a loop, e.g. when called on its own
+            round_context = RoundContext(algorand_client)
+        evaluation_round = round_context.get_current_round() + 1
         # Call the corresponding checkup functions, which could result in a state change
         # Check if expired
-        try:
-            report_contract_expired(
-                algorand_client=algorand_client,
-                valown_address=delco_app.valown_address,
-                delman_address=delco_app.delman_address,
-                partner_address=delco_app.partner_address,
-                valad_id=delco_app.valad_id,
-                delco_id=delco_app.app_id,
-                fee_asset_id=delco_app.fee_asa_id,
-                valman=valman,
-                noticeboard_client=delco_app.notbd_client
-            )
-            logger.log_contract_expired(delco_app.app_id)
-            return DELCO_LIVE_STATUS_EXPIRED
-        except AttributeError:
-            logger.log_expired_attribute_error(app_id=delco_app.app_id)
-        except LogicError:
-            logger.log_tried_contract_expired(app_id=delco_app.app_id)
-        except HTTPError: # Failed transaction on local network
-            logger.log_httperror_contract_expired(app_id=delco_app.app_id)
-        except AlgodHTTPError: # Failed transaction on public network
-            logger.log_httperror_contract_expired(app_id=delco_app.app_id)
+        if Daemon.predict_live_report(
+            logger, delco_app.app_id, "contract_expired",
+            delco_app.can_report_expired, evaluation_round
+        ):
+            try:
+                report_contract_expired(
+                    algorand_client=algorand_client,
+                    valown_address=delco_app.valown_address,
+                    delman_address=delco_app.delman_address,
+                    partner_address=delco_app.partner_address,
+                    valad_id=delco_app.valad_id,
+                    delco_id=delco_app.app_id,
+                    fee_asset_id=delco_app.fee_asa_id,
+                    valman=valman,
+                    noticeboard_client=delco_app.notbd_client,
+                    suggested_params=Daemon.get_round_suggested_params(round_context),
+                    simulate_first=simulate_first
+                )
+                logger.log_contract_expired(delco_app.app_id)
+                return DELCO_LIVE_STATUS_EXPIRED
+            except AttributeError:
+                logger.log_expired_attribute_error(app_id=delco_app.app_id)
+            except (LogicError, SimulationFailedError):
+                logger.log_tried_contract_expired(app_id=delco_app.app_id)
+            except HTTPError: # Failed transaction on local network
+                logger.log_httperror_contract_expired(app_id=delco_app.app_id)
+            except AlgodHTTPError: # Failed transaction on public network
+                logger.log_httperror_contract_expired(app_id=delco_app.app_id)
         # Check if ALGO (max) or gating ASA (min) limits breached
-        try:
-            report_delben_breach_limits(
-                algorand_client=algorand_client,
-                valown_address=delco_app.valown_address,
-                delman_address=delco_app.delman_address,
-                delben_address=delco_app.delben_address,
-                partner_address=delco_app.partner_address,
-                valad_id=delco_app.valad_id,
-                delco_id=delco_app.app_id,
-                fee_asset_id=delco_app.fee_asa_id,
-                gating_asa_id_list=delco_app.gating_asa_id_list,
-                valman=valman,
-                noticeboard_client=delco_app.notbd_client
-            )
-            logger.log_gating_or_stake_limit_breached(app_id=delco_app.app_id)
-            return DELCO_LIVE_STATUS_BREACH_LIMITS
-        except AttributeError:
-            logger.log_gating_or_stake_limit_breached_attribute_error(app_id=delco_app.app_id)
-        except LogicError:
-            logger.log_logicerror_gating_or_stake_limit_breached(app_id=delco_app.app_id)
-        except HTTPError: # Failed transaction on local network
-            logger.log_httperror_gating_or_stake_limit_breached(app_id=delco_app.app_id)
-        except AlgodHTTPError: # Failed transaction on public network
-            logger.log_httperror_gating_or_stake_limit_breached(app_id=delco_app.app_id)
-        try: # Check if can pay
-            report_delco_breach_pay( # Error if can pay, success if can not
-                algorand_client=algorand_client,
-                valown_address=delco_app.valown_address,
-                delman_address=delco_app.delman_address,
-                valad_id=delco_app.valad_id,
-                delco_id=delco_app.app_id,
-                fee_asset_id=delco_app.fee_asa_id,
-                valman=valman,
-                noticeboard_client=delco_app.notbd_client
-            )
-            logger.log_delco_cannot_pay(app_id=delco_app.app_id)
-            return DELCO_LIVE_STATUS_BREACH_PAY
-        except AttributeError:
-            logger.log_attributeerror_cannot_pay(app_id=delco_app.app_id)
-        except LogicError:
-            logger.log_logicerror_cannot_pay(app_id=delco_app.app_id)
-        except HTTPError: # Failed transaction on local network
-            logger.log_httperror_cannot_pay(app_id=delco_app.app_id)
-        except AlgodHTTPError: # Failed transaction on public network
-            logger.log_httperror_cannot_pay(app_id=delco_app.app_id)
-        try: # Check if expiry soon
-            report_contract_expiry_soon(
-                algorand_client=algorand_client,
-                valown_address=delco_app.valown_address,
-                delman_address=delco_app.delman_address,
-                valad_id=delco_app.valad_id,
-                delco_id=delco_app.app_id,
-                valman=valman,
-                noticeboard_client=delco_app.notbd_client
-            )
-            logger.log_delco_expires_soon(app_id=delco_app.app_id)
-            return DELCO_LIVE_STATUS_EXPIRES_SOON
-        except AttributeError:
-            logger.log_attributeerror_delco_expires_soon(app_id=delco_app.app_id)
-        except LogicError:
-            logger.log_logicerror_delco_expires_soon(app_id=delco_app.app_id)
-        except HTTPError: # Failed transaction on local network
-            logger.log_httperror_delco_expires_soon(app_id=delco_app.app_id)
-        except AlgodHTTPError: # Failed transaction on public network
-            logger.log_httperror_delco_expires_soon(app_id=delco_app.app_id)
+        if Daemon.predict_live_report(
+            logger, delco_app.app_id, "breach_limits",
+            delco_app.can_report_breach_limits, algorand_client, evaluation_round
+        ):
+            try:
+                report_delben_breach_limits(
+                    algorand_client=algorand_client,
+                    valown_address=delco_app.valown_address,
+                    delman_address=delco_app.delman_address,
+                    delben_address=delco_app.delben_address,
+                    partner_address=delco_app.partner_address,
+                    valad_id=delco_app.valad_id,
+                    delco_id=delco_app.app_id,
+                    fee_asset_id=delco_app.fee_asa_id,
+                    gating_asa_id_list=delco_app.gating_asa_id_list,
+                    valman=valman,
+                    noticeboard_client=delco_app.notbd_client,
+                    suggested_params=Daemon.get_round_suggested_params(round_context),
+                    simulate_first=simulate_first
+                )
+                logger.log_gating_or_stake_limit_breached(app_id=delco_app.app_id)
+                return DELCO_LIVE_STATUS_BREACH_LIMITS
+            except AttributeError:
+                logger.log_gating_or_stake_limit_breached_attribute_error(app_id=delco_app.app_id)
+            except (LogicError, SimulationFailedError):
+                logger.log_logicerror_gating_or_stake_limit_breached(app_id=delco_app.app_id)
+            except HTTPError: # Failed transaction on local network
+                logger.log_httperror_gating_or_stake_limit_breached(app_id=delco_app.app_id)
+            except AlgodHTTPError: # Failed transaction on public network
+                logger.log_httperror_gating_or_stake_limit_breached(app_id=delco_app.app_id)
+        if Daemon.predict_live_report(
+            logger, delco_app.app_id, "breach_pay",
+            delco_app.can_report_breach_pay, algorand_client, evaluation_round
+        ):
+            try: # Check if can pay
+                report_delco_breach_pay( # Error if can pay, success if can not
+                    algorand_client=algorand_client,
+                    valown_address=delco_app.valown_address,
+                    delman_address=delco_app.delman_address,
+                    valad_id=delco_app.valad_id,
+                    delco_id=delco_app.app_id,
+                    fee_asset_id=delco_app.fee_asa_id,
+                    valman=valman,
+                    noticeboard_client=delco_app.notbd_client,
+                    suggested_params=Daemon.get_round_suggested_params(round_context),
+                    simulate_first=simulate_first
+                )
+                logger.log_delco_cannot_pay(app_id=delco_app.app_id)
+                return DELCO_LIVE_STATUS_BREACH_PAY
+            except AttributeError:
+                logger.log_attributeerror_cannot_pay(app_id=delco_app.app_id)
+            except (LogicError, SimulationFailedError):
+                logger.log_logicerror_cannot_pay(app_id=delco_app.app_id)
+            except HTTPError: # Failed transaction on local network
+                logger.log_httperror_cannot_pay(app_id=delco_app.app_id)
+            except AlgodHTTPError: # Failed transaction on public network
+                logger.log_httperror_cannot_pay(app_id=delco_app.app_id)
+        if Daemon.predict_live_report(
+            logger, delco_app.app_id, "expiry_soon",
+            delco_app.can_report_expiry_soon, evaluation_round
+        ):
+            try: # Check if expiry soon
+                report_contract_expiry_soon(
+                    algorand_client=algorand_client,
+                    valown_address=delco_app.valown_address,
+                    delman_address=delco_app.delman_address,
+                    valad_id=delco_app.valad_id,
+                    delco_id=delco_app.app_id,
+                    valman=valman,
+                    noticeboard_client=delco_app.notbd_client,
+                    suggested_params=Daemon.get_round_suggested_params(round_context),
+                    simulate_first=simulate_first
+                )
+                logger.log_delco_expires_soon(app_id=delco_app.app_id)
+                return DELCO_LIVE_STATUS_EXPIRES_SOON
+            except AttributeError:
+                logger.log_attributeerror_delco_expires_soon(app_id=delco_app.app_id)
+            except (LogicError, SimulationFailedError):
+                logger.log_logicerror_delco_expires_soon(app_id=delco_app.app_id)
+            except HTTPError: # Failed transaction on local network
+                logger.log_httperror_delco_expires_soon(app_id=delco_app.app_id)
+            except AlgodHTTPError: # Failed transaction on public network
+                logger.log_httperror_delco_expires_soon(app_id=delco_app.app_id)
         return DELCO_LIVE_STATUS_NO_CHANGE
 
 
@@ -680,6 +1140,7 @@ class Daemon(object):
         partkey_manager: PartkeyManager,
         delco_app: DelcoAppWrapper,
         logger: Logger,
+        round_context: RoundContext=None,
     ) -> None:
         """Handle an ended delegator contract (delete partkeys).
 
@@ -693,6 +1154,8 @@ class Daemon(object):
             Delegator Contract app wrapper.
         logger : Logger
             Message logger.
+        round_context : RoundContext, optional
+            Round-scoped algod information shared within the loop, by default None.
         """
         # logger.debug(f'In ended state handler for delco with ID {delco_app.app_id}.')
         logger.log_delco_in_ended_handler(app_id=delco_app.app_id)
@@ -707,7 +1170,9 @@ class Daemon(object):
             logger.log_urlerror_checking_partkey_generated(app_id=delco_app.app_id)
         # Scheduled deletion of partkey, which will no longer be used
         if is_generated:
-            current_round = algorand_client.client.algod.status()['last-round']
+            if round_context is None: # Not shared within a loop, e.g. when called on its own
+                round_context = RoundContext(algorand_client)
+            current_round = round_context.get_current_round()
             # Extend duration for the 320 rounds (15 min)
             # To prevent the delayed staking on extension
             # Extension falls under withdrawal
@@ -738,6 +1203,7 @@ class Daemon(object):
         partkey_manager: PartkeyManager,
         delco_app: DelcoAppWrapper,
         logger: Logger,
+        round_context: RoundContext=None,
     ) -> None:
         """Handle an ended delegator contract (delete partkeys).
 
@@ -751,6 +1217,8 @@ class Daemon(object):
             Delegator Contract app wrapper.
         logger : Logger
             Message logger.
+        round_context : RoundContext, optional
+            Round-scoped algod information shared within the loop, by default None.
         """
         logger.log_delco_in_deleted_handler(app_id=delco_app.app_id)
         # Check if the partkey still exists (could be deleted at contract expiry or manually)
@@ -765,7 +1233,9 @@ class Daemon(object):
             logger.log_urlerror_checking_partkey_generated(app_id=delco_app.app_id)
         # Scheduled deletion of partkey, which will no longer be used
         if is_generated:
-            current_round = algorand_client.client.algod.status()['last-round']
+            if round_context is None: # Not shared within a loop, e.g. when called on its own
+                round_context = RoundContext(algorand_client)
+            current_round = round_context.get_current_round()
             target_scheduled_deletion = current_round
             partkey_manager.update_generated_partkey_scheduled_deletion(
                 address=delco_app.delben_address,
@@ -782,6 +1252,27 @@ class Daemon(object):
             logger.log_no_partkeys_found_for_ended_or_deleted(app_id=delco_app.app_id)
 
 
+    @staticmethod
+    def get_round_suggested_params(
+        round_context: RoundContext=None
+    ) -> SuggestedParams | None:
+        """Get suggested parameters from the round context.
+
+        Parameters
+        ----------
+        round_context : RoundContext, optional
+            Round-scoped algod information shared within the loop, by default None.
+
+        Returns
+        -------
+        SuggestedParams | None
+            Suggested parameters or None, in which case they are fetched by the called utility.
+        """
+        if round_context is None:
+            return None
+        return round_context.get_suggested_params()
+
+
     def populate_valad_wrapper_list(self) -> Tuple[int, List]:
         """Populate the list of validator ad apps wrappers.
 
@@ -790,8 +1281,12 @@ class Daemon(object):
         Tuple[int, int]
             Number of validator ads connected and the list of validator ad IDs from the config file.
         """
-        # Read in latest valad app IDs
-        self.daemon_config.read_swap()
+        # Read in latest valad app IDs and other settings, only if the config swap changed
+        changed_settings = self.daemon_config.read_swap_if_changed()
+        if len(changed_settings) > 0:
+            self.apply_config_changes(changed_settings)
+        # Fetch fresh app state in this loop, at most once per app (after the valad app IDs are up to date)
+        self.reset_app_state_cache()
         # Fetch valads based on the info provided in the config
         valad_id_list = copy.copy(self.daemon_config.validator_ad_id_list)
         self.logger.log_num_of_valad_ids_found(num_of_valads=len(valad_id_list))
@@ -807,6 +1302,73 @@ class Daemon(object):
         return num_of_valads, valad_id_list
 
 
+    def reset_app_state_cache(self) -> None:
+        """Discard the app state fetched in the previous loop.
+        """
+        self.app_state_cache.reset()
+
+
+    def apply_config_changes(
+        self,
+        changed_settings: dict
+    ) -> None:
+        """Apply the changed config settings that can be changed at runtime.
+
+        Notes
+        -----
+        Validator ads that were removed from the config are no longer serviced.
+        Their delegator contracts that are already known keep being serviced until they end.
+        The remaining settings (e.g. algod connection, worker pool, or log files) only take effect after a restart.
+
+        Parameters
+        ----------
+        changed_settings : dict
+            Previous and new value of each changed setting, indexed by the setting name.
+        """
+        self.logger.log_config_changed(changed_settings=', '.join(
+            f'{name}' if name in DaemonConfig.SECRET_SETTING_NAME_LIST else f'{name}: {before} -> {after}'
+            for name, (before, after) in changed_settings.items()
+        ))
+        restart_setting_list = []
+        for name, (before, after) in changed_settings.items():
+            if name == 'validator_ad_id_list':
+                removed_valad_id_list = [app_id for app_id in (before or []) if app_id not in after]
+                if len(removed_valad_id_list) > 0:
+                    self.valad_app_list.remove_multiple_apps(removed_valad_id_list)
+                    self.logger.log_removed_valads_from_config(valad_id_list=removed_valad_id_list)
+            elif name in ('loop_period_s', 'loop_period_rounds', 'loop_deadline_s', 'simulate_first'):
+                setattr(self, name, after)
+            elif name == 'claim_period_s':
+                self.claim_timer.period_s = after
+            elif name == 'min_log_level':
+                self.logger.min_log_level = after
+            else:
+                restart_setting_list.append(name)
+        if len(restart_setting_list) > 0:
+            self.logger.log_config_change_requires_restart(setting_list=restart_setting_list)
+
+
+    def request_config_reload(
+        self,
+        signum: int=None,
+        frame: object=None
+    ) -> None:
+        """Read the config swap at the start of the next loop, regardless of whether it changed.
+
+        Notes
+        -----
+        Can be registered as a signal handler (e.g. for SIGHUP).
+
+        Parameters
+        ----------
+        signum : int, optional
+            Signal number, by default None.
+        frame : object, optional
+            Interrupted stack frame, by default None.
+        """
+        self.daemon_config.request_reload()
+
+
     def populate_delco_wrapper_list(self) -> None:
         """Populate the list of delegator contract apps wrappers.
         """
@@ -822,6 +1384,10 @@ class Daemon(object):
             num_of_updated_delcos=num_of_updated_delcos, 
             num_of_delcos=num_of_delcos
         )
+        self.logger.log_saved_app_state_calls(
+            num_of_saved_calls=self.app_state_cache.get_num_of_saved_calls(),
+            num_of_algod_calls=self.app_state_cache.num_of_algod_calls
+        )
 
 
     def maintain_contracts(
@@ -849,6 +1415,8 @@ class Daemon(object):
         valman: AddressAndSigner,
         delco_app: DelcoAppWrapper,
         logger: Logger,
+        round_context: RoundContext=None,
+        simulate_first: bool=False,
     ) -> int:
         """Claim used up operational fee.
 
@@ -862,6 +1430,10 @@ class Daemon(object):
             Delegator Contract app wrapper.
         logger : Logger
             Message logger.
+        round_context : RoundContext, optional
+            Round-scoped algod information shared within the loop, by default None.
+        simulate_first : bool, optional
+            Simulate the unsigned reports first and only submit them if successful, by default False.
 
         Returns
         -------
@@ -881,12 +1453,16 @@ class Daemon(object):
                     delco_id=delco_app.app_id,
                     fee_asset_id=delco_app.fee_asa_id,
                     valman=valman,
-                    noticeboard_client=delco_app.notbd_client
+                    noticeboard_client=delco_app.notbd_client,
+                    suggested_params=Daemon.get_round_suggested_params(round_context),
+                    simulate_first=simulate_first
                 )   
                 logger.log_successfully_claimed_operational_fee(app_id=delco_app.app_id)
                 return CLAIM_OPERATIONAL_FEE_SUCCESS
             except AttributeError: # In case of Algod offline error.
                 logger.log_attributeerror_claim_operational_fee(app_id=delco_app.app_id)
+            except SimulationFailedError as e: # Nothing to claim or not possible, thus not submitted
+                logger.log_simulation_failed_claim_operational_fee(app_id=delco_app.app_id, e=e)
             except Exception as e: # Capture unknown error, i.e. other than above.
                 logger.log_unknownerror_claim_operational_fee(app_id=delco_app.app_id, e=e)
             return CLAIM_OPERATIONAL_FEE_ERROR
@@ -904,7 +1480,9 @@ class Daemon(object):
                 algorand_client=self.algorand_client,
                 valman=self.valman,
                 delco_app=delco_app,
-                logger=self.logger
+                logger=self.logger,
+                round_context=self.round_context,
+                simulate_first=self.simulate_first
             )
 
 
@@ -916,36 +1494,215 @@ class Daemon(object):
         while not self.stop_flag:
             # Measure time
             start_time_s = time.time()
-            # Check algod
-            algod_status = Daemon.check_algod_status(self.algorand_client)
-            # If good, run daemon logic
-            if algod_status.is_ok:
-                self.logger.log_algod_ok_continuing()
-                self.logger.log_current_round(current_round=self.algorand_client.client.algod.status()["last-round"])
-                try:
-                    self.maintain_contracts()        # Service valads and delcos
-                except Exception as e:
-                    self.logger.log_generic_contract_servicing_error(e)
+            algod_status = self.run_single_loop(start_time_s)
+            # Wait for the next round window if running round-driven and algod is reachable
+            if self.loop_period_rounds > 0 and algod_status.is_ok:
+                target_round = algod_status.last_round + self.loop_period_rounds
                 try:
-                    self.partkey_manager.refresh()  # Manage partkeys
+                    self.logger.log_targeted_wait_round(target_round=target_round)
+                    self.wait_for_round(target_round, algod_status.last_round)
+                    continue
                 except Exception as e:
-                    self.logger.log_generic_partkey_manager_error(e)
-                if self.claim_timer.has_time_window_elapsed() == True:                  # Separate timer for claiming.
-                    self.claim_timer.reset_timer()                                      # Always reset timer.
-                    try:                                                                # Wrap in try statement.
-                        self.claim_operational_fee()                                    # Claim operational fee.
-                    except Exception as e:                                              # If the entire function fails.
-                        self.logger.log_generic_claim_operational_fee_error(e)          # Log generic error.
-            # If not, report critical
-            else:
-                self.logger.log_algod_error(algod_status.message)
+                    self.logger.log_could_not_wait_for_round(target_round=target_round, e=e) # Fall back to sleep
             # Sleep for the remaining time
             try:
-                self.logger.log_single_loop_execution_time(round(time.time() - start_time_s, 2))
                 self.logger.log_targeted_sleep_duration(round(start_time_s + self.loop_period_s - time.time(), 2))
                 time.sleep(start_time_s + self.loop_period_s - time.time())
             except Exception as e:
                 self.logger.log_could_not_sleep(duration_s=self.loop_period_s, e=e)
+        self.close() # Release the workers once stopped
+
+
+    def close(
+        self
+    ) -> None:
+        """Release the workers, connections, and files of the daemon.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+        self.partkey_manager.stop_generation_worker()
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+        if isinstance(self.algorand_client.client.algod, InstrumentedAlgodClient):
+            self.algorand_client.client.algod.close() # Release persistent connections
+        if self.state_store is not None:
+            self.state_store.close()
+        self.logger.flush()
+
+
+    def run_single_loop(
+        self,
+        start_time_s: float
+    ) -> AlgodStatus:
+        """Run a single loop of the daemon: check algod, service the contracts and partkeys, and log the loop.
+
+        Parameters
+        ----------
+        start_time_s : float
+            Time at which the loop started.
+
+        Returns
+        -------
+        AlgodStatus
+            Status of algod at the start of the loop.
+        """
+        if self.loop_deadline_s > 0:
+            self.loop_deadline_time_s = start_time_s + self.loop_deadline_s
+        # Check algod
+        algod_status = Daemon.check_algod_status(self.algorand_client)
+        self.round_context.reset(algod_status.status) # Reuse the fetched status within the loop
+        # If good, run daemon logic
+        if algod_status.is_ok:
+            self.logger.log_algod_ok_continuing()
+            self.logger.log_current_round(current_round=algod_status.last_round)
+            try:
+                self.maintain_contracts()        # Service valads and delcos
+            except Exception as e:
+                self.logger.log_generic_contract_servicing_error(e)
+            try:
+                self.partkey_manager.refresh()  # Manage partkeys
+            except Exception as e:
+                self.logger.log_generic_partkey_manager_error(e)
+            if self.claim_timer.has_time_window_elapsed() == True and \
+                not self.is_loop_deadline_exceeded():                               # Otherwise claim next loop.
+                self.claim_timer.reset_timer()                                      # Always reset timer.
+                try:                                                                # Wrap in try statement.
+                    self.claim_operational_fee()                                    # Claim operational fee.
+                except Exception as e:                                              # If the entire function fails.
+                    self.logger.log_generic_claim_operational_fee_error(e)          # Log generic error.
+        # If not, report critical
+        else:
+            self.logger.log_algod_error(algod_status.message)
+        self.logger.log_saved_algod_calls(
+            num_of_saved_calls=self.round_context.get_num_of_saved_calls(),
+            num_of_algod_calls=self.round_context.num_of_algod_calls
+        )
+        num_of_dropped = self.logger.get_num_of_dropped_messages()
+        if num_of_dropped > self.num_of_dropped_log_messages:
+            self.logger.log_dropped_log_messages(num_of_dropped=num_of_dropped - self.num_of_dropped_log_messages)
+            self.num_of_dropped_log_messages = num_of_dropped
+        self.save_state()
+        self.log_algod_requests()
+        loop_duration_s = time.time() - start_time_s
+        self.logger.log_single_loop_execution_time(round(loop_duration_s, 2))
+        self.update_loop_metrics(loop_duration_s, algod_status.is_ok)
+        return algod_status
+
+
+    def restore_state(
+        self
+    ) -> None:
+        """Restore the app wrappers and partkey buffers from the local state store.
+
+        Notes
+        -----
+        The app wrappers are only restored once their apps are added, while the dynamic state is still read from algod.
+        """
+        valad_static_fields_dict = self.state_store.load_static_fields('valad')
+        delco_static_fields_dict = self.state_store.load_static_fields('delco')
+        self.valad_app_list.restore_static_fields(valad_static_fields_dict)
+        self.delco_app_list.restore_static_fields(delco_static_fields_dict)
+        num_of_partkeys = self.partkey_manager.restore_buffers(*self.state_store.load_partkeys())
+        self.logger.log_state_restored(
+            num_of_valads=len(valad_static_fields_dict),
+            num_of_delcos=len(delco_static_fields_dict),
+            num_of_partkeys=num_of_partkeys,
+            state_path=self.state_store.state_path
+        )
+
+
+    def save_state(
+        self
+    ) -> None:
+        """Save the app wrappers and partkey buffers to the local state store if they changed.
+        """
+        if self.state_store is None:
+            return
+        try:
+            self.state_store.save_static_fields('valad', self.valad_app_list.get_static_fields_dict())
+            self.state_store.save_static_fields('delco', self.delco_app_list.get_static_fields_dict())
+            self.state_store.save_partkeys(*self.partkey_manager.get_buffer_state())
+        except Exception as e:
+            self.logger.log_state_save_error(state_path=self.state_store.state_path, e=e)
+
+
+    def log_algod_requests(
+        self
+    ) -> None:
+        """Log a summary of the algod requests made since the last call (i.e. in the last loop) and reset them.
+        """
+        algod_client = self.algorand_client.client.algod
+        if not isinstance(algod_client, InstrumentedAlgodClient):
+            return
+        endpoint_stats_dict = algod_client.pop_endpoint_stats()
+        total = InstrumentedAlgodClient.summarize_endpoint_stats(endpoint_stats_dict)
+        num_of_contracts = len(self.valad_app_list.get_app_list()) + len(self.delco_app_list.get_app_list())
+        self.metrics.set('algod_requests_per_loop', total.num_of_requests)
+        self.logger.log_algod_requests_in_loop(
+            num_of_requests=total.num_of_requests,
+            num_of_requests_per_contract=round(total.num_of_requests / max(1, num_of_contracts), 2),
+            num_of_bytes_received=total.num_of_bytes_received,
+            duration_s=round(total.duration_s, 3),
+            endpoint_stats=InstrumentedAlgodClient.format_endpoint_stats(endpoint_stats_dict)
+        )
+
+
+    def update_loop_metrics(
+        self,
+        duration_s: float,
+        is_algod_ok: bool
+    ) -> None:
+        """Record the metrics of a single loop.
+
+        Parameters
+        ----------
+        duration_s : float
+            Execution time of the loop in seconds.
+        is_algod_ok : bool
+            Flag whether algod was reachable in the loop.
+        """
+        self.metrics.observe('loop_duration_seconds', duration_s)
+        # Only loops driven by the period in seconds have a time budget (round-driven loops follow the blocks)
+        if self.loop_period_rounds == 0 and duration_s > self.loop_period_s:
+            self.metrics.inc('loop_overruns_total')
+            self.logger.log_loop_overrun(duration_s=round(duration_s, 2), loop_period_s=self.loop_period_s)
+        self.metrics.set('loop_period_seconds', self.loop_period_s)
+        self.metrics.set('algod_ok', int(is_algod_ok))
+        self.metrics.set('num_of_valads', len(self.valad_app_list.get_app_list()))
+        self.metrics.set('num_of_delcos', len(self.delco_app_list.get_app_list()))
+        self.metrics.set('partkey_buffer_pending', len(self.partkey_manager.buffer_pending))
+        self.metrics.set('partkey_buffer_generated', len(self.partkey_manager.buffer_generated))
+
+
+    def wait_for_round(
+        self,
+        target_round: int,
+        current_round: int
+    ) -> int:
+        """Block until algod reaches the target round or the daemon is stopped.
+
+        Notes
+        -----
+        Uses algod's wait-for-block-after endpoint, which returns as soon as a new block is available.
+
+        Parameters
+        ----------
+        target_round : int
+            Round to wait for.
+        current_round : int
+            Last known round.
+
+        Returns
+        -------
+        int
+            The last round reported by algod.
+        """
+        while current_round < target_round and not self.stop_flag:
+            current_round = self.algorand_client.client.algod.status_after_block(
+                current_round,
+                timeout=self.wait_for_block_timeout_s
+            )['last-round']
+        return current_round
 
 
     def stop(
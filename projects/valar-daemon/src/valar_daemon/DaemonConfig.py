@@ -1,5 +1,6 @@
 """Class definition for managing daemon config.
 """
+import copy
 import configparser
 from pathlib import Path
 
@@ -19,14 +20,47 @@ class DaemonConfig(object):
         Algod URL.
     algod_config_token : str, optional
         Algod token.
+    algod_connection_pool_size : int, optional
+        Maximal number of idle persistent (keep-alive) algod connections, by default 0 (new connection per request).
+    algod_timeout_s : float, optional
+        Algod request timeout in seconds, by default 30.
+    algod_max_retries : int, optional
+        Maximal number of retries of an idempotent algod request after a connection error, by default 0.
+    algod_retry_backoff_s : float, optional
+        Wait before the first algod request retry in seconds, doubled for each next retry, by default 0.5.
+    algod_record_path : str, optional
+        Directory to which the algod requests and responses are recorded, by default '' (not recorded).
+    algod_replay_path : str, optional
+        Recording from which the algod responses are replayed instead of reaching algod, by default '' (no replay).
     loop_period_s : int, optional
         Execution loop period in seconds, by default 3.
     claim_period_s : int, optional
         Earnings claim period in seconds.
+    max_workers : int, optional
+        Number of workers for servicing contracts concurrently, by default 1 (serial servicing).
+    loop_period_rounds : int, optional
+        Execution loop period in rounds, by default 0 (loop period in seconds applies instead).
+    loop_deadline_s : float, optional
+        Servicing budget of a loop in seconds, by default 0 (no deadline).
+    partkey_poll_period_s : float, optional
+        Period for polling partkey generation in the background, by default 0 (polled once per loop instead).
+    simulate_first : bool, optional
+        Simulate the unsigned reports and claims first and only submit the successful ones (one extra request per
+        submitted group), by default False.
+    metrics_port : int, optional
+        Local port of the metrics endpoint, by default 0 (metrics not served).
+    persist_state : bool, optional
+        Keep the app wrappers and partkey buffers in a local state file for fast restarts, by default False.
+    prefetch_max_concurrency : int, optional
+        Maximal number of concurrent app state reads of the prefetch engine (`PrefetchDaemon`), by default 16.
     max_log_file_size_B : str, optional
         Maximal size of individual log files in bytes.
     num_of_log_files_per_level : str, optional
         Number of log files for each log level.
+    min_log_level : int, optional
+        Minimal level of the logged messages (10 - debug to 50 - critical), by default 10 (everything is logged).
+    log_json : bool, optional
+        Additionally write the logs in the JSON-lines format, by default False.
     config_path : Path
         The config file location.
     config_filename : str
@@ -35,6 +69,10 @@ class DaemonConfig(object):
         Full path to the config, including the filename.
     swap_full_path : Path
         Full path to the swap, including the filename.
+    swap_stat : tuple
+        Modification time and size of the swap when last read (None if not yet read).
+    is_reload_requested : bool
+        Flag to read the swap regardless of its modification time and size (e.g. on SIGHUP).
 
     Methods
     -------
@@ -46,6 +84,12 @@ class DaemonConfig(object):
         Read the configuration file, updating the class' parameters.
     read_swap
         Read swap file, updating the class' parameters.
+    read_swap_if_changed
+        Read swap file only if it changed since it was last read, returning the changed settings.
+    request_reload
+        Read the swap file on the next check, regardless of whether it changed.
+    get_settings
+        Get a copy of the current settings.
     read
         Read daemon config file, updating the class' parameters.
     write
@@ -54,8 +98,38 @@ class DaemonConfig(object):
         Convert the claim period from hours to seconds.
     _convert_claim_period_from_seconds_to_hours_rounded
         Convert the claim period from seconds to hours and round the period.
+    _get_optional_option
+        Get an optional config option, falling back to a default value if not defined.
     """
 
+    SETTING_NAME_LIST = (
+        'validator_ad_id_list',
+        'validator_manager_mnemonic',
+        'algod_config_server',
+        'algod_config_token',
+        'algod_connection_pool_size',
+        'algod_timeout_s',
+        'algod_max_retries',
+        'algod_retry_backoff_s',
+        'algod_record_path',
+        'algod_replay_path',
+        'max_log_file_size_B',
+        'num_of_log_files_per_level',
+        'min_log_level',
+        'log_json',
+        'loop_period_s',
+        'claim_period_s',
+        'max_workers',
+        'loop_period_rounds',
+        'loop_deadline_s',
+        'partkey_poll_period_s',
+        'simulate_first',
+        'metrics_port',
+        'persist_state',
+        'prefetch_max_concurrency',
+    )
+    SECRET_SETTING_NAME_LIST = ('validator_manager_mnemonic', 'algod_config_token')
+
 
     def __init__(
         self,
@@ -76,12 +150,30 @@ class DaemonConfig(object):
         self.validator_manager_mnemonic = None
         self.algod_config_server = None
         self.algod_config_token = None
+        self.algod_connection_pool_size = None
+        self.algod_timeout_s = None
+        self.algod_max_retries = None
+        self.algod_retry_backoff_s = None
+        self.algod_record_path = None
+        self.algod_replay_path = None
         self.loop_period_s = None
         self.claim_period_s = None
+        self.max_workers = None
+        self.loop_period_rounds = None
+        self.loop_deadline_s = None
+        self.partkey_poll_period_s = None
+        self.simulate_first = None
+        self.metrics_port = None
+        self.persist_state = None
+        self.prefetch_max_concurrency = None
+        self.min_log_level = None
+        self.log_json = None
         self.config_path = config_path
         self.config_filename = config_filename
         self.config_full_path = Path(config_path, config_filename)
         self.swap_full_path = Path(config_path, self.get_swap_filename())
+        self.swap_stat = None
+        self.is_reload_requested = False
 
     
     def get_swap_filename(
@@ -128,9 +220,70 @@ class DaemonConfig(object):
         None | str
             Warning message if applicable.
         """
+        self.swap_stat = self._get_swap_stat() # Before reading, so that a concurrent edit is read on the next check
         return self.read(self.swap_full_path)
 
 
+    def read_swap_if_changed(
+        self
+    ) -> dict:
+        """Read swap file only if its modification time or size changed or if a reload is requested.
+
+        Returns
+        -------
+        dict
+            Previous and new value of each changed setting, indexed by the setting name (empty if none changed).
+        """
+        if self._get_swap_stat() == self.swap_stat and not self.is_reload_requested:
+            return dict()
+        self.is_reload_requested = False
+        settings_before = self.get_settings()
+        self.read_swap()
+        settings_after = self.get_settings()
+        return {
+            name: (settings_before[name], settings_after[name]) 
+            for name in self.SETTING_NAME_LIST if settings_before[name] != settings_after[name]
+        }
+
+
+    def request_reload(
+        self
+    ) -> None:
+        """Read the swap file on the next check, regardless of whether it changed (e.g. on SIGHUP).
+        """
+        self.is_reload_requested = True
+
+
+    def get_settings(
+        self
+    ) -> dict:
+        """Get a copy of the current settings.
+
+        Returns
+        -------
+        dict
+            Setting values, indexed by the setting name.
+        """
+        return {name: copy.copy(getattr(self, name, None)) for name in self.SETTING_NAME_LIST}
+
+
+    def _get_swap_stat(
+        self
+    ) -> tuple | None:
+        """Get the modification time and size of the swap file.
+
+        Returns
+        -------
+        tuple | None
+            Modification time in nanoseconds and size in bytes, None if the swap does not exist.
+        """
+        try:
+            swap_stat = self.swap_full_path.stat()
+        except FileNotFoundError:
+            return None
+        return (swap_stat.st_mtime_ns, swap_stat.st_size)
+
+
     def read(
         self,
         full_path: Path,
@@ -166,9 +319,17 @@ class DaemonConfig(object):
 
         self.algod_config_server = str(config.get('algo_client_config', 'algod_config_server'))
         self.algod_config_token = str(config.get('algo_client_config', 'algod_config_token'))
+        self.algod_connection_pool_size = max(0, self._get_optional_option(config, 'algo_client_config', 'algod_connection_pool_size', 0, int))
+        self.algod_timeout_s = self._get_optional_option(config, 'algo_client_config', 'algod_timeout_s', 30, float)
+        self.algod_max_retries = max(0, self._get_optional_option(config, 'algo_client_config', 'algod_max_retries', 0, int))
+        self.algod_retry_backoff_s = max(0, self._get_optional_option(config, 'algo_client_config', 'algod_retry_backoff_s', 0.5, float))
+        self.algod_record_path = self._get_optional_option(config, 'algo_client_config', 'algod_record_path', '', str).strip()
+        self.algod_replay_path = self._get_optional_option(config, 'algo_client_config', 'algod_replay_path', '', str).strip()
 
         self.max_log_file_size_B = int(eval(config.get('logging_config', 'max_log_file_size_B')))
         self.num_of_log_files_per_level = int(eval(config.get('logging_config', 'num_of_log_files_per_level')))
+        self.min_log_level = self._get_optional_option(config, 'logging_config', 'min_log_level', 10, int)
+        self.log_json = bool(self._get_optional_option(config, 'logging_config', 'log_json', 0, int))
 
         self.loop_period_s = int(config.get('runtime_config', 'loop_period_s'))
         # Check claim period and set to 1 week if not yet defined
@@ -178,6 +339,15 @@ class DaemonConfig(object):
             claim_period_h = 168
             config_read_warning = 'Daemon config does not include the claim period - setting it to 1 week.'
         self.claim_period_s = self._convert_claim_period_from_hours_to_seconds(claim_period_h)
+        # Optional parameters, which keep the default behavior when not defined
+        self.max_workers = max(1, self._get_optional_option(config, 'runtime_config', 'max_workers', 1, int))
+        self.loop_period_rounds = max(0, self._get_optional_option(config, 'runtime_config', 'loop_period_rounds', 0, int))
+        self.loop_deadline_s = max(0, self._get_optional_option(config, 'runtime_config', 'loop_deadline_s', 0, float))
+        self.partkey_poll_period_s = max(0, self._get_optional_option(config, 'runtime_config', 'partkey_poll_period_s', 0, float))
+        self.simulate_first = bool(self._get_optional_option(config, 'runtime_config', 'simulate_first', 0, int))
+        self.metrics_port = max(0, self._get_optional_option(config, 'runtime_config', 'metrics_port', 0, int))
+        self.persist_state = bool(self._get_optional_option(config, 'runtime_config', 'persist_state', 0, int))
+        self.prefetch_max_concurrency = max(1, self._get_optional_option(config, 'runtime_config', 'prefetch_max_concurrency', 16, int))
 
         return config_read_warning
 
@@ -245,16 +415,32 @@ class DaemonConfig(object):
         '\n' + \
         f'algod_config_server = {self.algod_config_server}' + '\n' + \
         f'algod_config_token = {self.algod_config_token}' + '\n' + \
+        f'algod_connection_pool_size = {self.algod_connection_pool_size}' + '\n' + \
+        f'algod_timeout_s = {self.algod_timeout_s}' + '\n' + \
+        f'algod_max_retries = {self.algod_max_retries}' + '\n' + \
+        f'algod_retry_backoff_s = {self.algod_retry_backoff_s}' + '\n' + \
+        f'algod_record_path = {self.algod_record_path}' + '\n' + \
+        f'algod_replay_path = {self.algod_replay_path}' + '\n' + \
         '\n\n' + \
         '[logging_config] #######################################################################################################' + '\n' + \
         '\n' + \
         f'max_log_file_size_B = {self.max_log_file_size_B}' + '\n' \
         f'num_of_log_files_per_level = {self.num_of_log_files_per_level}' + '\n' \
+        f'min_log_level = {self.min_log_level}' + '\n' \
+        f'log_json = {int(self.log_json)}' + '\n' \
         '\n\n' + \
         '[runtime_config] #######################################################################################################' + '\n' + \
         '\n' + \
         f'loop_period_s = {self.loop_period_s}' + '\n' + \
-        f'claim_period_h = {self._convert_claim_period_from_seconds_to_hours_rounded(self.claim_period_s)}' + '\n'
+        f'claim_period_h = {self._convert_claim_period_from_seconds_to_hours_rounded(self.claim_period_s)}' + '\n' + \
+        f'max_workers = {self.max_workers}' + '\n' + \
+        f'loop_period_rounds = {self.loop_period_rounds}' + '\n' + \
+        f'loop_deadline_s = {self.loop_deadline_s}' + '\n' + \
+        f'partkey_poll_period_s = {self.partkey_poll_period_s}' + '\n' + \
+        f'simulate_first = {int(self.simulate_first)}' + '\n' + \
+        f'metrics_port = {self.metrics_port}' + '\n' + \
+        f'persist_state = {int(self.persist_state)}' + '\n' + \
+        f'prefetch_max_concurrency = {self.prefetch_max_concurrency}' + '\n'
 
         with open(path_to_write, 'w') as f:
             f.write(config_content_string)
@@ -296,4 +482,36 @@ class DaemonConfig(object):
             Claim period in hours.
         """
         return max(1, int(round(claim_period_s / 3600)))
-    
\ No newline at end of file
+
+
+    @staticmethod
+    def _get_optional_option(
+        config: configparser.RawConfigParser,
+        section: str,
+        option: str,
+        default: object,
+        cast: type=str
+    ) -> object:
+        """Get an optional config option, falling back to a default value if not defined.
+
+        Parameters
+        ----------
+        config : configparser.RawConfigParser
+            Parsed config.
+        section : str
+            Config section.
+        option : str
+            Config option.
+        default : object
+            Value returned if the option is not defined.
+        cast : type, optional
+            Type to which the read value is converted, by default str.
+
+        Returns
+        -------
+        object
+            The option's value.
+        """
+        if config.has_option(section, option):
+            return cast(config.get(section, option))
+        return default
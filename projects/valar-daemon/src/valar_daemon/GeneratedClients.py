@@ -0,0 +1,45 @@
+"""Lazy access to the generated app clients, which are imported on first use instead of when the daemon starts.
+"""
+import importlib
+
+
+class LazyModule(object):
+    """Stand-in for a module that is imported on first attribute access.
+
+    Notes
+    -----
+    The generated clients embed their app specs and define many dataclasses, making them slow to import.
+    Accessed attributes are kept on the stand-in, so further accesses are plain attribute lookups.
+    Importing is thread-safe, since it goes through the import system (`importlib.import_module`).
+
+    Attributes
+    ----------
+    module_name : str
+        Full name of the module, e.g. `valar_daemon.ValidatorAdClient`.
+    """
+
+    def __init__(
+        self,
+        module_name: str
+    ):
+        """Initialize the stand-in without importing the module.
+
+        Parameters
+        ----------
+        module_name : str
+            Full name of the module.
+        """
+        self.module_name = module_name
+
+    def __getattr__(
+        self,
+        name: str
+    ) -> object:
+        value = getattr(importlib.import_module(self.module_name), name)
+        setattr(self, name, value)
+        return value
+
+
+valad_module = LazyModule('valar_daemon.ValidatorAdClient')
+delco_module = LazyModule('valar_daemon.DelegatorContractClient')
+notbd_module = LazyModule('valar_daemon.NoticeboardClient')
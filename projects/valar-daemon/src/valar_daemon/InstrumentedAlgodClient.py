@@ -0,0 +1,549 @@
+"""Algod client that records the count, size, and duration of its requests per endpoint.
+
+Optionally, the requests are sent over a pool of persistent (keep-alive) connections and retried on connection errors.
+"""
+import json
+import time
+import threading
+import http.client
+import urllib.error
+from urllib import parse
+from urllib.error import URLError
+from dataclasses import dataclass
+from urllib.request import Request, urlopen
+
+from algosdk import constants, error
+from algosdk.v2client.algod import AlgodClient, api_version_path_prefix
+
+from valar_daemon.Metrics import Metrics, get_algod_endpoint_label
+
+
+@dataclass
+class AlgodEndpointStats:
+    """Request statistics of a single algod endpoint.
+
+    Attributes
+    ----------
+    num_of_requests : int
+        Number of requests.
+    num_of_errors : int
+        Number of failed requests.
+    num_of_bytes_sent : int
+        Size of the request bodies in bytes.
+    num_of_bytes_received : int
+        Size of the response bodies in bytes.
+    duration_s : float
+        Combined duration of the requests in seconds.
+    """
+    num_of_requests: int = 0
+    num_of_errors: int = 0
+    num_of_bytes_sent: int = 0
+    num_of_bytes_received: int = 0
+    duration_s: float = 0.
+
+
+class AlgodConnectionPool(object):
+    """Pool of persistent (keep-alive) HTTP connections to a single algod.
+
+    Notes
+    -----
+    Idle connections are reused last-in-first-out, so that the fewest connections are kept open.
+    A reused connection may have been closed by algod in the meantime, in which case the request is repeated
+    on a new connection.
+    Only idempotent requests (GET) are repeated after any stale connection error, since a reset or broken connection
+    does not tell whether algod already processed the request.
+    Other requests (e.g. transaction submission) are only repeated if algod closed the connection without responding.
+
+    Attributes
+    ----------
+    max_num_of_idle : int
+        Maximal number of idle connections kept open.
+    idle_connection_list : list
+        Idle connections.
+    num_of_connections_opened : int
+        Number of opened connections.
+    """
+
+    STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+    IDEMPOTENT_METHODS = ('GET', 'HEAD')
+
+    def __init__(
+        self,
+        algod_address: str,
+        max_num_of_idle: int
+    ):
+        """Initialize the connection pool.
+
+        Parameters
+        ----------
+        algod_address : str
+            Algod URL, e.g. `http://localhost:4001`.
+        max_num_of_idle : int
+            Maximal number of idle connections kept open.
+        """
+        url = parse.urlsplit(algod_address)
+        self.connection_class = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+        self.host = url.hostname
+        self.port = url.port
+        self.base_path = url.path.rstrip('/')
+        self.max_num_of_idle = max_num_of_idle
+        self.lock = threading.Lock()
+        self.idle_connection_list = []
+        self.num_of_connections_opened = 0
+
+    def _acquire(
+        self,
+        timeout: float
+    ) -> tuple:
+        """Get an idle connection or open a new one.
+
+        Returns
+        -------
+        tuple
+            Connection and flag whether it was reused.
+        """
+        with self.lock:
+            connection = self.idle_connection_list.pop() if self.idle_connection_list else None
+            if connection is None:
+                self.num_of_connections_opened += 1
+        if connection is None:
+            return self.connection_class(self.host, self.port, timeout=timeout), False
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+        return connection, True
+
+    def _release(
+        self,
+        connection: http.client.HTTPConnection
+    ) -> None:
+        """Return a connection to the pool, closing it if the pool is full.
+        """
+        with self.lock:
+            if len(self.idle_connection_list) < self.max_num_of_idle:
+                self.idle_connection_list.append(connection)
+                return
+        connection.close()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: bytes,
+        headers: dict,
+        timeout: float
+    ) -> tuple:
+        """Send a request and read the response.
+
+        Parameters
+        ----------
+        method : str
+            Request method.
+        path : str
+            Request path, including the query.
+        body : bytes
+            Request body.
+        headers : dict
+            Request headers.
+        timeout : float
+            Connection and read timeout in seconds.
+
+        Returns
+        -------
+        tuple
+            Response status code and body.
+
+        Raises
+        ------
+        OSError
+            Connection error or timeout.
+        http.client.HTTPException
+            Malformed response.
+        """
+        while True:
+            connection, is_reused = self._acquire(timeout)
+            try:
+                connection.request(method, self.base_path + path, body=body, headers=headers)
+                response = connection.getresponse()
+                response_body = response.read()
+            except self.STALE_CONNECTION_ERRORS as e:
+                connection.close()
+                if is_reused and ( # Closed by algod while idle, repeat on a new connection if safe
+                    method in self.IDEMPOTENT_METHODS or isinstance(e, http.client.RemoteDisconnected)
+                ):
+                    continue
+                raise
+            except BaseException:
+                connection.close()
+                raise
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(connection)
+            return response.status, response_body
+
+    def close(self) -> None:
+        """Close all idle connections.
+        """
+        with self.lock:
+            idle_connection_list = self.idle_connection_list
+            self.idle_connection_list = []
+        for connection in idle_connection_list:
+            connection.close()
+
+
+class InstrumentedAlgodClient(AlgodClient):
+    """Drop-in algod client, recording the statistics of the requests made since the last reset (e.g. per loop).
+
+    Notes
+    -----
+    All `AlgodClient` endpoints go through `algod_request`, which is overridden to measure the requests.
+    The request handling follows `AlgodClient.algod_request`, except that the response body is read in full first,
+    in order to record its size.
+    The statistics are guarded by a lock, since the daemon's handlers can make requests from multiple worker threads.
+    If a connection pool size is given, the requests are sent over persistent connections instead of opening a new
+    connection per request (saves the TCP and TLS setup, especially when algod is remote).
+    Requests that fail due to a connection error are retried with an exponential backoff if they are idempotent (GET),
+    while the final connection error is raised as `URLError`, as done by `AlgodClient`.
+
+    Attributes
+    ----------
+    metrics : Metrics
+        Metrics registry, additionally recording the requests if set.
+    timeout_s : float
+        Default request timeout in seconds.
+    max_retries : int
+        Maximal number of retries of an idempotent request after a connection error.
+    retry_backoff_s : float
+        Wait before the first retry in seconds, doubled for each next retry.
+    connection_pool : AlgodConnectionPool
+        Pool of persistent connections (None if a new connection is opened per request).
+    endpoint_stats_dict : dict
+        Request statistics since the last reset, indexed by endpoint label (e.g. `GET /accounts/{address}`).
+    """
+
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        headers: dict=None,
+        metrics: Metrics=None,
+        timeout_s: float=30,
+        max_retries: int=0,
+        retry_backoff_s: float=0.5,
+        connection_pool_size: int=0
+    ):
+        """Initialize the instrumented algod client.
+
+        Parameters
+        ----------
+        algod_token : str
+            Algod API token.
+        algod_address : str
+            Algod URL.
+        headers : dict, optional
+            Extra headers for all requests, by default None.
+        metrics : Metrics, optional
+            Metrics registry, by default None.
+        timeout_s : float, optional
+            Default request timeout in seconds, by default 30 (as `AlgodClient`).
+        max_retries : int, optional
+            Maximal number of retries of an idempotent request after a connection error, by default 0.
+        retry_backoff_s : float, optional
+            Wait before the first retry in seconds, doubled for each next retry, by default 0.5.
+        connection_pool_size : int, optional
+            Maximal number of idle persistent connections, by default 0 (new connection per request).
+        """
+        super().__init__(algod_token, algod_address, headers)
+        self.metrics = metrics
+        self.timeout_s = timeout_s
+        self.max_retries = max_retries
+        self.retry_backoff_s = retry_backoff_s
+        self.connection_pool = None
+        if connection_pool_size > 0:
+            self.connection_pool = AlgodConnectionPool(algod_address, connection_pool_size)
+        self.lock = threading.Lock()
+        self.endpoint_stats_dict = dict()
+
+    def algod_request(
+        self,
+        method: str,
+        requrl: str,
+        params: dict=None,
+        data: bytes=None,
+        headers: dict=None,
+        response_format: str="json",
+        timeout: float=None
+    ) -> dict | bytes:
+        """Execute a request, recording its statistics.
+
+        Parameters
+        ----------
+        method : str
+            Request method.
+        requrl : str
+            Request URL path.
+        params : dict, optional
+            Request parameters, by default None.
+        data : bytes, optional
+            Request body, by default None.
+        headers : dict, optional
+            Additional request headers, by default None.
+        response_format : str, optional
+            Response format, by default "json".
+        timeout : float, optional
+            Request timeout in seconds, by default None (`timeout_s` applies).
+
+        Returns
+        -------
+        dict | bytes
+            Parsed JSON response or raw response body.
+
+        Raises
+        ------
+        AlgodHTTPError
+            Algod responded with an error.
+        URLError
+            Algod could not be reached, also after retrying.
+        """
+        endpoint = get_algod_endpoint_label(method, requrl)
+        timeout = self.timeout_s if timeout is None else timeout
+        num_of_bytes_received = 0
+        is_error = True
+        start_time_s = time.perf_counter()
+        try:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    body = self._send(method, requrl, params, data, headers, timeout)
+                    break
+                except URLError:
+                    if method != 'GET' or attempt >= self.max_retries: # Do not repeat e.g. transaction submission
+                        raise
+                    if self.metrics is not None:
+                        self.metrics.inc('algod_request_retries_total', endpoint=endpoint)
+                    time.sleep(self.retry_backoff_s * 2**attempt)
+            num_of_bytes_received = len(body)
+            is_error = False
+        finally:
+            self._record(
+                endpoint,
+                time.perf_counter() - start_time_s,
+                0 if data is None else len(data),
+                num_of_bytes_received,
+                is_error
+            )
+        if response_format != "json":
+            return body
+        if len(body) == 0: # Some algod responses return 200 OK with an empty body
+            return {}
+        try:
+            return json.loads(body)
+        except Exception as e:
+            raise error.AlgodResponseError("Failed to parse JSON response from algod") from e
+
+    def _send(
+        self,
+        method: str,
+        requrl: str,
+        params: dict,
+        data: bytes,
+        headers: dict,
+        timeout: float
+    ) -> bytes:
+        """Send a request and read the response body.
+
+        Returns
+        -------
+        bytes
+            Response body.
+
+        Raises
+        ------
+        AlgodHTTPError
+            Algod responded with an error.
+        URLError
+            Algod could not be reached.
+        """
+        header = {"User-Agent": "py-algorand-sdk"}
+        if self.headers:
+            header.update(self.headers)
+        if headers:
+            header.update(headers)
+        if requrl not in constants.no_auth:
+            header.update({constants.algod_auth_header: self.algod_token})
+        if requrl not in constants.unversioned_paths:
+            requrl = api_version_path_prefix + requrl
+        if params:
+            requrl = requrl + "?" + parse.urlencode(params)
+        status, body = self._transport(method, requrl, data, header, timeout)
+        if status >= 400:
+            raise_algod_http_error(status, body)
+        return body
+
+    def _transport(
+        self,
+        method: str,
+        requrl: str,
+        data: bytes,
+        header: dict,
+        timeout: float
+    ) -> tuple:
+        """Exchange a request with algod.
+
+        Parameters
+        ----------
+        method : str
+            Request method.
+        requrl : str
+            Request path, including the API version and query.
+        data : bytes
+            Request body.
+        header : dict
+            Request headers.
+        timeout : float
+            Request timeout in seconds.
+
+        Returns
+        -------
+        tuple
+            Response status code and body.
+
+        Raises
+        ------
+        URLError
+            Algod could not be reached.
+        """
+        if self.connection_pool is not None:
+            try:
+                return self.connection_pool.request(method, requrl, data, header, timeout)
+            except (OSError, http.client.HTTPException) as e:
+                raise URLError(e) # As raised by `urlopen`, which the daemon handles
+        request = Request(self.algod_address + requrl, headers=header, method=method, data=data)
+        try:
+            with urlopen(request, timeout=timeout) as response:
+                return response.status, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.read()
+
+    def _record(
+        self,
+        endpoint: str,
+        duration_s: float,
+        num_of_bytes_sent: int,
+        num_of_bytes_received: int,
+        is_error: bool
+    ) -> None:
+        """Add a request to the statistics and the metrics.
+        """
+        with self.lock:
+            endpoint_stats = self.endpoint_stats_dict.get(endpoint)
+            if endpoint_stats is None:
+                endpoint_stats = AlgodEndpointStats()
+                self.endpoint_stats_dict[endpoint] = endpoint_stats
+            endpoint_stats.num_of_requests += 1
+            endpoint_stats.num_of_errors += int(is_error)
+            endpoint_stats.num_of_bytes_sent += num_of_bytes_sent
+            endpoint_stats.num_of_bytes_received += num_of_bytes_received
+            endpoint_stats.duration_s += duration_s
+        if self.metrics is not None:
+            self.metrics.observe('algod_request_duration_seconds', duration_s, endpoint=endpoint)
+            self.metrics.inc('algod_response_bytes_total', num_of_bytes_received, endpoint=endpoint)
+            if is_error:
+                self.metrics.inc('algod_request_errors_total', endpoint=endpoint)
+
+    def close(self) -> None:
+        """Close the idle persistent connections, if any.
+        """
+        if self.connection_pool is not None:
+            self.connection_pool.close()
+
+    def pop_endpoint_stats(self) -> dict:
+        """Get the request statistics since the last call and reset them, e.g. at the end of a loop.
+
+        Returns
+        -------
+        dict
+            Request statistics, indexed by endpoint label.
+        """
+        with self.lock:
+            endpoint_stats_dict = self.endpoint_stats_dict
+            self.endpoint_stats_dict = dict()
+        return endpoint_stats_dict
+
+    @staticmethod
+    def summarize_endpoint_stats(
+        endpoint_stats_dict: dict
+    ) -> AlgodEndpointStats:
+        """Sum up the request statistics of all endpoints.
+
+        Parameters
+        ----------
+        endpoint_stats_dict : dict
+            Request statistics, indexed by endpoint label.
+
+        Returns
+        -------
+        AlgodEndpointStats
+            Combined request statistics.
+        """
+        total = AlgodEndpointStats()
+        for endpoint_stats in endpoint_stats_dict.values():
+            total.num_of_requests += endpoint_stats.num_of_requests
+            total.num_of_errors += endpoint_stats.num_of_errors
+            total.num_of_bytes_sent += endpoint_stats.num_of_bytes_sent
+            total.num_of_bytes_received += endpoint_stats.num_of_bytes_received
+            total.duration_s += endpoint_stats.duration_s
+        return total
+
+    @staticmethod
+    def format_endpoint_stats(
+        endpoint_stats_dict: dict
+    ) -> str:
+        """Format the per-endpoint request statistics as a single line, most requested endpoint first.
+
+        Parameters
+        ----------
+        endpoint_stats_dict : dict
+            Request statistics, indexed by endpoint label.
+
+        Returns
+        -------
+        str
+            Formatted as: '<endpoint>: <count>x, <bytes> B, <duration> s; ...'.
+        """
+        return '; '.join(
+            f'{endpoint}: {stats.num_of_requests}x, {stats.num_of_bytes_received} B, {round(stats.duration_s, 3)} s'
+            for endpoint, stats in sorted(
+                endpoint_stats_dict.items(),
+                key=lambda item: item[1].num_of_requests,
+                reverse=True
+            )
+        )
+
+
+def raise_algod_http_error(
+    code: int,
+    body: bytes
+) -> None:
+    """Raise the algod error response as `AlgodHTTPError`, taking the message from the JSON body if available.
+
+    Parameters
+    ----------
+    code : int
+        HTTP status code.
+    body : bytes
+        Response body.
+
+    Raises
+    ------
+    AlgodHTTPError
+    """
+    message = body.decode("utf-8")
+    data = None
+    try:
+        content = json.loads(message)
+        message = content["message"]
+        data = content.get("data")
+    except Exception:
+        pass
+    raise error.AlgodHTTPError(message, code, data)
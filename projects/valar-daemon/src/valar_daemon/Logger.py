@@ -1,11 +1,64 @@
 """Abstraction of the Daemon's logging functionality.
 """
 import os 
-import yaml
+import sys
+import json
+import queue
+import atexit
 import logging
-import inspect
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+from valar_daemon.log_messages import LOG_MESSAGE_TABLE
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking or failing when the queue is full.
+
+    Attributes
+    ----------
+    num_of_dropped : int
+        Number of records dropped due to a full queue.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.num_of_dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.num_of_dropped += 1 # Back-pressure: never block the servicing thread
+
+
+class LogListener(QueueListener):
+    """Queue listener that waits for space in the queue when stopping, instead of failing if it is full."""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formatter that writes each record as a single JSON object.
+
+    Notes
+    -----
+    Records of pre-defined messages carry the message key as the event ID and the message parameters as fields.
+    Parameters that are not natively JSON-serializable (e.g. exceptions) are written as strings.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps(
+            {
+                'time': record.created,
+                'level': record.levelno,
+                'event': getattr(record, 'event', None),
+                'fields': getattr(record, 'fields', {}),
+                'message': record.getMessage()
+            },
+            default=str
+        )
 
 
 class Logger():
@@ -16,18 +69,31 @@ class Logger():
     ERROR_LEVEL = 40
     CRITICAL_LEVEL = 50
 
+    DEFAULT_LOG_QUEUE_SIZE = 10_000
+
+    LOG_MESSAGE_SOURCE_PATH = str(Path(Path(__file__).parent, 'log_messages_source.yaml'))
+    LOG_MESSAGE_TABLE_PATH = str(Path(Path(__file__).parent, 'log_messages.py'))
+
+    _code_filename_cache = {} # Code object -> file name, resolved once per code object
+
     def __init__(
             self,
             log_dirpath: str,
             log_max_size_bytes: int,
             log_file_count: int,
             log_message_source_path: str=None,
+            log_queue_size: int=DEFAULT_LOG_QUEUE_SIZE,
+            min_log_level: int=DEBGUG_LEVEL,
+            log_json: bool=False,
         ):
         """Initialize logger, acting as a proxy for pre-defined messages and logs on different logging levels.
 
         Notes
         -----
         Creates a 5-level log, consisting of info, debug, warning, error, and critical.
+        Records are put on a bounded queue and written by a background listener, which routes each record to every
+        level file whose threshold it passes (e.g. a warning ends up in the debug, info, and warning files).
+        Records are dropped and counted if the queue is full, so that logging never blocks on disk I/O.
 
         Parameters
         ----------
@@ -38,66 +104,71 @@ class Logger():
         log_file_count : int
             Number of log files per log level (5 levels in total).
         log_message_source_path : str, optional
-            Path to the definitions of pre-defined log messages. Default is None (log in src/valar_daemon dir).
+            Path to the definitions of pre-defined log messages. Default is None (pre-parsed `LOG_MESSAGE_TABLE`).
+        log_queue_size : int, optional
+            Maximal number of records waiting to be written, by default `DEFAULT_LOG_QUEUE_SIZE`.
+        min_log_level : int, optional
+            Minimal level of the logged messages, by default `DEBGUG_LEVEL` (everything is logged).
+        log_json : bool, optional
+            Additionally write all records to a JSON-lines log in the `json` subdirectory, by default False.
         """
-        # Load in pre-defined messages
+        # Load in pre-defined messages, parsing the YAML source only if it is not the default one
         if log_message_source_path is None:
-            log_message_source_path = str(Path(Path(__file__).parent, 'log_messages_source.yaml'))
-        log_messages = Logger._fetch_log_messages(log_message_source_path)
+            log_messages = {key: dict(value) for key, value in LOG_MESSAGE_TABLE.items()}
+        else:
+            log_messages = Logger._fetch_log_messages(log_message_source_path)
         self.log_messages = Logger._strip_trailing_newline(log_messages)
+        self.min_log_level = min_log_level
+        # Pre-compile the pre-defined messages, resolving their level and template once
+        self.log_message_templates = self._compile_log_messages(self.log_messages)
 
         # Make logger master directory
         Logger.try_to_make_directory(log_dirpath)
 
-        # Make debug subdirectory and initialize debug logger
-        debug_log_dirpath = Path(log_dirpath, f'{self.DEBGUG_LEVEL}-debug')
-        Logger.try_to_make_directory(debug_log_dirpath)
-        self.debug_logger = self.create_logger(
-            debug_log_dirpath,
-            'debug', 
-            log_max_size_bytes,
-            log_file_count - 1 # If greater than 0, log backups are added
-        )
-
-        # Make info subdirectory and initialize info logger
-        info_log_dirpath = Path(log_dirpath, f'{self.INFO_LEVEL}-info')
-        Logger.try_to_make_directory(info_log_dirpath)
-        self.info_logger = self.create_logger(
-            info_log_dirpath,
-            'info', 
-            log_max_size_bytes,
-            log_file_count - 1 # If greater than 0, log backups are added
-        )
-
-        # Make warning subdirectory and initialize info warning
-        warning_log_dirpath = Path(log_dirpath, f'{self.WARNING_LEVEL}-warning')
-        Logger.try_to_make_directory(warning_log_dirpath)
-        self.warning_logger = self.create_logger(
-            warning_log_dirpath,
-            'warning', 
-            log_max_size_bytes,
-            log_file_count - 1 # If greater than 0, log backups are added
-        )
+        # Make a subdirectory and file handler for each level
+        self.file_handler_list = []
+        for level, logname in (
+            (self.DEBGUG_LEVEL, 'debug'),
+            (self.INFO_LEVEL, 'info'),
+            (self.WARNING_LEVEL, 'warning'),
+            (self.ERROR_LEVEL, 'error'),
+            (self.CRITICAL_LEVEL, 'critical'),
+        ):
+            level_log_dirpath = Path(log_dirpath, f'{level}-{logname}')
+            Logger.try_to_make_directory(level_log_dirpath)
+            self.file_handler_list.append(self.create_handler(
+                level_log_dirpath,
+                logname, 
+                level,
+                log_max_size_bytes,
+                log_file_count - 1 # If greater than 0, log backups are added
+            ))
+
+        # Optionally make a subdirectory and machine-parsable JSON-lines handler, receiving all records
+        if log_json:
+            json_log_dirpath = Path(log_dirpath, 'json')
+            Logger.try_to_make_directory(json_log_dirpath)
+            json_handler = self.create_handler(
+                json_log_dirpath,
+                'events',
+                self.DEBGUG_LEVEL,
+                log_max_size_bytes,
+                log_file_count - 1,
+                extension='jsonl'
+            )
+            json_handler.setFormatter(JsonLinesFormatter())
+            self.file_handler_list.append(json_handler)
 
-        # Make error subdirectory and initialize info error
-        error_log_dirpath = Path(log_dirpath, f'{self.ERROR_LEVEL}-error')
-        Logger.try_to_make_directory(error_log_dirpath)
-        self.error_logger = self.create_logger(
-            error_log_dirpath,
-            'error', 
-            log_max_size_bytes,
-            log_file_count - 1 # If greater than 0, log backups are added
-        )
+        # Hot path only puts the record on the queue (logger not registered globally, i.e. one per instance)
+        self.log_queue = queue.Queue(maxsize=log_queue_size)
+        self.queue_handler = BoundedQueueHandler(self.log_queue)
+        self.logger = logging.Logger(f'valar-daemon-{id(self)}', level=logging.DEBUG)
+        self.logger.addHandler(self.queue_handler)
 
-        # Make critical subdirectory and initialize info critical
-        critical_log_dirpath = Path(log_dirpath, f'{self.CRITICAL_LEVEL}-critical')
-        Logger.try_to_make_directory(critical_log_dirpath)
-        self.critical_logger = self.create_logger(
-            critical_log_dirpath,
-            'critical', 
-            log_max_size_bytes,
-            log_file_count - 1 # If greater than 0, log backups are added
-        )
+        # Background listener writes the records to the files
+        self.listener = LogListener(self.log_queue, *self.file_handler_list, respect_handler_level=True)
+        self.listener.start()
+        atexit.register(self.stop)
 
     ### Utilities ######################################################################################################
 
@@ -123,13 +194,15 @@ class Logger():
             raise e 
 
     @staticmethod
-    def create_logger(
+    def create_handler(
         log_dirpath: str,
         logname: str,
+        level: int,
         log_max_size_bytes: int,
-        log_file_count: int
-    ) -> logging.Logger:
-        """Create logger.
+        log_file_count: int,
+        extension: str='log'
+    ) -> RotatingFileHandler:
+        """Create a rotating file handler for a single level.
 
         Parameters
         ----------
@@ -137,40 +210,66 @@ class Logger():
             Path to where the logs will be produced.
         logname : str
             Name of the created log.
+        level : int
+            Minimal level of the records written to the log.
         log_max_size_bytes : int
             Maximal size of an individual file in bytes.
         log_file_count : int
             Number of log files per log level (5 levels in total).
+        extension : str, optional
+            Extension of the log file, by default 'log'.
 
         Returns
         -------
-        logging.Logger
-            The created logger.
+        RotatingFileHandler
+            The created handler.
         """
         # Create log file handler
         handler = RotatingFileHandler(
-            Path(log_dirpath, f'{logname}.log'), 
+            Path(log_dirpath, f'{logname}.{extension}'), 
             maxBytes=log_max_size_bytes, 
             backupCount=log_file_count
         )
-        # Set logging level - allow the logging of everything
-        handler.setLevel(logging.DEBUG)
+        # Set logging level - records below are not written to this file
+        handler.setLevel(level)
         # Set up the prefix of each message
         handler.setFormatter(logging.Formatter(
             '%(asctime)s - %(levelname)s - %(message)s'
         ))
-        # Create logger
-        logger = logging.getLogger(logname)
-        # Set log level once more, this time for the logger
-        logger.setLevel(logging.DEBUG)
-        # Connect the log file handler to the logger 
-        logger.addHandler(handler)
-        return logger
+        return handler
+
+    def flush(self):
+        """Wait until all queued records are written.
+        """
+        if self.listener._thread is not None: # Nothing would be written once stopped
+            self.log_queue.join()
+
+    def stop(self):
+        """Write the remaining records and stop the background listener.
+        """
+        atexit.unregister(self.stop) # Release the logger, e.g. when one is created per test
+        if self.listener._thread is not None:
+            self.listener.stop()
+        for handler in self.file_handler_list:
+            handler.close()
+
+    def get_num_of_dropped_messages(self) -> int:
+        """Get the number of records dropped due to a full queue.
+
+        Returns
+        -------
+        int
+        """
+        return self.queue_handler.num_of_dropped
         
     @staticmethod
     def _fetch_log_messages(log_message_source_path: str) -> dict:
         """Fetch the pre-defined log messages.
 
+        Notes
+        -----
+        PyYAML is imported only here, since the default messages are pre-parsed into `LOG_MESSAGE_TABLE`.
+
         Parameters
         ----------
         log_message_source_path : str
@@ -181,10 +280,40 @@ class Logger():
         dict
             Pre-defined log messages.
         """
+        import yaml
         log_file = Path(log_message_source_path)
         with log_file.open("r") as f:
             return yaml.safe_load(f)
-        
+
+    @staticmethod
+    def compile_log_message_table(
+        log_message_source_path: str=LOG_MESSAGE_SOURCE_PATH,
+        log_message_table_path: str=LOG_MESSAGE_TABLE_PATH
+    ) -> None:
+        """Parse the pre-defined log messages and write them as a Python module, which loads faster than the YAML.
+
+        Notes
+        -----
+        Has to be rerun after changing the YAML source, e.g. through `python -m valar_daemon.Logger`.
+
+        Parameters
+        ----------
+        log_message_source_path : str, optional
+            Path to the definitions of pre-defined log messages, by default `LOG_MESSAGE_SOURCE_PATH`.
+        log_message_table_path : str, optional
+            Path to the written module, by default `LOG_MESSAGE_TABLE_PATH`.
+        """
+        from pprint import pformat
+        log_messages = Logger._fetch_log_messages(log_message_source_path)
+        Path(log_message_table_path).write_text(
+            '"""Pre-parsed pre-defined log messages, generated from `log_messages_source.yaml`.\n'
+            '\n'
+            'Do not edit, instead rerun `python -m valar_daemon.Logger` after changing the YAML source.\n'
+            '"""\n'
+            '\n'
+            f'LOG_MESSAGE_TABLE = {pformat(log_messages, width=120, sort_dicts=False)}\n'
+        )
+
     @staticmethod
     def _strip_trailing_newline(log_messages: dict) -> dict:
         """Strip the pre-defined log messages of trailing `\n`, which are likely present, depending on user input.
@@ -204,6 +333,39 @@ class Logger():
             value['message'] = value['message'].rstrip("\n")
         return log_messages
 
+    def _compile_log_messages(self, log_messages: dict) -> dict:
+        """Pre-compile the pre-defined log messages for fast lookup when logging.
+
+        Parameters
+        ----------
+        log_messages : dict
+            Pre-defined log messages.
+
+        Returns
+        -------
+        dict
+            Tuple of the level, bound format method of the message, and the level's logging method for each message.
+
+        Raises
+        ------
+        ValueError
+            A message has an unsupported level.
+        """
+        log_at_level_dict = {
+            self.DEBGUG_LEVEL: self.debug,
+            self.INFO_LEVEL: self.info,
+            self.WARNING_LEVEL: self.warning,
+            self.ERROR_LEVEL: self.error,
+            self.CRITICAL_LEVEL: self.critical
+        }
+        log_message_templates = dict()
+        for key, value in log_messages.items():
+            level = int(value['level'])
+            if level not in log_at_level_dict:
+                raise ValueError(f'Log message {key} has unsupported level {level}.')
+            log_message_templates[key] = (level, value['message'].format, log_at_level_dict[level])
+        return log_message_templates
+
     @staticmethod
     def get_filename_and_lineno(call_stack_regression_levels: int=2) -> str:
         """Get the file name and line number string for prepending to log messages.
@@ -212,6 +374,8 @@ class Logger():
         -----
         Calling through pre-defined messages requires 4-level regression and through the `info` etc. 2-level.
         Would be simpler to always call bottom-most caller (const. level), but it changes behavior when when debugging.
+        Walks the frames directly instead of using `inspect.stack()`, which reads the source context of every frame.
+        The file name is resolved once per code object and cached.
 
         Parameters
         ----------
@@ -223,41 +387,42 @@ class Logger():
         str
             Format accoring to: '<file>:<line>'
         """
-        # caller_frame = inspect.currentframe().f_back.f_back
-        caller_frame = inspect.stack()[call_stack_regression_levels]
-        # filename = os.path.basename(caller_frame.f_code.co_filename)
-        filename = os.path.basename(caller_frame.filename)
-        # lineno = caller_frame.f_lineno
-        lineno = caller_frame.lineno
-        return f'{filename}:{lineno}'
+        caller_frame = sys._getframe(call_stack_regression_levels) # Same frame as `inspect.stack()[levels]`
+        code = caller_frame.f_code
+        filename = Logger._code_filename_cache.get(code, None)
+        if filename is None:
+            filename = os.path.basename(code.co_filename)
+            Logger._code_filename_cache[code] = filename
+        return f'{filename}:{caller_frame.f_lineno}'
 
 
     def _log(
             self, 
-            level: int, 
-            message: str, 
+            message_key: str, 
             **kwargs
         ):
-        """Proxy for logging a message at the corresponding level.
+        """Proxy for logging a pre-defined message at the corresponding level.
+
+        Notes
+        -----
+        Messages below the minimal level return after a single integer comparison, i.e. before the message is
+        formatted and the call site is looked up.
 
         Parameters
         ----------
-        level : int
-            The logging level.
-        message : str
-            Logged message.
+        message_key : str
+            Key of the pre-defined message.
+        **kwargs
+            Parameters of the pre-defined message.
         """
-        kwargs['call_stack_regression_levels'] = 5
-        if level == self.DEBGUG_LEVEL:
-            self.debug(message, **kwargs)
-        elif level == self.INFO_LEVEL:
-            self.info(message, **kwargs)
-        elif level == self.WARNING_LEVEL:
-            self.warning(message, **kwargs)
-        elif level == self.ERROR_LEVEL:
-            self.error(message, **kwargs)
-        elif level == self.CRITICAL_LEVEL:
-            self.critical(message, **kwargs)
+        level, format_message, log_at_level = self.log_message_templates[message_key]
+        if level < self.min_log_level:
+            return
+        log_at_level(
+            format_message(**kwargs),
+            call_stack_regression_levels=5,
+            extra={'event': message_key, 'fields': kwargs} # Picked up by the JSON-lines log
+        )
         
 
     ### Generic messaging ##############################################################################################
@@ -286,6 +451,7 @@ class Logger():
             self, 
             message: str, 
             append_filename_and_lineno: bool=True, 
+            extra: dict=None,
             **kwargs
         ):
         """Log a debug message.
@@ -296,16 +462,21 @@ class Logger():
             Logged message.
         append_filename_and_lineno : bool, optional
             Flag whether to append the file name and line number where the logger was called, by default True.
+        extra : dict, optional
+            Additional attributes of the log record (e.g. event ID and fields), by default None.
         """
+        if self.DEBGUG_LEVEL < self.min_log_level:
+            return
         if append_filename_and_lineno:
             message = Logger.prepend_filename_and_lineno_to_message(message, **kwargs)
-        self.debug_logger.debug(message)
+        self.logger.debug(message, extra=extra)
 
 
     def info(
             self, 
             message: str, 
             append_filename_and_lineno: bool=True, 
+            extra: dict=None,
             **kwargs
         ):
         """Log an info message.
@@ -316,17 +487,21 @@ class Logger():
             Logged message.
         append_filename_and_lineno : bool, optional
             Flag whether to append the file name and line number where the logger was called, by default True.
+        extra : dict, optional
+            Additional attributes of the log record (e.g. event ID and fields), by default None.
         """
+        if self.INFO_LEVEL < self.min_log_level:
+            return
         if append_filename_and_lineno:
             message = Logger.prepend_filename_and_lineno_to_message(message, **kwargs)
-        self.debug_logger.info(message)
-        self.info_logger.info(message)
+        self.logger.info(message, extra=extra)
 
 
     def warning(
             self, 
             message: str, 
             append_filename_and_lineno: bool=True, 
+            extra: dict=None,
             **kwargs
         ):
         """Log a warning message.
@@ -337,18 +512,21 @@ class Logger():
             Logged message.
         append_filename_and_lineno : bool, optional
             Flag whether to append the file name and line number where the logger was called, by default True.
+        extra : dict, optional
+            Additional attributes of the log record (e.g. event ID and fields), by default None.
         """
+        if self.WARNING_LEVEL < self.min_log_level:
+            return
         if append_filename_and_lineno:
             message = Logger.prepend_filename_and_lineno_to_message(message, **kwargs)
-        self.debug_logger.warning(message)
-        self.info_logger.warning(message)
-        self.warning_logger.warning(message)
+        self.logger.warning(message, extra=extra)
 
 
     def error(
             self, 
             message: str, 
             append_filename_and_lineno: bool=True, 
+            extra: dict=None,
             **kwargs
         ):
         """Log an error message.
@@ -359,19 +537,21 @@ class Logger():
             Logged message.
         append_filename_and_lineno : bool, optional
             Flag whether to append the file name and line number where the logger was called, by default True.
+        extra : dict, optional
+            Additional attributes of the log record (e.g. event ID and fields), by default None.
         """
+        if self.ERROR_LEVEL < self.min_log_level:
+            return
         if append_filename_and_lineno:
             message = Logger.prepend_filename_and_lineno_to_message(message, **kwargs)
-        self.debug_logger.error(message)
-        self.info_logger.error(message)
-        self.warning_logger.error(message)
-        self.error_logger.error(message)
+        self.logger.error(message, extra=extra)
 
 
     def critical(
             self, 
             message: str, 
             append_filename_and_lineno: bool=True, 
+            extra: dict=None,
             **kwargs
         ):
         """Log a critical message.
@@ -382,23 +562,20 @@ class Logger():
             Logged message.
         append_filename_and_lineno : bool, optional
             Flag whether to append the file name and line number where the logger was called, by default True.
+        extra : dict, optional
+            Additional attributes of the log record (e.g. event ID and fields), by default None.
         """
+        if self.CRITICAL_LEVEL < self.min_log_level:
+            return
         if append_filename_and_lineno:
             message = Logger.prepend_filename_and_lineno_to_message(message, **kwargs)
-        self.debug_logger.critical(message)
-        self.info_logger.critical(message)
-        self.warning_logger.critical(message)
-        self.error_logger.critical(message)
-        self.critical_logger.critical(message)
+        self.logger.critical(message, extra=extra)
 
 
     ### Pre-defined messaging ##########################################################################################
 
-    # def specific_log_message(self, par1, par2):
-    #     self._log(
-    #         self.log_messages["specific-log-message"]["level"],
-    #         self.log_messages["specific-log-message"]["message"].format(par1=par1, par2=par2)
-    #     )
+    # def log_specific_log_message(self, par1, par2):
+    #     self._log("specific_log_message", par1=par1, par2=par2)
 
 
     ############################################################################
@@ -409,10 +586,7 @@ class Logger():
         self,
         current_round: int
     ):
-        self._log(
-            self.log_messages["current_round"]["level"],
-            self.log_messages["current_round"]["message"].format(current_round=current_round)
-        )
+        self._log("current_round", current_round=current_round)
 
     ############################################################################
     ### Daemon #################################################################
@@ -422,409 +596,303 @@ class Logger():
         self,
         num_of_valads: int
     ):
-        self._log(
-            self.log_messages["maintaining_valads"]["level"],
-            self.log_messages["maintaining_valads"]["message"].format(num_of_valads=num_of_valads)
-        )
+        self._log("maintaining_valads", num_of_valads=num_of_valads)
 
     def log_state_of_valad_with_id(
         self,
         app_id: int,
         state: bytes
     ):
-        self._log(
-            self.log_messages["state_of_valad_with_id"]["level"],
-            self.log_messages["state_of_valad_with_id"]["message"].format(app_id=app_id, state=state)
-        )
+        self._log("state_of_valad_with_id", app_id=app_id, state=state)
 
     def log_set_valad_ready_attribute_error(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["set_valad_ready_attribute_error"]["level"],
-            self.log_messages["set_valad_ready_attribute_error"]["message"].format(app_id=app_id)
-        )
+        self._log("set_valad_ready_attribute_error", app_id=app_id)
 
     def log_maintaining_delcos(
         self,
         num_of_delcos: int
     ):
-        self._log(
-            self.log_messages["maintaining_delcos"]["level"],
-            self.log_messages["maintaining_delcos"]["message"].format(num_of_delcos=num_of_delcos)
-        )
+        self._log("maintaining_delcos", num_of_delcos=num_of_delcos)
 
     def log_unknown_delco_error(
         self,
         app_id: int,
         e: Exception
     ):
-        self._log(
-            self.log_messages["unknown_delco_error"]["level"],
-            self.log_messages["unknown_delco_error"]["message"].format(app_id=app_id, e=e)
-        )
+        self._log("unknown_delco_error", app_id=app_id, e=e)
 
     def log_removed_ended_or_deleted_delco(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["removed_ended_or_deleted_delco"]["level"],
-            self.log_messages["removed_ended_or_deleted_delco"]["message"].format(app_id=app_id)
-        )
+        self._log("removed_ended_or_deleted_delco", app_id=app_id)
 
     def log_state_of_delco_with_id(
         self,
         app_id: int,
         state: bytes
     ):
-        self._log(
-            self.log_messages["state_of_delco_with_id"]["level"],
-            self.log_messages["state_of_delco_with_id"]["message"].format(app_id=app_id, state=state)
-        )
+        self._log("state_of_delco_with_id", app_id=app_id, state=state)
 
     def log_unknown_delco_state(
         self,
         state: bytes
     ):
-        self._log(
-            self.log_messages["unknown_delco_state"]["level"],
-            self.log_messages["unknown_delco_state"]["message"].format(state=state)
-        )
+        self._log("unknown_delco_state", state=state)
 
     def log_delco_in_ready_handler(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["delco_in_ready_handler"]["level"],
-            self.log_messages["delco_in_ready_handler"]["message"].format(app_id=app_id)
-        )
+        self._log("delco_in_ready_handler", app_id=app_id)
 
     def log_urlerror_checking_partkey_generated(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["urlerror_checking_partkey_generated"]["level"],
-            self.log_messages["urlerror_checking_partkey_generated"]["message"].format(app_id=app_id)
-        )
+        self._log("urlerror_checking_partkey_generated", app_id=app_id)
 
     def log_partkeys_generated_for_delco(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["partkeys_generated_for_delco"]["level"],
-            self.log_messages["partkeys_generated_for_delco"]["message"].format(app_id=app_id)
-        )
+        self._log("partkeys_generated_for_delco", app_id=app_id)
 
     def log_delco_cannot_pay(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["delco_cannot_pay"]["level"],
-            self.log_messages["delco_cannot_pay"]["message"].format(app_id=app_id)
-        )
+        self._log("delco_cannot_pay", app_id=app_id)
 
     def log_attributeerror_cannot_pay(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["attributeerror_cannot_pay"]["level"],
-            self.log_messages["attributeerror_cannot_pay"]["message"].format(app_id=app_id)
-        )
+        self._log("attributeerror_cannot_pay", app_id=app_id)
 
     def log_logicerror_cannot_pay(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["logicerror_cannot_pay"]["level"],
-            self.log_messages["logicerror_cannot_pay"]["message"].format(app_id=app_id)
-        )
+        self._log("logicerror_cannot_pay", app_id=app_id)
 
     def log_httperror_cannot_pay(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["httperror_cannot_pay"]["level"],
-            self.log_messages["httperror_cannot_pay"]["message"].format(app_id=app_id)
-        )
+        self._log("httperror_cannot_pay", app_id=app_id)
 
     def log_partkeys_not_submitted(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["partkeys_not_submitted"]["level"],
-            self.log_messages["partkeys_not_submitted"]["message"].format(app_id=app_id)
-        )
+        self._log("partkeys_not_submitted", app_id=app_id)
 
     def log_attributeerror_partkeys_not_submitted(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["attributeerror_partkeys_not_submitted"]["level"],
-            self.log_messages["attributeerror_partkeys_not_submitted"]["message"].format(app_id=app_id)
-        )
+        self._log("attributeerror_partkeys_not_submitted", app_id=app_id)
 
     def log_logicerror_partkeys_not_submitted(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["logicerror_partkeys_not_submitted"]["level"],
-            self.log_messages["logicerror_partkeys_not_submitted"]["message"].format(app_id=app_id)
-        )
+        self._log("logicerror_partkeys_not_submitted", app_id=app_id)
 
     def log_httperror_partkeys_not_submitted(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["httperror_partkeys_not_submitted"]["level"],
-            self.log_messages["httperror_partkeys_not_submitted"]["message"].format(app_id=app_id)
-        )
+        self._log("httperror_partkeys_not_submitted", app_id=app_id)
 
     def log_partkey_params_submitted(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["partkey_params_submitted"]["level"],
-            self.log_messages["partkey_params_submitted"]["message"].format(app_id=app_id)
-        )
+        self._log("partkey_params_submitted", app_id=app_id)
 
     def log_attributeerror_partkey_submit(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["attributeerror_partkey_submit"]["level"],
-            self.log_messages["attributeerror_partkey_submit"]["message"].format(app_id=app_id)
-        )
+        self._log("attributeerror_partkey_submit", app_id=app_id)
 
     def log_urlerror_checking_partkey_pending(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["urlerror_checking_partkey_pending"]["level"],
-            self.log_messages["urlerror_checking_partkey_pending"]["message"].format(app_id=app_id)
-        )
+        self._log("urlerror_checking_partkey_pending", app_id=app_id)
 
     def log_partkey_generation_pending(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["partkey_generation_pending"]["level"],
-            self.log_messages["partkey_generation_pending"]["message"].format(app_id=app_id)
-        )
+        self._log("partkey_generation_pending", app_id=app_id)
 
     def log_requested_partkey_generation(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["requested_partkey_generation"]["level"],
-            self.log_messages["requested_partkey_generation"]["message"].format(app_id=app_id)
-        )
+        self._log("requested_partkey_generation", app_id=app_id)
 
     def log_partkey_generation_denied(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["partkey_generation_denied"]["level"],
-            self.log_messages["partkey_generation_denied"]["message"].format(app_id=app_id)
-        )
+        self._log("partkey_generation_denied", app_id=app_id)
 
     def log_partkeys_not_confirmed(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["partkeys_not_confirmed"]["level"],
-            self.log_messages["partkeys_not_confirmed"]["message"].format(app_id=app_id)
-        )
+        self._log("partkeys_not_confirmed", app_id=app_id)
 
     def log_attributeerror_partkeys_not_confirmed(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["attributeerror_partkeys_not_confirmed"]["level"],
-            self.log_messages["attributeerror_partkeys_not_confirmed"]["message"].format(app_id=app_id)
-        )
+        self._log("attributeerror_partkeys_not_confirmed", app_id=app_id)
 
     def log_logicerror_partkeys_not_confirmed(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["logicerror_partkeys_not_confirmed"]["level"],
-            self.log_messages["logicerror_partkeys_not_confirmed"]["message"].format(app_id=app_id)
-        )
+        self._log("logicerror_partkeys_not_confirmed", app_id=app_id)
 
     def log_httperror_partkeys_not_confirmed(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["httperror_partkeys_not_confirmed"]["level"],
-            self.log_messages["httperror_partkeys_not_confirmed"]["message"].format(app_id=app_id)
-        )
+        self._log("httperror_partkeys_not_confirmed", app_id=app_id)
 
     def log_delco_in_live_handler(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["delco_in_live_handler"]["level"],
-            self.log_messages["delco_in_live_handler"]["message"].format(app_id=app_id)
-        )
+        self._log("delco_in_live_handler", app_id=app_id)
+
+    def log_skipped_live_report(
+        self,
+        app_id: int,
+        report_name: str
+    ):
+        self._log("skipped_live_report", app_id=app_id, report_name=report_name)
+
+    def log_live_report_prediction_error(
+        self,
+        app_id: int,
+        report_name: str,
+        e: Exception
+    ):
+        self._log("live_report_prediction_error", app_id=app_id, report_name=report_name, e=e)
+
+    def log_batch_reported(
+        self,
+        num_of_delcos: int,
+        delco_id_list: list
+    ):
+        self._log("batch_reported", num_of_delcos=num_of_delcos, delco_id_list=delco_id_list)
+
+    def log_batch_report_failed(
+        self,
+        delco_id_list: list,
+        e: Exception
+    ):
+        self._log("batch_report_failed", delco_id_list=delco_id_list, e=e)
 
     def log_contract_expired(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["contract_expired"]["level"],
-            self.log_messages["contract_expired"]["message"].format(app_id=app_id)
-        )
+        self._log("contract_expired", app_id=app_id)
 
     def log_expired_attribute_error(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["expired_attribute_error"]["level"],
-            self.log_messages["expired_attribute_error"]["message"].format(app_id=app_id)
-        )
+        self._log("expired_attribute_error", app_id=app_id)
 
     def log_tried_contract_expired(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["tried_contract_expired"]["level"],
-            self.log_messages["tried_contract_expired"]["message"].format(app_id=app_id)
-        )
+        self._log("tried_contract_expired", app_id=app_id)
 
     def log_httperror_contract_expired(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["httperror_contract_expired"]["level"],
-            self.log_messages["httperror_contract_expired"]["message"].format(app_id=app_id)
-        )
+        self._log("httperror_contract_expired", app_id=app_id)
 
     def log_delco_expires_soon(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["delco_expires_soon"]["level"],
-            self.log_messages["delco_expires_soon"]["message"].format(app_id=app_id)
-        )
+        self._log("delco_expires_soon", app_id=app_id)
 
     def log_attributeerror_delco_expires_soon(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["attributeerror_delco_expires_soon"]["level"],
-            self.log_messages["attributeerror_delco_expires_soon"]["message"].format(app_id=app_id)
-        )
+        self._log("attributeerror_delco_expires_soon", app_id=app_id)
 
     def log_logicerror_delco_expires_soon(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["logicerror_delco_expires_soon"]["level"],
-            self.log_messages["logicerror_delco_expires_soon"]["message"].format(app_id=app_id)
-        )
+        self._log("logicerror_delco_expires_soon", app_id=app_id)
 
     def log_httperror_delco_expires_soon(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["httperror_delco_expires_soon"]["level"],
-            self.log_messages["httperror_delco_expires_soon"]["message"].format(app_id=app_id)
-        )
+        self._log("httperror_delco_expires_soon", app_id=app_id)
 
     def log_gating_or_stake_limit_breached(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["gating_or_stake_limit_breached"]["level"],
-            self.log_messages["gating_or_stake_limit_breached"]["message"].format(app_id=app_id)
-        )
+        self._log("gating_or_stake_limit_breached", app_id=app_id)
 
     def log_expired_attribute_error(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["expired_attribute_error"]["level"],
-            self.log_messages["expired_attribute_error"]["message"].format(app_id=app_id)
-        )
+        self._log("expired_attribute_error", app_id=app_id)
 
     def log_gating_or_stake_limit_breached(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["gating_or_stake_limit_breached"]["level"],
-            self.log_messages["gating_or_stake_limit_breached"]["message"].format(app_id=app_id)
-        )
+        self._log("gating_or_stake_limit_breached", app_id=app_id)
 
     def log_gating_or_stake_limit_breached_attribute_error(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["gating_or_stake_limit_breached_attribute_error"]["level"],
-            self.log_messages["gating_or_stake_limit_breached_attribute_error"]["message"].format(app_id=app_id)
-        )
+        self._log("gating_or_stake_limit_breached_attribute_error", app_id=app_id)
 
     def log_logicerror_gating_or_stake_limit_breached(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["logicerror_gating_or_stake_limit_breached"]["level"],
-            self.log_messages["logicerror_gating_or_stake_limit_breached"]["message"].format(app_id=app_id)
-        )
+        self._log("logicerror_gating_or_stake_limit_breached", app_id=app_id)
 
     def log_httperror_gating_or_stake_limit_breached(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["httperror_gating_or_stake_limit_breached"]["level"],
-            self.log_messages["httperror_gating_or_stake_limit_breached"]["message"].format(app_id=app_id)
-        )
+        self._log("httperror_gating_or_stake_limit_breached", app_id=app_id)
 
     def log_delco_in_ended_handler(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["delco_in_ended_handler"]["level"],
-            self.log_messages["delco_in_ended_handler"]["message"].format(app_id=app_id)
-        )
+        self._log("delco_in_ended_handler", app_id=app_id)
 
     def log_scheduled_partkey_deletion_for_ended_or_deleted(
         self,
@@ -833,238 +901,319 @@ class Logger():
         round_end: int
     ):
         self._log(
-            self.log_messages["scheduled_partkey_deletion_for_ended_or_deleted"]["level"],
-            self.log_messages["scheduled_partkey_deletion_for_ended_or_deleted"]["message"].format(
-                app_id=app_id,
-                scheduled_deletion=scheduled_deletion,
-                round_end=round_end
-            )
+            "scheduled_partkey_deletion_for_ended_or_deleted",
+            app_id=app_id,
+            scheduled_deletion=scheduled_deletion,
+            round_end=round_end
         )
 
     def log_no_partkeys_found_for_ended_or_deleted(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["no_partkeys_found_for_ended_or_deleted"]["level"],
-            self.log_messages["no_partkeys_found_for_ended_or_deleted"]["message"].format(app_id=app_id)
-        )
+        self._log("no_partkeys_found_for_ended_or_deleted", app_id=app_id)
 
     def log_delco_in_deleted_handler(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["delco_in_deleted_handler"]["level"],
-            self.log_messages["delco_in_deleted_handler"]["message"].format(app_id=app_id)
-        )
+        self._log("delco_in_deleted_handler", app_id=app_id)
 
     def log_num_of_valad_ids_found(
         self,
         num_of_valads: int
     ):
-        self._log(
-            self.log_messages["num_of_valad_ids_found"]["level"],
-            self.log_messages["num_of_valad_ids_found"]["message"].format(num_of_valads=num_of_valads)
-        )
+        self._log("num_of_valad_ids_found", num_of_valads=num_of_valads)
 
     def log_num_of_valad_clients_connected(
         self,
         num_of_valads: int
     ):
-        self._log(
-            self.log_messages["num_of_valad_clients_connected"]["level"],
-            self.log_messages["num_of_valad_clients_connected"]["message"].format(num_of_valads=num_of_valads)
-        )
+        self._log("num_of_valad_clients_connected", num_of_valads=num_of_valads)
 
     def log_num_of_updated_valads(
         self,
         num_of_updated_valads:int,
         num_of_valads: int
     ):
-        self._log(
-            self.log_messages["num_of_updated_valads"]["level"],
-            self.log_messages["num_of_updated_valads"]["message"].format(
-                num_of_updated_valads=num_of_updated_valads, 
-                num_of_valads=num_of_valads
-            )
-        )
+        self._log("num_of_updated_valads", num_of_updated_valads=num_of_updated_valads, num_of_valads=num_of_valads)
 
     def log_zero_valad_clients(
         self,
         valad_id_list: list
     ):
-        self._log(
-            self.log_messages["zero_valad_clients"]["level"],
-            self.log_messages["zero_valad_clients"]["message"].format(valad_id_list=valad_id_list)
-        )
+        self._log("zero_valad_clients", valad_id_list=valad_id_list)
 
     def log_zero_valad_clients(
         self,
         valad_id_list: list
     ):
-        self._log(
-            self.log_messages["zero_valad_clients"]["level"],
-            self.log_messages["zero_valad_clients"]["message"].format(valad_id_list=valad_id_list)
-        )
+        self._log("zero_valad_clients", valad_id_list=valad_id_list)
 
     def log_num_of_connected_delcos(
         self,
         num_of_delcos: int
     ):
-        self._log(
-            self.log_messages["num_of_connected_delcos"]["level"],
-            self.log_messages["num_of_connected_delcos"]["message"].format(num_of_delcos=num_of_delcos)
-        )
+        self._log("num_of_connected_delcos", num_of_delcos=num_of_delcos)
 
     def log_num_of_delco_clients_connected(
         self,
         num_of_delcos: int
     ):
-        self._log(
-            self.log_messages["num_of_delco_clients_connected"]["level"],
-            self.log_messages["num_of_delco_clients_connected"]["message"].format(num_of_delcos=num_of_delcos)
-        )
+        self._log("num_of_delco_clients_connected", num_of_delcos=num_of_delcos)
 
     def log_num_of_updated_delcos(
         self,
         num_of_updated_delcos:int,
         num_of_delcos: int
     ):
-        self._log(
-            self.log_messages["num_of_updated_delcos"]["level"],
-            self.log_messages["num_of_updated_delcos"]["message"].format(
-                num_of_updated_delcos=num_of_updated_delcos, 
-                num_of_delcos=num_of_delcos
-            )
-        )
+        self._log("num_of_updated_delcos", num_of_updated_delcos=num_of_updated_delcos, num_of_delcos=num_of_delcos)
 
     def log_algod_ok_continuing(
         self
     ):
-        self._log(
-            self.log_messages["algod_ok_continuing"]["level"],
-            self.log_messages["algod_ok_continuing"]["message"]
-        )
+        self._log("algod_ok_continuing")
 
     def log_generic_contract_servicing_error(
         self,
         e: Exception
     ):
-        self._log(
-            self.log_messages["generic_contract_servicing_error"]["level"],
-            self.log_messages["generic_contract_servicing_error"]["message"].format(e=e)
-        )
+        self._log("generic_contract_servicing_error", e=e)
 
     def log_generic_partkey_manager_error(
         self,
         e: Exception
     ):
-        self._log(
-            self.log_messages["generic_partkey_manager_error"]["level"],
-            self.log_messages["generic_partkey_manager_error"]["message"].format(e=e)
-        )
+        self._log("generic_partkey_manager_error", e=e)
 
     def log_algod_error(
         self,
         msg: int
     ):
-        self._log(
-            self.log_messages["algod_error"]["level"],
-            self.log_messages["algod_error"]["message"].format(msg=msg)
-        )
+        self._log("algod_error", msg=msg)
 
     def log_single_loop_execution_time(
         self,
         duration_s: float
     ):
-        self._log(
-            self.log_messages["single_loop_execution_time"]["level"],
-            self.log_messages["single_loop_execution_time"]["message"].format(duration_s=duration_s)
-        )
+        self._log("single_loop_execution_time", duration_s=duration_s)
 
     def log_targeted_sleep_duration(
         self,
         duration_s: float
+    ):
+        self._log("targeted_sleep_duration", duration_s=duration_s)
+
+    def log_valads_serviced(
+        self,
+        num_of_valads: int,
+        duration_s: float,
+        max_workers: int
+    ):
+        self._log("valads_serviced", num_of_valads=num_of_valads, duration_s=duration_s, max_workers=max_workers)
+
+    def log_delcos_serviced(
+        self,
+        num_of_delcos: int,
+        duration_s: float,
+        max_workers: int
+    ):
+        self._log("delcos_serviced", num_of_delcos=num_of_delcos, duration_s=duration_s, max_workers=max_workers)
+
+    def log_targeted_wait_round(
+        self,
+        target_round: int
+    ):
+        self._log("targeted_wait_round", target_round=target_round)
+
+    def log_saved_algod_calls(
+        self,
+        num_of_saved_calls: int,
+        num_of_algod_calls: int
+    ):
+        self._log("saved_algod_calls", num_of_saved_calls=num_of_saved_calls, num_of_algod_calls=num_of_algod_calls)
+
+    def log_saved_app_state_calls(
+        self,
+        num_of_saved_calls: int,
+        num_of_algod_calls: int
+    ):
+        self._log("saved_app_state_calls", num_of_saved_calls=num_of_saved_calls, num_of_algod_calls=num_of_algod_calls)
+
+    def log_prefetched_app_states(
+        self,
+        num_of_apps: int,
+        duration_s: float
+    ):
+        self._log("prefetched_app_states", num_of_apps=num_of_apps, duration_s=duration_s)
+
+    def log_delco_servicing_time(
+        self,
+        app_id: int,
+        duration_s: float
+    ):
+        self._log("delco_servicing_time", app_id=app_id, duration_s=duration_s)
+
+    def log_config_changed(
+        self,
+        changed_settings: str
+    ):
+        self._log("config_changed", changed_settings=changed_settings)
+
+    def log_removed_valads_from_config(
+        self,
+        valad_id_list: list
+    ):
+        self._log("removed_valads_from_config", valad_id_list=valad_id_list)
+
+    def log_config_change_requires_restart(
+        self,
+        setting_list: list
+    ):
+        self._log("config_change_requires_restart", setting_list=setting_list)
+
+    def log_loop_overrun(
+        self,
+        duration_s: float,
+        loop_period_s: float
+    ):
+        self._log("loop_overrun", duration_s=duration_s, loop_period_s=loop_period_s)
+
+    def log_deferred_apps_after_deadline(
+        self,
+        num_of_apps: int,
+        app_id_list: list
+    ):
+        self._log("deferred_apps_after_deadline", num_of_apps=num_of_apps, app_id_list=app_id_list)
+
+    def log_algod_requests_in_loop(
+        self,
+        num_of_requests: int,
+        num_of_requests_per_contract: float,
+        num_of_bytes_received: int,
+        duration_s: float,
+        endpoint_stats: str
     ):
         self._log(
-            self.log_messages["targeted_sleep_duration"]["level"],
-            self.log_messages["targeted_sleep_duration"]["message"].format(duration_s=duration_s)
+            "algod_requests_in_loop",
+            num_of_requests=num_of_requests,
+            num_of_requests_per_contract=num_of_requests_per_contract,
+            num_of_bytes_received=num_of_bytes_received,
+            duration_s=duration_s,
+            endpoint_stats=endpoint_stats
         )
 
-    def log_could_not_sleep(
+    def log_metrics_server_started(
         self,
-        duration_s: float,
+        port: int
+    ):
+        self._log("metrics_server_started", port=port)
+
+    def log_metrics_server_error(
+        self,
+        port: int,
         e: Exception
+    ):
+        self._log("metrics_server_error", port=port, e=e)
+
+    def log_state_restored(
+        self,
+        num_of_valads: int,
+        num_of_delcos: int,
+        num_of_partkeys: int,
+        state_path: str
     ):
         self._log(
-            self.log_messages["could_not_sleep"]["level"],
-            self.log_messages["could_not_sleep"]["message"].format(duration_s=duration_s, e=e)
+            "state_restored",
+            num_of_valads=num_of_valads,
+            num_of_delcos=num_of_delcos,
+            num_of_partkeys=num_of_partkeys,
+            state_path=state_path
         )
 
+    def log_state_store_error(
+        self,
+        state_path: str,
+        e: Exception
+    ):
+        self._log("state_store_error", state_path=state_path, e=e)
+
+    def log_state_save_error(
+        self,
+        state_path: str,
+        e: Exception
+    ):
+        self._log("state_save_error", state_path=state_path, e=e)
+
+    def log_dropped_log_messages(
+        self,
+        num_of_dropped: int
+    ):
+        self._log("dropped_log_messages", num_of_dropped=num_of_dropped)
+
+    def log_could_not_sleep(
+        self,
+        duration_s: float,
+        e: Exception
+    ):
+        self._log("could_not_sleep", duration_s=duration_s, e=e)
+
+    def log_could_not_wait_for_round(
+        self,
+        target_round: int,
+        e: Exception
+    ):
+        self._log("could_not_wait_for_round", target_round=target_round, e=e)
+
     def log_generic_claim_operational_fee_error(
         self,
         e: Exception
     ):
-        self._log(
-            self.log_messages["generic_claim_operational_fee_error"]["level"],
-            self.log_messages["generic_claim_operational_fee_error"]["message"].format(e=e)
-        )
+        self._log("generic_claim_operational_fee_error", e=e)
 
     def log_attributeerror_claim_operational_fee(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["attributeerror_claim_operational_fee"]["level"],
-            self.log_messages["attributeerror_claim_operational_fee"]["message"].format(app_id=app_id)
-        )
+        self._log("attributeerror_claim_operational_fee", app_id=app_id)
 
     def log_unknownerror_claim_operational_fee(
         self,
         app_id: int,
         e: Exception
     ):
-        self._log(
-            self.log_messages["unknownerror_claim_operational_fee"]["level"],
-            self.log_messages["unknownerror_claim_operational_fee"]["message"].format(app_id=app_id, e=e)
-        )
+        self._log("unknownerror_claim_operational_fee", app_id=app_id, e=e)
+
+    def log_simulation_failed_claim_operational_fee(
+        self,
+        app_id: int,
+        e: Exception
+    ):
+        self._log("simulation_failed_claim_operational_fee", app_id=app_id, e=e)
 
     def log_calling_claim_operational_fee(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["calling_claim_operational_fee"]["level"],
-            self.log_messages["calling_claim_operational_fee"]["message"].format(app_id=app_id)
-        )
+        self._log("calling_claim_operational_fee", app_id=app_id)
 
     def log_trying_to_claim_operational_fee(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["trying_to_claim_operational_fee"]["level"],
-            self.log_messages["trying_to_claim_operational_fee"]["message"].format(app_id=app_id)
-        )
+        self._log("trying_to_claim_operational_fee", app_id=app_id)
 
     def log_successfully_claimed_operational_fee(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["successfully_claimed_operational_fee"]["level"],
-            self.log_messages["successfully_claimed_operational_fee"]["message"].format(app_id=app_id)
-        )
+        self._log("successfully_claimed_operational_fee", app_id=app_id)
 
     def log_will_not_claim_operational_fee_of_not_live(
         self,
         app_id: int
     ):
-        self._log(
-            self.log_messages["will_not_claim_operational_fee_of_not_live"]["level"],
-            self.log_messages["will_not_claim_operational_fee_of_not_live"]["message"].format(app_id=app_id)
-        )
+        self._log("will_not_claim_operational_fee_of_not_live", app_id=app_id)
 
 
     ############################################################################
@@ -1077,14 +1226,7 @@ class Logger():
         errno: int,
         strerror=str
     ):
-        self._log(
-            self.log_messages["app_create_urlerror"]["level"],
-            self.log_messages["app_create_urlerror"]["message"].format(
-                app_id=app_id,
-                errno=errno,
-                strerror=strerror
-            )
-        )
+        self._log("app_create_urlerror", app_id=app_id, errno=errno, strerror=strerror)
 
     def log_app_create_algohttperror(
         self,
@@ -1092,34 +1234,21 @@ class Logger():
         errno: int,
         strerror=str
     ):
-        self._log(
-            self.log_messages["app_create_algohttperror"]["level"],
-            self.log_messages["app_create_algohttperror"]["message"].format(
-                app_id=app_id,
-                errno=errno,
-                strerror=strerror
-            )
-        )
+        self._log("app_create_algohttperror", app_id=app_id, errno=errno, strerror=strerror)
 
     def log_app_create_genericerror(
         self,
         app_id: float,
         e: Exception
     ):
-        self._log(
-            self.log_messages["app_create_genericerror"]["level"],
-            self.log_messages["app_create_genericerror"]["message"].format(app_id=app_id, e=e)
-        )
+        self._log("app_create_genericerror", app_id=app_id, e=e)
 
     def log_app_dynamic_update_genericerror(
         self,
         app_id: float,
         e: Exception
     ):
-        self._log(
-            self.log_messages["app_dynamic_update_genericerror"]["level"],
-            self.log_messages["app_dynamic_update_genericerror"]["message"].format(app_id=app_id, e=e)
-        )
+        self._log("app_dynamic_update_genericerror", app_id=app_id, e=e)
 
     ############################################################################
     ### Partkeymanager #########################################################
@@ -1132,12 +1261,10 @@ class Logger():
         vote_last_valid: int
     ):
         self._log(
-            self.log_messages["partkey_generation_request"]["level"],
-            self.log_messages["partkey_generation_request"]["message"].format(
-                address=address,
-                vote_first_valid=vote_first_valid,
-                vote_last_valid=vote_last_valid
-            )
+            "partkey_generation_request",
+            address=address,
+            vote_first_valid=vote_first_valid,
+            vote_last_valid=vote_last_valid
         )
     
     def log_generating_partkeys(
@@ -1147,70 +1274,51 @@ class Logger():
         vote_last_valid: int
     ):
         self._log(
-            self.log_messages["generating_partkeys"]["level"],
-            self.log_messages["generating_partkeys"]["message"].format(
-                address=address,
-                vote_first_valid=vote_first_valid,
-                vote_last_valid=vote_last_valid
-            )
+            "generating_partkeys",
+            address=address,
+            vote_first_valid=vote_first_valid,
+            vote_last_valid=vote_last_valid
         )
 
     def log_requested_partkey_in_past(
         self,
         num_of_keys: int
     ):
-        self._log(
-            self.log_messages["requested_partkey_in_past"]["level"],
-            self.log_messages["requested_partkey_in_past"]["message"].format(num_of_keys=num_of_keys)
-        )
+        self._log("requested_partkey_in_past", num_of_keys=num_of_keys)
 
     def log_pending_buffer_is_full(
         self,
         num_of_keys: int
     ):
-        self._log(
-            self.log_messages["pending_buffer_is_full"]["level"],
-            self.log_messages["pending_buffer_is_full"]["message"].format(num_of_keys=num_of_keys)
-        )
+        self._log("pending_buffer_is_full", num_of_keys=num_of_keys)
 
     def log_generated_buffer_is_full(
         self,
         num_of_keys: int
     ):
-        self._log(
-            self.log_messages["generated_buffer_is_full"]["level"],
-            self.log_messages["generated_buffer_is_full"]["message"].format(num_of_keys=num_of_keys)
-        )
+        self._log("generated_buffer_is_full", num_of_keys=num_of_keys)
 
     def log_requested_partkey_in_pending(
         self
     ):
-        self._log(
-            self.log_messages["requested_partkey_in_pending"]["level"],
-            self.log_messages["requested_partkey_in_pending"]["message"]
-        )
+        self._log("requested_partkey_in_pending")
 
     def log_requested_partkey_in_generated(
         self
     ):
-        self._log(
-            self.log_messages["requested_partkey_in_generated"]["level"],
-            self.log_messages["requested_partkey_in_generated"]["message"]
-        )
+        self._log("requested_partkey_in_generated")
 
     def log_partkey_generation_request_added(
         self
     ):
-        self._log(
-            self.log_messages["partkey_generation_request_added"]["level"],
-            self.log_messages["partkey_generation_request_added"]["message"]
-        )
+        self._log("partkey_generation_request_added")
 
     def log_generic_algod_error(
         self,
         e: Exception
     ):
-        self._log(
-            self.log_messages["generic_algod_error"]["level"],
-            self.log_messages["generic_algod_error"]["message"].format(e=e)
-        )
+        self._log("generic_algod_error", e=e)
+
+
+if __name__ == '__main__':
+    Logger.compile_log_message_table()
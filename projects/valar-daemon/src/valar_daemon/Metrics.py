@@ -0,0 +1,275 @@
+"""Daemon metrics, exported in the Prometheus text format over a local HTTP endpoint.
+"""
+import re
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class Metrics(object):
+    """Thread-safe registry of counters, gauges, and histograms.
+
+    Notes
+    -----
+    Each metric is identified by its name and labels, e.g. `observe('loop_duration_seconds', 1.2)`.
+    The names are prefixed when rendered (e.g. `valar_daemon_loop_duration_seconds`).
+
+    Attributes
+    ----------
+    prefix : str
+        Prefix of the rendered metric names.
+    buckets_s : tuple
+        Upper bounds of the histogram buckets in seconds.
+    counter_dict : dict
+        Counter values, indexed by name and labels.
+    gauge_dict : dict
+        Gauge values, indexed by name and labels.
+    histogram_dict : dict
+        Histogram bucket counts, sum, and count, indexed by name and labels.
+    """
+
+    DEFAULT_BUCKETS_S = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+    def __init__(
+        self,
+        prefix: str='valar_daemon',
+        buckets_s: tuple=DEFAULT_BUCKETS_S
+    ):
+        """Initialize the metrics registry.
+
+        Parameters
+        ----------
+        prefix : str, optional
+            Prefix of the rendered metric names, by default 'valar_daemon'.
+        buckets_s : tuple, optional
+            Upper bounds of the histogram buckets in seconds, by default `DEFAULT_BUCKETS_S`.
+        """
+        self.prefix = prefix
+        self.buckets_s = tuple(sorted(buckets_s))
+        self.lock = threading.Lock()
+        self.counter_dict = dict()
+        self.gauge_dict = dict()
+        self.histogram_dict = dict()
+
+    @staticmethod
+    def _get_key(name: str, labels: dict) -> tuple:
+        return (name, tuple(sorted(labels.items())))
+
+    def inc(
+        self,
+        name: str,
+        value: float=1,
+        **labels
+    ) -> None:
+        """Increment a counter.
+
+        Parameters
+        ----------
+        name : str
+            Metric name.
+        value : float, optional
+            Increment, by default 1.
+        """
+        key = Metrics._get_key(name, labels)
+        with self.lock:
+            self.counter_dict[key] = self.counter_dict.get(key, 0) + value
+
+    def set(
+        self,
+        name: str,
+        value: float,
+        **labels
+    ) -> None:
+        """Set a gauge.
+
+        Parameters
+        ----------
+        name : str
+            Metric name.
+        value : float
+            Value.
+        """
+        key = Metrics._get_key(name, labels)
+        with self.lock:
+            self.gauge_dict[key] = value
+
+    def observe(
+        self,
+        name: str,
+        value_s: float,
+        **labels
+    ) -> None:
+        """Add an observation (e.g. a duration) to a histogram.
+
+        Parameters
+        ----------
+        name : str
+            Metric name.
+        value_s : float
+            Observed value in seconds.
+        """
+        key = Metrics._get_key(name, labels)
+        bucket_index = bisect.bisect_left(self.buckets_s, value_s)
+        with self.lock:
+            histogram = self.histogram_dict.get(key)
+            if histogram is None:
+                histogram = [[0] * (len(self.buckets_s) + 1), 0., 0] # Bucket counts (last is +Inf), sum, count
+                self.histogram_dict[key] = histogram
+            histogram[0][bucket_index] += 1
+            histogram[1] += value_s
+            histogram[2] += 1
+
+    def get_histogram_count(
+        self,
+        name: str,
+        **labels
+    ) -> int:
+        """Get the number of observations in a histogram.
+
+        Parameters
+        ----------
+        name : str
+            Metric name.
+
+        Returns
+        -------
+        int
+            Number of observations, zero if none made.
+        """
+        with self.lock:
+            histogram = self.histogram_dict.get(Metrics._get_key(name, labels))
+            return 0 if histogram is None else histogram[2]
+
+    @staticmethod
+    def _format_labels(labels: tuple) -> str:
+        if not labels:
+            return ''
+        label_list = []
+        for label, value in labels:
+            value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            label_list.append(f'{label}="{value}"')
+        return '{' + ','.join(label_list) + '}'
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format.
+
+        Returns
+        -------
+        str
+            Rendered metrics.
+        """
+        line_list = []
+        with self.lock:
+            for metric_type, metric_dict in (('counter', self.counter_dict), ('gauge', self.gauge_dict)):
+                for name in sorted(set(name for name, _ in metric_dict)):
+                    line_list.append(f'# TYPE {self.prefix}_{name} {metric_type}')
+                    for (key_name, labels), value in sorted(metric_dict.items(), key=str):
+                        if key_name == name:
+                            line_list.append(f'{self.prefix}_{name}{Metrics._format_labels(labels)} {value}')
+            for name in sorted(set(name for name, _ in self.histogram_dict)):
+                line_list.append(f'# TYPE {self.prefix}_{name} histogram')
+                for (key_name, labels), (bucket_counts, total, count) in sorted(self.histogram_dict.items(), key=str):
+                    if key_name != name:
+                        continue
+                    cumulative_count = 0
+                    for upper_bound, bucket_count in zip(self.buckets_s + ('+Inf',), bucket_counts):
+                        cumulative_count += bucket_count
+                        bucket_labels = Metrics._format_labels(labels + (('le', upper_bound),))
+                        line_list.append(f'{self.prefix}_{name}_bucket{bucket_labels} {cumulative_count}')
+                    line_list.append(f'{self.prefix}_{name}_sum{Metrics._format_labels(labels)} {total}')
+                    line_list.append(f'{self.prefix}_{name}_count{Metrics._format_labels(labels)} {count}')
+        return '\n'.join(line_list) + '\n'
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    """Serve the metrics of the server's registry at `/metrics`.
+    """
+
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = self.server.metrics.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass # Do not write scrapes to stderr
+
+
+class MetricsServer(object):
+    """Local HTTP endpoint exporting the metrics, served from a background thread.
+    """
+
+    def __init__(
+        self,
+        metrics: Metrics,
+        port: int,
+        host: str='127.0.0.1'
+    ):
+        """Initialize the metrics server.
+
+        Parameters
+        ----------
+        metrics : Metrics
+            Exported metrics.
+        port : int
+            Port of the endpoint (0 picks a free port).
+        host : str, optional
+            Interface of the endpoint, by default '127.0.0.1' (local access only).
+        """
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self.server = None
+        self.thread = None
+
+    def start(self) -> None:
+        """Start serving in a background thread.
+        """
+        self.server = ThreadingHTTPServer((self.host, self.port), MetricsRequestHandler)
+        self.server.daemon_threads = True
+        self.server.metrics = self.metrics
+        self.port = self.server.server_address[1] # Resolve the port if picked by the OS
+        self.thread = threading.Thread(
+            target=self.server.serve_forever,
+            name='valar-daemon-metrics',
+            daemon=True
+        )
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and release the port.
+        """
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+            self.thread = None
+
+
+def get_algod_endpoint_label(
+    method: str,
+    requrl: str
+) -> str:
+    """Get the endpoint label of an algod request, replacing addresses and numbers with placeholders.
+
+    Parameters
+    ----------
+    method : str
+        Request method.
+    requrl : str
+        Request URL path, e.g. `/accounts/<address>`.
+
+    Returns
+    -------
+    str
+        Endpoint label, e.g. `GET /accounts/{address}`.
+    """
+    path = re.sub(r'/[A-Z2-7]{58}(?=/|$)', '/{address}', requrl.split('?')[0])
+    path = re.sub(r'/\d+(?=/|$)', '/{id}', path)
+    return f'{method} {path}'
+
@@ -5,12 +5,18 @@ Potential danger points:
 - General algod API changes (paths, parameters, behavior).
 """
 import time
+import heapq
+import itertools
+import threading
+from collections import OrderedDict
 from typing import Tuple, List, Dict
 
 from algokit_utils.beta.algorand_client import AlgorandClient
 from algosdk.error import AlgodHTTPError
 
 from valar_daemon.Logger import Logger
+from valar_daemon.RoundContext import RoundContext
+from valar_daemon.Metrics import Metrics
 
 
 """Return values when requesting partkey generation/
@@ -89,18 +95,71 @@ def create_partkey_dict(
 
 class PartkeyBuffer(object):
     """Buffer housing participation key information.
+
+    Notes
+    -----
+    Partkeys are kept in insertion (FIFO) order and indexed by their address, first round, and last round.
+    Adding a partkey that is already in the buffer updates the existing entry in place.
+    Scheduled deletions can additionally be tracked in a min-heap, so that due partkeys are found without a full scan.
+    Removed and rescheduled partkeys leave stale heap entries, which are dropped once they outnumber the live ones.
+    Access by partkey index is O(1) and popping the oldest partkey O(1), while positional access is O(n).
     """
 
-    def __init__(self, max_num_of_keys: int=50):
+    def __init__(
+        self,
+        max_num_of_keys: int=50,
+        track_deletion: bool=False
+    ):
         """Initialize a partkey buffer.
 
         Parameters
         ----------
         max_num_of_keys : int, optional
             Maximum number of keys stored in the buffer, by default 50.
+        track_deletion : bool, optional
+            Track the scheduled deletions for `pop_partkeys_due_for_deletion`, by default False.
         """
         self.max_num_of_keys = max_num_of_keys
-        self.partkeys = []
+        self.track_deletion = track_deletion
+        self.partkey_dict = OrderedDict() # Partkeys, indexed by address, first and last round
+        self.deletion_heap = [] # Entries of scheduled deletion round, sequence number, and partkey index
+        self.deletion_seq = dict() # Sequence number of the latest heap entry for each partkey index
+        self.deletion_counter = itertools.count()
+
+    def __len__(self) -> int:
+        """Number of partkeys in the buffer.
+        """
+        return len(self.partkey_dict)
+
+    @property
+    def partkeys(self) -> list:
+        """List of the participation keys in FIFO order.
+        """
+        return list(self.partkey_dict.values())
+
+    @staticmethod
+    def get_partkey_index(
+        address: str,
+        vote_first_valid: int,
+        vote_last_valid: int
+    ) -> Tuple[str, int, int]:
+        """Get the index under which the partkey is stored.
+
+        Parameters
+        ----------
+        address : str
+            Address of participating entity.
+        vote_first_valid : int
+            First round when the partkeys are valid.
+        vote_last_valid : int
+            Last round when the partkeys are valid.
+
+        Returns
+        -------
+        Tuple[str, int, int]
+            Partkey index.
+        """
+        return (address, vote_first_valid, vote_last_valid)
 
     def is_full(self) -> bool:
         """Check if partkey buffer is full.
@@ -110,7 +169,7 @@ class PartkeyBuffer(object):
         bool
             True if full.
         """
-        return len(self.partkeys) >= self.max_num_of_keys
+        return len(self.partkey_dict) >= self.max_num_of_keys
         
     def add_partkey_to_buffer(            
         self,
@@ -147,8 +206,9 @@ class PartkeyBuffer(object):
         scheduled_deletion : int, optional
             Round at which key will be deleted, by default None
         """
-        if self.is_full():
-            raise RuntimeError(f'Partkey buffer is full ({len(self.partkeys)} partkeys present).')
+        partkey_index = self.get_partkey_index(address, vote_first_valid, vote_last_valid)
+        if partkey_index not in self.partkey_dict and self.is_full():
+            raise RuntimeError(f'Partkey buffer is full ({len(self.partkey_dict)} partkeys present).')
         partkey = create_partkey_dict(
             address=address,
             vote_first_valid=vote_first_valid,
@@ -160,25 +220,62 @@ class PartkeyBuffer(object):
             id=id,
             scheduled_deletion=scheduled_deletion
         )
-        self.partkeys.append(partkey)
+        self.partkey_dict[partkey_index] = partkey
+        self._track_scheduled_deletion(partkey_index, scheduled_deletion)
     
     def pop_partkey_from_buffer(
         self,
         idx: int=0
     ) -> dict:
-        """Pop oldest entry.
+        """Pop entry at the given position, by default the oldest one.
+
+        Notes
+        -----
+        Popping the oldest entry is O(1), while other positions are O(n).
 
         Parameters
         ----------
         idx : int, optional
-            _description_, by default 0
+            Position of the entry in FIFO order, by default 0
+
+        Returns
+        -------
+        dict
+            Partkey info.
+        """
+        if idx == 0 and not self.is_empty():
+            partkey_index, partkey = self.partkey_dict.popitem(last=False)
+        else:
+            partkey_index = list(self.partkey_dict.keys())[idx]
+            partkey = self.partkey_dict.pop(partkey_index)
+        self._untrack_scheduled_deletion(partkey_index)
+        return partkey
+
+    def remove_partkey_from_buffer(
+        self,
+        address: str,
+        vote_first_valid: int,
+        vote_last_valid: int
+    ) -> dict:
+        """Remove the partkey from the buffer.
+
+        Parameters
+        ----------
+        address : str
+            Address of participating entity.
+        vote_first_valid : int
+            First round when the partkeys are valid.
+        vote_last_valid : int
+            Last round when the partkeys are valid.
 
         Returns
         -------
         dict
-            _description_
+            Partkey info. None if the partkey is not in the buffer.
         """
-        return self.partkeys.pop(idx)
+        partkey_index = self.get_partkey_index(address, vote_first_valid, vote_last_valid)
+        self._untrack_scheduled_deletion(partkey_index)
+        return self.partkey_dict.pop(partkey_index, None)
 
     def get_next(
         self
@@ -193,7 +290,7 @@ class PartkeyBuffer(object):
         if self.is_empty():
             return None
         else:
-            return self.partkeys[0]
+            return next(iter(self.partkey_dict.values()))
 
     def is_empty(
         self
@@ -205,7 +302,7 @@ class PartkeyBuffer(object):
         bool
             Flag on emptiness of buffer.
         """
-        if len(self.partkeys) == 0:
+        if len(self.partkey_dict) == 0:
             return True
         else: 
             return False
@@ -226,22 +323,12 @@ class PartkeyBuffer(object):
             First round when the partkeys are valid.
         vote_last_valid : int
             Last round when the partkeys are valid.
-        checked_buffer : List[dict]
-            The buffer that is checked.
 
         Returns
         -------
         bool
         """
-        if len(self.partkeys) > 0:
-            for entry in self.partkeys:
-                if all([
-                    entry['address'] == address,
-                    entry['vote-first-valid'] == vote_first_valid,
-                    entry['vote-last-valid'] == vote_last_valid
-                ]):
-                    return True
-        return False
+        return self.get_partkey_index(address, vote_first_valid, vote_last_valid) in self.partkey_dict
                     
     def return_partkeys(
             self
@@ -261,7 +348,11 @@ class PartkeyBuffer(object):
         vote_first_valid: int,
         vote_last_valid: int,
     ) -> int:
-        """Get the index of a partkey in the buffer.
+        """Get the index (position in FIFO order) of a partkey in the buffer.
+
+        Notes
+        -----
+        O(n), since the position is not stored. Prefer the access by address, first and last round.
 
         Parameters
         ----------
@@ -282,18 +373,8 @@ class PartkeyBuffer(object):
         RuntimeError
             Cannot find partkey with ID
         """
-        for idx, entry in enumerate(self.partkeys):
-            if all([
-                entry['address'] == address,
-                entry['vote-first-valid'] == vote_first_valid,
-                entry['vote-last-valid'] == vote_last_valid
-            ]):
-                return idx
-        raise RuntimeError(
-            f'Cannot find partkey with ' + \
-            f'first round {entry["vote-first-valid"]} and last round {entry["vote-last-valid"]} ' + \
-            f'for address {address} in buffer.'
-        )
+        partkey_index = self._get_existing_partkey_index(address, vote_first_valid, vote_last_valid)
+        return list(self.partkey_dict.keys()).index(partkey_index)
     
     def update_partkey_scheduled_deletion(
         self,
@@ -320,32 +401,154 @@ class PartkeyBuffer(object):
         Tuple(str, int)
             Confirmation of the ID and scheduled deletion round.
         """
-        idx = self.get_index_of_partkey_in_buffer(
-            address=address,
-            vote_first_valid=vote_first_valid,
-            vote_last_valid=vote_last_valid,
-        )
-        self.partkeys[idx]['scheduled-deletion'] = scheduled_deletion
-        return (self.partkeys[idx]['id'], self.partkeys[idx]['scheduled-deletion'])
+        partkey_index = self._get_existing_partkey_index(address, vote_first_valid, vote_last_valid)
+        partkey = self.partkey_dict[partkey_index]
+        partkey['scheduled-deletion'] = scheduled_deletion
+        self._track_scheduled_deletion(partkey_index, scheduled_deletion)
+        return (partkey['id'], partkey['scheduled-deletion'])
+
+    def pop_partkeys_due_for_deletion(
+        self,
+        current_round: int
+    ) -> List[dict]:
+        """Pop the partkeys whose scheduled deletion round has passed from the deletion schedule.
+
+        Notes
+        -----
+        The partkeys remain in the buffer, they are only no longer scheduled for deletion.
+        Only available if the buffer tracks the scheduled deletions.
+
+        Parameters
+        ----------
+        current_round : int
+            Current round.
+
+        Returns
+        -------
+        List[dict]
+            Partkeys due for deletion, earliest first.
+        """
+        due_partkeys = []
+        while len(self.deletion_heap) > 0 and self.deletion_heap[0][0] < current_round:
+            _, seq, partkey_index = heapq.heappop(self.deletion_heap)
+            if self.deletion_seq.get(partkey_index, None) == seq: # Skip removed or rescheduled entries
+                del self.deletion_seq[partkey_index]
+                due_partkeys.append(self.partkey_dict[partkey_index])
+        return due_partkeys
+
+    def _get_existing_partkey_index(
+        self,
+        address: str,
+        vote_first_valid: int,
+        vote_last_valid: int
+    ) -> Tuple[str, int, int]:
+        """Get the index of a partkey and raise an error if it is not in the buffer.
+        """
+        partkey_index = self.get_partkey_index(address, vote_first_valid, vote_last_valid)
+        if partkey_index not in self.partkey_dict:
+            raise RuntimeError(
+                f'Cannot find partkey with ' + \
+                f'first round {vote_first_valid} and last round {vote_last_valid} ' + \
+                f'for address {address} in buffer.'
+            )
+        return partkey_index
+
+    def _track_scheduled_deletion(
+        self,
+        partkey_index: Tuple[str, int, int],
+        scheduled_deletion: int
+    ) -> None:
+        """Add the partkey to the deletion schedule, superseding any previous entry.
+        """
+        if not self.track_deletion:
+            return
+        if scheduled_deletion is None:
+            self._untrack_scheduled_deletion(partkey_index)
+            return
+        seq = next(self.deletion_counter)
+        self.deletion_seq[partkey_index] = seq
+        heapq.heappush(self.deletion_heap, (scheduled_deletion, seq, partkey_index))
+        self._compact_deletion_heap()
+
+    def _untrack_scheduled_deletion(
+        self,
+        partkey_index: Tuple[str, int, int]
+    ) -> None:
+        """Remove the partkey from the deletion schedule, leaving a stale heap entry until compaction.
+        """
+        if self.deletion_seq.pop(partkey_index, None) is not None:
+            self._compact_deletion_heap()
+
+    def _compact_deletion_heap(self) -> None:
+        """Rebuild the deletion heap from the live entries once the stale entries outnumber them.
+        """
+        if len(self.deletion_heap) <= 2 * len(self.deletion_seq):
+            return
+        self.deletion_heap = [
+            entry for entry in self.deletion_heap if self.deletion_seq.get(entry[2], None) == entry[1]
+        ]
+        heapq.heapify(self.deletion_heap)
 
 
 class PartkeyManager(object):
     """Participation key manager.
+
+    Notes
+    -----
+    The buffers are guarded by a lock, since the daemon's handlers can request keys from multiple worker threads.
+    The node's partkeys are fetched once and indexed, since the handlers check them repeatedly within a loop.
+    The snapshot is invalidated on each refresh (once per daemon loop), when generating keys, and periodically while
+    waiting on a generation, while deleted keys are dropped from it directly.
+    Pending keys are generated one at a time (algod limitation), earliest generation deadline first.
+    Generation is progressed on each refresh and, optionally, by a background worker polling at a shorter period.
     """
 
     busy_msg = 'participation key generation already in progress'
 
+    GENERATION_SNAPSHOT_MAX_AGE_S = 5 # Minimal period of fetching the node's partkeys while waiting on a generation
+
 
     def __init__(
         self, 
         logger: Logger,
-        algorand_client: AlgorandClient
+        algorand_client: AlgorandClient,
+        round_context: RoundContext=None,
+        metrics: Metrics=None
     ):
         self.logger = logger
         self.algorand_client = algorand_client
+        self.round_context = round_context # Optional, avoids repeated status calls within a loop
+        self.metrics = metrics # Optional, records the key generation durations
+        self.generation_start_time_s = None # Start of the generation of the key in generation
         self.buffer_pending = PartkeyBuffer()
-        self.buffer_generated = PartkeyBuffer()
+        self.buffer_generated = PartkeyBuffer(track_deletion=True) # Only generated partkeys are deleted
         self.busy_generating_partkey = False # Flag
+        self.partkey_in_generation = None # Pending partkey that is being generated
+        self.generation_deadlines = dict() # Round by which each pending partkey should be generated
+        self.lock = threading.RLock() # Guards the buffers when servicing delcos concurrently
+        self.generation_worker = None # Background thread polling the generation
+        self.generation_worker_stop_event = threading.Event()
+        self.partkey_snapshot = None # Node's partkeys, indexed by address, first and last round
+        self.partkey_snapshot_ids = None # Node's partkeys, indexed by ID
+        self.partkey_snapshot_time_s = None # Time at which the snapshot was fetched
+        self.num_of_snapshot_invalidations = 0 # Discards snapshots fetched before the last invalidation
+        self.snapshot_lock = threading.Lock() # Guards the snapshot, never held while waiting on algod
+        self.snapshot_fetched_event = None # Set once the fetch in progress is done, None if not fetching
+
+
+    def get_current_round(
+        self
+    ) -> int:
+        """Get the current round, reusing the round context if available.
+
+        Returns
+        -------
+        int
+            Current round.
+        """
+        if self.round_context is not None:
+            return self.round_context.get_current_round()
+        return self.algorand_client.client.algod.status()['last-round']
 
 
     def add_partkey_generation_request(
@@ -354,7 +557,8 @@ class PartkeyManager(object):
         vote_first_valid: int,
         vote_last_valid: int,
         vote_key_dilution: int=None,
-        scheduled_deletion: int=None
+        scheduled_deletion: int=None,
+        generation_deadline: int=None
     ):
         """Add partkey generation request to buffer. 
 
@@ -370,6 +574,8 @@ class PartkeyManager(object):
             Dilution key parameter, by default None
         scheduled_deletion : int, optional
             Round at which key will be deleted, by default None
+        generation_deadline : int, optional
+            Round by which the key should be generated (prioritization), by default None (first valid round).
 
         Returns
         -------
@@ -383,92 +589,207 @@ class PartkeyManager(object):
             vote_last_valid=vote_last_valid
         )
         try:
-            last_round = self.algorand_client.client.algod.status()['last-round']
+            last_round = self.get_current_round()
         except Exception as e:
             self.logger.log_generic_algod_error(e)
             return PARTKEY_GENERATION_REQUEST_FAIL_ALGOD_ERROR
-        # First check if the partkey's validity is in the past
-        if last_round >= vote_last_valid:
-            self.logger.log_requested_partkey_in_past(num_of_keys=len(self.buffer_pending.partkeys))
-            return PARTKEY_GENERATION_REQUEST_FAIL_IN_THE_PAST
-        # Check for full buffers
-        if self.buffer_pending.is_full():
-            # self.logger.debug(f'Pending buffer is full ({self.buffer_pending.max_num_of_keys} partkeys).')
-            self.logger.log_pending_buffer_is_full(num_of_keys=len(self.buffer_pending.partkeys))
-            return PARTKEY_GENERATION_REQUEST_FAIL_PENDING_FULL
-        elif self.buffer_generated.is_full():
-            # self.logger.debug(f'Generated buffer is full ({self.buffer_generated.max_num_of_keys} partkeys).')
-            self.logger.log_generated_buffer_is_full(num_of_keys=len(self.buffer_generated.partkeys))
-            return PARTKEY_GENERATION_REQUEST_FAIL_GENERATED_FULL
-        else:
-            # Then check if already present in the buffers
-            in_pending_buffer = self.is_partkey_generation_pending(
-                address, 
-                vote_first_valid, 
-                vote_last_valid
-            )
-            in_generated_buffer = self.buffer_generated.is_partkey_in_buffer(
-                address, 
-                vote_first_valid, 
-                vote_last_valid,
-            )
-            if in_pending_buffer:
-                # self.logger.debug(f'Requested partkey already in pending buffer.')
-                self.logger.log_requested_partkey_in_pending()
-                return PARTKEY_GENERATION_REQUEST_FAIL_IN_PENDING
-            elif in_generated_buffer:
-                # self.logger.debug(f'Requested partkey already in generated buffer.')
-                self.logger.log_requested_partkey_in_generated()
-                return PARTKEY_GENERATION_REQUEST_FAIL_IN_GENERATED
+        with self.lock:
+            # First check if the partkey's validity is in the past
+            if last_round >= vote_last_valid:
+                self.logger.log_requested_partkey_in_past(num_of_keys=len(self.buffer_pending))
+                return PARTKEY_GENERATION_REQUEST_FAIL_IN_THE_PAST
+            # Check for full buffers
+            if self.buffer_pending.is_full():
+                # self.logger.debug(f'Pending buffer is full ({self.buffer_pending.max_num_of_keys} partkeys).')
+                self.logger.log_pending_buffer_is_full(num_of_keys=len(self.buffer_pending))
+                return PARTKEY_GENERATION_REQUEST_FAIL_PENDING_FULL
+            elif self.buffer_generated.is_full():
+                # self.logger.debug(f'Generated buffer is full ({self.buffer_generated.max_num_of_keys} partkeys).')
+                self.logger.log_generated_buffer_is_full(num_of_keys=len(self.buffer_generated))
+                return PARTKEY_GENERATION_REQUEST_FAIL_GENERATED_FULL
             else:
-                # Finally, update scheduled deletion and make the request
-                if scheduled_deletion is None:
-                    scheduled_deletion = vote_last_valid # No early deletion by default
-                self.buffer_pending.add_partkey_to_buffer(
-                    address,
-                    vote_first_valid,
+                # Then check if already present in the buffers
+                in_pending_buffer = self.is_partkey_generation_pending(
+                    address, 
+                    vote_first_valid, 
+                    vote_last_valid
+                )
+                in_generated_buffer = self.buffer_generated.is_partkey_in_buffer(
+                    address, 
+                    vote_first_valid, 
                     vote_last_valid,
-                    vote_key_dilution=vote_key_dilution,
-                    scheduled_deletion=scheduled_deletion
                 )
-                # self.logger.debug(f'Added to pending buffer.')
-                self.logger.log_partkey_generation_request_added()
-                return PARTKEY_GENERATION_REQUEST_OK_ADDED
+                if in_pending_buffer:
+                    # self.logger.debug(f'Requested partkey already in pending buffer.')
+                    self.logger.log_requested_partkey_in_pending()
+                    return PARTKEY_GENERATION_REQUEST_FAIL_IN_PENDING
+                elif in_generated_buffer:
+                    # self.logger.debug(f'Requested partkey already in generated buffer.')
+                    self.logger.log_requested_partkey_in_generated()
+                    return PARTKEY_GENERATION_REQUEST_FAIL_IN_GENERATED
+                else:
+                    # Finally, update scheduled deletion and make the request
+                    if scheduled_deletion is None:
+                        scheduled_deletion = vote_last_valid # No early deletion by default
+                    self.buffer_pending.add_partkey_to_buffer(
+                        address,
+                        vote_first_valid,
+                        vote_last_valid,
+                        vote_key_dilution=vote_key_dilution,
+                        scheduled_deletion=scheduled_deletion
+                    )
+                    if generation_deadline is None:
+                        generation_deadline = vote_first_valid # Keys needed by the first valid round by default
+                    self.generation_deadlines[
+                        PartkeyBuffer.get_partkey_index(address, vote_first_valid, vote_last_valid)
+                    ] = generation_deadline
+                    # self.logger.debug(f'Added to pending buffer.')
+                    self.logger.log_partkey_generation_request_added()
+                    return PARTKEY_GENERATION_REQUEST_OK_ADDED
  
                 
     def refresh(
         self
     ) -> None:
         """Update buffers and run any pending partkey generation.
+
+        Notes
+        -----
+        The node's partkeys are fetched anew on each refresh (i.e. once per daemon loop), so that keys added or
+        deleted on the node outside of the daemon are picked up.
+        """
+        self.invalidate_partkey_snapshot()
+        with self.lock:
+            # if not self.busy_generating_partkey:
+            # Conduct maintenance - key deletion (and info fetching) can take place even when busy generating
+            self.delete_scheduled_partkeys()                # delete scheduled keys from generated buffer
+            self.remove_old_entries_in_buffer_generated()   # delete expired keys from generated buffer
+        self.progress_partkey_generation()                  # generate pending keys
+
+
+    def progress_partkey_generation(
+        self
+    ) -> None:
+        """Check if the key in generation is done and, if so, start generating the next pending key.
+
+        Notes
+        -----
+        Algod remains busy briefly after the key is already generated.
+        In that case the next key is started on the following call.
+        While a key is generating, the node's partkeys are fetched anew at most every `GENERATION_SNAPSHOT_MAX_AGE_S`.
+        They are fetched before taking the lock, so that servicing is not blocked while waiting on algod.
         """
-        # if not self.busy_generating_partkey:
-        # Conduct maintenance - key deletion (and info fetching) can take place even when busy generating
-        self.delete_scheduled_partkeys()                # delete scheduled keys from generated buffer
-        self.remove_old_entries_in_buffer_generated()   # delete expired keys from generated buffer
-        # Keys need to be generated
-        if not self.buffer_pending.is_empty(): # Keygen pending or busy
-            next_pending = self.buffer_pending.get_next() # Shared between if clauses - should not execute sequentially!
+        if self.busy_generating_partkey:
+            with self.snapshot_lock:
+                snapshot_time_s = self.partkey_snapshot_time_s
+            if snapshot_time_s is not None and time.time() - snapshot_time_s >= self.GENERATION_SNAPSHOT_MAX_AGE_S:
+                self.invalidate_partkey_snapshot() # Look for the key on the node
+            self.get_partkey_snapshot()
+        with self.lock:
+            if self.buffer_pending.is_empty(): # Nothing pending nor in generation
+                return
             if self.busy_generating_partkey: # Check if generating finished
+                in_generation = self.partkey_in_generation
+                if in_generation is None: # Fall back to the oldest entry
+                    in_generation = self.buffer_pending.get_next()
                 is_generated = self.is_partkey_generated( # Check if the pending task is already done
-                    next_pending['address'],
-                    next_pending['vote-first-valid'],
-                    next_pending['vote-last-valid']
+                    in_generation['address'],
+                    in_generation['vote-first-valid'],
+                    in_generation['vote-last-valid']
                 )
-                if is_generated:
-                    self.move_next_partkey_to_generated_buffer() # Move to generated buffer
-                    self.busy_generating_partkey = False
-                    # Warning!
-                    # algod remains busy briefly after the key is already generated
-                    # This requires a wait period between observing a key and generating a new one
-                    time.sleep(0.1)
-            else: # If not busy and pending, generate new one
-                self.generate_partkey(
+                if not is_generated:
+                    return
+                self.move_next_partkey_to_generated_buffer() # Move to generated buffer
+                self.busy_generating_partkey = False
+                if self.metrics is not None and self.generation_start_time_s is not None:
+                    self.metrics.observe('partkey_generation_duration_seconds', time.time() - self.generation_start_time_s)
+            if not self.buffer_pending.is_empty(): # If not busy and pending, generate new one
+                next_pending = self.get_next_pending_partkey()
+                res = self.generate_partkey(
                     next_pending['address'],
                     next_pending['vote-first-valid'],
                     next_pending['vote-last-valid'],
                     next_pending['vote-key-dilution']
                 )
-                self.busy_generating_partkey = True
+                if res == 0: # Otherwise algod is still busy, try again on next call
+                    self.partkey_in_generation = next_pending
+                    self.busy_generating_partkey = True
+                    self.generation_start_time_s = time.time()
+
+
+    def get_next_pending_partkey(
+        self
+    ) -> dict:
+        """Get the pending partkey with the earliest generation deadline (FIFO on equal deadlines).
+
+        Returns
+        -------
+        dict
+            Partkey info. None if there are no pending partkeys.
+        """
+        with self.lock:
+            if self.buffer_pending.is_empty():
+                return None
+            return min(
+                self.buffer_pending.return_partkeys(),
+                key=lambda entry: self.generation_deadlines.get(
+                    PartkeyBuffer.get_partkey_index(entry['address'], entry['vote-first-valid'], entry['vote-last-valid']),
+                    entry['vote-first-valid']
+                )
+            )
+
+
+    def start_generation_worker(
+        self,
+        poll_period_s: float
+    ) -> None:
+        """Start a background thread that progresses the partkey generation in between refreshes.
+
+        Parameters
+        ----------
+        poll_period_s : float
+            Period at which the generation is polled.
+        """
+        if self.generation_worker is not None:
+            return
+        self.generation_worker_stop_event.clear()
+        self.generation_worker = threading.Thread(
+            target=self.run_generation_worker,
+            args=(poll_period_s,),
+            name='valar-daemon-partkey-generation',
+            daemon=True
+        )
+        self.generation_worker.start()
+
+
+    def stop_generation_worker(
+        self
+    ) -> None:
+        """Stop the background generation thread and wait for it to finish.
+        """
+        if self.generation_worker is None:
+            return
+        self.generation_worker_stop_event.set()
+        self.generation_worker.join()
+        self.generation_worker = None
+
+
+    def run_generation_worker(
+        self,
+        poll_period_s: float
+    ) -> None:
+        """Progress the partkey generation periodically until stopped.
+
+        Parameters
+        ----------
+        poll_period_s : float
+            Period at which the generation is polled.
+        """
+        while not self.generation_worker_stop_event.wait(poll_period_s):
+            try:
+                self.progress_partkey_generation()
+            except Exception as e:
+                self.logger.log_generic_partkey_manager_error(e)
 
 
     def try_adding_generated_keys_to_buffer(
@@ -503,53 +824,163 @@ class PartkeyManager(object):
         # All relevant partkeys are in the buffer, can return
         if len(partkey_params_list) == 0:
             return 0
-        # Get all existing partkeys on the node
-        res = self.algorand_client.client.algod.algod_request(
-            'GET', 
-            '/participation'
-        )
         # Look for existing partkeys that should be in the buffer and add them if found on the node
         num_of_added_keys = 0
-        if res is not None: # If there are partkeys on the node
-            for partkey_params in partkey_params_list:  # Iterate provided partkeys
-                for entry in res: # Iterate the partkeys that are on the node
-                    if all([ # Match against all parameters and add partkey to buffer if it exists on the node
-                        entry['address'] == partkey_params['address'],
-                        entry['key']['vote-first-valid'] == partkey_params['vote-first-valid'],
-                        entry['key']['vote-last-valid'] == partkey_params['vote-last-valid']
-                    ]):
-                        self.buffer_generated.add_partkey_to_buffer(
-                            address=entry['address'],
-                            vote_first_valid=entry['key']['vote-first-valid'],
-                            vote_last_valid=entry['key']['vote-last-valid'],
-                            selection_participation_key=entry['key']['selection-participation-key'],
-                            state_proof_key=entry['key']['state-proof-key'],
-                            vote_participation_key=entry['key']['vote-participation-key'],
-                            vote_key_dilution=entry['key']['vote-key-dilution'],
-                            id=entry['id']
-                        )
-                        num_of_added_keys += 1
+        for partkey_params in partkey_params_list:  # Iterate provided partkeys
+            entry = self.get_existing_partkey_parameters(
+                partkey_params['address'],
+                partkey_params['vote-first-valid'],
+                partkey_params['vote-last-valid']
+            )
+            if entry is not None: # Add partkey to buffer if it exists on the node
+                self.buffer_generated.add_partkey_to_buffer(
+                    address=entry['address'],
+                    vote_first_valid=entry['vote-first-valid'],
+                    vote_last_valid=entry['vote-last-valid'],
+                    selection_participation_key=entry['selection-participation-key'],
+                    state_proof_key=entry['state-proof-key'],
+                    vote_participation_key=entry['vote-participation-key'],
+                    vote_key_dilution=entry['vote-key-dilution'],
+                    id=entry['id']
+                )
+                num_of_added_keys += 1
         return num_of_added_keys
 
 
+    def get_buffer_state(
+        self
+    ) -> Tuple[List[dict], List[dict], Dict[Tuple[str, int, int], int]]:
+        """Get a copy of the buffered partkeys and generation deadlines, e.g. for persisting them.
+
+        Returns
+        -------
+        Tuple[List[dict], List[dict], Dict[Tuple[str, int, int], int]]
+            Pending partkeys, generated partkeys (incl. scheduled deletions), and the generation deadlines.
+        """
+        with self.lock:
+            return (
+                [dict(partkey) for partkey in self.buffer_pending.return_partkeys()],
+                [dict(partkey) for partkey in self.buffer_generated.return_partkeys()],
+                dict(self.generation_deadlines)
+            )
+
+
+    def restore_buffers(
+        self,
+        pending_partkey_list: List[dict],
+        generated_partkey_list: List[dict],
+        generation_deadlines: Dict[Tuple[str, int, int], int]
+    ) -> int:
+        """Restore the buffered partkeys and generation deadlines, e.g. after a restart.
+
+        Notes
+        -----
+        Partkeys that are already in the buffers are kept as they are.
+        Pending partkeys that were generated in the meantime are added to the generated buffer instead.
+
+        Parameters
+        ----------
+        pending_partkey_list : List[dict]
+            Pending partkeys.
+        generated_partkey_list : List[dict]
+            Generated partkeys, including their scheduled deletion.
+        generation_deadlines : Dict[Tuple[str, int, int], int]
+            Round by which each pending partkey should be generated, indexed by the partkey index.
+
+        Returns
+        -------
+        int
+            Number of restored partkeys.
+        """
+        num_of_restored_keys = 0
+        with self.lock:
+            for partkey in generated_partkey_list:
+                partkey_index = PartkeyBuffer.get_partkey_index(
+                    partkey['address'], partkey['vote-first-valid'], partkey['vote-last-valid']
+                )
+                if self.buffer_generated.is_partkey_in_buffer(*partkey_index) or self.buffer_generated.is_full():
+                    continue
+                self.buffer_generated.add_partkey_to_buffer(
+                    address=partkey['address'],
+                    vote_first_valid=partkey['vote-first-valid'],
+                    vote_last_valid=partkey['vote-last-valid'],
+                    selection_participation_key=partkey['selection-participation-key'],
+                    state_proof_key=partkey['state-proof-key'],
+                    vote_participation_key=partkey['vote-participation-key'],
+                    vote_key_dilution=partkey['vote-key-dilution'],
+                    id=partkey['id'],
+                    scheduled_deletion=partkey['scheduled-deletion']
+                )
+                num_of_restored_keys += 1
+            for partkey in pending_partkey_list:
+                partkey_index = PartkeyBuffer.get_partkey_index(
+                    partkey['address'], partkey['vote-first-valid'], partkey['vote-last-valid']
+                )
+                if self.buffer_pending.is_partkey_in_buffer(*partkey_index) or \
+                    self.buffer_generated.is_partkey_in_buffer(*partkey_index):
+                    continue
+                try:
+                    entry = self.get_existing_partkey_parameters(*partkey_index)
+                except Exception as e: # Keep the request pending, the key is looked for again once generated
+                    self.logger.log_generic_algod_error(e)
+                    entry = None
+                if entry is not None: # Generated in the meantime
+                    if self.buffer_generated.is_full():
+                        continue
+                    self.buffer_generated.add_partkey_to_buffer(
+                        address=entry['address'],
+                        vote_first_valid=entry['vote-first-valid'],
+                        vote_last_valid=entry['vote-last-valid'],
+                        selection_participation_key=entry['selection-participation-key'],
+                        state_proof_key=entry['state-proof-key'],
+                        vote_participation_key=entry['vote-participation-key'],
+                        vote_key_dilution=entry['vote-key-dilution'],
+                        id=entry['id']
+                    )
+                else:
+                    if self.buffer_pending.is_full():
+                        continue
+                    self.buffer_pending.add_partkey_to_buffer(
+                        address=partkey['address'],
+                        vote_first_valid=partkey['vote-first-valid'],
+                        vote_last_valid=partkey['vote-last-valid'],
+                        vote_key_dilution=partkey['vote-key-dilution'],
+                        scheduled_deletion=partkey['scheduled-deletion']
+                    )
+                    self.generation_deadlines[partkey_index] = generation_deadlines.get(
+                        partkey_index, partkey['vote-first-valid']
+                    )
+                num_of_restored_keys += 1
+        return num_of_restored_keys
+
+
     def delete_scheduled_partkeys(self):
         """Delete partkeys that have been scheduled for deletion (e.g. on early contract termination).
         """
-        current_round = self.algorand_client.client.algod.status()['last-round']
-        for entry in self.buffer_generated.return_partkeys():
-            if entry['scheduled-deletion'] is not None:
-                if current_round > entry['scheduled-deletion']:
-                    is_generated = self.is_partkey_generated( # Check if not already deleted in the meantime
+        current_round = self.get_current_round()
+        due_partkeys = self.buffer_generated.pop_partkeys_due_for_deletion(current_round)
+        for idx, entry in enumerate(due_partkeys):
+            try:
+                is_generated = self.is_partkey_generated( # Check if not already deleted in the meantime
+                    entry['address'],
+                    entry['vote-first-valid'],
+                    entry['vote-last-valid']
+                )
+                if is_generated:
+                    self.delete_partkey(
                         entry['address'],
                         entry['vote-first-valid'],
                         entry['vote-last-valid']
                     )
-                    if is_generated:
-                        self.delete_partkey(
-                            entry['address'],
-                            entry['vote-first-valid'],
-                            entry['vote-last-valid']
-                        )
+            except Exception as e:
+                for remaining_entry in due_partkeys[idx:]: # Reschedule to retry on next refresh
+                    self.buffer_generated.update_partkey_scheduled_deletion(
+                        remaining_entry['address'],
+                        remaining_entry['vote-first-valid'],
+                        remaining_entry['vote-last-valid'],
+                        remaining_entry['scheduled-deletion']
+                    )
+                raise e
 
 
     def is_partkey_generation_pending(
@@ -573,11 +1004,12 @@ class PartkeyManager(object):
         -------
         bool
         """
-        return self.buffer_pending.is_partkey_in_buffer(
-            address, 
-            vote_first_valid, 
-            vote_last_valid
-        )
+        with self.lock:
+            return self.buffer_pending.is_partkey_in_buffer(
+                address, 
+                vote_first_valid, 
+                vote_last_valid
+            )
 
 
     def is_partkey_generated(
@@ -611,24 +1043,37 @@ class PartkeyManager(object):
     def move_next_partkey_to_generated_buffer(
         self
     ) -> None:
-        """Move oldest partkey (FIFO) from pending to generated buffer.
+        """Move the partkey in generation (by default the oldest one) from pending to generated buffer.
         """
-        entry = self.buffer_pending.pop_partkey_from_buffer() # Pop oldest entry
-        entry = self.get_existing_partkey_parameters( # Retrieve partkey from algod
-            entry['address'],
-            entry['vote-first-valid'],
-            entry['vote-last-valid']
-        )
-        self.buffer_generated.add_partkey_to_buffer(
-            address=entry['address'],
-            vote_first_valid=entry['vote-first-valid'],
-            vote_last_valid=entry['vote-last-valid'],
-            selection_participation_key=entry['selection-participation-key'],
-            state_proof_key=entry['state-proof-key'],
-            vote_participation_key=entry['vote-participation-key'],
-            vote_key_dilution=entry['vote-key-dilution'],
-            id=entry['id']
-        )
+        with self.lock:
+            if self.partkey_in_generation is None:
+                entry = self.buffer_pending.pop_partkey_from_buffer() # Pop oldest entry
+            else:
+                entry = self.buffer_pending.remove_partkey_from_buffer(
+                    self.partkey_in_generation['address'],
+                    self.partkey_in_generation['vote-first-valid'],
+                    self.partkey_in_generation['vote-last-valid']
+                )
+                self.partkey_in_generation = None
+            self.generation_deadlines.pop(
+                PartkeyBuffer.get_partkey_index(entry['address'], entry['vote-first-valid'], entry['vote-last-valid']),
+                None
+            )
+            entry = self.get_existing_partkey_parameters( # Retrieve partkey from algod
+                entry['address'],
+                entry['vote-first-valid'],
+                entry['vote-last-valid']
+            )
+            self.buffer_generated.add_partkey_to_buffer(
+                address=entry['address'],
+                vote_first_valid=entry['vote-first-valid'],
+                vote_last_valid=entry['vote-last-valid'],
+                selection_participation_key=entry['selection-participation-key'],
+                state_proof_key=entry['state-proof-key'],
+                vote_participation_key=entry['vote-participation-key'],
+                vote_key_dilution=entry['vote-key-dilution'],
+                id=entry['id']
+            )
 
 
     # def generate_next_partkey(
@@ -692,6 +1137,7 @@ class PartkeyManager(object):
                 f'/participation/generate/{address}',
                 params=params
             )
+            self.invalidate_partkey_snapshot() # The new key appears once generated
             # self.logger.info(f'Generating partkey for {address} starting at {vote_first_valid} and ending at {vote_last_valid}.')
             self.logger.log_generating_partkeys(
                 address=address,
@@ -734,18 +1180,48 @@ class PartkeyManager(object):
         # RuntimeError
         #     Did not find the partkey for <address>.
         """
-        res = self.algorand_client.client.algod.algod_request(
-            'GET', 
-            '/participation'
-        )
-        if res is not None:
-            for entry in res:
-                if all([
-                    entry['address'] == address,
-                    entry['key']['vote-first-valid'] == vote_first_valid,
-                    entry['key']['vote-last-valid'] == vote_last_valid
-                ]):
-                    return create_partkey_dict(
+        return self.get_partkey_snapshot().get((address, vote_first_valid, vote_last_valid), None)
+
+
+    def get_partkey_snapshot(
+        self
+    ) -> Dict[Tuple[str, int, int], dict]:
+        """Get the node's partkeys, fetching them only if there is no valid snapshot.
+
+        Notes
+        -----
+        The partkeys are fetched without holding any lock and swapped in under the snapshot lock.
+        Concurrent calls wait for the fetch in progress instead of fetching the partkeys again.
+        The manager's lock may be held by the caller, since the fetching call never takes it.
+        A snapshot fetched before an invalidation (e.g. a key deletion) is used by the caller, but not kept.
+
+        Returns
+        -------
+        Dict[Tuple[str, int, int], dict]
+            Partkey parameters, indexed by address, first round, and last round.
+        """
+        while True:
+            with self.snapshot_lock:
+                if self.partkey_snapshot is not None:
+                    return self.partkey_snapshot
+                snapshot_fetched_event = self.snapshot_fetched_event
+                if snapshot_fetched_event is None: # Fetch the partkeys in this call
+                    snapshot_fetched_event = threading.Event()
+                    self.snapshot_fetched_event = snapshot_fetched_event
+                    num_of_snapshot_invalidations = self.num_of_snapshot_invalidations
+                    break
+            snapshot_fetched_event.wait() # Fetched in another call
+        fetch_time_s = time.time()
+        try:
+            res = self.algorand_client.client.algod.algod_request(
+                'GET', 
+                '/participation'
+            )
+            partkey_snapshot = dict()
+            partkey_snapshot_ids = dict()
+            if res is not None: # If there are partkeys on the node
+                for entry in res:
+                    partkey = create_partkey_dict(
                         address=entry['address'],
                         vote_first_valid=entry['key']['vote-first-valid'],
                         vote_last_valid=entry['key']['vote-last-valid'],
@@ -755,9 +1231,30 @@ class PartkeyManager(object):
                         vote_key_dilution=entry['key']['vote-key-dilution'],
                         id=entry['id']
                     )
-                    # return {key: entry[key] for key in self.relevant_partkey_parameters}
-        # raise RuntimeError(f'Did not find the partkey for {address}.')
-        return None
+                    partkey_snapshot[(partkey['address'], partkey['vote-first-valid'], partkey['vote-last-valid'])] = partkey
+                    partkey_snapshot_ids[partkey['id']] = partkey
+            with self.snapshot_lock:
+                if self.num_of_snapshot_invalidations == num_of_snapshot_invalidations:
+                    self.partkey_snapshot = partkey_snapshot
+                    self.partkey_snapshot_ids = partkey_snapshot_ids
+                    self.partkey_snapshot_time_s = fetch_time_s
+        finally:
+            with self.snapshot_lock:
+                self.snapshot_fetched_event = None
+            snapshot_fetched_event.set() # On error or invalidation, the waiting calls fetch the partkeys themselves
+        return partkey_snapshot
+
+
+    def invalidate_partkey_snapshot(
+        self
+    ) -> None:
+        """Invalidate the snapshot of the node's partkeys, so that they are fetched on next access.
+        """
+        with self.snapshot_lock:
+            self.partkey_snapshot = None
+            self.partkey_snapshot_ids = None
+            self.partkey_snapshot_time_s = None
+            self.num_of_snapshot_invalidations += 1
 
 
     def remove_old_entries_in_buffer_generated(
@@ -771,13 +1268,15 @@ class PartkeyManager(object):
             Number of removed entries.
         """
         num_of_removed = 0 
-        last_round = self.algorand_client.client.algod.status()['last-round'] # Get last round
-        partkeys = self.buffer_generated.return_partkeys() # Fetch partkeys
-        for idx in reversed(range(len(partkeys))): # Reverse iteration to avoid pop issues
-            entry = partkeys[idx]
+        last_round = self.get_current_round() # Get last round
+        for entry in self.buffer_generated.return_partkeys(): # Iterate a copy to allow removal
             if entry['vote-last-valid'] < last_round: # Automatically deleted in partkey list
-                # self.buffer_generated.pop(idx) # Delete entry
-                self.buffer_generated.pop_partkey_from_buffer(idx)
+                self.buffer_generated.remove_partkey_from_buffer(
+                    entry['address'],
+                    entry['vote-first-valid'],
+                    entry['vote-last-valid']
+                )
+                num_of_removed += 1
         # for idx, entry in enumerate(self.buffer_generated.return_partkeys()):
         #     is_generated = self.is_partkey_generated(
         #         entry['address'],
@@ -903,6 +1402,13 @@ class PartkeyManager(object):
             'DELETE', 
             f'/participation/{partkey_id}'
         )
+        with self.snapshot_lock: # Drop the deleted key from the snapshot if the key is known
+            is_in_snapshot = self.partkey_snapshot_ids is not None and partkey_id in self.partkey_snapshot_ids
+            if is_in_snapshot:
+                partkey = self.partkey_snapshot_ids.pop(partkey_id)
+                self.partkey_snapshot.pop((partkey['address'], partkey['vote-first-valid'], partkey['vote-last-valid']), None)
+        if not is_in_snapshot: # Otherwise fetch it anew
+            self.invalidate_partkey_snapshot()
 
 
     def get_partkey_id(
@@ -959,9 +1465,10 @@ class PartkeyManager(object):
         Tuple(str, int)
             Confirmation of the ID and scheduled deletion round.
         """
-        return self.buffer_generated.update_partkey_scheduled_deletion(
-            address=address,
-            vote_first_valid=vote_first_valid,
-            vote_last_valid=vote_last_valid,
-            scheduled_deletion=scheduled_deletion
-        )
+        with self.lock:
+            return self.buffer_generated.update_partkey_scheduled_deletion(
+                address=address,
+                vote_first_valid=vote_first_valid,
+                vote_last_valid=vote_last_valid,
+                scheduled_deletion=scheduled_deletion
+            )
@@ -0,0 +1,297 @@
+"""Prefetch engine, i.e. the blocking loop of `Daemon` with the app global states fetched concurrently ahead of it.
+"""
+import time
+import asyncio
+from typing import List
+
+import httpx
+from algosdk import constants
+from algosdk.v2client.algod import api_version_path_prefix
+
+from valar_daemon.Daemon import Daemon
+from valar_daemon.GeneratedClients import valad_module, delco_module, notbd_module
+from valar_daemon.InstrumentedAlgodClient import InstrumentedAlgodClient, raise_algod_http_error
+from valar_daemon.AlgodRecording import RecordingAlgodClient, ReplayAlgodClient
+from valar_daemon.Metrics import get_algod_endpoint_label
+from valar_daemon.utils import decode_global_state
+
+
+class AsyncAlgodClient(object):
+    """Async HTTP client for the algod reads that are issued concurrently, sharing the blocking client's settings.
+
+    Notes
+    -----
+    The requests are recorded in the statistics of the blocking client, so that they show up in the loop's summary.
+    The HTTP client is created on first use, i.e. bound to the event loop that runs the requests.
+
+    Attributes
+    ----------
+    algod_client : InstrumentedAlgodClient
+        Blocking algod client, whose address, token, headers, and timeout are used.
+    max_connections : int
+        Maximal number of open connections.
+    http_client : httpx.AsyncClient
+        Async HTTP client with persistent connections (None until first used).
+    """
+
+    def __init__(
+        self,
+        algod_client: InstrumentedAlgodClient,
+        max_connections: int
+    ):
+        """Initialize the async algod client.
+
+        Parameters
+        ----------
+        algod_client : InstrumentedAlgodClient
+            Blocking algod client.
+        max_connections : int
+            Maximal number of open connections.
+        """
+        self.algod_client = algod_client
+        self.max_connections = max_connections
+        self.http_client = None
+
+    async def algod_request(
+        self,
+        method: str,
+        requrl: str
+    ) -> dict:
+        """Execute a request, recording its statistics.
+
+        Parameters
+        ----------
+        method : str
+            Request method.
+        requrl : str
+            Request URL path, without the API version.
+
+        Returns
+        -------
+        dict
+            Parsed JSON response.
+
+        Raises
+        ------
+        AlgodHTTPError
+            Algod responded with an error.
+        httpx.HTTPError
+            Algod could not be reached.
+        """
+        if self.http_client is None:
+            header = {"User-Agent": "py-algorand-sdk"}
+            if self.algod_client.headers:
+                header.update(self.algod_client.headers)
+            header.update({constants.algod_auth_header: self.algod_client.algod_token})
+            self.http_client = httpx.AsyncClient(
+                base_url=self.algod_client.algod_address,
+                headers=header,
+                timeout=self.algod_client.timeout_s,
+                limits=httpx.Limits(max_connections=self.max_connections)
+            )
+        num_of_bytes_received = 0
+        is_error = True
+        start_time_s = time.perf_counter()
+        try:
+            response = await self.http_client.request(method, api_version_path_prefix + requrl)
+            body = response.content
+            num_of_bytes_received = len(body)
+            if response.status_code >= 400:
+                raise_algod_http_error(response.status_code, body)
+            is_error = False
+        finally:
+            self.algod_client._record(
+                get_algod_endpoint_label(method, requrl),
+                time.perf_counter() - start_time_s,
+                0,
+                num_of_bytes_received,
+                is_error
+            )
+        return response.json()
+
+    async def application_info(
+        self,
+        app_id: int
+    ) -> dict:
+        """Get an app's info, as `AlgodClient.application_info`.
+
+        Parameters
+        ----------
+        app_id : int
+            App ID.
+
+        Returns
+        -------
+        dict
+        """
+        return await self.algod_request('GET', f'/applications/{app_id}')
+
+    async def close(self) -> None:
+        """Close the persistent connections, if any.
+        """
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+
+
+class PrefetchDaemon(Daemon):
+    """Daemon that prefetches the global state of all apps concurrently, running the requests on an asyncio event loop.
+
+    Notes
+    -----
+    This is not an async servicing engine: only the app global state reads (`GET /applications/{app_id}`) are
+    concurrent, while the servicing itself is the blocking loop of `Daemon`.
+    Before the app wrappers are updated, the global state of all known apps is fetched concurrently over an async
+    HTTP client into the shared app state cache, from which the wrappers are then updated without waiting on algod.
+    The app wrappers of the validator ads (and their noticeboards) are fetched first, followed by their delcos.
+    The state handlers, box reads, partkey calls, and report submissions are those of `Daemon` and remain blocking,
+    i.e. they are dispatched serially or on the daemon's worker pool (`max_workers`), as done by `Daemon`.
+    Apps whose state could not be fetched concurrently are fetched by their wrappers, as done by `Daemon`.
+    The global state is only fetched concurrently if algod is reached directly, i.e. not if algod traffic is recorded
+    or replayed, so that the recordings remain complete.
+
+    Attributes
+    ----------
+    prefetch_max_concurrency : int
+        Maximal number of concurrent app state requests.
+    event_loop : asyncio.AbstractEventLoop
+        Event loop running the app state requests, driven by the daemon's loop.
+    async_algod_client : AsyncAlgodClient
+        Async algod client for the app state (None if the state is not fetched concurrently).
+    """
+
+    def __init__(
+        self,
+        log_path: str,
+        config_path: str
+    ) -> None:
+        """Prefetch engine of the Valar Daemon.
+
+        Parameters
+        ----------
+        log_path : str
+            Path to where the log will be generated.
+        config_path : str
+            Path to the input config file.
+        """
+        self.event_loop = asyncio.new_event_loop() # Used while populating the app wrappers during initialization
+        self.prefetch_max_concurrency = None # Set from the config with the async algod client
+        self.async_algod_client = None
+        super().__init__(log_path, config_path)
+
+
+    def get_async_algod_client(self) -> AsyncAlgodClient:
+        """Get the async algod client, creating it on first use.
+
+        Returns
+        -------
+        AsyncAlgodClient
+            Async algod client (None if algod is not reached directly).
+        """
+        algod_client = self.algorand_client.client.algod
+        if self.async_algod_client is None and \
+            isinstance(algod_client, InstrumentedAlgodClient) and \
+            not isinstance(algod_client, (RecordingAlgodClient, ReplayAlgodClient)):
+            self.prefetch_max_concurrency = self.daemon_config.prefetch_max_concurrency
+            self.async_algod_client = AsyncAlgodClient(algod_client, self.prefetch_max_concurrency)
+        return self.async_algod_client
+
+
+    async def fetch_global_states(
+        self,
+        app_id_list: List[int],
+        GlobalStateClass: type
+    ) -> int:
+        """Fetch the global state of the apps concurrently into the app state cache.
+
+        Notes
+        -----
+        Apps whose state is already cached are skipped, while failed requests or decodings are left to the app wrappers.
+
+        Parameters
+        ----------
+        app_id_list : List[int]
+            IDs of the apps.
+        GlobalStateClass : type
+            Generated global state class of the apps, e.g. `valad_module.GlobalState`.
+
+        Returns
+        -------
+        int
+            Number of fetched global states.
+        """
+        async_algod_client = self.get_async_algod_client()
+        semaphore = asyncio.Semaphore(self.prefetch_max_concurrency)
+        async def fetch_global_state(app_id):
+            async with semaphore:
+                try:
+                    app_info = await async_algod_client.application_info(app_id)
+                    self.app_state_cache.set_global_state(app_id, GlobalStateClass(decode_global_state(app_info)))
+                except Exception:
+                    return False
+            return True
+        app_id_list = [
+            app_id for app_id in dict.fromkeys(app_id_list) if not self.app_state_cache.has_global_state(app_id)
+        ]
+        return sum(await asyncio.gather(*[fetch_global_state(app_id) for app_id in app_id_list]))
+
+
+    def prefetch_global_states(
+        self,
+        app_id_list: List[int],
+        GlobalStateClass: type
+    ) -> None:
+        """Fetch the global state of the apps concurrently into the app state cache, if algod is reached directly.
+
+        Parameters
+        ----------
+        app_id_list : List[int]
+            IDs of the apps.
+        GlobalStateClass : type
+            Generated global state class of the apps, e.g. `valad_module.GlobalState`.
+        """
+        if self.get_async_algod_client() is None:
+            return
+        start_time_s = time.time()
+        num_of_fetched = self.event_loop.run_until_complete(self.fetch_global_states(app_id_list, GlobalStateClass))
+        self.logger.log_prefetched_app_states(
+            num_of_apps=num_of_fetched,
+            duration_s=round(time.time() - start_time_s, 3)
+        )
+
+
+    def reset_app_state_cache(self) -> None:
+        """Discard the app state fetched in the previous loop and fetch the validator ads and noticeboards concurrently.
+        """
+        super().reset_app_state_cache()
+        valad_app_list = self.valad_app_list.get_app_list()
+        self.prefetch_global_states(
+            self.daemon_config.validator_ad_id_list + [valad_app.app_id for valad_app in valad_app_list],
+            valad_module.GlobalState
+        )
+        self.prefetch_global_states(
+            [valad_app.notbd_client.app_id for valad_app in valad_app_list],
+            notbd_module.GlobalState
+        )
+
+
+    def populate_delco_wrapper_list(self) -> None:
+        """Fetch the delegator contracts concurrently and populate the list of their app wrappers.
+        """
+        self.prefetch_global_states(
+            [d_id for valad_app in self.valad_app_list.get_app_list() for d_id in valad_app.delco_id_list],
+            delco_module.GlobalState
+        )
+        super().populate_delco_wrapper_list()
+
+
+    def close(
+        self
+    ) -> None:
+        """Release the workers, connections, and files of the daemon, as well as its event loop.
+        """
+        super().close()
+        if self.async_algod_client is not None:
+            self.event_loop.run_until_complete(self.async_algod_client.close())
+        self.event_loop.run_until_complete(self.event_loop.shutdown_default_executor()) # E.g. DNS lookups
+        self.event_loop.close()
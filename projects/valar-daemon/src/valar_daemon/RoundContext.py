@@ -0,0 +1,116 @@
+"""Round-scoped algod information, shared by the daemon's components within a single loop.
+"""
+import copy
+import threading
+
+from algosdk.transaction import SuggestedParams
+from algokit_utils.beta.algorand_client import AlgorandClient
+
+
+class RoundContext(object):
+    """Round-scoped algod information, fetched at most once per loop.
+
+    Notes
+    -----
+    The information is fetched lazily and reset at the start of each loop.
+    Accessing the information is thread safe, allowing it to be shared between workers.
+
+    Attributes
+    ----------
+    algorand_client : AlgorandClient
+        Algorand client.
+    status : dict
+        Algod status, None if not yet fetched.
+    suggested_params : SuggestedParams
+        Suggested transaction parameters, None if not yet fetched.
+    num_of_algod_calls : int
+        Number of calls to algod since the last reset.
+    num_of_requests : int
+        Number of requests for information since the last reset.
+    """
+
+    def __init__(
+        self,
+        algorand_client: AlgorandClient
+    ):
+        """Initialize round context.
+
+        Parameters
+        ----------
+        algorand_client : AlgorandClient
+            Algorand client.
+        """
+        self.algorand_client = algorand_client
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(
+        self,
+        status: dict=None
+    ) -> None:
+        """Discard the cached information, e.g. at the start of a new loop.
+
+        Parameters
+        ----------
+        status : dict, optional
+            Already-fetched algod status to seed the context with, by default None.
+        """
+        with self.lock:
+            self.status = status
+            self.suggested_params = None
+            self.num_of_algod_calls = 0 if status is None else 1
+            self.num_of_requests = 0
+
+    def get_status(self) -> dict:
+        """Get the algod status, fetching it only if not yet cached.
+
+        Returns
+        -------
+        dict
+            Algod status.
+        """
+        with self.lock:
+            self.num_of_requests += 1
+            if self.status is None:
+                self.status = self.algorand_client.client.algod.status()
+                self.num_of_algod_calls += 1
+            return self.status
+
+    def get_current_round(self) -> int:
+        """Get the last round, as reported by algod at the start of the loop.
+
+        Returns
+        -------
+        int
+            Last round.
+        """
+        return self.get_status()['last-round']
+
+    def get_suggested_params(self) -> SuggestedParams:
+        """Get a copy of the suggested transaction parameters, fetching them only if not yet cached.
+
+        Notes
+        -----
+        A copy is returned, since callers adjust the fee.
+
+        Returns
+        -------
+        SuggestedParams
+            Suggested transaction parameters.
+        """
+        with self.lock:
+            self.num_of_requests += 1
+            if self.suggested_params is None:
+                self.suggested_params = self.algorand_client.client.algod.suggested_params()
+                self.num_of_algod_calls += 1
+            return copy.copy(self.suggested_params)
+
+    def get_num_of_saved_calls(self) -> int:
+        """Get the number of algod calls that were saved by reusing the cached information.
+
+        Returns
+        -------
+        int
+            Number of saved algod calls.
+        """
+        return max(0, self.num_of_requests - self.num_of_algod_calls)
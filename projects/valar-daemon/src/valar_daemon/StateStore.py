@@ -0,0 +1,209 @@
+"""Local state store, keeping the daemon's state between restarts.
+"""
+import json
+import sqlite3
+from pathlib import Path
+from typing import Tuple, List, Dict
+
+
+class StateStore(object):
+    """SQLite-backed store of the app wrappers' static fields and the partkey buffers.
+
+    Notes
+    -----
+    The state is only written if it changed since it was last saved, each part in a single transaction.
+    A file with a different schema version is cleared, since the state can always be rebuilt from the chain.
+
+    Attributes
+    ----------
+    state_path : Path
+        Path to the state file.
+    connection : sqlite3.Connection
+        Connection to the state file.
+    saved_static_fields_dict : dict
+        Last saved static fields of the apps in JSON, indexed by the app kind (e.g. 'delco') and app ID.
+    saved_partkey_row_list : list
+        Last saved partkey rows.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(
+        self,
+        state_path: Path
+    ):
+        """Open the state file, creating it if it does not exist.
+
+        Parameters
+        ----------
+        state_path : Path
+            Path to the state file.
+        """
+        self.state_path = Path(state_path)
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.state_path)
+        self.saved_static_fields_dict = dict()
+        self.saved_partkey_row_list = None
+        self._create_schema()
+
+    @staticmethod
+    def get_state_path(
+        log_path: str
+    ) -> Path:
+        """Get the path of the state file, which is kept next to the log directory.
+
+        Parameters
+        ----------
+        log_path : str
+            Path to the log directory.
+
+        Returns
+        -------
+        Path
+            Path to the state file, e.g. `valar-daemon-log-state.sqlite` for the log directory `valar-daemon-log`.
+        """
+        log_path = Path(log_path).absolute()
+        return log_path.with_name(f'{log_path.name}-state.sqlite')
+
+    def _create_schema(self) -> None:
+        with self.connection:
+            schema_version = self.connection.execute('PRAGMA user_version').fetchone()[0]
+            if schema_version != StateStore.SCHEMA_VERSION:
+                self.connection.execute('DROP TABLE IF EXISTS app_wrapper')
+                self.connection.execute('DROP TABLE IF EXISTS partkey')
+                self.connection.execute(f'PRAGMA user_version = {StateStore.SCHEMA_VERSION}')
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS app_wrapper ('
+                'kind TEXT NOT NULL, app_id INTEGER NOT NULL, static_fields TEXT NOT NULL, '
+                'PRIMARY KEY (kind, app_id))'
+            )
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS partkey ('
+                'buffer TEXT NOT NULL, position INTEGER NOT NULL, partkey TEXT NOT NULL, generation_deadline INTEGER, '
+                'PRIMARY KEY (buffer, position))'
+            )
+
+    def save_static_fields(
+        self,
+        kind: str,
+        static_fields_dict: Dict[int, dict]
+    ) -> bool:
+        """Save the static fields of the apps of one kind, replacing the previously saved ones.
+
+        Parameters
+        ----------
+        kind : str
+            App kind, e.g. 'valad' or 'delco'.
+        static_fields_dict : Dict[int, dict]
+            Static fields of each app, indexed by app ID.
+
+        Returns
+        -------
+        bool
+            Flag whether the state changed and was written.
+        """
+        static_fields_json_dict = {
+            app_id: json.dumps(static_fields, sort_keys=True) for app_id, static_fields in static_fields_dict.items()
+        }
+        if self.saved_static_fields_dict.get(kind, None) == static_fields_json_dict:
+            return False
+        with self.connection:
+            self.connection.execute('DELETE FROM app_wrapper WHERE kind = ?', (kind,))
+            self.connection.executemany(
+                'INSERT INTO app_wrapper (kind, app_id, static_fields) VALUES (?, ?, ?)',
+                [(kind, app_id, static_fields_json) for app_id, static_fields_json in static_fields_json_dict.items()]
+            )
+        self.saved_static_fields_dict[kind] = static_fields_json_dict
+        return True
+
+    def load_static_fields(
+        self,
+        kind: str
+    ) -> Dict[int, dict]:
+        """Load the static fields of the apps of one kind.
+
+        Parameters
+        ----------
+        kind : str
+            App kind, e.g. 'valad' or 'delco'.
+
+        Returns
+        -------
+        Dict[int, dict]
+            Static fields of each app, indexed by app ID.
+        """
+        static_fields_json_dict = dict(self.connection.execute(
+            'SELECT app_id, static_fields FROM app_wrapper WHERE kind = ? ORDER BY app_id', (kind,)
+        ))
+        self.saved_static_fields_dict[kind] = static_fields_json_dict
+        return {app_id: json.loads(static_fields_json) for app_id, static_fields_json in static_fields_json_dict.items()}
+
+    def save_partkeys(
+        self,
+        pending_partkey_list: List[dict],
+        generated_partkey_list: List[dict],
+        generation_deadlines: Dict[Tuple[str, int, int], int]
+    ) -> bool:
+        """Save the buffered partkeys, replacing the previously saved ones.
+
+        Parameters
+        ----------
+        pending_partkey_list : List[dict]
+            Pending partkeys.
+        generated_partkey_list : List[dict]
+            Generated partkeys, including their scheduled deletion.
+        generation_deadlines : Dict[Tuple[str, int, int], int]
+            Round by which each pending partkey should be generated, indexed by the partkey index.
+
+        Returns
+        -------
+        bool
+            Flag whether the state changed and was written.
+        """
+        partkey_row_list = []
+        for buffer, partkey_list in (('generated', generated_partkey_list), ('pending', pending_partkey_list)):
+            for position, partkey in enumerate(partkey_list):
+                generation_deadline = generation_deadlines.get(
+                    (partkey['address'], partkey['vote-first-valid'], partkey['vote-last-valid']), None
+                )
+                partkey_row_list.append((buffer, position, json.dumps(partkey, sort_keys=True), generation_deadline))
+        if self.saved_partkey_row_list == partkey_row_list:
+            return False
+        with self.connection:
+            self.connection.execute('DELETE FROM partkey')
+            self.connection.executemany(
+                'INSERT INTO partkey (buffer, position, partkey, generation_deadline) VALUES (?, ?, ?, ?)',
+                partkey_row_list
+            )
+        self.saved_partkey_row_list = partkey_row_list
+        return True
+
+    def load_partkeys(
+        self
+    ) -> Tuple[List[dict], List[dict], Dict[Tuple[str, int, int], int]]:
+        """Load the buffered partkeys.
+
+        Returns
+        -------
+        Tuple[List[dict], List[dict], Dict[Tuple[str, int, int], int]]
+            Pending partkeys, generated partkeys (incl. scheduled deletions), and the generation deadlines.
+        """
+        partkey_list_dict = dict(pending=[], generated=[])
+        generation_deadlines = dict()
+        partkey_row_list = self.connection.execute(
+            'SELECT buffer, position, partkey, generation_deadline FROM partkey ORDER BY buffer, position'
+        ).fetchall()
+        for buffer, _, partkey_json, generation_deadline in partkey_row_list:
+            partkey = json.loads(partkey_json)
+            partkey_list_dict[buffer].append(partkey)
+            if generation_deadline is not None:
+                generation_deadlines[
+                    (partkey['address'], partkey['vote-first-valid'], partkey['vote-last-valid'])
+                ] = generation_deadline
+        self.saved_partkey_row_list = partkey_row_list
+        return partkey_list_dict['pending'], partkey_list_dict['generated'], generation_deadlines
+
+    def close(self) -> None:
+        """Close the state file.
+        """
+        self.connection.close()
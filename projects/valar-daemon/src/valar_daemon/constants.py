@@ -86,6 +86,12 @@ BOX_ASA_KEY_PREFIX : bytes
 ALGO_ASA_ID = 0
 """ID of Algo ASA."""
 
+FROM_BASE_TO_MILLI_MULTIPLIER = 1_000
+"""Conversion from base units to milli base units, used by the contracts to denote fees per round."""
+
+MAX_TXN_GROUP_SIZE = 16
+"""Maximal number of transactions in an atomic transaction group."""
+
 """
 Possible states of the contract:
     CREATED - validator ad has been created.
@@ -0,0 +1,737 @@
+"""Pre-parsed pre-defined log messages, generated from `log_messages_source.yaml`.
+
+Do not edit, instead rerun `python -m valar_daemon.Logger` after changing the YAML source.
+"""
+
+LOG_MESSAGE_TABLE = {'current_round': {'level': 10,
+                   'module': '*',
+                   'description': 'Displays the current round on the connected network.\n',
+                   'action': 'NA.\n',
+                   'message': 'Current round {current_round}.\n'},
+ 'maintaining_valads': {'level': 10,
+                        'module': 'Daemon',
+                        'description': 'Signals the daemon is handling the validator ads, indicated in the daemon '
+                                       'config file.\n',
+                        'action': 'NA.\n',
+                        'message': 'Maintaining {num_of_valads} valads.\n'},
+ 'state_of_valad_with_id': {'level': 10,
+                            'module': 'Daemon',
+                            'description': 'Reports the state of a validator ad next to its app ID. The state is '
+                                           'reported in bytes format.\n',
+                            'action': 'NA.\n',
+                            'message': 'Valad with ID {app_id} is in state {state}.\n'},
+ 'set_valad_ready_attribute_error': {'level': 40,
+                                     'module': 'Daemon',
+                                     'description': 'Received AttributeError while trying to change valad state to '
+                                                    '`READY`.  This is likely the result of a problem with algod, such '
+                                                    'as a wrong URL or an interrupted internet connection.\n',
+                                     'action': 'Check algod configuration and status; verify the network is '
+                                               'accessible.\n',
+                                     'message': 'Cannot change valad state for valad with ID {app_id}.\n'},
+ 'maintaining_delcos': {'level': 10,
+                        'module': 'Daemon',
+                        'description': 'Signals the daemon is handling the delegator contracts connected to the '
+                                       'validator ads.\n',
+                        'action': 'NA.\n',
+                        'message': 'Maintaining {num_of_delcos} delcos.\n'},
+ 'unknown_delco_error': {'level': 40,
+                         'module': 'Daemon',
+                         'description': 'Received an unexpected error during the handling of a delegator contract.\n',
+                         'action': 'Contact the Valar team, sending the app ID, the log files, and information about '
+                                   'your system.\n',
+                         'message': 'Error while handling delco with ID {app_id}, {e}.\n'},
+ 'removed_ended_or_deleted_delco': {'level': 10,
+                                    'module': 'Daemon',
+                                    'description': 'Indicates the daemon is checking the status of the delegator '
+                                                   'contracts connected to the validator ads.\n',
+                                    'action': 'NA.Daemon\n',
+                                    'message': 'Removed ended or deleted delco with ID {app_id}.\n'},
+ 'state_of_delco_with_id': {'level': 10,
+                            'module': 'Daemon',
+                            'description': 'Reports the state of a delegator contract next to its app ID. The state is '
+                                           'reported in bytes format.\n',
+                            'action': 'NA.\n',
+                            'message': 'Delco with ID {app_id} is in state {state}.\n'},
+ 'unknown_delco_state': {'level': 50,
+                         'module': 'Daemon',
+                         'description': 'Indicates the delegator contract is in a state that is not recognized by the '
+                                        'daemon.  The state is reported in bytes format.\n',
+                         'action': 'Contact the Valar team, sending the app ID, the log files, and information about '
+                                   'your system.\n',
+                         'message': 'Unknown delco state {state}.\n'},
+ 'delco_in_ready_handler': {'level': 10,
+                            'module': 'Daemon',
+                            'description': 'Indicates the delegator contract is being handled by the ready state '
+                                           'handler.\n',
+                            'action': 'NA.\n',
+                            'message': 'In ready state handler for delco with ID {app_id}.\n'},
+ 'urlerror_checking_partkey_generated': {'level': 30,
+                                         'module': 'Daemon',
+                                         'description': 'A URL error occurred while checking if participation keys '
+                                                        'have already been generated for the delegator contract. This '
+                                                        'is likely the result of a problem with algod, such as a wrong '
+                                                        'URL or an interrupted internet connection.\n',
+                                         'action': 'Check algod configuration and status; verify the network is '
+                                                   'accessible.\n',
+                                         'message': 'Cannot check if partkey generated for delco with ID {app_id}.\n'},
+ 'partkeys_generated_for_delco': {'level': 10,
+                                  'module': 'Daemon',
+                                  'description': 'The participation keys have been generated for the delegator '
+                                                 'contract.\n',
+                                  'action': 'NA.\n',
+                                  'message': 'Partkeys generated for delco with ID {app_id}.\n'},
+ 'delco_cannot_pay': {'level': 20,
+                      'module': 'Daemon',
+                      'description': 'The delegator contract can no longer transfer the payment asset to the validator '
+                                     'ad. This should lead to automatic termination of the contract.\n',
+                      'action': 'NA.\n',
+                      'message': 'Cannot pay for delco with ID {app_id}.\n'},
+ 'attributeerror_cannot_pay': {'level': 40,
+                               'module': 'Daemon',
+                               'description': 'The status of the payment asset on the delegator contract cannot be '
+                                              'checked due to an attribute error. This is likely the result of a '
+                                              'problem with algod, such as a wrong URL or an interrupted internet '
+                                              'connection.\n',
+                               'action': 'Check algod configuration and status; verify the network is accessible.\n',
+                               'message': 'Cannot check pay for delco with ID {app_id}.\n'},
+ 'logicerror_cannot_pay': {'level': 10,
+                           'module': 'Daemon',
+                           'description': 'The status of the payment asset on the delegator contract has been checked '
+                                          'and is OK. I.e. payments can be carried out. This error message is typical '
+                                          'for localnet deployments.\n',
+                           'action': 'NA.\n',
+                           'message': 'Checked if can pay for delco with ID {app_id}.\n'},
+ 'httperror_cannot_pay': {'level': 10,
+                          'module': 'Daemon',
+                          'description': 'The status of the payment asset on the delegator contract has been checked '
+                                         'and is OK. I.e. payments can be carried out. This error message is typical '
+                                         'for public deployments.\n',
+                          'action': 'NA.\n',
+                          'message': 'Checked if can pay for delco with ID {app_id}.\n'},
+ 'partkeys_not_submitted': {'level': 20,
+                            'module': 'Daemon',
+                            'description': "The time for submitting participation keys according to the validator ad's "
+                                           'terms is up. This should lead to automatic termination of the contract.\n',
+                            'action': 'NA.\n',
+                            'message': 'Cannot submit partkeys for delco with ID {app_id}.\n'},
+ 'attributeerror_partkeys_not_submitted': {'level': 40,
+                                           'module': 'Daemon',
+                                           'description': 'The remaining time for submitting participation keys for a '
+                                                          'delegator contract cannot be checked due to an attribute '
+                                                          'error. This is likely the result of a problem with algod, '
+                                                          'such as a wrong URL or an interrupted internet '
+                                                          'connection.\n',
+                                           'action': 'Check algod configuration and status; verify the network is '
+                                                     'accessible.\n',
+                                           'message': 'Cannot check partkey not submitted for delco with ID '
+                                                      '{app_id}.\n'},
+ 'logicerror_partkeys_not_submitted': {'level': 10,
+                                       'module': 'Daemon',
+                                       'description': 'The daemon still has time to submit the participation keys '
+                                                      '(self-report unsuccessful). This report is done in order to '
+                                                      'remove delegator contracts which can no longer be serviced, '
+                                                      'making way for new ones. This error message is typical for '
+                                                      'localnet deployments.\n',
+                                       'action': 'NA.\n',
+                                       'message': 'Checked if still time to submit partkeys for delco with ID '
+                                                  '{app_id}.\n'},
+ 'httperror_partkeys_not_submitted': {'level': 10,
+                                      'module': 'Daemon',
+                                      'description': 'The daemon still has time to submit the participation keys '
+                                                     '(self-report unsuccessful). This report is done in order to '
+                                                     'remove delegator contracts which can no longer be serviced, '
+                                                     'making way for new ones. This error message is typical for '
+                                                     'public network deployments.\n',
+                                      'action': 'NA.\n',
+                                      'message': 'Checked if still time to submit partkeys for delco with ID '
+                                                 '{app_id}.\n'},
+ 'partkey_params_submitted': {'level': 20,
+                              'module': 'Daemon',
+                              'description': 'The participation key parameters have successfully been submitted to the '
+                                             'delegator contract.\n',
+                              'action': 'NA.\n',
+                              'message': 'Submitted partkey parameters for delco with ID {app_id}.\n'},
+ 'attributeerror_partkey_submit': {'level': 40,
+                                   'module': 'Daemon',
+                                   'description': 'The participation key parameters cannot be submitted to the '
+                                                  'delegator contract due to an attribute error. This is likely the '
+                                                  'result of a problem with algod, such as a wrong URL or an '
+                                                  'interrupted internet connection.\n',
+                                   'action': 'Check algod configuration and status; verify the network is '
+                                             'accessible.\n',
+                                   'message': 'Cannot submit partkey params for delco with ID {app_id}.\n'},
+ 'urlerror_checking_partkey_pending': {'level': 30,
+                                       'module': 'Daemon',
+                                       'description': 'A URL error occurred while checking if participation key '
+                                                      'generation is pending for the delegator contract. This is '
+                                                      'likely the result of a problem with algod, such as a wrong URL '
+                                                      'or an interrupted internet connection.\n',
+                                       'action': 'Check algod configuration and status; verify the network is '
+                                                 'accessible.\n',
+                                       'message': 'Cannot check if partkey generation pending for delco with ID '
+                                                  '{app_id}.\n'},
+ 'partkey_generation_pending': {'level': 10,
+                                'module': 'Daemon',
+                                'description': 'The participation keys are either in line or being generated by the '
+                                               'node.\n',
+                                'action': 'NA.\n',
+                                'message': 'Partkey generation pending for delco with ID {app_id}.\n'},
+ 'requested_partkey_generation': {'level': 20,
+                                  'module': 'Daemon',
+                                  'description': 'A request to generate participation keys for the delegator contract '
+                                                 '(delegator beneficiary) has been issued.\n',
+                                  'action': 'NA.\n',
+                                  'message': 'Requested partkey generation for delco with ID {app_id}.\n'},
+ 'partkey_generation_denied': {'level': 30,
+                               'module': 'Daemon',
+                               'description': 'The request to generate participation keys for the delegator contract '
+                                              '(delegator beneficiary) has been denied. This is likely due to an full '
+                                              'participation key buffer. \n',
+                               'action': 'Check the number of delegator contracts and the number of generated '
+                                         'participation keys.\n',
+                               'message': 'Partkey generation request denied for delco with ID {app_id}.\n'},
+ 'partkeys_not_confirmed': {'level': 20,
+                            'module': 'Daemon',
+                            'description': 'The participation keys have not been confirmed within the agreed time. '
+                                           'This should lead to automatic termination of the contract.\n',
+                            'action': 'NA.\n',
+                            'message': 'Keys not confirmed on time for delco with ID {app_id}.\n'},
+ 'attributeerror_partkeys_not_confirmed': {'level': 40,
+                                           'module': 'Daemon',
+                                           'description': 'Received AttributeError while trying to check if the '
+                                                          'participation keys have been confirmed.  This is likely the '
+                                                          'result of a problem with algod, such as a wrong URL or an '
+                                                          'interrupted internet connection.\n',
+                                           'action': 'Check algod configuration and status; verify the network is '
+                                                     'accessible.\n',
+                                           'message': 'Cannot check partkey confirmation for delco with ID '
+                                                      '{app_id}.\n'},
+ 'logicerror_partkeys_not_confirmed': {'level': 10,
+                                       'module': 'Daemon',
+                                       'description': 'Tried reporting the participation keys as not confirmed without '
+                                                      'success.  The delegator beneficiary still has time to confirm '
+                                                      'the participation keys. This error message is typical for '
+                                                      'localnet deployments.\n',
+                                       'action': 'NA.\n',
+                                       'message': 'Tried calling not confirmed for delco with ID {app_id}.\n'},
+ 'httperror_partkeys_not_confirmed': {'level': 10,
+                                      'module': 'Daemon',
+                                      'description': 'Tried reporting the participation keys as not confirmed without '
+                                                     'success.  The delegator beneficiary still has time to confirm '
+                                                     'the participation keys. This error message is typical for public '
+                                                     'deployments.\n',
+                                      'action': 'NA.\n',
+                                      'message': 'Tried calling not confirmed for delco with ID {app_id}.\n'},
+ 'delco_in_live_handler': {'level': 10,
+                           'module': 'Daemon',
+                           'description': 'Indicates the delegator contract is being handled by the live state '
+                                          'handler.\n',
+                           'action': 'NA.\n',
+                           'message': 'In live state handler for delco with ID {app_id}.\n'},
+ 'skipped_live_report': {'level': 10,
+                         'module': 'Daemon',
+                         'description': 'Indicates that a live delegator contract report was not sent, since its '
+                                        "precondition (e.g. the contract's end round, the delegator beneficiary's "
+                                        'balances, or the fee asset balance and frozen status) does not hold.\n',
+                         'action': 'NA.\n',
+                         'message': 'Skipped {report_name} report for delco with ID {app_id}, precondition not met.\n'},
+ 'live_report_prediction_error': {'level': 30,
+                                  'module': 'Daemon',
+                                  'description': 'Warns that the precondition of a live delegator contract report '
+                                                 'could not be checked. The daemon tries to send the report anyway.\n',
+                                  'action': 'Check the connection to the node if this repeats.\n',
+                                  'message': 'Could not check {report_name} precondition for delco with ID {app_id}, '
+                                             'trying anyway; {e}.\n'},
+ 'contract_expired': {'level': 20,
+                      'module': 'Daemon',
+                      'description': 'Indicates the delegator contract has expired (ended normally / fulfilled).  This '
+                                     'should lead to automatic termination of the contract.\n',
+                      'action': 'NA.\n',
+                      'message': 'Expired for delco with ID {app_id}.\n'},
+ 'batch_reported': {'level': 20,
+                    'module': 'Daemon',
+                    'description': 'Indicates that multiple delegator contracts were reported as expired or as not '
+                                   'submitted in a single atomic group.\n',
+                    'action': 'NA.\n',
+                    'message': 'Reported {num_of_delcos} delcos in a single group, IDs {delco_id_list}.\n'},
+ 'batch_report_failed': {'level': 30,
+                         'module': 'Daemon',
+                         'description': 'Warns that the group reporting multiple delegator contracts as expired or as '
+                                        'not submitted failed. The delegator contracts are reported individually '
+                                        'instead.\n',
+                         'action': 'Check the node connection if this repeats.\n',
+                         'message': 'Group report of delcos with IDs {delco_id_list} failed, reporting them '
+                                    'individually; {e}.\n'},
+ 'expired_attribute_error': {'level': 40,
+                             'module': 'Daemon',
+                             'description': 'Received AttributeError while trying to report the delegator contract as '
+                                            'expired.  This is likely the result of a problem with algod, such as a '
+                                            'wrong URL or an interrupted internet connection.\n',
+                             'action': 'Check algod configuration and status; verify the network is accessible.\n',
+                             'message': 'Cannot check partkey confirmation for delco with ID {app_id}.\n'},
+ 'tried_contract_expired': {'level': 10,
+                            'module': 'Daemon',
+                            'description': 'Tried reporting the delegator contract as expired without success.  The '
+                                           'delegator contract is still active. This error message is typical for '
+                                           'localnet deployments.\n',
+                            'action': 'NA.\n',
+                            'message': 'Tried calling expired for delco with ID {app_id}.\n'},
+ 'httperror_contract_expired': {'level': 10,
+                                'module': 'Daemon',
+                                'description': 'Tried reporting the delegator contract as expired without success.  '
+                                               'The delegator contract is still active. This error message is typical '
+                                               'for public deployments.\n',
+                                'action': 'NA.\n',
+                                'message': 'Tried calling expired for delco with ID {app_id}.\n'},
+ 'delco_expires_soon': {'level': 20,
+                        'module': 'Daemon',
+                        'description': 'Indicates that a notification about an imminent expiry of the delegator '
+                                       'contract was sent. \n',
+                        'action': 'NA.\n',
+                        'message': 'Sent expires soon notification for delco with ID {app_id}.\n'},
+ 'attributeerror_delco_expires_soon': {'level': 40,
+                                       'module': 'Daemon',
+                                       'description': 'Received AttributeError while trying to issue delegator '
+                                                      'contract expiry notification.  This is likely the result of a '
+                                                      'problem with algod, such as a wrong URL or an interrupted '
+                                                      'internet connection.\n',
+                                       'action': 'Check algod configuration and status; verify the network is '
+                                                 'accessible.\n',
+                                       'message': 'Cannot issue expiry notification for delco with ID {app_id}.\n'},
+ 'logicerror_delco_expires_soon': {'level': 10,
+                                   'module': 'Daemon',
+                                   'description': 'Tried to issue delegator contract expiry notification without '
+                                                  'success.  The delegator contract is still active and the expiry is '
+                                                  'not imminent. This error message is typical for localnet '
+                                                  'deployments.\n',
+                                   'action': 'NA.\n',
+                                   'message': 'Tried to issue expiry notification for delco with ID {app_id}.\n'},
+ 'httperror_delco_expires_soon': {'level': 10,
+                                  'module': 'Daemon',
+                                  'description': 'Tried to issue delegator contract expiry notification without '
+                                                 'success.  The delegator contract is still active and the expiry is '
+                                                 'not imminent. This error message is typical for public '
+                                                 'deployments.\n',
+                                  'action': 'NA.\n',
+                                  'message': 'Tried to issue expiry notification for delco with ID {app_id}.\n'},
+ 'gating_or_stake_limit_breached': {'level': 20,
+                                    'module': 'Daemon',
+                                    'description': 'The delegator beneficiary breached the terms regarding gating '
+                                                   'assets and/or the maximum stake amount. This should lead to the '
+                                                   'breach counter increase and/or automatic termination of the '
+                                                   'contract.\n',
+                                    'action': 'NA.\n',
+                                    'message': 'Gating or stake limit breach for delco with ID {app_id}.\n'},
+ 'gating_or_stake_limit_breached_attribute_error': {'level': 40,
+                                                    'module': 'Daemon',
+                                                    'description': 'Received AttributeError while trying to report the '
+                                                                   'breach of the gating asset and/or the maximum '
+                                                                   'stake amount.  This is likely the result of a '
+                                                                   'problem with algod, such as a wrong URL or an '
+                                                                   'interrupted internet connection.\n',
+                                                    'action': 'Check algod configuration and status; verify the '
+                                                              'network is accessible.\n',
+                                                    'message': 'Attribute error for gating and stake limits for delco '
+                                                               'with ID {app_id}.\n'},
+ 'logicerror_gating_or_stake_limit_breached': {'level': 10,
+                                               'module': 'Daemon',
+                                               'description': 'Tried reporting the breach of the gating asset and/or '
+                                                              'the maximum stake amount without success.  The '
+                                                              'delegator beneficiary complies with the requirements. '
+                                                              'This error message is typical for localnet '
+                                                              'deployments.\n',
+                                               'action': 'NA.\n',
+                                               'message': 'Gating and stake limits OK for delco with ID {app_id}.\n'},
+ 'httperror_gating_or_stake_limit_breached': {'level': 10,
+                                              'module': 'Daemon',
+                                              'description': 'Tried reporting the breach of the gating asset and/or '
+                                                             'the maximum stake amount without success.  The delegator '
+                                                             'beneficiary complies with the requirements. This error '
+                                                             'message is typical for public deployments.\n',
+                                              'action': 'NA.\n',
+                                              'message': 'Gating and stake limits OK for delco with ID {app_id}.\n'},
+ 'delco_in_ended_handler': {'level': 10,
+                            'module': 'Daemon',
+                            'description': 'Indicates the delegator contract is being handled by the ended state '
+                                           'handler.\n',
+                            'action': 'NA.\n',
+                            'message': 'In ended state handler for delco with ID {app_id}.\n'},
+ 'scheduled_partkey_deletion_for_ended_or_deleted': {'level': 20,
+                                                     'module': 'Daemon',
+                                                     'description': 'Scheduled the deletion of the participation keys '
+                                                                    'for ended or deleted delegator contract.\n',
+                                                     'action': 'NA.\n',
+                                                     'message': 'Scheduled partkey deletion for delco with ID {app_id} '
+                                                                'on round {scheduled_deletion} (end round is '
+                                                                '{round_end}).\n'},
+ 'no_partkeys_found_for_ended_or_deleted': {'level': 10,
+                                            'module': 'Daemon',
+                                            'description': 'No participation keys found for ended or deleted delegator '
+                                                           'contract.\n',
+                                            'action': 'NA.\n',
+                                            'message': 'No partkeys found for delco with ID {app_id}.\n'},
+ 'delco_in_deleted_handler': {'level': 10,
+                              'module': 'Daemon',
+                              'description': 'Indicates the delegator contract is being handled by the deleted state '
+                                             'handler.\n',
+                              'action': 'NA.\n',
+                              'message': 'In deleted state handler for delco with ID {app_id}.\n'},
+ 'num_of_valad_ids_found': {'level': 10,
+                            'module': 'Daemon',
+                            'description': 'Shows the number of validator ad IDs that have been extracted from the '
+                                           'config file.\n',
+                            'action': 'NA.\n',
+                            'message': 'Found {num_of_valads} valad in configuration file.\n'},
+ 'num_of_valad_clients_connected': {'level': 10,
+                                    'module': 'Daemon',
+                                    'description': 'Shows the number of validator ad clients that were freshly '
+                                                   'connected (previously untracked).\n',
+                                    'action': 'NA.\n',
+                                    'message': 'Connected {num_of_valads} additional valad clients.\n'},
+ 'num_of_updated_valads': {'level': 10,
+                           'module': 'Daemon',
+                           'description': 'Shows the number of validator ads whose latest on-chain information was '
+                                          'recorded.\n',
+                           'action': 'NA.\n',
+                           'message': 'Recorded {num_of_updated_valads} of {num_of_valads} connected valad clients.\n'},
+ 'zero_valad_clients': {'level': 30,
+                        'module': 'Daemon',
+                        'description': 'There are no connected clients for validator ads, meaning the daemon cannot '
+                                       'connect to any validator ads and will not continue maintaining validator '
+                                       'ads.\n',
+                        'action': 'NA.\n',
+                        'message': 'Zero connected clients for the indicated valads in the config: {valad_id_list}.\n'},
+ 'num_of_connected_delcos': {'level': 10,
+                             'module': 'Daemon',
+                             'description': 'Shows the number of delegator contracts connected to the validator ads.\n',
+                             'action': 'NA.\n',
+                             'message': '{num_of_delcos} delcos obtained from the valads.\n'},
+ 'num_of_delco_clients_connected': {'level': 10,
+                                    'module': 'Daemon',
+                                    'description': 'Shows the number of delegator contract clients that were freshly '
+                                                   'connected (previously untracked).\n',
+                                    'action': 'NA.\n',
+                                    'message': 'Connected {num_of_delcos} additional delco clients.\n'},
+ 'num_of_updated_delcos': {'level': 10,
+                           'module': 'Daemon',
+                           'description': 'Shows the number of delegator contracts whose latest on-chain information '
+                                          'was recorded.\n',
+                           'action': 'NA.\n',
+                           'message': 'Recorded {num_of_updated_delcos} of {num_of_delcos} connected valad clients.\n'},
+ 'algod_ok_continuing': {'level': 10,
+                         'module': 'Daemon',
+                         'description': 'Algod status is OK and the daemon can proceed maintaining contracts and '
+                                        'managing partkeys.\n',
+                         'action': 'NA.\n',
+                         'message': 'Algod OK, maintaining contracts and managing partkeys.\n'},
+ 'generic_contract_servicing_error': {'level': 40,
+                                      'module': 'Daemon',
+                                      'description': 'Displays the uncaught error that has been recorded during '
+                                                     'contract maintenance.\n',
+                                      'action': 'NA.\n',
+                                      'message': 'Error when trying to service contracts, {e}.\n'},
+ 'generic_partkey_manager_error': {'level': 40,
+                                   'module': 'Daemon',
+                                   'description': 'Displays the uncaught error that has been recorded during the '
+                                                  "participation key manager's refresh procedure.\n",
+                                   'action': 'Contact the Valar team, sending the the log files, information about '
+                                             'your system, and participation key info.\n',
+                                   'message': 'Error when trying to refresh partkey manager, {e}.\n'},
+ 'algod_error': {'level': 50,
+                 'module': 'Daemon',
+                 'description': 'Displays the error encountered by algod.\n',
+                 'action': 'Check algod configuration and status; verify the network is accessible.\n',
+                 'message': 'Algod error, {msg}.\n'},
+ 'single_loop_execution_time': {'level': 10,
+                                'module': 'Daemon',
+                                'description': 'Displays the time in seconds it took for the latest loop to execute.\n',
+                                'action': 'NA.\n',
+                                'message': 'Single loop execution took {duration_s} s.\n'},
+ 'targeted_sleep_duration': {'level': 10,
+                             'module': 'Daemon',
+                             'description': 'Displays the sleep duration in seconds.\n',
+                             'action': 'NA.\n',
+                             'message': 'Will sleep for {duration_s} s.\n'},
+ 'valads_serviced': {'level': 10,
+                     'module': 'Daemon',
+                     'description': 'Displays the time in seconds it took to service all validator ads and the number '
+                                    'of workers used for servicing.\n',
+                     'action': 'NA.\n',
+                     'message': 'Serviced {num_of_valads} valads in {duration_s} s using {max_workers} worker(s).\n'},
+ 'delcos_serviced': {'level': 10,
+                     'module': 'Daemon',
+                     'description': 'Displays the time in seconds it took to service all delegator contracts and the '
+                                    'number of workers used for servicing. Compare against the loop period to check '
+                                    'whether the daemon keeps up with the number of delegator contracts.\n',
+                     'action': 'NA.\n',
+                     'message': 'Serviced {num_of_delcos} delcos in {duration_s} s using {max_workers} worker(s).\n'},
+ 'targeted_wait_round': {'level': 10,
+                         'module': 'Daemon',
+                         'description': 'Displays the round until which the daemon waits before executing the next '
+                                        'loop.\n',
+                         'action': 'NA.\n',
+                         'message': 'Will wait for round {target_round}.\n'},
+ 'saved_algod_calls': {'level': 10,
+                       'module': 'Daemon',
+                       'description': 'Displays how many algod calls were saved in the last loop by reusing the round '
+                                      'information (status and suggested parameters), alongside the number of calls '
+                                      'that were actually made to fetch it.\n',
+                       'action': 'NA.\n',
+                       'message': 'Reused round information {num_of_saved_calls} time(s), fetched it '
+                                  '{num_of_algod_calls} time(s).\n'},
+ 'saved_app_state_calls': {'level': 10,
+                           'module': 'Daemon',
+                           'description': 'Displays how many algod calls were saved in the last loop by reusing the '
+                                          'fetched global state of apps (e.g. a noticeboard or validator ad shared by '
+                                          'many delegator contracts), alongside the number of calls actually made.\n',
+                           'action': 'NA.\n',
+                           'message': 'Reused app global state {num_of_saved_calls} time(s), fetched it '
+                                      '{num_of_algod_calls} time(s).\n'},
+ 'prefetched_app_states': {'level': 10,
+                           'module': 'PrefetchDaemon',
+                           'description': 'Displays how many app global states the prefetch engine fetched '
+                                          'concurrently ahead of updating the app wrappers, and how long it took.\n',
+                           'action': 'NA.\n',
+                           'message': 'Fetched the global state of {num_of_apps} app(s) concurrently in {duration_s} '
+                                      's.\n'},
+ 'delco_servicing_time': {'level': 10,
+                          'module': 'Daemon',
+                          'description': 'Displays how long it took to service a single delegator contract.\n',
+                          'action': 'NA.\n',
+                          'message': 'Serviced delco with ID {app_id} in {duration_s} s.\n'},
+ 'config_changed': {'level': 20,
+                    'module': 'Daemon',
+                    'description': 'Displays the settings that changed in the config since it was last read. The '
+                                   'values of secret settings (e.g. the mnemonic) are not displayed.\n',
+                    'action': 'NA.\n',
+                    'message': 'Config changed - {changed_settings}.\n'},
+ 'removed_valads_from_config': {'level': 20,
+                                'module': 'Daemon',
+                                'description': 'Displays the validator ads that are no longer serviced, since they '
+                                               'were removed from the config. Already known delegator contracts of '
+                                               'these validator ads keep being serviced until they end.\n',
+                                'action': 'NA.\n',
+                                'message': 'Stopped servicing validator ads {valad_id_list}, which were removed from '
+                                           'the config.\n'},
+ 'config_change_requires_restart': {'level': 30,
+                                    'module': 'Daemon',
+                                    'description': 'Warns that some of the changed settings only take effect after the '
+                                                   'daemon is restarted.\n',
+                                    'action': 'Restart the daemon to apply the indicated settings.\n',
+                                    'message': 'Restart the daemon to apply the changed settings {setting_list}.\n'},
+ 'loop_overrun': {'level': 30,
+                  'module': 'Daemon',
+                  'description': 'Warns that the loop took longer than the configured loop period, i.e. the next loop '
+                                 'starts late.\n',
+                  'action': 'Check the algod responsiveness and consider increasing the loop period or configuring a '
+                            'loop deadline.\n',
+                  'message': 'Loop took {duration_s} s, longer than the loop period of {loop_period_s} s.\n'},
+ 'deferred_apps_after_deadline': {'level': 30,
+                                  'module': 'Daemon',
+                                  'description': 'Warns that the loop deadline was exceeded before all apps were '
+                                                 'serviced. The remaining apps are serviced first in the next loop.\n',
+                                  'action': 'Check the algod responsiveness and consider increasing the loop deadline '
+                                            'or the number of workers.\n',
+                                  'message': 'Deferred {num_of_apps} app(s) to the next loop after exceeding the loop '
+                                             'deadline: {app_id_list}.\n'},
+ 'algod_requests_in_loop': {'level': 10,
+                            'module': 'Daemon',
+                            'description': 'Displays the algod requests made in the last loop, alongside the number of '
+                                           'requests per serviced contract (validator ads and delegator contracts), '
+                                           'the received bytes, and the combined request duration. The requests are '
+                                           'additionally broken down per endpoint, most requested first.\n',
+                            'action': 'NA.\n',
+                            'message': 'Made {num_of_requests} algod request(s) ({num_of_requests_per_contract} per '
+                                       'contract), received {num_of_bytes_received} B in {duration_s} s - '
+                                       '{endpoint_stats}.\n'},
+ 'metrics_server_started': {'level': 20,
+                            'module': 'Daemon',
+                            'description': 'Displays the port of the local metrics endpoint.\n',
+                            'action': 'NA.\n',
+                            'message': 'Serving metrics at http://127.0.0.1:{port}/metrics.\n'},
+ 'metrics_server_error': {'level': 40,
+                          'module': 'Daemon',
+                          'description': 'The local metrics endpoint could not be started, e.g. because the port is '
+                                         'already in use. The daemon continues without serving metrics.\n',
+                          'action': 'Check that the configured `metrics_port` is free.\n',
+                          'message': 'Could not serve metrics on port {port}, {e}.\n'},
+ 'state_restored': {'level': 20,
+                    'module': 'Daemon',
+                    'description': 'Displays the number of validator ads, delegator contracts, and participation keys '
+                                   'restored from the local state file on startup.\n',
+                    'action': 'NA.\n',
+                    'message': 'Restored {num_of_valads} valad(s), {num_of_delcos} delco(s), and {num_of_partkeys} '
+                               'partkey(s) from {state_path}.\n'},
+ 'state_store_error': {'level': 40,
+                       'module': 'Daemon',
+                       'description': 'The local state file could not be opened or read, e.g. due to missing '
+                                      'permissions or a corrupted file. The daemon continues, rebuilding its state '
+                                      'from the chain.\n',
+                       'action': 'Check the permissions of the state file or remove it.\n',
+                       'message': 'Could not use the state file {state_path}, {e}.\n'},
+ 'state_save_error': {'level': 30,
+                      'module': 'Daemon',
+                      'description': 'The state could not be written to the local state file, e.g. because the disk is '
+                                     'full. The daemon continues and tries again in the next loop.\n',
+                      'action': 'Check the free disk space and the permissions of the state file.\n',
+                      'message': 'Could not save the state to {state_path}, {e}.\n'},
+ 'dropped_log_messages': {'level': 30,
+                          'module': 'Daemon',
+                          'description': 'Warns that log messages were dropped in the last loop, because the queue of '
+                                         'messages waiting to be written to the log files was full.\n',
+                          'action': 'Check the disk performance and the amount of produced log messages.\n',
+                          'message': 'Dropped {num_of_dropped} log message(s) due to a full log queue.\n'},
+ 'could_not_sleep': {'level': 30,
+                     'module': 'Daemon',
+                     'description': 'Warns that the daemon could not go to sleep. This is often the result of long '
+                                    'loop execution times.\n',
+                     'action': 'Check that the reported loop execution time and configure the loop period '
+                               'accordingly.\n',
+                     'message': 'Could not sleep for {duration_s} s, {e}\n'},
+ 'could_not_wait_for_round': {'level': 30,
+                              'module': 'Daemon',
+                              'description': 'Warns that the daemon could not wait for the next round, for example due '
+                                             'to an interrupted algod connection. The daemon falls back to sleeping '
+                                             'for the loop period in seconds.\n',
+                              'action': 'Check algod configuration and status; verify the network is accessible.\n',
+                              'message': 'Could not wait for round {target_round}, {e}\n'},
+ 'generic_claim_operational_fee_error': {'level': 40,
+                                         'module': 'Daemon',
+                                         'description': 'Displays the uncaught error that has been recorded during the '
+                                                        'claiming of operational fees.\n',
+                                         'action': 'Contact the Valar team, sending the the log files, information '
+                                                   'about your system, and participation key info.\n',
+                                         'message': 'Error when trying to claim operational fee, {e}.\n'},
+ 'attributeerror_claim_operational_fee': {'level': 40,
+                                          'module': 'Daemon',
+                                          'description': 'The used up operational fee on the delegator contract cannot '
+                                                         'be claimed due to an attribute error. This is likely the '
+                                                         'result of a problem with algod, such as a wrong URL or an '
+                                                         'interrupted internet connection.\n',
+                                          'action': 'Check algod configuration and status; verify the network is '
+                                                    'accessible.\n',
+                                          'message': 'Cannot claim operational fee for delco with ID {app_id}.\n'},
+ 'unknownerror_claim_operational_fee': {'level': 40,
+                                        'module': 'Daemon',
+                                        'description': 'The used up operational fee on the delegator contract cannot '
+                                                       'be claimed due to an unknown error.\n',
+                                        'action': 'Contact the Valar team, sending the app ID, the log files, and '
+                                                  'information about your system.\n',
+                                        'message': 'Error when trying to claim operational fee for delco with ID '
+                                                   '{app_id}, {e}.\n'},
+ 'simulation_failed_claim_operational_fee': {'level': 20,
+                                             'module': 'Daemon',
+                                             'description': 'The operational fee claim failed in simulation (see '
+                                                            '`simulate_first`), so it was not signed nor submitted.\n',
+                                             'action': 'NA.\n',
+                                             'message': 'Did not claim operational fee for delco with ID {app_id}, '
+                                                        'simulation failed; {e}.\n'},
+ 'calling_claim_operational_fee': {'level': 10,
+                                   'module': 'Daemon',
+                                   'description': 'The daemon will call the function to claim the used up operational '
+                                                  'fee of a delegator contract in live state.\n',
+                                   'action': 'NA.\n',
+                                   'message': 'Calling claim operational fee for delco with ID {app_id}.\n'},
+ 'trying_to_claim_operational_fee': {'level': 10,
+                                     'module': 'Daemon',
+                                     'description': 'The daemon will try to claim the used up operational fee of a '
+                                                    'delegator contract in live state.\n',
+                                     'action': 'NA.\n',
+                                     'message': 'Trying to claim operational fee for delco with ID {app_id}.\n'},
+ 'successfully_claimed_operational_fee': {'level': 20,
+                                          'module': 'Daemon',
+                                          'description': 'The daemon has successfully claimed the used up operational '
+                                                         'fee of a delegator contract in live state.\n',
+                                          'action': 'NA.\n',
+                                          'message': 'Claimed operational fee for delco with ID {app_id}.\n'},
+ 'will_not_claim_operational_fee_of_not_live': {'level': 10,
+                                                'module': 'Daemon',
+                                                'description': 'The daemon will skip trying to claim the operational '
+                                                               'fee of a delegator contract that is not in live '
+                                                               'state.\n',
+                                                'action': 'NA.\n',
+                                                'message': 'Skipping claiming of operational fee for non-live delco '
+                                                           'with ID {app_id}.\n'},
+ 'app_create_urlerror': {'level': 40,
+                         'module': 'AppWrapper',
+                         'description': 'Encountered URLError wen trying to create app wrapper.  Often indicates an '
+                                        'issue with algod.\n',
+                         'action': 'Check algod configuration and status; verify the network is accessible.\n',
+                         'message': 'App ID {app_id}, URLError {errno}: {strerror}.\n'},
+ 'app_create_algohttperror': {'level': 40,
+                              'module': 'AppWrapper',
+                              'description': 'Encountered AlgoHTTPError wen trying to create app wrapper. Often '
+                                             'indicates a non-existent app.\n',
+                              'action': 'Check that the created app exists.\n',
+                              'message': 'App ID {app_id}, AlgoHTTPError {errno}: {strerror}.\n'},
+ 'app_create_genericerror': {'level': 40,
+                             'module': 'AppWrapper',
+                             'description': 'Encountered an unknown exception wen trying to create app wrapper.\n',
+                             'action': 'Contact the Valar team, sending the app ID, the log files, and information '
+                                       'about your system.\n',
+                             'message': 'App ID {app_id}, {e}.\n'},
+ 'app_dynamic_update_genericerror': {'level': 40,
+                                     'module': 'AppWrapper',
+                                     'description': 'Encountered an unknown exception wen trying to update dynamic app '
+                                                    'wrapper parameters.\n',
+                                     'action': 'Contact the Valar team, sending the app ID, the log files, and '
+                                               'information about your system.\n',
+                                     'message': 'App ID {app_id}, {e}.\n'},
+ 'partkey_generation_request': {'level': 10,
+                                'module': 'PartkeyManager',
+                                'description': 'Received a request to generate participation keys for the given '
+                                               'address and duration.\n',
+                                'action': 'NA.\n',
+                                'message': 'Partkey generation request for address {address} and for rounds '
+                                           '{vote_first_valid} to {vote_last_valid}.\n'},
+ 'generating_partkeys': {'level': 20,
+                         'module': 'PartkeyManager',
+                         'description': 'Algod has been instructed to generate participation keys for the given '
+                                        'address and duration.\n',
+                         'action': 'NA.\n',
+                         'message': 'Partkey generation started for address {address} and for rounds '
+                                    '{vote_first_valid} to {vote_last_valid}.\n'},
+ 'requested_partkey_in_past': {'level': 30,
+                               'module': 'PartkeyManager',
+                               'description': 'Requested the generation of a participation key with its validity in '
+                                              'the past (current round > last round).\n',
+                               'action': 'Check that no delegator contracts with expired validity are associated with '
+                                         'the validator ad.\n',
+                               'message': 'Requested partkey generation with past validity.\n'},
+ 'pending_buffer_is_full': {'level': 30,
+                            'module': 'PartkeyManager',
+                            'description': 'The buffer that holds requests for generating participation keys is '
+                                           'full.\n',
+                            'action': 'Check that the number of delegator contracts is reasonably small.\n',
+                            'message': 'Pending buffer is full ({num_of_keys} partkeys).\n'},
+ 'generated_buffer_is_full': {'level': 30,
+                              'module': 'PartkeyManager',
+                              'description': 'The buffer that holds information about generated participation keys is '
+                                             'full.\n',
+                              'action': 'Check the number generated participation keys is reasonably small.\n',
+                              'message': 'Generated buffer is full ({num_of_keys} partkeys).\n'},
+ 'requested_partkey_in_pending': {'level': 30,
+                                  'module': 'PartkeyManager',
+                                  'description': 'The request for generating participation keys is already being '
+                                                 'handled.\n',
+                                  'action': 'Contact the Valar team, sending the the log files and information about '
+                                            'your system.\n',
+                                  'message': 'Partkey generation request already in pending buffer.\n'},
+ 'requested_partkey_in_generated': {'level': 30,
+                                    'module': 'PartkeyManager',
+                                    'description': 'The participation keys with the same address and duration are '
+                                                   'already in the generated buffer.\n',
+                                    'action': 'Contact the Valar team, sending the the log files, information about '
+                                              'your system, and participation key info.\n',
+                                    'message': 'Partkey generation request already in generated buffer.\n'},
+ 'partkey_generation_request_added': {'level': 10,
+                                      'module': 'PartkeyManager',
+                                      'description': 'The request to generate participation keys has been added to the '
+                                                     'pending buffer.\n',
+                                      'action': 'NA.\n',
+                                      'message': 'Added to pending buffer.\n'},
+ 'generic_algod_error': {'level': 40,
+                         'module': 'PartkeyManager',
+                         'description': 'An error was encountered when checking the last round number.\n',
+                         'action': 'NA.\n',
+                         'message': 'Algod error, {e}.\n'}}
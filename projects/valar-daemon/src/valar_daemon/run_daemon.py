@@ -4,12 +4,15 @@ Run the Valar Daemon. For more information see https://github.com/ValarStaking/v
 Options:
   - `--config_path`,  Path to the config file. Defaults to `./daemon.config`.
   - `--log_path`,     Path to the log directory (created if does not exist). Defaults to `./valar-daemon-log`
+  - `--engine`,       Servicing engine, `sync` (blocking loop) or `prefetch` (blocking loop with concurrent app state prefetch). Defaults to `sync`.
 """
 if __name__ == '__main__':
 
+    import signal
     import argparse
     from pathlib import Path
     from valar_daemon.Daemon import Daemon
+    from valar_daemon.PrefetchDaemon import PrefetchDaemon
 
     repo_link = 'https://github.com/ValarStaking/valar'
     parser = argparse.ArgumentParser(description=
@@ -25,6 +28,11 @@ if __name__ == '__main__':
         help='Path to the log directory (created if does not exist). Defaults to `./valar-daemon-log`',
         default=Path(Path.cwd(), 'valar-daemon-log')
     )
+    parser.add_argument(
+        '--engine', type=str, required=False, choices=['sync', 'prefetch'],
+        help='Servicing engine, `sync` (blocking loop) or `prefetch` (blocking loop with concurrent app state prefetch). Defaults to `sync`.',
+        default='sync'
+    )
     args = parser.parse_args()
 
     print(
@@ -32,14 +40,19 @@ if __name__ == '__main__':
         'Pointing the Valar Daemon to the following:\n'
         f'\t Config file at: {args.config_path}\n'
         f'\t Log directory at: {args.log_path}\n'
+        f'\t Servicing engine: {args.engine}\n'
         '\n'
         'Starting Valar Daemon. Expect no further stdout stream - check the above log directory for feedback.'
         '\n'
     )
 
-    daemon = Daemon(
+    DaemonClass = PrefetchDaemon if args.engine == 'prefetch' else Daemon
+    daemon = DaemonClass(
         args.log_path,
         args.config_path
     )
 
+    if hasattr(signal, 'SIGHUP'): # Not available on Windows
+        signal.signal(signal.SIGHUP, daemon.request_config_reload)
+
     daemon.run()
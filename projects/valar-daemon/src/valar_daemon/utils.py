@@ -1,51 +1,96 @@
 """Various utility functions, including interaction with the Valar Smart Contracts.
 """
+from __future__ import annotations # The generated clients are only imported for type checking
+
 import base64
 import struct
+import copy
 import dataclasses
+from typing import TYPE_CHECKING
 
 from algosdk.error import AlgodHTTPError
+from algosdk.transaction import SuggestedParams
 from algokit_utils.beta.algorand_client import AlgorandClient
 from algokit_utils.beta.account_manager import AddressAndSigner
 from algokit_utils import TransactionParameters, ABITransactionResponse
-from algokit_utils.network_clients import AlgoClientConfig, AlgoClientConfigs
-from algosdk.abi import AddressType, ArrayStaticType, ByteType, TupleType, UintType
-
-from valar_daemon.NoticeboardClient import NoticeboardClient, KeyRegTxnInfo
-from valar_daemon.DelegatorContractClient import (
-    DelegationTermsBalance,
-    DelegationTermsGeneral,
-    GlobalState as DelcoGlobalState
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer, AtomicTransactionResponse
+from algosdk.transaction import SignedTransaction
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+from algokit_utils.network_clients import AlgoClientConfig, get_indexer_client, get_kmd_client
+from algokit_utils.beta.client_manager import AlgoSdkClients
+from algosdk.abi import AddressType
+from algosdk.encoding import encode_address
+
+from valar_daemon.GeneratedClients import valad_module, delco_module, notbd_module
+from valar_daemon.InstrumentedAlgodClient import InstrumentedAlgodClient
+from valar_daemon.AlgodRecording import (
+    AlgodRecorder,
+    AlgodRecording,
+    RecordingAlgodClient,
+    ReplayAlgodClient,
+    get_next_recording_path
 )
-from valar_daemon.ValidatorAdClient import ValidatorTermsTiming
 from valar_daemon.constants import *
 
+if TYPE_CHECKING:
+    from valar_daemon.NoticeboardClient import NoticeboardClient, NoticeboardTermsTiming
+    from valar_daemon.DelegatorContractClient import (
+        DelegationTermsBalance,
+        DelegationTermsGeneral,
+        GlobalState as DelcoGlobalState
+    )
+    from valar_daemon.ValidatorAdClient import ValidatorTermsTiming
+
 
 
 ### Misc utilities #####################################################################################################
 
 def get_algorand_client(
     algod_config_server: str,
-    algod_config_token: str
+    algod_config_token: str,
+    timeout_s: float=30,
+    max_retries: int=0,
+    retry_backoff_s: float=0.5,
+    connection_pool_size: int=0,
+    record_path: str='',
+    replay_path: str=''
 ) -> AlgorandClient:
     """Get an algorand client from the provided configuration.
 
+    Notes
+    -----
+    The algod client records the statistics of its requests (see `InstrumentedAlgodClient`).
+    Idempotent algod requests that fail due to a connection error are retried with an exponential backoff.
+    With a connection pool, algod requests reuse persistent (keep-alive) connections.
+    In replay mode, algod is not reached and the responses are served from a recording instead (see `AlgodRecording`).
+    Replay takes precedence over recording, i.e. a replayed run is not recorded again.
+
     Parameters
     ----------
     algod_config_server : str
         Algod URL.
     algod_config_token : str
         Algod token.
+    timeout_s : float, optional
+        Default algod request timeout in seconds, by default 30.
+    max_retries : int, optional
+        Maximal number of retries of an idempotent algod request after a connection error, by default 0.
+    retry_backoff_s : float, optional
+        Wait before the first retry in seconds, doubled for each next retry, by default 0.5.
+    connection_pool_size : int, optional
+        Maximal number of idle persistent algod connections, by default 0 (new connection per request).
+    record_path : str, optional
+        Directory to which the algod requests and responses are recorded, by default '' (not recorded).
+    replay_path : str, optional
+        Recording from which the algod responses are replayed, by default '' (algod is reached).
 
     Returns
     -------
     AlgorandClient
-        Configured Algorand client without timeout.
+        Algorand client, whose algod client applies the request timeout, retries, connection pool, and recording or
+        replay, without caching the suggested parameters (timeout of 0).
     """
-    algod_config = AlgoClientConfig(
-        server=algod_config_server,
-        token=algod_config_token
-    )
     indexer_config = AlgoClientConfig(
         server='http://localhost:8980',
         token='aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa'
@@ -54,17 +99,55 @@ def get_algorand_client(
         server='http://localhost:4002',
         token='aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa'
     )
+    algod_client_kwargs = dict(
+        algod_token=algod_config_token,
+        algod_address=algod_config_server,
+        headers={"X-Algo-API-Token": algod_config_token},
+        timeout_s=timeout_s,
+        max_retries=max_retries,
+        retry_backoff_s=retry_backoff_s,
+        connection_pool_size=connection_pool_size
+    )
+    if replay_path:
+        algod_client = ReplayAlgodClient(AlgodRecording(replay_path), **algod_client_kwargs)
+    elif record_path:
+        algod_client = RecordingAlgodClient(AlgodRecorder(get_next_recording_path(record_path)), **algod_client_kwargs)
+    else:
+        algod_client = InstrumentedAlgodClient(**algod_client_kwargs)
     algorand_client = AlgorandClient(
-        AlgoClientConfigs(
-            algod_config=algod_config,
-            indexer_config=indexer_config,
-            kmd_config=kmd_config,
+        AlgoSdkClients(
+            algod=algod_client,
+            indexer=get_indexer_client(indexer_config),
+            kmd=get_kmd_client(kmd_config),
         )
     )
     algorand_client.set_suggested_params_timeout(0)
     return algorand_client
 
 
+def get_suggested_params(
+    algorand_client: AlgorandClient,
+    suggested_params: SuggestedParams=None
+) -> SuggestedParams:
+    """Get suggested parameters, reusing the provided ones if available.
+
+    Parameters
+    ----------
+    algorand_client : AlgorandClient
+        Algorand client.
+    suggested_params : SuggestedParams, optional
+        Suggested parameters to reuse instead of fetching them, by default None.
+
+    Returns
+    -------
+    SuggestedParams
+        Copy of the provided suggested parameters or freshly fetched ones.
+    """
+    if suggested_params is None:
+        return algorand_client.client.algod.suggested_params()
+    return copy.copy(suggested_params)
+
+
 def decode_uint64_list(
     data: bytes
 ) -> list:
@@ -85,6 +168,31 @@ def decode_uint64_list(
     return int_list
 
 
+def decode_global_state(
+    app_info: dict
+) -> dict:
+    """Decode an app's global state from algod's app info, as done by the generated clients' `get_global_state`.
+
+    Parameters
+    ----------
+    app_info : dict
+        Response of algod's `GET /v2/applications/{application-id}`.
+
+    Returns
+    -------
+    dict
+        Global state values (bytes or int), indexed by the raw keys, as taken by the generated `GlobalState`.
+    """
+    global_state = dict()
+    for state_value in app_info.get('params', {}).get('global-state', []):
+        value = state_value['value']
+        if value['type'] == 1:
+            global_state[base64.b64decode(state_value['key'])] = base64.b64decode(value['bytes'])
+        else:
+            global_state[base64.b64decode(state_value['key'])] = value['uint']
+    return global_state
+
+
 @dataclasses.dataclass()
 class User:
     role: bytes
@@ -128,6 +236,7 @@ def get_delco_fee_and_gating_asa_id(
     -----
     Algo ASA is added by default, since it is staked.
     The payment ASA is also included in the gating ASA list.
+    Only the two relevant delegation terms are decoded, instead of the whole global state.
 
     Parameters
     ----------
@@ -138,87 +247,97 @@ def get_delco_fee_and_gating_asa_id(
     -------
     Tuple[int, List[int]]
     """
-    global_state = DelegatorContractGlobalState.from_global_state(global_state_raw)
+    delegation_terms_balance = decode_delegation_terms_balance(global_state_raw.delegation_terms_balance.as_bytes)
     gating_asa_id_list = [ALGO_ASA_ID] # By defaults, since ALGO is the one staked
-    for asa in global_state.delegation_terms_balance.gating_asa_list:
+    for asa in delegation_terms_balance.gating_asa_list:
         if asa[0] != ALGO_ASA_ID:
             gating_asa_id_list.append(asa[0]) # Add up to 4 additional ASAs
     return (
-        global_state.delegation_terms_general.fee_asset_id,
+        DELEGATION_TERMS_GENERAL_STRUCT.unpack(global_state_raw.delegation_terms_general.as_bytes)[3], # fee_asset_id
         gating_asa_id_list
     )
 
 
-DEFAULT_DELEGATION_TERMS_BALANCE = DelegationTermsBalance(
-    stake_max = 0,
-    cnt_breach_del_max = 0,
-    rounds_breach = 0,
-    gating_asa_list = [(0, 0), (0, 0)],
-)
+def get_default_delegation_terms_balance() -> DelegationTermsBalance:
+    return delco_module.DelegationTermsBalance(
+        stake_max = 0,
+        cnt_breach_del_max = 0,
+        rounds_breach = 0,
+        gating_asa_list = [(0, 0), (0, 0)],
+    )
+
 
+def get_default_delegation_terms_general() -> DelegationTermsGeneral:
+    return delco_module.DelegationTermsGeneral(
+        commission = 0,
+        fee_round = 0,
+        fee_setup = 0,
+        fee_asset_id = 0,
+        partner_address = ZERO_ADDRESS,
+        fee_round_partner = 0,
+        fee_setup_partner = 0,
+        rounds_setup = 0,
+        rounds_confirm = 0,
+    )
 
-DEFAULT_DELEGATION_TERMS_GENERAL = DelegationTermsGeneral(
-    commission = 0,
-    fee_round = 0,
-    fee_setup = 0,
-    fee_asset_id = 0,
-    partner_address = ZERO_ADDRESS,
-    fee_round_partner = 0,
-    fee_setup_partner = 0,
-    rounds_setup = 0,
-    rounds_confirm = 0,
+
+# Precompiled layouts of the static-size ABI structs (big-endian, without padding), built once instead of per call.
+# The decoded values are the same as with the corresponding `algosdk.abi.TupleType` (see `test_decoders.py`).
+DELEGATION_TERMS_BALANCE_STRUCT = struct.Struct(
+    '>'
+    'Q'     # stake_max
+    'Q'     # cnt_breach_del_max
+    'Q'     # rounds_breach
+    '4Q'    # gating_asa_list (2 x 2 uint64)
+)
+DELEGATION_TERMS_GENERAL_STRUCT = struct.Struct(
+    '>'
+    'Q'     # commission
+    'Q'     # fee_round
+    'Q'     # fee_setup
+    'Q'     # fee_asset_id
+    '32s'   # partner_address
+    'Q'     # fee_round_partner
+    'Q'     # fee_setup_partner
+    'Q'     # rounds_setup
+    'Q'     # rounds_confirm
 )
 
 
 def decode_abi_address(data: bytes) -> str:
-    return AddressType().decode(data)
+    if len(data) != 32:
+        raise ValueError(f'Address should be 32 bytes long, got {len(data)}.')
+    return encode_address(bytes(data))
 
 
 def decode_delegation_terms_balance(data: bytes) -> DelegationTermsBalance:
-    delegation_terms_balance_type = TupleType(
-        [
-            UintType(64),  # stake_max
-            UintType(64),  # cnt_breach_del_max
-            UintType(64),  # rounds_breach
-            ArrayStaticType(ArrayStaticType(UintType(64), 2), 2),  # gating_asa_list
-        ]
-    )
-
-    decoded_tuple = delegation_terms_balance_type.decode(data)
-
-    delegation_terms_balance = DelegationTermsBalance(
-        stake_max=decoded_tuple[0],
-        cnt_breach_del_max=decoded_tuple[1],
-        rounds_breach=decoded_tuple[2],
-        gating_asa_list=[tuple(item) for item in decoded_tuple[3]],
+    (
+        stake_max,
+        cnt_breach_del_max,
+        rounds_breach,
+        asa_id_0, asa_min_0,
+        asa_id_1, asa_min_1
+    ) = DELEGATION_TERMS_BALANCE_STRUCT.unpack(data)
+
+    delegation_terms_balance = delco_module.DelegationTermsBalance(
+        stake_max=stake_max,
+        cnt_breach_del_max=cnt_breach_del_max,
+        rounds_breach=rounds_breach,
+        gating_asa_list=[(asa_id_0, asa_min_0), (asa_id_1, asa_min_1)],
     )
 
     return delegation_terms_balance
 
 
 def decode_delegation_terms_general(data: bytes) -> DelegationTermsGeneral:
-    delegation_terms_general_type = TupleType(
-        [
-            UintType(64),  # commission
-            UintType(64),  # fee_round
-            UintType(64),  # fee_setup
-            UintType(64),  # fee_asset_id
-            AddressType(),  # partner_address
-            UintType(64),  # fee_round_partner
-            UintType(64),  # fee_setup_partner
-            UintType(64),  # rounds_setup
-            UintType(64),  # rounds_confirm
-        ]
-    )
-
-    decoded_tuple = delegation_terms_general_type.decode(data)
+    decoded_tuple = DELEGATION_TERMS_GENERAL_STRUCT.unpack(data)
 
-    delegation_terms_general = DelegationTermsGeneral(
+    delegation_terms_general = delco_module.DelegationTermsGeneral(
         commission=decoded_tuple[0],
         fee_round=decoded_tuple[1],
         fee_setup=decoded_tuple[2],
         fee_asset_id=decoded_tuple[3],
-        partner_address=decoded_tuple[4],
+        partner_address=encode_address(decoded_tuple[4]),
         fee_round_partner=decoded_tuple[5],
         fee_setup_partner=decoded_tuple[6],
         rounds_setup=decoded_tuple[7],
@@ -233,8 +352,8 @@ class DelegatorContractGlobalState:
     cnt_breach_del: int = 0
     del_beneficiary: str = ZERO_ADDRESS
     del_manager: str = ZERO_ADDRESS
-    delegation_terms_balance: DelegationTermsBalance = dataclasses.field(default_factory=lambda: DEFAULT_DELEGATION_TERMS_BALANCE)  # noqa: E501
-    delegation_terms_general: DelegationTermsGeneral = dataclasses.field(default_factory=lambda: DEFAULT_DELEGATION_TERMS_GENERAL)  # noqa: E501
+    delegation_terms_balance: DelegationTermsBalance = dataclasses.field(default_factory=get_default_delegation_terms_balance)  # noqa: E501
+    delegation_terms_general: DelegationTermsGeneral = dataclasses.field(default_factory=get_default_delegation_terms_general)  # noqa: E501
     fee_operational: int = 0
     fee_operational_partner: int = 0
     noticeboard_app_id: int = 0
@@ -286,29 +405,30 @@ class DelegatorContractGlobalState:
 
 ### Validator ad client helpers ########################################################################################
 
-DEFAULT_VALIDATOR_TERMS_TIME = ValidatorTermsTiming(
-    rounds_setup = 0,
-    rounds_confirm = 0,
-    rounds_duration_min = 0,
-    rounds_duration_max = 0,
-    round_max_end = 0,
+def get_default_validator_terms_time() -> ValidatorTermsTiming:
+    return valad_module.ValidatorTermsTiming(
+        rounds_setup = 0,
+        rounds_confirm = 0,
+        rounds_duration_min = 0,
+        rounds_duration_max = 0,
+        round_max_end = 0,
+    )
+
+
+VALIDATOR_TERMS_TIMING_STRUCT = struct.Struct(
+    '>'
+    'Q'     # rounds_setup
+    'Q'     # rounds_confirm
+    'Q'     # rounds_duration_min
+    'Q'     # rounds_duration_max
+    'Q'     # round_max_end
 )
 
 
 def decode_validator_terms_time(data: bytes) -> ValidatorTermsTiming:
-    data_type = TupleType(
-        [
-            UintType(64),  # rounds_setup
-            UintType(64),  # rounds_confirm
-            UintType(64),  # rounds_duration_min
-            UintType(64),  # rounds_duration_max
-            UintType(64),  # round_max_end
-        ]
-    )
-
-    decoded_tuple = data_type.decode(data)
+    decoded_tuple = VALIDATOR_TERMS_TIMING_STRUCT.unpack(data)
 
-    decoded_data = ValidatorTermsTiming(
+    decoded_data = valad_module.ValidatorTermsTiming(
         rounds_setup = decoded_tuple[0],
         rounds_confirm = decoded_tuple[1],
         rounds_duration_min = decoded_tuple[2],
@@ -320,9 +440,217 @@ def decode_validator_terms_time(data: bytes) -> ValidatorTermsTiming:
 
 
 
+### Report precondition helpers (change detection) ####################################################################
+
+NOTICEBOARD_TERMS_TIMING_STRUCT = struct.Struct(
+    '>'
+    'Q'     # rounds_duration_min_min
+    'Q'     # rounds_duration_max_max
+    'Q'     # before_expiry
+    'Q'     # report_period
+)
+
+
+def decode_noticeboard_terms_timing(data: bytes) -> NoticeboardTermsTiming:
+    decoded_tuple = NOTICEBOARD_TERMS_TIMING_STRUCT.unpack(data)
+
+    decoded_data = notbd_module.NoticeboardTermsTiming(
+        rounds_duration_min_min = decoded_tuple[0],
+        rounds_duration_max_max = decoded_tuple[1],
+        before_expiry = decoded_tuple[2],
+        report_period = decoded_tuple[3],
+    )
+
+    return decoded_data
+
+
+def calc_fee_operational(
+    fee_round: int,
+    round_end: int,
+    round_start: int
+) -> int:
+    """Calculate the operational fee between two rounds, mirroring the smart contracts.
+
+    Parameters
+    ----------
+    fee_round : int
+        Fee per round in the asset's milli base units.
+    round_end : int
+        End round.
+    round_start : int
+        Start round.
+
+    Returns
+    -------
+    int
+        Operational fee in the asset's base units.
+    """
+    return (fee_round * (round_end - round_start)) // FROM_BASE_TO_MILLI_MULTIPLIER
+
+
+def get_asset_holding(
+    algorand_client: AlgorandClient,
+    address: str,
+    asset_id: int
+) -> Tuple[int, bool]:
+    """Get the balance of an asset (or ALGO) and whether it is frozen for the given address.
+
+    Notes
+    -----
+    An address that is not opted into the asset has a zero, non-frozen balance.
+
+    Parameters
+    ----------
+    algorand_client : AlgorandClient
+        Algorand client.
+    address : str
+        Address of the holder.
+    asset_id : int
+        Asset ID, where `ALGO_ASA_ID` denotes ALGO.
+
+    Returns
+    -------
+    Tuple[int, bool]
+        Balance and frozen flag.
+    """
+    if asset_id == ALGO_ASA_ID:
+        account_info = algorand_client.client.algod.account_info(address, exclude='all')
+        return account_info['amount'], False
+    try:
+        asset_holding = algorand_client.client.algod.account_asset_info(address, asset_id)['asset-holding']
+    except AlgodHTTPError as e:
+        if e.code == 404: # Not opted in
+            return 0, False
+        raise e
+    return asset_holding['amount'], asset_holding['is-frozen']
+
+
+def is_delben_eligible(
+    algorand_client: AlgorandClient,
+    delben_address: str,
+    stake_max: int,
+    gating_asa_list: List[Tuple[int, int]]
+) -> bool:
+    """Check whether the delegator beneficiary meets the agreed balance limits, mirroring the delegator contract.
+
+    Parameters
+    ----------
+    algorand_client : AlgorandClient
+        Algorand client.
+    delben_address : str
+        Delegator beneficiary address.
+    stake_max : int
+        Maximal ALGO balance.
+    gating_asa_list : List[Tuple[int, int]]
+        Gating asset IDs and their minimal balances.
+
+    Returns
+    -------
+    bool
+        True if the limits are met.
+    """
+    algo_balance, _ = get_asset_holding(algorand_client, delben_address, ALGO_ASA_ID)
+    if algo_balance > stake_max:
+        return False
+    for asa_id, asa_min in gating_asa_list:
+        if asa_id == ALGO_ASA_ID:
+            continue
+        asa_balance, _ = get_asset_holding(algorand_client, delben_address, asa_id)
+        if asa_balance < asa_min:
+            return False
+    return True
+
+
+
 ### Valar Smart Contract interface #####################################################################################
 
 
+class SimulationFailedError(Exception):
+    """Transaction group failed in simulation and was therefore not signed nor submitted."""
+
+
+def simulate_unsigned_group(
+    algod_client: AlgodClient,
+    atc: AtomicTransactionComposer
+) -> str | None:
+    """Simulate a transaction group without signing it.
+
+    Notes
+    -----
+    Relies on algod's `allow_empty_signatures`.
+    The group is built, but not signed, so it can still be executed afterwards.
+    Algod simulates a single group per request, i.e. each simulated group costs one extra request.
+
+    Parameters
+    ----------
+    algod_client : AlgodClient
+        Algod client.
+    atc : AtomicTransactionComposer
+        Transaction group to simulate.
+
+    Returns
+    -------
+    str | None
+        Failure message, None if the group would succeed.
+    """
+    txn_group = SimulateRequestTransactionGroup(
+        txns=[SignedTransaction(txn_with_signer.txn, None) for txn_with_signer in atc.build_group()]
+    )
+    response = algod_client.simulate_transactions(
+        SimulateRequest(txn_groups=[txn_group], allow_empty_signatures=True)
+    )
+    return response['txn-groups'][0].get('failure-message', None)
+
+
+def execute_composer(
+    composer: object,
+    simulate_first: bool=False
+) -> AtomicTransactionResponse:
+    """Execute the calls of a generated client's composer, optionally simulating them first.
+
+    Notes
+    -----
+    Simulating costs one extra request per composer, i.e. per individual report or claim.
+    Reports that are batched into a single group (see `Daemon.report_delcos_in_batches`) share one simulation.
+
+    Parameters
+    ----------
+    composer : object
+        Composer of a generated client, e.g. `NoticeboardClient.compose()`.
+    simulate_first : bool, optional
+        Simulate the unsigned calls first and only sign and submit them if successful, by default False.
+
+    Returns
+    -------
+    AtomicTransactionResponse
+
+    Raises
+    ------
+    SimulationFailedError
+        The simulation failed, i.e. the calls were not submitted.
+    """
+    if simulate_first:
+        failure_message = simulate_unsigned_group(
+            composer.app_client.algod_client,
+            composer.build()
+        )
+        if failure_message is not None:
+            raise SimulationFailedError(failure_message)
+    return composer.execute()
+
+
+
+USER_INFO_STRUCT = struct.Struct(
+    '>'
+    '4s'    # role
+    '8s'    # dll_name
+    '32s'   # prev_user
+    '32s'   # next_user
+    '110Q'  # app_ids
+    'Q'     # cnt_app_ids
+)
+
+
 @dataclasses.dataclass()
 class UserInfo:
     """
@@ -339,25 +667,15 @@ class UserInfo:
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "UserInfo":
-        data_type = TupleType(
-            [
-                ArrayStaticType(ByteType(), 4),    # role
-                ArrayStaticType(ByteType(), 8),    # dll_name
-                AddressType(),   # prev_user
-                AddressType(),   # next_user
-                ArrayStaticType(UintType(64), 110),   # app_ids
-                UintType(64),   # cnt_app_ids
-            ]
-        )
-        decoded_tuple = data_type.decode(data)
+        decoded_tuple = USER_INFO_STRUCT.unpack(data)
 
         return UserInfo(
-            role=bytes(decoded_tuple[0]),
-            dll_name=bytes(decoded_tuple[1]),
-            prev_user=decoded_tuple[2],
-            next_user=decoded_tuple[3],
-            app_ids= decoded_tuple[4],
-            cnt_app_ids=decoded_tuple[5],
+            role=decoded_tuple[0],
+            dll_name=decoded_tuple[1],
+            prev_user=encode_address(decoded_tuple[2]),
+            next_user=encode_address(decoded_tuple[3]),
+            app_ids=list(decoded_tuple[4:114]),
+            cnt_app_ids=decoded_tuple[114],
         )
 
     def get_free_app_idx(self) -> int | None:
@@ -515,6 +833,7 @@ def set_valad_ready(
     valad_id: int,
     valman: AddressAndSigner,
     noticeboard_client: NoticeboardClient,
+    suggested_params: SuggestedParams=None
 ) -> ABITransactionResponse[None]:
     """Set validator ad to ready.
 
@@ -536,6 +855,8 @@ def set_valad_ready(
         Validator manager address and signer.
     noticeboard_client : NoticeboardClient
         Noticeboard client.
+    suggested_params : SuggestedParams, optional
+        Suggested parameters to reuse instead of fetching them, by default None.
     """
 
     boxes_user = [
@@ -551,7 +872,7 @@ def set_valad_ready(
     val_app_idx = user_info.get_app_idx(valad_id)
 
     # Increase fee for inner txns for ad_ready.
-    sp = algorand_client.client.algod.suggested_params()
+    sp = get_suggested_params(algorand_client, suggested_params)
     sp.fee = 2 * sp.min_fee
     sp.flat_fee = True
 
@@ -577,8 +898,10 @@ def report_delco_breach_pay(
     delco_id: int,
     fee_asset_id: int,
     valman: AddressAndSigner,
-    noticeboard_client: NoticeboardClient
-) -> ABITransactionResponse[None]:
+    noticeboard_client: NoticeboardClient,
+    suggested_params: SuggestedParams=None,
+    simulate_first: bool=False
+) -> AtomicTransactionResponse:
     """Report that the delegator contract can not transfer payment funds to validator ad.
 
     Parameters
@@ -599,10 +922,14 @@ def report_delco_breach_pay(
         Validator manager address and signer.
     noticeboard_client : NoticeboardClient
         Noticeboard client.
+    suggested_params : SuggestedParams, optional
+        Suggested parameters to reuse instead of fetching them, by default None.
+    simulate_first : bool, optional
+        Simulate the unsigned call first and only sign and submit it if successful, by default False.
 
     Returns
     -------
-    ABITransactionResponse[None]
+    AtomicTransactionResponse
     """
     boxes = valown_and_delman_boxes(
         valown_address=valown_address,
@@ -629,11 +956,11 @@ def report_delco_breach_pay(
     # Increase fee for forwarding the call to validator ad (1) and then delegator contract (1),
     # as well as for (potential) distribution of earnings (2), (potential) payout of partner fee (1),
     # and (potential) notification message (1).
-    sp = algorand_client.client.algod.suggested_params()
+    sp = get_suggested_params(algorand_client, suggested_params)
     sp.fee = 7 * sp.min_fee
     sp.flat_fee = True
 
-    return noticeboard_client.breach_pay(
+    return execute_composer(noticeboard_client.compose().breach_pay(
         del_manager=delman_address,
         del_app=delco_id,
         del_app_idx=del_app_idx,
@@ -648,7 +975,7 @@ def report_delco_breach_pay(
             accounts=[delman_address],
             boxes=boxes
         ),
-    )
+    ), simulate_first)
 
 
 def submit_partkeys(
@@ -667,7 +994,8 @@ def submit_partkeys(
     vote_key_dilution: int,
     vote_pk: str,
     selection_pk: str,
-    state_proof_pk: str
+    state_proof_pk: str,
+    suggested_params: SuggestedParams=None
 ) -> ABITransactionResponse[None]:
     """Submit participation keys.
 
@@ -705,6 +1033,8 @@ def submit_partkeys(
         Selection parameter of participation keys.
     state_proof_pk : str
         State proof parameter of participation keys.
+    suggested_params : SuggestedParams, optional
+        Suggested parameters to reuse instead of fetching them, by default None.
 
     Returns
     -------
@@ -738,7 +1068,7 @@ def submit_partkeys(
     # Increase fee for forwarding the call to validator ad (1) and then delegator contract (1),
     # as well as distribution of earnings to the validator ad (1) and noticeboard (1),
     # (potential) payout of partner fee (1), and (potential) notification message (1).
-    sp = algorand_client.client.algod.suggested_params()
+    sp = get_suggested_params(algorand_client, suggested_params)
     sp.fee = 7 * sp.min_fee
     sp.flat_fee = True
 
@@ -749,7 +1079,7 @@ def submit_partkeys(
         val_owner=valown_address,
         val_app=valad_id,
         val_app_idx=val_app_idx,
-        key_reg_txn_info = KeyRegTxnInfo(
+        key_reg_txn_info = notbd_module.KeyRegTxnInfo(
             vote_first=vote_first,
             vote_last=vote_last,
             vote_key_dilution=vote_key_dilution,
@@ -778,8 +1108,11 @@ def report_partkeys_not_submitted(
     delco_id: int,
     fee_asset_id: int,
     valman: AddressAndSigner,
-    noticeboard_client: NoticeboardClient
-) -> ABITransactionResponse[None]:
+    noticeboard_client: NoticeboardClient,
+    suggested_params: SuggestedParams=None,
+    simulate_first: bool=False,
+    batch_composer: object=None
+) -> AtomicTransactionResponse | object:
     """Report that the validator manager has not submitted the partkeys on time.
 
     Parameters
@@ -802,10 +1135,17 @@ def report_partkeys_not_submitted(
         Validator manager address and signer.
     noticeboard_client : NoticeboardClient
         Noticeboard client.
+    suggested_params : SuggestedParams, optional
+        Suggested parameters to reuse instead of fetching them, by default None.
+    simulate_first : bool, optional
+        Simulate the unsigned call first and only sign and submit it if successful, by default False.
+    batch_composer : object, optional
+        Noticeboard composer to add the call to, which is executed by the caller, by default None.
 
     Returns
     -------
-    ABITransactionResponse[None]
+    AtomicTransactionResponse | object
+        Execution response, or the batch composer with the added call if one is provided.
     """    
     boxes = valown_and_delman_boxes(
         valown_address=valown_address,
@@ -829,14 +1169,20 @@ def report_partkeys_not_submitted(
 
     # Increase fee for forwarding the call to validator ad (1) and then delegator contract (1),
     # plus the try for return of deposit to the delegator.
-    sp = algorand_client.client.algod.suggested_params()
+    sp = get_suggested_params(algorand_client, suggested_params)
     sp.fee = 5 * sp.min_fee
     sp.flat_fee = True
 
     # foreign_accounts = [partner_address, delman_address]
     foreign_accounts = [delman_address]
 
-    return noticeboard_client.keys_not_submitted(
+    if batch_composer is None:
+        batch_composer = noticeboard_client.compose()
+        execute = True
+    else:
+        execute = False # Executed by the caller, together with other calls
+
+    batch_composer.keys_not_submitted(
         del_manager=delman_address,
         del_app=delco_id,
         del_app_idx=del_app_idx,
@@ -853,6 +1199,10 @@ def report_partkeys_not_submitted(
         ),
     )
 
+    if execute:
+        return execute_composer(batch_composer, simulate_first)
+    return batch_composer
+
 
 def report_unconfirmed_partkeys(
     algorand_client: AlgorandClient,
@@ -863,8 +1213,10 @@ def report_unconfirmed_partkeys(
     delco_id: int,
     fee_asset_id: int,
     valman: AddressAndSigner,
-    noticeboard_client: NoticeboardClient
-) -> ABITransactionResponse[None]:
+    noticeboard_client: NoticeboardClient,
+    suggested_params: SuggestedParams=None,
+    simulate_first: bool=False
+) -> AtomicTransactionResponse:
     """Report that the delegator beneficiary has not confirmed the partkeys on time.
 
     Parameters
@@ -887,10 +1239,14 @@ def report_unconfirmed_partkeys(
         Validator manager address and signer.
     noticeboard_client : NoticeboardClient
         Noticeboard client.
+    suggested_params : SuggestedParams, optional
+        Suggested parameters to reuse instead of fetching them, by default None.
+    simulate_first : bool, optional
+        Simulate the unsigned call first and only sign and submit it if successful, by default False.
 
     Returns
     -------
-    ABITransactionResponse[None]
+    AtomicTransactionResponse
     """    
     boxes = valown_and_delman_boxes(
         valown_address=valown_address,
@@ -914,13 +1270,13 @@ def report_unconfirmed_partkeys(
 
     # Increase fee for forwarding the call to validator ad (1) and then delegator contract (1),
     # plus the try for return of deposit to the delegator.
-    sp = algorand_client.client.algod.suggested_params()
+    sp = get_suggested_params(algorand_client, suggested_params)
     sp.fee = 6 * sp.min_fee
     sp.flat_fee = True
 
     foreign_accounts = [partner_address, delman_address]
 
-    return noticeboard_client.keys_not_confirmed(
+    return execute_composer(noticeboard_client.compose().keys_not_confirmed(
         del_manager=delman_address,
         del_app=delco_id,
         del_app_idx=del_app_idx,
@@ -935,7 +1291,7 @@ def report_unconfirmed_partkeys(
             foreign_assets=foreign_assets,
             boxes=boxes
         ),
-    )
+    ), simulate_first)
 
 
 def report_contract_expired(
@@ -947,8 +1303,11 @@ def report_contract_expired(
     delco_id: int,
     fee_asset_id: int,
     valman: AddressAndSigner,
-    noticeboard_client: NoticeboardClient
-) -> ABITransactionResponse[None]:
+    noticeboard_client: NoticeboardClient,
+    suggested_params: SuggestedParams=None,
+    simulate_first: bool=False,
+    batch_composer: object=None
+) -> AtomicTransactionResponse | object:
     """Report that the delegator contract has expired (ended due to completion).
 
     Parameters
@@ -971,10 +1330,17 @@ def report_contract_expired(
         Validator manager address and signer.
     noticeboard_client : NoticeboardClient
         Noticeboard client.
+    suggested_params : SuggestedParams, optional
+        Suggested parameters to reuse instead of fetching them, by default None.
+    simulate_first : bool, optional
+        Simulate the unsigned call first and only sign and submit it if successful, by default False.
+    batch_composer : object, optional
+        Noticeboard composer to add the call to, which is executed by the caller, by default None.
 
     Returns
     -------
-    ABITransactionResponse[None]
+    AtomicTransactionResponse | object
+        Execution response, or the batch composer with the added call if one is provided.
     """    
     boxes = valown_and_delman_boxes(
         valown_address=valown_address,
@@ -1004,11 +1370,17 @@ def report_contract_expired(
     # Increase fee for forwarding the call to validator ad (1) and then delegator contract (1),
     # as well as for (potential) distribution of earnings (2), (potential) payout of partner fee (1),
     # and (potential) notification message (1).
-    sp = algorand_client.client.algod.suggested_params()
+    sp = get_suggested_params(algorand_client, suggested_params)
     sp.fee = 7 * sp.min_fee
     sp.flat_fee = True
 
-    return noticeboard_client.contract_expired(
+    if batch_composer is None:
+        batch_composer = noticeboard_client.compose()
+        execute = True
+    else:
+        execute = False # Executed by the caller, together with other calls
+
+    batch_composer.contract_expired(
         del_manager=delman_address,
         del_app=delco_id,
         del_app_idx=del_app_idx,
@@ -1025,6 +1397,10 @@ def report_contract_expired(
         ),
     )
 
+    if execute:
+        return execute_composer(batch_composer, simulate_first)
+    return batch_composer
+
 
 def report_delben_breach_limits(
     algorand_client: AlgorandClient,
@@ -1037,8 +1413,10 @@ def report_delben_breach_limits(
     fee_asset_id: int,
     gating_asa_id_list: List[int],
     valman: AddressAndSigner,
-    noticeboard_client: NoticeboardClient
-) -> ABITransactionResponse[None]:
+    noticeboard_client: NoticeboardClient,
+    suggested_params: SuggestedParams=None,
+    simulate_first: bool=False
+) -> AtomicTransactionResponse:
     """Report that the delegator beneficiary breached the max stake or one of the possible min gating ASA limits.
 
     Parameters
@@ -1065,10 +1443,14 @@ def report_delben_breach_limits(
         Validator manager address and signer.
     noticeboard_client : NoticeboardClient
         Noticeboard client.
+    suggested_params : SuggestedParams, optional
+        Suggested parameters to reuse instead of fetching them, by default None.
+    simulate_first : bool, optional
+        Simulate the unsigned call first and only sign and submit it if successful, by default False.
 
     Returns
     -------
-    ABITransactionResponse[None]
+    AtomicTransactionResponse
     """        
     boxes = valown_and_delman_boxes(
         valown_address=valown_address,
@@ -1100,11 +1482,11 @@ def report_delben_breach_limits(
     # as well as for (potential) distribution of earnings (2), (potential) note sending (1), and
     # the gas app call (1), the actual app call (1), (potential) payout of partner fee (1),
     # and (potential) notification message (1).
-    sp = algorand_client.client.algod.suggested_params()
+    sp = get_suggested_params(algorand_client, suggested_params)
     sp.fee = 9 * sp.min_fee
     sp.flat_fee = True
 
-    return noticeboard_client.compose(
+    return execute_composer(noticeboard_client.compose(
     ).gas(
         transaction_parameters=TransactionParameters(
             sender = valman.address,
@@ -1126,7 +1508,7 @@ def report_delben_breach_limits(
             suggested_params=sp,
             boxes=boxes,
         ),
-    ).execute()
+    ), simulate_first)
 
 
 def report_contract_expiry_soon(
@@ -1136,8 +1518,10 @@ def report_contract_expiry_soon(
     valad_id: int,
     delco_id: int,
     valman: AddressAndSigner,
-    noticeboard_client: NoticeboardClient
-) -> ABITransactionResponse[None]:
+    noticeboard_client: NoticeboardClient,
+    suggested_params: SuggestedParams=None,
+    simulate_first: bool=False
+) -> AtomicTransactionResponse:
     """Report to the delegator manager that the delegator contract is about to expire.
 
     Parameters
@@ -1156,10 +1540,14 @@ def report_contract_expiry_soon(
         Validator manager address and signer.
     noticeboard_client : NoticeboardClient
         Noticeboard client.
+    suggested_params : SuggestedParams, optional
+        Suggested parameters to reuse instead of fetching them, by default None.
+    simulate_first : bool, optional
+        Simulate the unsigned call first and only sign and submit it if successful, by default False.
 
     Returns
     -------
-    ABITransactionResponse[None]
+    AtomicTransactionResponse
     """        
     boxes = valown_and_delman_boxes(
         valown_address=valown_address,
@@ -1180,11 +1568,11 @@ def report_contract_expiry_soon(
 
     # Increase fee for forwarding the call to validator ad (1), and delegator contract (1),
     # as well as for (potential) notification message (1), and the app call (1).
-    sp = algorand_client.client.algod.suggested_params()
+    sp = get_suggested_params(algorand_client, suggested_params)
     sp.fee = 4 * sp.min_fee
     sp.flat_fee = True
 
-    return noticeboard_client.contract_report_expiry_soon(
+    return execute_composer(noticeboard_client.compose().contract_report_expiry_soon(
         del_manager=delman_address,
         del_app=delco_id,
         del_app_idx=del_app_idx,
@@ -1198,7 +1586,7 @@ def report_contract_expiry_soon(
             accounts=foreign_accounts,
             boxes=boxes,
         ),
-    )
+    ), simulate_first)
 
 
 def claim_used_up_operational_fee(
@@ -1210,8 +1598,10 @@ def claim_used_up_operational_fee(
     delco_id: int,
     fee_asset_id: int,
     valman: AddressAndSigner,
-    noticeboard_client: NoticeboardClient
-) -> ABITransactionResponse[None]:
+    noticeboard_client: NoticeboardClient,
+    suggested_params: SuggestedParams=None,
+    simulate_first: bool=False
+) -> AtomicTransactionResponse:
     """Transfer used up operational fee from delegator contract to the corresponding validator ad.
 
     Notes
@@ -1238,10 +1628,14 @@ def claim_used_up_operational_fee(
         Validator manager address and signer.
     noticeboard_client : NoticeboardClient
         Noticeboard client.
+    suggested_params : SuggestedParams, optional
+        Suggested parameters to reuse instead of fetching them, by default None.
+    simulate_first : bool, optional
+        Simulate the unsigned call first and only sign and submit it if successful, by default False.
 
     Returns
     -------
-    ABITransactionResponse[None]
+    AtomicTransactionResponse
     """        
     boxes = valown_and_delman_boxes(
         valown_address=valown_address,
@@ -1271,11 +1665,11 @@ def claim_used_up_operational_fee(
     # Increase fee for forwarding the call to validator ad (1) and then delegator contract (1),
     # as well as for (potential) distribution of earnings (2),
     # and (potential) payout of partner fee (1).
-    sp = algorand_client.client.algod.suggested_params()
+    sp = get_suggested_params(algorand_client, suggested_params)
     sp.fee = 6 * sp.min_fee
     sp.flat_fee = True
 
-    return noticeboard_client.contract_claim(
+    return execute_composer(noticeboard_client.compose().contract_claim(
         del_manager=delman_address,
         del_app=delco_id,
         del_app_idx=del_app_idx,
@@ -1290,4 +1684,4 @@ def claim_used_up_operational_fee(
             accounts=foreign_accounts,
             boxes=boxes,
         ),
-    )
+    ), simulate_first)
@@ -6,8 +6,10 @@ The inherited `...AppWrapper` methods are tested through `ValadAppWrapperList` a
 The wrappers should be independent of app state (just the client is connected), so tests don't have to be exhaustive.
 """
 # import sys
+import time
 import pytest
 import logging
+import threading
 # from pathlib import Path
 from typing import Callable
 
@@ -18,6 +20,7 @@ from valar_daemon.ValidatorAdClient import ValidatorAdClient
 from valar_daemon.DelegatorContractClient import DelegatorContractClient
 from valar_daemon.NoticeboardClient import NoticeboardClient
 from valar_daemon.AppWrapper import (
+    AppStateCache,
     AppWrapper,
     ValadAppWrapper,
     DelcoAppWrapper,
@@ -28,6 +31,7 @@ from valar_daemon.constants import (
     VALAD_STATE_NOT_READY, 
     VALAD_STATE_READY,
     DELCO_STATE_READY,
+    DELCO_STATE_LIVE,
     DELCO_STATE_ENDED_EXPIRED,
     VALAD_STATE_DELETED_MASK
 )
@@ -628,3 +632,107 @@ def test_delco_app_wrapper_list_get_partkey_params(
     assert app_wrapper.delben_address == params['address']
     assert app_wrapper.round_start == params['vote-first-valid']
     assert app_wrapper.round_end == params['vote-last-valid']
+
+
+@pytest.mark.parametrize(
+    "algo_fee_asset, valad_state, delco_state, delben_equal_delman", 
+    [
+        (True, VALAD_STATE_READY, DELCO_STATE_READY, True)
+    ]
+    )
+def test_app_state_cache_shared_between_wrappers(
+        algorand_client: AlgorandClient,
+        valad_id: int,
+        delco_id: int
+    ):
+    """Test that the noticeboard and valad state is fetched once when shared between wrappers.
+
+    Parameters
+    ----------
+    algorand_client : AlgorandClient
+    valad_id : int
+    delco_id : int
+    """
+    app_state_cache = AppStateCache(algorand_client)
+    # Valad and noticeboard state fetched when creating the valad wrapper
+    valad_wrapper = ValadAppWrapper(algorand_client, valad_id, app_state_cache)
+    assert app_state_cache.num_of_algod_calls == 2
+    # Only the delco state is fetched, the rest is reused
+    delco_wrapper = DelcoAppWrapper(algorand_client, delco_id, app_state_cache)
+    assert app_state_cache.num_of_algod_calls == 3
+    assert app_state_cache.get_num_of_saved_calls() == 2
+    assert delco_wrapper.notbd_client is valad_wrapper.notbd_client
+    # Updating in the same loop reuses the state
+    delco_wrapper.update_dynamic()
+    assert app_state_cache.num_of_algod_calls == 3
+    # Updating in the next loop fetches the state again, reusing the client
+    app_state_cache.reset()
+    delco_wrapper.update_dynamic()
+    assert app_state_cache.num_of_algod_calls == 1
+    assert app_state_cache.get_client(DelegatorContractClient, delco_id) is delco_wrapper.delco_client
+
+
+@pytest.mark.parametrize(
+    "algo_fee_asset, valad_state, delco_state, delben_equal_delman", 
+    [
+        (True, VALAD_STATE_READY, DELCO_STATE_LIVE, True),
+        (False, VALAD_STATE_READY, DELCO_STATE_LIVE, True)
+    ]
+    )
+def test_delco_app_wrapper_live_report_predictions(
+        algorand_client: AlgorandClient,
+        delco_id: int
+    ):
+    """Test that none of the live reports are predicted to succeed for a freshly live delco.
+
+    Parameters
+    ----------
+    algorand_client : AlgorandClient
+    delco_id : int
+    """
+    wrapper = DelcoAppWrapper(algorand_client, delco_id)
+    current_round = algorand_client.client.algod.status()['last-round']
+    assert not wrapper.can_report_expired(current_round)
+    assert not wrapper.can_report_expiry_soon(current_round)
+    assert not wrapper.can_report_breach_limits(algorand_client, current_round)
+    assert not wrapper.can_report_breach_pay(algorand_client, current_round)
+    # Expiry is predicted once the end round is reached
+    assert wrapper.can_report_expired(wrapper.round_end)
+    assert wrapper.can_report_expiry_soon(wrapper.round_end - 1) == (wrapper.before_expiry >= 1)
+
+
+class SlowAppClient(object):
+    """App client stand-in, whose global state takes a while to fetch.
+    """
+
+    def __init__(self, app_id: int, fetch_time_s: float):
+        self.app_id = app_id
+        self.fetch_time_s = fetch_time_s
+        self.num_of_fetches = 0
+
+    def get_global_state(self):
+        self.num_of_fetches += 1
+        time.sleep(self.fetch_time_s)
+        return f'state-{self.app_id}'
+
+
+def test_app_state_cache_fetch_outside_lock():
+    """Test that different apps are fetched concurrently, while an app in the course of being fetched is fetched once.
+    """
+    fetch_time_s = 0.2
+    app_state_cache = AppStateCache(None)
+    app_client_list = [SlowAppClient(app_id, fetch_time_s) for app_id in (1, 2, 3, 4)]
+    thread_list = [
+        threading.Thread(target=app_state_cache.get_global_state, args=(app_client,))
+        for app_client in app_client_list + app_client_list # Each app requested twice
+    ]
+    start_time_s = time.perf_counter()
+    for thread in thread_list:
+        thread.start()
+    for thread in thread_list:
+        thread.join()
+    assert time.perf_counter() - start_time_s < 2 * fetch_time_s # Not serialized (would be 4x)
+    assert [app_client.num_of_fetches for app_client in app_client_list] == [1, 1, 1, 1]
+    assert app_state_cache.num_of_algod_calls == 4
+    assert app_state_cache.get_num_of_saved_calls() == 4
+    assert app_state_cache.get_global_state(app_client_list[0]) == 'state-1'
@@ -420,7 +420,8 @@ def prepare_daemon_config(
         [fixture] Noticeboard utility from smart contract tests.
     """
     def _prep_daemon_config(
-        valad_id: list
+        valad_id: list,
+        max_workers: int=1
     ) -> Tuple[Path, str]:
         config_path = tmp_path
         config_filename = 'daemon.config'
@@ -431,6 +432,7 @@ def prepare_daemon_config(
         config_params = deepcopy(default_config_params) 
         config_params['validator_ad_id_list']=valad_id
         config_params['validator_manager_mnemonic']=mne
+        config_params['max_workers']=max_workers
         # Write config
         create_daemon_config_file(
             config_path,
@@ -1014,17 +1016,22 @@ class TestDelcoLiveStateHandler():
     @pytest.mark.parametrize(
         "algo_fee_asset, breach_pay, breach_stake, breach_gating, "
         "valad_state, delben_equal_delman, delco_state, "
-        "expected_delco_state", 
+        "expected_delco_state, simulate_first", 
         [
             ( # Active, same delegator manager and beneficiary
                 False, False, False, False, 
                 VALAD_STATE_READY, True, DELCO_STATE_LIVE, 
-                DELCO_STATE_LIVE
+                DELCO_STATE_LIVE, False
             ),
             ( # Duration elapsed, same delegator manager and beneficiary
                 False, False, False, False, 
                 VALAD_STATE_READY, True, DELCO_STATE_LIVE, 
-                DELCO_STATE_ENDED_EXPIRED
+                DELCO_STATE_ENDED_EXPIRED, False
+            ),
+            ( # Duration elapsed, report simulated before submitting
+                False, False, False, False, 
+                VALAD_STATE_READY, True, DELCO_STATE_LIVE, 
+                DELCO_STATE_ENDED_EXPIRED, True
             )
         ]
     )
@@ -1035,7 +1042,8 @@ class TestDelcoLiveStateHandler():
             Tuple[ValadAppWrapper, DelcoAppWrapper, AddressAndSigner]
         ],
         logger_mockup: logging.Logger,
-        expected_delco_state: bytes
+        expected_delco_state: bytes,
+        simulate_first: bool
     ):
         """Test contract expired (successfully ended).
 
@@ -1049,6 +1057,8 @@ class TestDelcoLiveStateHandler():
             [fixture] Logger.
         expected_delco_state : bytes
             [param] The expected state of the delegator contract.
+        simulate_first : bool
+            [param] Flag whether to simulate the reports before submitting them.
         """
         _, delco_app, valad_manager = valad_and_delco_app_wrapper_and_valman
         # Wait / progress rounds until delco expires
@@ -1067,7 +1077,8 @@ class TestDelcoLiveStateHandler():
             algorand_client,
             valad_manager,
             delco_app,
-            logger_mockup
+            logger_mockup,
+            simulate_first=simulate_first
         )
         delco_state = delco_app.delco_client.get_global_state().state.as_bytes
         assert(delco_state == expected_delco_state)
@@ -1350,6 +1361,7 @@ class TestDaemonMisc:
             algorand_client.client.algod.algod_address = "https://some.cloud"
         res = Daemon.check_algod_status(algorand_client)
         assert(res.is_ok == expected_is_ok_flag)
+        assert((res.last_round is not None) == expected_is_ok_flag)
     
     
     @staticmethod
@@ -1412,6 +1424,57 @@ class TestDaemonMisc:
         assert result == expected_result
 
 
+class TestDaemonRoundDrivenLoop:
+    """Test the round-driven waiting between loops.
+    """
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "algo_fee_asset, delben_equal_delman, valad_state, num_of_rounds", 
+        [   
+            (True, True, VALAD_STATE_READY, 1),
+            (True, True, VALAD_STATE_READY, 3)
+        ]
+    )
+    def test_wait_for_round(
+        algorand_client: AlgorandClient,
+        valad_app_wrapper_and_valman: Callable[
+            [AlgorandClient, Noticeboard, ActionInputs, bytes], 
+            Tuple[ValadAppWrapper, AddressAndSigner]
+        ],
+        prepare_daemon_config : Callable[
+            [Path, Noticeboard], 
+            Callable[..., Tuple[Path, str]]
+        ],
+        num_of_rounds: int
+    ):
+        """Check that waiting returns once the targeted round is reached.
+
+        Parameters
+        ----------
+        algorand_client : AlgorandClient
+            [fixture] Algorand client.
+        valad_app_wrapper_and_valman : Callable
+            [fixture] Callable for making the validator ad.
+        prepare_daemon_config : Callable
+            [fixture] Prepare configuration for the daemon.
+        num_of_rounds : int
+            [param] Number of rounds to progress before waiting.
+        """
+        valad_app_wrapper, _ = valad_app_wrapper_and_valman
+        config_path, config_name = prepare_daemon_config(
+            valad_id=[valad_app_wrapper.app_id]
+        )
+        daemon = Daemon(
+            str(Path(config_path, 'daemon.log')),
+            str(Path(config_path, config_name))
+        )
+        start_round = Daemon.check_algod_status(algorand_client).last_round
+        wait_for_rounds(algorand_client, num_of_rounds)
+        reached_round = daemon.wait_for_round(start_round + num_of_rounds, start_round)
+        assert reached_round >= start_round + num_of_rounds
+
+
 class TestDaemonConnectivityReliability:
     """Interrupt Daemon's connectivity to check corresponding error handling.
     """
@@ -1561,3 +1624,280 @@ class TestDaemonRebootReliability:
         )
         # Check that the import was successful
         assert len(daemon.partkey_manager.buffer_generated.partkeys) == 1
+
+
+class TestDaemonConcurrentServicing:
+    """Service multiple delegator contracts using the worker pool.
+    """
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "algo_fee_asset, delben_equal_delman, valad_state, max_workers", 
+        [   
+            (True, True, VALAD_STATE_READY, 1),
+            (True, True, VALAD_STATE_READY, 2)
+        ]
+    )
+    def test_concurrent_partkey_generation_requests(
+        valad_app_wrapper_and_valman: Callable[
+            [AlgorandClient, Noticeboard, ActionInputs, bytes], 
+            Tuple[ValadAppWrapper, AddressAndSigner]
+        ],
+        prepare_daemon_config : Callable[
+            [Path, Noticeboard], 
+            Callable[..., Tuple[Path, str]]
+        ],
+        noticeboard: Noticeboard,
+        action_inputs: ActionInputs,
+        max_workers: int
+    ):
+        """Check that each ready delegator contract gets exactly one partkey generation request, regardless of workers.
+
+        Parameters
+        ----------
+        valad_app_wrapper_and_valman : Callable
+            [fixture] Callable for making the validator ad.
+        prepare_daemon_config : Callable
+            [fixture] Prepare configuration for the daemon.
+        noticeboard: Noticeboard
+            [fixture] Noticeboard utility class.
+        action_inputs: ActionInputs
+            [fixture] Settings for the test.
+        max_workers : int
+            [param] Number of workers for servicing the delegator contracts.
+        """
+        # Make valad
+        valad_app_wrapper, _ = valad_app_wrapper_and_valman
+        # Make config file for daemon
+        config_path, config_name = prepare_daemon_config(
+            valad_id=[valad_app_wrapper.app_id],
+            max_workers=max_workers
+        )
+        # Initialize daemon
+        daemon = Daemon(
+            str(Path(config_path, 'daemon.log')),
+            str(Path(config_path, config_name))
+        )
+        # Create the maximum number of delegator contracts for the validator ad
+        for _ in range(action_inputs.cnt_del_max):
+            noticeboard.initialize_delegator_contract_state(
+                action_inputs=action_inputs, 
+                val_app_id=valad_app_wrapper.app_id,
+                target_state='READY'
+            )
+        # Service twice - the second servicing should not add duplicate requests
+        daemon.maintain_contracts()
+        daemon.maintain_contracts()
+        # Check that one partkey generation is pending per delegator contract
+        assert len(daemon.delco_app_list.get_app_list()) == action_inputs.cnt_del_max
+        assert len(daemon.partkey_manager.buffer_pending.partkeys) == action_inputs.cnt_del_max
+        for delco_app in daemon.delco_app_list.get_app_list():
+            assert daemon.partkey_manager.is_partkey_generation_pending(
+                delco_app.delben_address,
+                delco_app.round_start,
+                delco_app.round_end
+            )
+
+
+class TestDaemonLoopDeadline:
+    """Defer servicing once the loop deadline is exceeded.
+    """
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "algo_fee_asset, delben_equal_delman, valad_state", 
+        [   
+            (True, True, VALAD_STATE_READY),
+        ]
+    )
+    def test_deferred_after_deadline(
+        valad_app_wrapper_and_valman: Callable[
+            [AlgorandClient, Noticeboard, ActionInputs, bytes], 
+            Tuple[ValadAppWrapper, AddressAndSigner]
+        ],
+        prepare_daemon_config : Callable[
+            [Path, Noticeboard], 
+            Callable[..., Tuple[Path, str]]
+        ],
+        noticeboard: Noticeboard,
+        action_inputs: ActionInputs
+    ):
+        """Check that contracts are deferred past the deadline and serviced in the next loop.
+
+        Parameters
+        ----------
+        valad_app_wrapper_and_valman : Callable
+            [fixture] Callable for making the validator ad.
+        prepare_daemon_config : Callable
+            [fixture] Prepare configuration for the daemon.
+        noticeboard: Noticeboard
+            [fixture] Noticeboard utility class.
+        action_inputs: ActionInputs
+            [fixture] Settings for the test.
+        """
+        valad_app_wrapper, _ = valad_app_wrapper_and_valman
+        config_path, config_name = prepare_daemon_config(
+            valad_id=[valad_app_wrapper.app_id]
+        )
+        daemon = Daemon(
+            str(Path(config_path, 'daemon.log')),
+            str(Path(config_path, config_name))
+        )
+        for _ in range(action_inputs.cnt_del_max):
+            noticeboard.initialize_delegator_contract_state(
+                action_inputs=action_inputs, 
+                val_app_id=valad_app_wrapper.app_id,
+                target_state='READY'
+            )
+        # Service with an exhausted budget - nothing is serviced
+        daemon.loop_deadline_time_s = time.time() - 1
+        daemon.maintain_contracts()
+        delco_id_list = [delco_app.app_id for delco_app in daemon.delco_app_list.get_app_list()]
+        assert len(delco_id_list) == action_inputs.cnt_del_max
+        assert set(delco_id_list).issubset(daemon.deferred_app_id_set)
+        assert len(daemon.partkey_manager.buffer_pending.partkeys) == 0
+        # Service without a deadline - the deferred contracts are serviced
+        daemon.loop_deadline_time_s = None
+        daemon.maintain_contracts()
+        assert len(daemon.deferred_app_id_set) == 0
+        assert len(daemon.partkey_manager.buffer_pending.partkeys) == action_inputs.cnt_del_max
+
+
+class TestDaemonBatchedReports:
+    """Report multiple delegator contracts in a single atomic group.
+    """
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "algo_fee_asset, delben_equal_delman, valad_state", 
+        [   
+            (True, True, VALAD_STATE_READY)
+        ]
+    )
+    def test_batched_partkeys_not_submitted(
+        algorand_client: AlgorandClient,
+        valad_app_wrapper_and_valman: Callable[
+            [AlgorandClient, Noticeboard, ActionInputs, bytes], 
+            Tuple[ValadAppWrapper, AddressAndSigner]
+        ],
+        prepare_daemon_config : Callable[
+            [Path, Noticeboard], 
+            Callable[..., Tuple[Path, str]]
+        ],
+        noticeboard: Noticeboard,
+        action_inputs: ActionInputs
+    ):
+        """Check that ready delegator contracts, whose setup time is up, are reported together.
+
+        Parameters
+        ----------
+        algorand_client : AlgorandClient
+            [fixture] Algorand client.
+        valad_app_wrapper_and_valman : Callable
+            [fixture] Callable for making the validator ad.
+        prepare_daemon_config : Callable
+            [fixture] Prepare configuration for the daemon.
+        noticeboard: Noticeboard
+            [fixture] Noticeboard utility class.
+        action_inputs: ActionInputs
+            [fixture] Settings for the test.
+        """
+        # Make valad
+        valad_app_wrapper, _ = valad_app_wrapper_and_valman
+        # Make config file for daemon
+        config_path, config_name = prepare_daemon_config(
+            valad_id=[valad_app_wrapper.app_id]
+        )
+        # Initialize daemon
+        daemon = Daemon(
+            str(Path(config_path, 'daemon.log')),
+            str(Path(config_path, config_name))
+        )
+        # Create the maximum number of delegator contracts for the validator ad
+        for _ in range(action_inputs.cnt_del_max):
+            noticeboard.initialize_delegator_contract_state(
+                action_inputs=action_inputs, 
+                val_app_id=valad_app_wrapper.app_id,
+                target_state='READY'
+            )
+        daemon.populate_valad_wrapper_list()
+        daemon.populate_delco_wrapper_list()
+        delco_app_list = daemon.delco_app_list.get_app_list()
+        # Wait until the setup time is up for all delegator contracts
+        round_setup_end = max([delco_app.round_setup_end for delco_app in delco_app_list])
+        current_round = algorand_client.client.algod.status()['last-round']
+        wait_for_rounds(algorand_client, max(0, round_setup_end - current_round))
+        daemon.round_context.reset()
+        # Report in a single group
+        batch_reported_delco_id_list = daemon.report_delcos_in_batches(delco_app_list)
+        assert sorted(batch_reported_delco_id_list) == sorted([delco_app.app_id for delco_app in delco_app_list])
+        for delco_app in delco_app_list:
+            delco_state = delco_app.delco_client.get_global_state().state.as_bytes
+            assert delco_state == DELCO_STATE_ENDED_NOT_SUBMITTED
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "algo_fee_asset, delben_equal_delman, valad_state", 
+        [   
+            (True, True, VALAD_STATE_READY)
+        ]
+    )
+    def test_batched_reports_after_deadline(
+        algorand_client: AlgorandClient,
+        valad_app_wrapper_and_valman: Callable[
+            [AlgorandClient, Noticeboard, ActionInputs, bytes], 
+            Tuple[ValadAppWrapper, AddressAndSigner]
+        ],
+        prepare_daemon_config : Callable[
+            [Path, Noticeboard], 
+            Callable[..., Tuple[Path, str]]
+        ],
+        noticeboard: Noticeboard,
+        action_inputs: ActionInputs
+    ):
+        """Check that no group is reported after the loop deadline, leaving the delegator contracts to the next loop.
+
+        Parameters
+        ----------
+        algorand_client : AlgorandClient
+            [fixture] Algorand client.
+        valad_app_wrapper_and_valman : Callable
+            [fixture] Callable for making the validator ad.
+        prepare_daemon_config : Callable
+            [fixture] Prepare configuration for the daemon.
+        noticeboard: Noticeboard
+            [fixture] Noticeboard utility class.
+        action_inputs: ActionInputs
+            [fixture] Settings for the test.
+        """
+        valad_app_wrapper, _ = valad_app_wrapper_and_valman
+        config_path, config_name = prepare_daemon_config(
+            valad_id=[valad_app_wrapper.app_id]
+        )
+        daemon = Daemon(
+            str(Path(config_path, 'daemon.log')),
+            str(Path(config_path, config_name))
+        )
+        for _ in range(action_inputs.cnt_del_max):
+            noticeboard.initialize_delegator_contract_state(
+                action_inputs=action_inputs, 
+                val_app_id=valad_app_wrapper.app_id,
+                target_state='READY'
+            )
+        daemon.populate_valad_wrapper_list()
+        daemon.populate_delco_wrapper_list()
+        delco_app_list = daemon.delco_app_list.get_app_list()
+        round_setup_end = max([delco_app.round_setup_end for delco_app in delco_app_list])
+        current_round = algorand_client.client.algod.status()['last-round']
+        wait_for_rounds(algorand_client, max(0, round_setup_end - current_round))
+        daemon.round_context.reset()
+        # Report with an exhausted budget - nothing is reported
+        daemon.loop_deadline_time_s = time.time() - 1
+        assert daemon.report_delcos_in_batches(delco_app_list) == []
+        for delco_app in delco_app_list:
+            delco_state = delco_app.delco_client.get_global_state().state.as_bytes
+            assert delco_state == DELCO_STATE_READY
+        # Report without a deadline - all are reported in a single group
+        daemon.loop_deadline_time_s = None
+        batch_reported_delco_id_list = daemon.report_delcos_in_batches(delco_app_list)
+        assert sorted(batch_reported_delco_id_list) == sorted([delco_app.app_id for delco_app in delco_app_list])
@@ -83,6 +83,41 @@ def test_read_config(
         assert getattr(daemon_config, key) == value
 
 
+def test_read_config_optional_defaults(tmp_path: Path):
+    """Test that the optional parameters take their default values if not included in the config.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        [fixture] Path to temporary directory, per test.
+    """
+    create_daemon_config_file(
+        tmp_path, 
+        'daemon.config',
+        default_config_params,
+        include_claim_period=True,
+        include_optional=False
+    )
+    daemon_config = DaemonConfig(tmp_path, 'daemon.config')
+    daemon_config.read_config()
+    assert daemon_config.max_workers == 1
+    assert daemon_config.loop_period_rounds == 0
+    assert daemon_config.partkey_poll_period_s == 0
+    assert daemon_config.simulate_first == False
+    assert daemon_config.metrics_port == 0
+    assert daemon_config.persist_state == False
+    assert daemon_config.prefetch_max_concurrency == 16
+    assert daemon_config.algod_connection_pool_size == 0
+    assert daemon_config.algod_timeout_s == 30
+    assert daemon_config.algod_max_retries == 0
+    assert daemon_config.algod_retry_backoff_s == 0.5
+    assert daemon_config.algod_record_path == ''
+    assert daemon_config.algod_replay_path == ''
+    assert daemon_config.loop_deadline_s == 0
+    assert daemon_config.min_log_level == 10
+    assert daemon_config.log_json == False
+
+
 def test_write_config(tmp_path: Path, daemon_config: DaemonConfig):
     """Test writing config file.
 
@@ -157,6 +192,38 @@ def test_read_swap(daemon_config: DaemonConfig):
         assert getattr(daemon_config, key) == value
 
 
+
+def test_read_swap_if_changed(daemon_config: DaemonConfig):
+    """Test that the swap is only read when changed or a reload is requested, returning the changed settings.
+
+    Parameters
+    ----------
+    daemon_config : DaemonConfig
+        [fixture] An initialized daemon config abstraction object.
+    """
+    daemon_config.read_config()
+    daemon_config.create_swap() 
+    # First check reads the swap, without changes
+    assert daemon_config.read_swap_if_changed() == dict()
+    # Unchanged swap is not read
+    daemon_config.loop_period_s = None
+    assert daemon_config.read_swap_if_changed() == dict()
+    assert daemon_config.loop_period_s is None
+    # Requested reload reads the swap
+    daemon_config.request_reload()
+    assert daemon_config.read_swap_if_changed() == {'loop_period_s': (None, default_config_params['loop_period_s'])}
+    # Changed swap is read
+    daemon_config.loop_period_s += 1
+    daemon_config.validator_ad_id_list = daemon_config.validator_ad_id_list + [123]
+    daemon_config.create_swap() 
+    daemon_config.loop_period_s -= 1
+    daemon_config.validator_ad_id_list = daemon_config.validator_ad_id_list[:-1]
+    changed_settings = daemon_config.read_swap_if_changed()
+    assert set(changed_settings.keys()) == {'loop_period_s', 'validator_ad_id_list'}
+    assert changed_settings['loop_period_s'][1] == default_config_params['loop_period_s'] + 1
+    assert changed_settings['validator_ad_id_list'][1][-1] == 123
+
+
 @pytest.mark.parametrize(
     "claim_period_h, expected_claim_period_s", 
     [
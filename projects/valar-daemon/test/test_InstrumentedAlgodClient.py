@@ -0,0 +1,202 @@
+"""Test that the instrumented algod client records its requests and behaves like the algod client.
+"""
+import json
+import socket
+import http.client
+import pytest
+import threading
+from urllib.error import URLError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from algosdk.error import AlgodHTTPError
+
+from valar_daemon.Metrics import Metrics
+from valar_daemon.InstrumentedAlgodClient import InstrumentedAlgodClient, AlgodConnectionPool
+
+
+STATUS_BODY = json.dumps({'last-round': 123}).encode('utf-8')
+ERROR_BODY = json.dumps({'message': 'account not found'}).encode('utf-8')
+
+
+class AlgodRequestHandler(BaseHTTPRequestHandler):
+    """Respond to the status endpoint and fail all other requests, keeping the connection alive.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.path == '/v2/status':
+            self.send_response(200)
+            body = STATUS_BODY
+        else:
+            self.send_response(404)
+            body = ERROR_BODY
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StaleConnection(object):
+    """Idle connection that was closed by algod, failing the next request with the given error.
+    """
+
+    def __init__(self, error: Exception):
+        self.error = error
+        self.sock = None
+        self.timeout = None
+
+    def request(self, *args, **kwargs):
+        raise self.error
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(scope="module")
+def algod_address():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), AlgodRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+class TestInstrumentedAlgodClient():
+
+
+    @staticmethod
+    def test_endpoint_stats(
+        algod_address: str
+    ):
+        """Test that the requests are counted per endpoint, including their size, errors, and duration.
+
+        Parameters
+        ----------
+        algod_address : str
+            Algod URL.
+        """
+        metrics = Metrics()
+        algod_client = InstrumentedAlgodClient('a'*64, algod_address, metrics=metrics)
+        assert algod_client.status() == {'last-round': 123}
+        assert algod_client.status() == {'last-round': 123}
+        with pytest.raises(AlgodHTTPError) as e:
+            algod_client.account_info('A'*58)
+        assert e.value.code == 404
+        assert 'account not found' in str(e.value)
+        endpoint_stats_dict = algod_client.pop_endpoint_stats()
+        status_stats = endpoint_stats_dict['GET /status']
+        assert status_stats.num_of_requests == 2
+        assert status_stats.num_of_errors == 0
+        assert status_stats.num_of_bytes_received == 2 * len(STATUS_BODY)
+        assert status_stats.duration_s > 0
+        assert endpoint_stats_dict['GET /accounts/{address}'].num_of_errors == 1
+        total = InstrumentedAlgodClient.summarize_endpoint_stats(endpoint_stats_dict)
+        assert total.num_of_requests == 3
+        assert InstrumentedAlgodClient.format_endpoint_stats(endpoint_stats_dict).startswith('GET /status: 2x')
+        assert algod_client.pop_endpoint_stats() == {}
+        assert metrics.get_histogram_count('algod_request_duration_seconds', endpoint='GET /status') == 2
+
+
+    @staticmethod
+    def test_connection_pool(
+        algod_address: str
+    ):
+        """Test that the requests, including failed ones, reuse a single persistent connection.
+
+        Parameters
+        ----------
+        algod_address : str
+            Algod URL.
+        """
+        algod_client = InstrumentedAlgodClient('a'*64, algod_address, connection_pool_size=2)
+        for _ in range(3):
+            assert algod_client.status() == {'last-round': 123}
+        with pytest.raises(AlgodHTTPError) as e:
+            algod_client.account_info('A'*58)
+        assert e.value.code == 404
+        assert algod_client.status() == {'last-round': 123}
+        assert algod_client.connection_pool.num_of_connections_opened == 1
+        algod_client.close()
+        assert algod_client.status() == {'last-round': 123}
+        assert algod_client.connection_pool.num_of_connections_opened == 2
+
+
+    @staticmethod
+    @pytest.mark.parametrize("connection_pool_size", [0, 1])
+    def test_retry_on_connection_error(
+        connection_pool_size: int
+    ):
+        """Test that idempotent requests are retried on connection errors, raising `URLError` in the end.
+
+        Parameters
+        ----------
+        connection_pool_size : int
+            Maximal number of idle persistent connections.
+        """
+        with socket.socket() as s: # Find a port without a listener
+            s.bind(('127.0.0.1', 0))
+            port = s.getsockname()[1]
+        metrics = Metrics()
+        algod_client = InstrumentedAlgodClient(
+            'a'*64,
+            f'http://127.0.0.1:{port}',
+            metrics=metrics,
+            max_retries=2,
+            retry_backoff_s=0.01,
+            connection_pool_size=connection_pool_size
+        )
+        with pytest.raises(URLError):
+            algod_client.status()
+        with pytest.raises(URLError):
+            algod_client.send_raw_transaction('AA==') # Not repeated
+        endpoint_stats_dict = algod_client.pop_endpoint_stats()
+        assert endpoint_stats_dict['GET /status'].num_of_errors == 1
+        assert 'algod_request_retries_total{endpoint="GET /status"} 2' in metrics.render()
+        assert 'algod_request_retries_total{endpoint="POST /transactions"}' not in metrics.render()
+
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "method, error, is_repeated",
+        [
+            ('GET', ConnectionResetError(), True),
+            ('GET', http.client.RemoteDisconnected(), True),
+            ('POST', ConnectionResetError(), False),
+            ('POST', BrokenPipeError(), False),
+            ('POST', http.client.RemoteDisconnected(), True)
+        ]
+    )
+    def test_repeat_on_stale_connection(
+        algod_address: str,
+        method: str,
+        error: Exception,
+        is_repeated: bool
+    ):
+        """Test that only requests that algod cannot have processed are repeated after a stale connection error.
+
+        Parameters
+        ----------
+        algod_address : str
+            Algod URL.
+        method : str
+            Request method.
+        error : Exception
+            Error of the stale connection.
+        is_repeated : bool
+            Whether the request is expected to be repeated on a new connection.
+        """
+        connection_pool = AlgodConnectionPool(algod_address, max_num_of_idle=1)
+        connection_pool.idle_connection_list.append(StaleConnection(error))
+        if is_repeated:
+            status, _ = connection_pool.request(method, '/v2/status', None, {}, 1)
+            assert status == (200 if method == 'GET' else 501) # The test server does not implement POST
+            assert connection_pool.num_of_connections_opened == 1
+        else:
+            with pytest.raises(type(error)):
+                connection_pool.request(method, '/v2/status', None, {}, 1)
+            assert connection_pool.num_of_connections_opened == 0
+        connection_pool.close()
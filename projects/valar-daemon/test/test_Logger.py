@@ -1,8 +1,18 @@
+import gc
+import json
 import pytest
 import inspect
+import weakref
 from pathlib import Path
 
 from valar_daemon.Logger import Logger
+from valar_daemon.log_messages import LOG_MESSAGE_TABLE
+
+from test.test_benchmark.LoggerBenchmark import (
+    MIN_CALL_SITE_SPEEDUP,
+    get_filename_and_lineno_inspect,
+    measure_per_call_s
+)
 
 
 @pytest.fixture
@@ -42,3 +52,161 @@ class TestLoggerMessaging():
                     # Generate a list of 0s matching the number of parameters
                     args = [0] * len(sig.parameters)
                     method(*args)  # Call the method with arguments set to 0
+
+
+
+def read_level_log(log_dirpath: Path, level: int, logname: str) -> str:
+    """Read the active log file of a single level.
+
+    Parameters
+    ----------
+    log_dirpath : Path
+        Log output path.
+    level : int
+        Level of the log.
+    logname : str
+        Name of the log.
+
+    Returns
+    -------
+    str
+        Contents of the log.
+    """
+    return Path(log_dirpath, f'{level}-{logname}', f'{logname}.log').read_text()
+
+
+class TestLoggerPipeline():
+
+    @staticmethod
+    def test_level_fan_out(tmp_path: Path):
+        """Test that each record is written to every level file whose threshold it passes.
+        """
+        logger = Logger(tmp_path, 40*1024, 1)
+        logger.debug('debug-message')
+        logger.warning('warning-message')
+        logger.critical('critical-message')
+        logger.flush()
+        for level, logname, expected, unexpected in (
+            (10, 'debug', ['debug-message', 'warning-message', 'critical-message'], []),
+            (20, 'info', ['warning-message', 'critical-message'], ['debug-message']),
+            (30, 'warning', ['warning-message', 'critical-message'], ['debug-message']),
+            (40, 'error', ['critical-message'], ['debug-message', 'warning-message']),
+            (50, 'critical', ['critical-message'], ['debug-message', 'warning-message']),
+        ):
+            content = read_level_log(tmp_path, level, logname)
+            assert all(message in content for message in expected)
+            assert not any(message in content for message in unexpected)
+        logger.stop()
+
+    @staticmethod
+    def test_min_log_level(tmp_path: Path):
+        """Test that pre-defined and direct messages below the minimal level are skipped.
+        """
+        logger = Logger(tmp_path, 40*1024, 1, min_log_level=20)
+        logger.log_current_round(current_round=123456789) # Level 10
+        logger.debug('debug-message')
+        logger.log_batch_reported(num_of_delcos=2, delco_id_list=[987654321]) # Level 20
+        logger.flush()
+        content = read_level_log(tmp_path, 10, 'debug')
+        assert '123456789' not in content
+        assert 'debug-message' not in content
+        assert '987654321' in content
+        assert 'test_Logger.py:' in content # Call site still resolved to the caller
+        logger.stop()
+
+    @staticmethod
+    def test_json_lines(tmp_path: Path):
+        """Test that pre-defined messages are written to the JSON-lines log with their key and typed parameters.
+        """
+        logger = Logger(tmp_path, 40*1024, 1, log_json=True)
+        logger.log_current_round(current_round=123)
+        logger.log_single_loop_execution_time(0.25)
+        logger.warning('free-text-message')
+        logger.flush()
+        record_list = [
+            json.loads(line) for line in Path(tmp_path, 'json', 'events.jsonl').read_text().splitlines()
+        ]
+        assert [record['event'] for record in record_list] == ['current_round', 'single_loop_execution_time', None]
+        assert record_list[0]['fields'] == {'current_round': 123}
+        assert list(record_list[1]['fields'].values()) == [0.25]
+        assert record_list[2]['level'] == 30
+        assert record_list[2]['message'].endswith('free-text-message')
+        logger.stop()
+
+    @staticmethod
+    def test_dropped_when_queue_full(tmp_path: Path):
+        """Test that records are dropped and counted instead of blocking when the queue is full.
+        """
+        logger = Logger(tmp_path, 40*1024, 1, log_queue_size=1)
+        logger.stop() # Nothing consumes the queue anymore
+        logger.info('kept-message')
+        logger.info('dropped-message')
+        logger.info('dropped-message')
+        assert logger.get_num_of_dropped_messages() == 2
+
+    @staticmethod
+    def test_released_after_stop(tmp_path: Path):
+        """Test that a stopped logger is no longer referenced by its exit hook, i.e. can be garbage collected.
+        """
+        logger = Logger(tmp_path, 40*1024, 1)
+        logger.stop()
+        logger_ref = weakref.ref(logger)
+        del logger
+        gc.collect()
+        assert logger_ref() is None
+
+
+class TestLoggerCallSite():
+
+    @staticmethod
+    def test_call_site_matches_inspect():
+        """Check that the frame-based lookup points to the same call site as `inspect.stack()`.
+        """
+        def _call_through_levels():
+            return (
+                Logger.get_filename_and_lineno(call_stack_regression_levels=2),
+                get_filename_and_lineno_inspect(call_stack_regression_levels=2)
+            )
+        frame_based, inspect_based = _call_through_levels() # Both regress to this line
+        assert frame_based == inspect_based
+        assert frame_based.startswith('test_Logger.py:')
+
+    @staticmethod
+    def test_call_site_speedup():
+        """Check that the frame-based lookup is at least `MIN_CALL_SITE_SPEEDUP` times faster than `inspect.stack()`.
+
+        Notes
+        -----
+        The relative speedup is checked instead of the absolute time, which depends on the machine.
+        """
+        num_of_calls = 200
+        inspect_s = measure_per_call_s(lambda: get_filename_and_lineno_inspect(1), num_of_calls)
+        frame_s = measure_per_call_s(lambda: Logger.get_filename_and_lineno(1), num_of_calls)
+        assert inspect_s >= MIN_CALL_SITE_SPEEDUP * frame_s
+
+
+class TestLogMessageTable():
+
+    @staticmethod
+    def test_table_matches_source():
+        """Check that the pre-parsed message table is up to date with the YAML source (else compile it anew).
+        """
+        assert LOG_MESSAGE_TABLE == Logger._fetch_log_messages(Logger.LOG_MESSAGE_SOURCE_PATH), \
+            'Outdated log message table, run `python -m valar_daemon.Logger`.'
+
+    @staticmethod
+    def test_compiled_table(tmp_path: Path):
+        """Check that the compiled table loads the same messages as the YAML source, with and without a custom path.
+        """
+        table_path = Path(tmp_path, 'log_messages.py')
+        Logger.compile_log_message_table(log_message_table_path=str(table_path))
+        namespace = dict()
+        exec(table_path.read_text(), namespace)
+        assert namespace['LOG_MESSAGE_TABLE'] == Logger._fetch_log_messages(Logger.LOG_MESSAGE_SOURCE_PATH)
+        default_logger = Logger(Path(tmp_path, 'default'), 40*1024, 1)
+        source_logger = Logger(Path(tmp_path, 'source'), 40*1024, 1, Logger.LOG_MESSAGE_SOURCE_PATH)
+        assert default_logger.log_messages == source_logger.log_messages
+        assert all(not value['message'].endswith('\n') for value in default_logger.log_messages.values())
+        assert LOG_MESSAGE_TABLE['current_round']['message'].endswith('\n') # Table not stripped in place
+        default_logger.stop()
+        source_logger.stop()
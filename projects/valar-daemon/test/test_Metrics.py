@@ -0,0 +1,83 @@
+"""Test that the metrics are recorded, rendered, and served correctly.
+"""
+import pytest
+import urllib.request
+from urllib.error import HTTPError
+
+from valar_daemon.Metrics import Metrics, MetricsServer, get_algod_endpoint_label
+
+
+class TestMetrics():
+
+
+    @staticmethod
+    def test_render():
+        """Test that counters, gauges, and cumulative histogram buckets are rendered in the Prometheus text format.
+        """
+        metrics = Metrics(buckets_s=(0.1, 1))
+        metrics.inc('loops_total')
+        metrics.inc('loops_total')
+        metrics.set('partkey_buffer_pending', 3)
+        metrics.observe('delco_handler_duration_seconds', 0.05, handler='delco_live_state_handler')
+        metrics.observe('delco_handler_duration_seconds', 0.5, handler='delco_live_state_handler')
+        metrics.observe('delco_handler_duration_seconds', 5, handler='delco_live_state_handler')
+        line_list = metrics.render().splitlines()
+        assert '# TYPE valar_daemon_loops_total counter' in line_list
+        assert 'valar_daemon_loops_total 2' in line_list
+        assert 'valar_daemon_partkey_buffer_pending 3' in line_list
+        assert '# TYPE valar_daemon_delco_handler_duration_seconds histogram' in line_list
+        for upper_bound, count in (('0.1', 1), ('1', 2), ('+Inf', 3)):
+            assert (
+                'valar_daemon_delco_handler_duration_seconds_bucket'
+                f'{{handler="delco_live_state_handler",le="{upper_bound}"}} {count}'
+            ) in line_list
+        assert 'valar_daemon_delco_handler_duration_seconds_count{handler="delco_live_state_handler"} 3' in line_list
+        assert metrics.get_histogram_count('delco_handler_duration_seconds', handler='delco_live_state_handler') == 3
+
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "method, requrl, label",
+        [
+            ('GET', '/status', 'GET /status'),
+            ('GET', '/status/wait-for-block-after/123', 'GET /status/wait-for-block-after/{id}'),
+            ('GET', '/accounts/' + 'A'*58 + '/assets/456', 'GET /accounts/{address}/assets/{id}'),
+            ('POST', '/participation/generate/' + 'A'*58, 'POST /participation/generate/{address}'),
+        ]
+    )
+    def test_algod_endpoint_label(
+        method: str,
+        requrl: str,
+        label: str
+    ):
+        """Test that addresses and numbers are replaced in the endpoint label, keeping the number of labels bounded.
+
+        Parameters
+        ----------
+        method : str
+            Request method.
+        requrl : str
+            Request URL path.
+        label : str
+            Expected endpoint label.
+        """
+        assert get_algod_endpoint_label(method, requrl) == label
+
+
+    @staticmethod
+    def test_server():
+        """Test that the metrics are served at `/metrics` on a free port.
+        """
+        metrics = Metrics()
+        metrics.set('algod_ok', 1)
+        metrics_server = MetricsServer(metrics, 0)
+        metrics_server.start()
+        try:
+            url = f'http://127.0.0.1:{metrics_server.port}'
+            with urllib.request.urlopen(f'{url}/metrics', timeout=5) as response:
+                assert response.status == 200
+                assert 'valar_daemon_algod_ok 1' in response.read().decode('utf-8')
+            with pytest.raises(HTTPError):
+                urllib.request.urlopen(f'{url}/other', timeout=5)
+        finally:
+            metrics_server.stop()
@@ -41,6 +41,13 @@ def generate_random_address(length=58):
     characters = string.ascii_uppercase + string.digits
     return ''.join(random.choices(characters, k=length))
 
+def fill_partkey_buffer(partkey_buffer, num_of_keys):
+    max_num_of_keys = partkey_buffer.max_num_of_keys
+    partkey_buffer.max_num_of_keys = num_of_keys # Allow overfilling
+    for i in range(num_of_keys):
+        partkey_buffer.add_partkey_to_buffer(generate_random_address(), i, i + 1_000)
+    partkey_buffer.max_num_of_keys = max_num_of_keys
+
 @pytest.fixture(scope="function")
 def partkey_buffer():
     return PartkeyBuffer()
@@ -146,7 +153,7 @@ class TestPartkeyBuffer:
         expected_is_full_result: bool
     ):
         partkey_buffer.max_num_of_keys = max_num_of_keys
-        partkey_buffer.partkeys = [i for i in range(num_of_keys)]
+        fill_partkey_buffer(partkey_buffer, num_of_keys)
         assert partkey_buffer.is_full() == expected_is_full_result
 
     @staticmethod
@@ -164,7 +171,7 @@ class TestPartkeyBuffer:
     ):
         if test_buffer_full:
             partkey_buffer.max_num_of_keys = 50
-            partkey_buffer.partkeys = [i for i in range(partkey_buffer.max_num_of_keys)]
+            fill_partkey_buffer(partkey_buffer, partkey_buffer.max_num_of_keys)
             with pytest.raises(RuntimeError):
                 partkey_buffer.add_partkey_to_buffer(
                     dummy_partkey.address,
@@ -220,7 +227,7 @@ class TestPartkeyBuffer:
         for i in range(3):
             partkey_buffer.add_partkey_to_buffer(
                 dummy_partkey.address,
-                dummy_partkey.vote_first_valid,
+                dummy_partkey.vote_first_valid + i,
                 dummy_partkey.vote_last_valid
             )
         assert not partkey_buffer.is_empty()
@@ -233,11 +240,12 @@ class TestPartkeyBuffer:
         for i in range(3):
             partkey_buffer.add_partkey_to_buffer(
                 dummy_partkey.address,
-                dummy_partkey.vote_first_valid,
+                dummy_partkey.vote_first_valid + i,
                 dummy_partkey.vote_last_valid
             )
         assert len(partkey_buffer.partkeys) == 3
-        partkey_buffer.pop_partkey_from_buffer()
+        res = partkey_buffer.pop_partkey_from_buffer()
+        assert res['vote-first-valid'] == dummy_partkey.vote_first_valid # Oldest first
         assert len(partkey_buffer.partkeys) == 2
 
     @staticmethod
@@ -275,6 +283,74 @@ class TestPartkeyBuffer:
         )
         assert partkey_buffer.return_partkeys() == partkey_buffer.partkeys
 
+    @staticmethod
+    def test_add_existing_partkey_updates_entry(
+        partkey_buffer
+    ):
+        address = generate_random_address()
+        fill_partkey_buffer(partkey_buffer, 2)
+        partkey_buffer.add_partkey_to_buffer(address, 10, 20)
+        partkey_buffer.add_partkey_to_buffer(address, 10, 20, id='id', scheduled_deletion=15)
+        assert len(partkey_buffer) == 3
+        assert partkey_buffer.get_index_of_partkey_in_buffer(address, 10, 20) == 2
+        assert partkey_buffer.partkeys[2]['id'] == 'id'
+
+    @staticmethod
+    def test_remove_partkey_from_buffer(
+        partkey_buffer
+    ):
+        address = generate_random_address()
+        fill_partkey_buffer(partkey_buffer, 2)
+        partkey_buffer.add_partkey_to_buffer(address, 10, 20)
+        res = partkey_buffer.remove_partkey_from_buffer(address, 10, 20)
+        assert res['address'] == address
+        assert not partkey_buffer.is_partkey_in_buffer(address, 10, 20)
+        assert partkey_buffer.remove_partkey_from_buffer(address, 10, 20) is None
+        assert len(partkey_buffer) == 2
+
+    @staticmethod
+    def test_pop_partkeys_due_for_deletion():
+        partkey_buffer = PartkeyBuffer(track_deletion=True)
+        address = generate_random_address()
+        partkey_buffer.add_partkey_to_buffer(address, 0, 100, scheduled_deletion=30)
+        partkey_buffer.add_partkey_to_buffer(address, 1, 100, scheduled_deletion=10)
+        partkey_buffer.add_partkey_to_buffer(address, 2, 100)
+        partkey_buffer.add_partkey_to_buffer(address, 3, 100, scheduled_deletion=20)
+        partkey_buffer.add_partkey_to_buffer(address, 4, 100, scheduled_deletion=40)
+        partkey_buffer.update_partkey_scheduled_deletion(address, 0, 100, 5) # Reschedule earlier
+        partkey_buffer.update_partkey_scheduled_deletion(address, 3, 100, 50) # Reschedule later
+        partkey_buffer.remove_partkey_from_buffer(address, 4, 100) # Remove
+        assert partkey_buffer.pop_partkeys_due_for_deletion(5) == []
+        res = partkey_buffer.pop_partkeys_due_for_deletion(31)
+        assert [entry['vote-first-valid'] for entry in res] == [0, 1]
+        assert partkey_buffer.pop_partkeys_due_for_deletion(31) == [] # Popped from schedule
+        assert len(partkey_buffer) == 4 # Still in buffer
+        res = partkey_buffer.pop_partkeys_due_for_deletion(1_000)
+        assert [entry['vote-first-valid'] for entry in res] == [3]
+
+    @staticmethod
+    def test_deletion_heap_stays_bounded():
+        partkey_buffer = PartkeyBuffer(track_deletion=True)
+        address = generate_random_address()
+        for i in range(1_000):
+            partkey_buffer.add_partkey_to_buffer(address, i, i + 100, scheduled_deletion=i + 50)
+            partkey_buffer.update_partkey_scheduled_deletion(address, i, i + 100, i + 60) # Reschedule
+            if i >= 10:
+                partkey_buffer.remove_partkey_from_buffer(address, i - 10, i + 90)
+        assert len(partkey_buffer) == 10
+        assert len(partkey_buffer.deletion_heap) <= 2 * len(partkey_buffer.deletion_seq)
+        res = partkey_buffer.pop_partkeys_due_for_deletion(2_000)
+        assert [entry['vote-first-valid'] for entry in res] == list(range(990, 1_000))
+
+    @staticmethod
+    def test_deletion_not_tracked(
+        partkey_buffer
+    ):
+        address = generate_random_address()
+        partkey_buffer.add_partkey_to_buffer(address, 0, 100, scheduled_deletion=30)
+        assert partkey_buffer.deletion_heap == []
+        assert partkey_buffer.pop_partkeys_due_for_deletion(1_000) == []
+
 
 
 class TestPartkeyManager:
@@ -324,10 +400,10 @@ class TestPartkeyManager:
             )
         elif return_target == PARTKEY_GENERATION_REQUEST_FAIL_PENDING_FULL:
             partkey_manager.buffer_pending.max_num_of_keys = 50
-            partkey_manager.buffer_pending.partkeys = [i for i in range(50)]
+            fill_partkey_buffer(partkey_manager.buffer_pending, 50)
         elif return_target == PARTKEY_GENERATION_REQUEST_FAIL_GENERATED_FULL:
             partkey_manager.buffer_generated.max_num_of_keys = 50
-            partkey_manager.buffer_generated.partkeys = [i for i in range(50)]
+            fill_partkey_buffer(partkey_manager.buffer_generated, 50)
         res = partkey_manager.add_partkey_generation_request(
             dummy_partkey.address,
             dummy_partkey.vote_first_valid,
@@ -882,6 +958,81 @@ class TestPartkeyManager:
         )
 
 
+    @staticmethod
+    def test_partkey_snapshot(
+        algorand_client,
+        partkey_manager,
+        dummy_partkey
+    ):
+        """Test that the node's partkeys are reused until the next refresh or until the key is deleted.
+        """
+        try_to_delete_partkey(
+            algorand_client,
+            dummy_partkey.address,
+            dummy_partkey.vote_first_valid,
+            dummy_partkey.vote_last_valid
+        )
+        generate_partkey(
+            algorand_client,
+            dummy_partkey.address,
+            dummy_partkey.vote_first_valid,
+            dummy_partkey.vote_last_valid
+        )
+        time.sleep(
+            calc_sleep_time_for_partkey_generation(dummy_partkey.vote_last_valid - dummy_partkey.vote_first_valid)
+        )
+        # Snapshot taken on first check
+        partkey_params = partkey_manager.get_existing_partkey_parameters(
+            dummy_partkey.address,
+            dummy_partkey.vote_first_valid,
+            dummy_partkey.vote_last_valid
+        )
+        assert partkey_manager.partkey_snapshot_ids[partkey_params['id']] == partkey_params
+        # Deleted outside of the manager, but still in the snapshot
+        try_to_delete_partkey(
+            algorand_client,
+            dummy_partkey.address,
+            dummy_partkey.vote_first_valid,
+            dummy_partkey.vote_last_valid
+        )
+        assert partkey_manager.is_partkey_generated(
+            dummy_partkey.address,
+            dummy_partkey.vote_first_valid,
+            dummy_partkey.vote_last_valid
+        )
+        # Fetched anew on the next refresh (i.e. loop)
+        partkey_manager.refresh()
+        assert not partkey_manager.is_partkey_generated(
+            dummy_partkey.address,
+            dummy_partkey.vote_first_valid,
+            dummy_partkey.vote_last_valid
+        )
+        # Deleting through the manager drops the key from the snapshot
+        generate_partkey(
+            algorand_client,
+            dummy_partkey.address,
+            dummy_partkey.vote_first_valid,
+            dummy_partkey.vote_last_valid
+        )
+        time.sleep(
+            calc_sleep_time_for_partkey_generation(dummy_partkey.vote_last_valid - dummy_partkey.vote_first_valid)
+        )
+        partkey_manager.invalidate_partkey_snapshot()
+        partkey_manager.delete_partkey_using_id(
+            partkey_manager.get_partkey_id(
+                dummy_partkey.address,
+                dummy_partkey.vote_first_valid,
+                dummy_partkey.vote_last_valid
+            )
+        )
+        assert partkey_manager.partkey_snapshot is not None
+        assert not partkey_manager.is_partkey_generated(
+            dummy_partkey.address,
+            dummy_partkey.vote_first_valid,
+            dummy_partkey.vote_last_valid
+        )
+
+
     @staticmethod
     def test_get_partkey_id(
         algorand_client,
@@ -1509,3 +1660,62 @@ class TestPartkeyManager:
             dummy_partkey.vote_last_valid
         )
         assert exists == False
+
+
+    @staticmethod
+    def test_get_next_pending_partkey(
+        partkey_manager
+    ):
+        """Verify that pending partkeys are generated earliest deadline first and in FIFO order on equal deadlines.
+        """
+        address = generate_random_address()
+        for vote_first_valid, generation_deadline in [(100, None), (200, 150), (300, 100), (400, 100)]:
+            partkey_manager.buffer_pending.add_partkey_to_buffer(address, vote_first_valid, vote_first_valid + 1_000)
+            if generation_deadline is not None:
+                partkey_manager.generation_deadlines[(address, vote_first_valid, vote_first_valid + 1_000)] = generation_deadline
+        order = []
+        while not partkey_manager.buffer_pending.is_empty():
+            entry = partkey_manager.get_next_pending_partkey()
+            order.append(entry['vote-first-valid'])
+            partkey_manager.buffer_pending.remove_partkey_from_buffer(
+                entry['address'],
+                entry['vote-first-valid'],
+                entry['vote-last-valid']
+            )
+        assert order == [100, 300, 400, 200]
+        assert partkey_manager.get_next_pending_partkey() is None
+
+
+    @staticmethod
+    def test_generation_worker(
+        algorand_client,
+        partkey_manager,
+        dummy_partkey_factory
+    ):
+        """Verify that the background worker generates multiple pending partkeys without calling refresh.
+        """
+        partkeys = [dummy_partkey_factory() for i in range(3)]
+        for partkey in partkeys:
+            res = partkey_manager.add_partkey_generation_request(
+                partkey.address,
+                partkey.vote_first_valid,
+                partkey.vote_last_valid
+            )
+            assert res == PARTKEY_GENERATION_REQUEST_OK_ADDED
+        partkey_manager.start_generation_worker(poll_period_s=0.1)
+        timeout_s = 3 * calc_sleep_time_for_partkey_generation(
+            partkeys[0].vote_last_valid - partkeys[0].vote_first_valid
+        ) + 10
+        start_time = time.time()
+        while not partkey_manager.buffer_pending.is_empty() and time.time() - start_time < timeout_s:
+            time.sleep(0.1)
+        partkey_manager.stop_generation_worker()
+        assert partkey_manager.buffer_pending.is_empty()
+        assert len(partkey_manager.buffer_generated) == len(partkeys)
+        for partkey in partkeys:
+            try_to_delete_partkey(
+                algorand_client,
+                partkey.address,
+                partkey.vote_first_valid,
+                partkey.vote_last_valid
+            )
@@ -0,0 +1,38 @@
+"""Test that the prefetch engine services the contracts as the blocking daemon does, using the fake algod.
+"""
+from pathlib import Path
+
+from valar_daemon.PrefetchDaemon import PrefetchDaemon
+from valar_daemon.constants import DELCO_STATE_LIVE
+
+from test.test_benchmark.Benchmark import run_benchmark
+
+
+class TestPrefetchDaemon():
+
+
+    @staticmethod
+    def test_same_servicing_as_daemon(
+        tmp_path: Path
+    ):
+        """Test that the ready delcos get live and that each loop makes the same algod requests as with `Daemon`.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Config and log directory.
+        """
+        num_of_delcos = 20
+        Path(tmp_path, 'sync').mkdir()
+        Path(tmp_path, 'prefetch').mkdir()
+        sync_result = run_benchmark(
+            num_of_delcos, num_of_loops=5, num_of_ready_delcos=2, work_path=Path(tmp_path, 'sync')
+        )
+        prefetch_result = run_benchmark(
+            num_of_delcos, num_of_loops=5, num_of_ready_delcos=2, work_path=Path(tmp_path, 'prefetch'),
+            DaemonClass=PrefetchDaemon, prefetch_max_concurrency=8, max_workers=4
+        )
+        assert prefetch_result.delco_state_list == [DELCO_STATE_LIVE] * num_of_delcos
+        assert prefetch_result.num_of_startup_requests == sync_result.num_of_startup_requests
+        assert prefetch_result.num_of_requests_list == sync_result.num_of_requests_list
+        assert prefetch_result.request_count_dict == sync_result.request_count_dict
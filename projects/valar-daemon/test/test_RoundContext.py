@@ -0,0 +1,84 @@
+"""Test that the round context reuses algod information within a loop.
+"""
+import pytest
+
+from algokit_utils.beta.algorand_client import AlgorandClient
+
+from test.utils import wait_for_rounds
+
+from valar_daemon.RoundContext import RoundContext
+
+
+@pytest.fixture(scope="function")
+def round_context(algorand_client):
+    return RoundContext(algorand_client)
+
+
+class TestRoundContext():
+
+
+    @staticmethod
+    def test_status_fetched_once(
+        round_context: RoundContext,
+        algorand_client: AlgorandClient
+    ):
+        """Test that the status is fetched once and reused until reset.
+
+        Parameters
+        ----------
+        round_context : RoundContext
+            Round context.
+        algorand_client : AlgorandClient
+            Algorand client.
+        """
+        current_round = round_context.get_current_round()
+        wait_for_rounds(algorand_client, 1)
+        assert round_context.get_current_round() == current_round
+        assert round_context.num_of_algod_calls == 1
+        assert round_context.get_num_of_saved_calls() == 1
+        round_context.reset()
+        assert round_context.get_current_round() > current_round
+        assert round_context.num_of_algod_calls == 1
+        assert round_context.get_num_of_saved_calls() == 0
+
+
+    @staticmethod
+    def test_reset_with_status(
+        round_context: RoundContext,
+        algorand_client: AlgorandClient
+    ):
+        """Test that a seeded status is reused without calling algod.
+
+        Parameters
+        ----------
+        round_context : RoundContext
+            Round context.
+        algorand_client : AlgorandClient
+            Algorand client.
+        """
+        status = algorand_client.client.algod.status()
+        round_context.reset(status)
+        assert round_context.get_current_round() == status['last-round']
+        assert round_context.num_of_algod_calls == 1
+        assert round_context.get_num_of_saved_calls() == 1
+
+
+    @staticmethod
+    def test_suggested_params_copied(
+        round_context: RoundContext
+    ):
+        """Test that the suggested parameters are fetched once and that adjusting a copy does not affect the cache.
+
+        Parameters
+        ----------
+        round_context : RoundContext
+            Round context.
+        """
+        sp_1 = round_context.get_suggested_params()
+        sp_1.fee = 7 * sp_1.min_fee
+        sp_1.flat_fee = True
+        sp_2 = round_context.get_suggested_params()
+        assert sp_2.fee != sp_1.fee
+        assert sp_2.flat_fee != sp_1.flat_fee
+        assert round_context.num_of_algod_calls == 1
+        assert round_context.get_num_of_saved_calls() == 1
@@ -0,0 +1,115 @@
+"""Test that the local state store keeps the app wrappers' static fields and the partkey buffers between restarts.
+"""
+import sqlite3
+from pathlib import Path
+
+from valar_daemon.Logger import Logger
+from valar_daemon.PartkeyManager import PartkeyManager, create_partkey_dict
+from valar_daemon.StateStore import StateStore
+
+
+ADDRESS = 'A'*58
+DELCO_STATIC_FIELDS = {
+    'valad_id': 1001,
+    'delben_address': ADDRESS,
+    'gating_asa_min_list': [(0, 0), (2002, 5)],
+    'notbd_id': 1000
+}
+
+
+class TestStateStore():
+
+
+    @staticmethod
+    def test_state_path():
+        """Test that the state file is placed next to the log directory.
+        """
+        state_path = StateStore.get_state_path(Path('/var/valar/valar-daemon-log'))
+        assert state_path == Path('/var/valar/valar-daemon-log-state.sqlite')
+
+
+    @staticmethod
+    def test_static_fields(
+        tmp_path: Path
+    ):
+        """Test that the static fields are saved per app kind, only written when changed, and loaded after a restart.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            State file directory.
+        """
+        state_path = Path(tmp_path, 'state.sqlite')
+        state_store = StateStore(state_path)
+        assert state_store.save_static_fields('delco', {3003: DELCO_STATIC_FIELDS}) == True
+        assert state_store.save_static_fields('delco', {3003: DELCO_STATIC_FIELDS}) == False # Unchanged
+        assert state_store.save_static_fields('valad', {1001: {'valown_address': ADDRESS, 'notbd_id': 1000}}) == True
+        state_store.close()
+        state_store = StateStore(state_path)
+        static_fields_dict = state_store.load_static_fields('delco')
+        assert list(static_fields_dict.keys()) == [3003]
+        assert static_fields_dict[3003]['gating_asa_min_list'] == [[0, 0], [2002, 5]]
+        assert state_store.save_static_fields('delco', {3003: DELCO_STATIC_FIELDS}) == False # Same as loaded
+        assert state_store.save_static_fields('delco', {}) == True
+        assert state_store.load_static_fields('delco') == {}
+        assert list(state_store.load_static_fields('valad').keys()) == [1001]
+        state_store.close()
+
+
+    @staticmethod
+    def test_partkeys(
+        tmp_path: Path
+    ):
+        """Test that the generated partkeys are restored with their scheduled deletion after a restart.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            State and log file directory.
+        """
+        logger = Logger(log_dirpath=Path(tmp_path, 'log'), log_max_size_bytes=40*1024, log_file_count=1)
+        state_path = Path(tmp_path, 'state.sqlite')
+        partkey_manager = PartkeyManager(logger, None)
+        partkey_manager.buffer_generated.add_partkey_to_buffer(ADDRESS, 100, 200, id='ID-1', scheduled_deletion=150)
+        partkey_manager.buffer_generated.add_partkey_to_buffer(ADDRESS, 200, 300, id='ID-2')
+        state_store = StateStore(state_path)
+        assert state_store.save_partkeys(*partkey_manager.get_buffer_state()) == True
+        assert state_store.save_partkeys(*partkey_manager.get_buffer_state()) == False # Unchanged
+        state_store.close()
+        # Restart
+        partkey_manager = PartkeyManager(logger, None)
+        state_store = StateStore(state_path)
+        pending_partkey_list, generated_partkey_list, generation_deadlines = state_store.load_partkeys()
+        assert pending_partkey_list == []
+        assert generated_partkey_list[0] == create_partkey_dict(ADDRESS, 100, 200, id='ID-1', scheduled_deletion=150)
+        assert generation_deadlines == {}
+        assert partkey_manager.restore_buffers(pending_partkey_list, generated_partkey_list, generation_deadlines) == 2
+        assert [partkey['id'] for partkey in partkey_manager.buffer_generated.partkeys] == ['ID-1', 'ID-2']
+        due_partkey_list = partkey_manager.buffer_generated.pop_partkeys_due_for_deletion(151)
+        assert [partkey['id'] for partkey in due_partkey_list] == ['ID-1']
+        assert state_store.save_partkeys(*partkey_manager.get_buffer_state()) == False # Same as loaded
+        state_store.close()
+        logger.stop()
+
+
+    @staticmethod
+    def test_schema_version(
+        tmp_path: Path
+    ):
+        """Test that a state file with a different schema version is cleared.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            State file directory.
+        """
+        state_path = Path(tmp_path, 'state.sqlite')
+        state_store = StateStore(state_path)
+        state_store.save_static_fields('delco', {3003: DELCO_STATIC_FIELDS})
+        state_store.close()
+        with sqlite3.connect(state_path) as connection:
+            connection.execute(f'PRAGMA user_version = {StateStore.SCHEMA_VERSION + 1}')
+        connection.close()
+        state_store = StateStore(state_path)
+        assert state_store.load_static_fields('delco') == {}
+        state_store.close()
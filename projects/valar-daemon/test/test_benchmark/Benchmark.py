@@ -0,0 +1,176 @@
+"""Offline benchmark of the daemon loop against the fake algod.
+
+Run from the daemon's directory with e.g.
+`PYTHONPATH=src python -m test.test_benchmark.Benchmark --num-of-delcos 10 100 1000`.
+"""
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import List
+
+from algosdk import account, mnemonic
+
+from valar_daemon.Daemon import Daemon
+from valar_daemon.PrefetchDaemon import PrefetchDaemon
+
+from test.utils import default_config_params, create_daemon_config_file
+from test.test_benchmark.FakeAlgod import ValarWorld, FakeAlgod
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of a single benchmark run.
+
+    Notes
+    -----
+    The CPU time only covers the thread that runs the loop, i.e. excludes the fake algod, the log writer, and workers.
+    """
+    num_of_delcos: int
+    num_of_contracts: int
+    startup_duration_s: float
+    num_of_startup_requests: int
+    loop_duration_s_list: List[float] = field(default_factory=list)
+    loop_cpu_s_list: List[float] = field(default_factory=list)
+    num_of_requests_list: List[int] = field(default_factory=list)
+    request_count_dict: dict = field(default_factory=dict)
+    delco_state_list: list = field(default_factory=list)
+
+    def get_mean_loop_duration_s(self) -> float:
+        return sum(self.loop_duration_s_list) / max(1, len(self.loop_duration_s_list))
+
+    def get_mean_loop_cpu_s(self) -> float:
+        return sum(self.loop_cpu_s_list) / max(1, len(self.loop_cpu_s_list))
+
+    def get_requests_per_contract(self) -> float:
+        """Get the mean number of algod requests per serviced contract (valads and delcos) in a loop.
+
+        Returns
+        -------
+        float
+        """
+        num_of_requests = sum(self.num_of_requests_list) / max(1, len(self.num_of_requests_list))
+        return num_of_requests / max(1, self.num_of_contracts)
+
+    def format(self) -> str:
+        """Format the result as a single line.
+
+        Returns
+        -------
+        str
+        """
+        return (
+            f'{self.num_of_delcos:>6} delcos | '
+            f'startup {self.startup_duration_s:7.3f} s ({self.num_of_startup_requests} requests) | '
+            f'loop {self.get_mean_loop_duration_s():7.3f} s wall, {self.get_mean_loop_cpu_s():7.3f} s CPU | '
+            f'{self.get_requests_per_contract():5.2f} requests per contract'
+        )
+
+
+def run_benchmark(
+    num_of_delcos: int,
+    num_of_loops: int=5,
+    num_of_ready_delcos: int=0,
+    work_path: Path=None,
+    DaemonClass: type=Daemon,
+    latency_s: float=0,
+    **config_params
+) -> BenchmarkResult:
+    """Run the daemon against a synthetic world served by the fake algod and measure its loops.
+
+    Notes
+    -----
+    The real daemon loop is executed, without waiting between the loops.
+    The world advances by one round before each loop.
+
+    Parameters
+    ----------
+    num_of_delcos : int
+        Number of delegator contracts.
+    num_of_loops : int, optional
+        Number of measured loops, by default 5.
+    num_of_ready_delcos : int, optional
+        Number of delegator contracts waiting for keys, by default 0.
+    work_path : Path, optional
+        Directory for the config and log, by default a temporary one.
+    DaemonClass : type, optional
+        Servicing engine, e.g. `PrefetchDaemon`, by default `Daemon`.
+    latency_s : float, optional
+        Delay of each algod response in seconds, e.g. to mimic a remote algod, by default 0.
+    **config_params
+        Daemon config parameters that override the defaults, e.g. `max_workers`.
+
+    Returns
+    -------
+    BenchmarkResult
+    """
+    if work_path is None:
+        with tempfile.TemporaryDirectory() as tmp_path:
+            return run_benchmark(
+                num_of_delcos, num_of_loops, num_of_ready_delcos, Path(tmp_path), DaemonClass, latency_s, **config_params
+            )
+    world = ValarWorld(num_of_delcos, num_of_ready_delcos)
+    fake_algod = FakeAlgod(world, latency_s)
+    try:
+        daemon_config_params = deepcopy(default_config_params)
+        daemon_config_params.update(
+            validator_ad_id_list=world.valad_id_list,
+            validator_manager_mnemonic=mnemonic.from_private_key(account.generate_account()[0]),
+            algod_config_server=fake_algod.url,
+            claim_period_h=10**6 # Do not claim during the benchmark
+        )
+        daemon_config_params.update(config_params)
+        create_daemon_config_file(work_path, 'daemon.config', daemon_config_params)
+        start_time_s = time.time()
+        daemon = DaemonClass(str(Path(work_path, 'valar-daemon-log')), str(Path(work_path, 'daemon.config')))
+        result = BenchmarkResult(
+            num_of_delcos=num_of_delcos,
+            num_of_contracts=len(world.valad_id_list) + num_of_delcos,
+            startup_duration_s=time.time() - start_time_s,
+            num_of_startup_requests=sum(fake_algod.pop_request_counts().values())
+        )
+        for _ in range(num_of_loops):
+            world.advance_round()
+            start_time_s = time.time()
+            start_cpu_s = time.thread_time()
+            daemon.run_single_loop(start_time_s)
+            result.loop_cpu_s_list.append(time.thread_time() - start_cpu_s)
+            result.loop_duration_s_list.append(time.time() - start_time_s)
+            result.request_count_dict = fake_algod.pop_request_counts()
+            result.num_of_requests_list.append(sum(result.request_count_dict.values()))
+        result.delco_state_list = world.get_delco_state_list()
+        daemon.close()
+        daemon.logger.stop()
+    finally:
+        fake_algod.stop()
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the daemon loop against a fake algod.')
+    parser.add_argument('--num-of-delcos', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--num-of-loops', type=int, default=5)
+    parser.add_argument('--num-of-ready-delcos', type=int, default=0)
+    parser.add_argument('--max-workers', type=int, default=1)
+    parser.add_argument('--connection-pool-size', type=int, default=0)
+    parser.add_argument('--min-log-level', type=int, default=20)
+    parser.add_argument('--engine', type=str, choices=['sync', 'prefetch'], default='sync')
+    parser.add_argument('--prefetch-max-concurrency', type=int, default=16)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    args = parser.parse_args()
+    for num_of_delcos in args.num_of_delcos:
+        result = run_benchmark(
+            num_of_delcos,
+            args.num_of_loops,
+            min(args.num_of_ready_delcos, num_of_delcos),
+            DaemonClass=PrefetchDaemon if args.engine == 'prefetch' else Daemon,
+            latency_s=args.latency_ms / 1000,
+            max_workers=args.max_workers,
+            algod_connection_pool_size=args.connection_pool_size,
+            min_log_level=args.min_log_level,
+            prefetch_max_concurrency=args.prefetch_max_concurrency
+        )
+        print(result.format())
+        print('    ' + ', '.join(f'{endpoint}: {count}' for endpoint, count in sorted(result.request_count_dict.items())))
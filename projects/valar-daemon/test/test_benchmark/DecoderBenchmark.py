@@ -0,0 +1,199 @@
+"""Micro-benchmark of the precompiled struct decoders against the generic ABI decoding they replaced.
+
+Run from the daemon's directory with e.g.
+`PYTHONPATH=src:../valar-smart-contracts python -m test.test_benchmark.DecoderBenchmark --num-of-decodes 10000`.
+"""
+import timeit
+import dataclasses
+import random
+import argparse
+from typing import Callable
+
+from algosdk import account
+from algosdk.abi import AddressType, ArrayStaticType, ByteType, TupleType, UintType
+from algosdk.encoding import decode_address
+
+from valar_daemon.utils import (
+    UserInfo,
+    decode_delegation_terms_balance,
+    decode_delegation_terms_general,
+    decode_validator_terms_time,
+    decode_noticeboard_terms_timing,
+    get_delco_fee_and_gating_asa_id
+)
+from valar_daemon.DelegatorContractClient import (
+    DelegationTermsBalance,
+    DelegationTermsGeneral,
+    GlobalState as DelcoGlobalState
+)
+from valar_daemon.ValidatorAdClient import ValidatorTermsTiming
+from valar_daemon.NoticeboardClient import NoticeboardTermsTiming
+
+
+### ABI reference decoders (previous implementation) ###################################################################
+
+DELEGATION_TERMS_BALANCE_TYPE = TupleType([
+    UintType(64),  # stake_max
+    UintType(64),  # cnt_breach_del_max
+    UintType(64),  # rounds_breach
+    ArrayStaticType(ArrayStaticType(UintType(64), 2), 2),  # gating_asa_list
+])
+DELEGATION_TERMS_GENERAL_TYPE = TupleType([
+    UintType(64),  # commission
+    UintType(64),  # fee_round
+    UintType(64),  # fee_setup
+    UintType(64),  # fee_asset_id
+    AddressType(),  # partner_address
+    UintType(64),  # fee_round_partner
+    UintType(64),  # fee_setup_partner
+    UintType(64),  # rounds_setup
+    UintType(64),  # rounds_confirm
+])
+VALIDATOR_TERMS_TIMING_TYPE = TupleType([UintType(64)] * 5)
+NOTICEBOARD_TERMS_TIMING_TYPE = TupleType([UintType(64)] * 4)
+USER_INFO_TYPE = TupleType([
+    ArrayStaticType(ByteType(), 4),    # role
+    ArrayStaticType(ByteType(), 8),    # dll_name
+    AddressType(),   # prev_user
+    AddressType(),   # next_user
+    ArrayStaticType(UintType(64), 110),   # app_ids
+    UintType(64),   # cnt_app_ids
+])
+
+
+def from_decoded_tuple(
+    cls: type,
+    decoded_tuple: list
+) -> object:
+    """Make a generated (keyword-only) dataclass from the decoded tuple of its fields.
+    """
+    return cls(**{field.name: value for field, value in zip(dataclasses.fields(cls), decoded_tuple)})
+
+
+def decode_delegation_terms_balance_abi(data: bytes) -> DelegationTermsBalance:
+    decoded_tuple = DELEGATION_TERMS_BALANCE_TYPE.decode(data)
+    return DelegationTermsBalance(
+        stake_max=decoded_tuple[0],
+        cnt_breach_del_max=decoded_tuple[1],
+        rounds_breach=decoded_tuple[2],
+        gating_asa_list=[tuple(item) for item in decoded_tuple[3]],
+    )
+
+
+def decode_delegation_terms_general_abi(data: bytes) -> DelegationTermsGeneral:
+    return from_decoded_tuple(DelegationTermsGeneral, DELEGATION_TERMS_GENERAL_TYPE.decode(data))
+
+
+def decode_validator_terms_time_abi(data: bytes) -> ValidatorTermsTiming:
+    return from_decoded_tuple(ValidatorTermsTiming, VALIDATOR_TERMS_TIMING_TYPE.decode(data))
+
+
+def decode_noticeboard_terms_timing_abi(data: bytes) -> NoticeboardTermsTiming:
+    return from_decoded_tuple(NoticeboardTermsTiming, NOTICEBOARD_TERMS_TIMING_TYPE.decode(data))
+
+
+def decode_user_info_abi(data: bytes) -> UserInfo:
+    decoded_tuple = USER_INFO_TYPE.decode(data)
+    return UserInfo(
+        role=bytes(decoded_tuple[0]),
+        dll_name=bytes(decoded_tuple[1]),
+        prev_user=decoded_tuple[2],
+        next_user=decoded_tuple[3],
+        app_ids=decoded_tuple[4],
+        cnt_app_ids=decoded_tuple[5],
+    )
+
+
+def get_delco_fee_and_gating_asa_id_abi(global_state_raw: DelcoGlobalState) -> tuple:
+    # Previously, the whole global state was interpreted, incl. the addresses
+    AddressType().decode(global_state_raw.del_beneficiary.as_bytes)
+    AddressType().decode(global_state_raw.del_manager.as_bytes)
+    delegation_terms_balance = decode_delegation_terms_balance_abi(global_state_raw.delegation_terms_balance.as_bytes)
+    delegation_terms_general = decode_delegation_terms_general_abi(global_state_raw.delegation_terms_general.as_bytes)
+    gating_asa_id_list = [0] + [asa[0] for asa in delegation_terms_balance.gating_asa_list if asa[0] != 0]
+    return delegation_terms_general.fee_asset_id, gating_asa_id_list
+
+
+### Sample data ########################################################################################################
+
+def random_uint64_bytes(
+    rng: random.Random,
+    num_of_values: int
+) -> bytes:
+    return b''.join(rng.getrandbits(64).to_bytes(8, 'big') for _ in range(num_of_values))
+
+
+def random_address_bytes() -> bytes:
+    return decode_address(account.generate_account()[1])
+
+
+def make_sample_dict(
+    seed: int=0
+) -> dict:
+    """Make random encoded structs, indexed by the name of the decoded struct.
+
+    Parameters
+    ----------
+    seed : int, optional
+        Seed of the random values (addresses are always random), by default 0.
+
+    Returns
+    -------
+    dict
+        Encoded structs.
+    """
+    rng = random.Random(seed)
+    delegation_terms_balance = random_uint64_bytes(rng, 7)
+    delegation_terms_general = random_uint64_bytes(rng, 4) + random_address_bytes() + random_uint64_bytes(rng, 4)
+    return dict(
+        delegation_terms_balance=delegation_terms_balance,
+        delegation_terms_general=delegation_terms_general,
+        validator_terms_time=random_uint64_bytes(rng, 5),
+        noticeboard_terms_timing=random_uint64_bytes(rng, 4),
+        user_info=(
+            b'val_' + b'dll_val_' + random_address_bytes() + random_address_bytes() + random_uint64_bytes(rng, 111)
+        ),
+        delco_global_state=DelcoGlobalState({
+            b'B': delegation_terms_balance,
+            b'G': delegation_terms_general,
+            b'del_beneficiary': random_address_bytes(),
+            b'del_manager': random_address_bytes()
+        })
+    )
+
+
+# Decoder pairs (struct, ABI reference), indexed by the name of the decoded struct
+DECODER_PAIR_DICT = dict(
+    delegation_terms_balance=(decode_delegation_terms_balance, decode_delegation_terms_balance_abi),
+    delegation_terms_general=(decode_delegation_terms_general, decode_delegation_terms_general_abi),
+    validator_terms_time=(decode_validator_terms_time, decode_validator_terms_time_abi),
+    noticeboard_terms_timing=(decode_noticeboard_terms_timing, decode_noticeboard_terms_timing_abi),
+    user_info=(UserInfo.from_bytes, decode_user_info_abi),
+    delco_global_state=(get_delco_fee_and_gating_asa_id, get_delco_fee_and_gating_asa_id_abi)
+)
+
+
+### Benchmark ##########################################################################################################
+
+def time_decoder(
+    decoder: Callable,
+    data: bytes,
+    num_of_decodes: int
+) -> float:
+    """Get the mean duration of a single decode in microseconds.
+    """
+    return min(timeit.repeat(lambda: decoder(data), number=num_of_decodes, repeat=3)) / num_of_decodes * 1e6
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the struct decoders against the ABI decoding.')
+    parser.add_argument('--num-of-decodes', type=int, default=10000)
+    args = parser.parse_args()
+    sample_dict = make_sample_dict()
+    for name, (decoder, abi_decoder) in DECODER_PAIR_DICT.items():
+        duration_us = time_decoder(decoder, sample_dict[name], args.num_of_decodes)
+        abi_duration_us = time_decoder(abi_decoder, sample_dict[name], args.num_of_decodes)
+        print(
+            f'{name:>26} | struct {duration_us:8.2f} us | ABI {abi_duration_us:8.2f} us | '
+            f'{abi_duration_us / duration_us:6.1f}x'
+        )
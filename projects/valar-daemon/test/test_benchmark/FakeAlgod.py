@@ -0,0 +1,553 @@
+"""In-process fake algod, serving a synthetic Valar world model for offline benchmarks of the daemon.
+
+Notes
+-----
+Only the endpoints used by the daemon are served.
+Calls that the world model does not expect to succeed (e.g. reports whose conditions do not hold) are rejected,
+similar to a failed transaction on a public network.
+"""
+import io
+import time
+import json
+import base64
+import struct
+import threading
+from urllib.parse import urlparse, parse_qs, unquote
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import msgpack
+from algosdk import account
+from algosdk.encoding import decode_address
+from algosdk.transaction import SignedTransaction
+
+from valar_daemon.NoticeboardClient import APP_SPEC
+from valar_daemon.constants import (
+    VALAD_STATE_READY,
+    VALAD_STATE_NOT_READY,
+    DELCO_STATE_READY,
+    DELCO_STATE_SUBMITTED,
+    DELCO_STATE_LIVE,
+    ALGO_ASA_ID
+)
+
+
+NOTICEBOARD_ID = 1000
+FIRST_VALAD_ID = 2000
+FIRST_DELCO_ID = 10000
+MAX_DELCOS_PER_VALAD = 14 # Fits into a single global state value
+NUM_OF_USER_APP_IDS = 110
+GENESIS_HASH = base64.b64encode(bytes(32)).decode('utf-8')
+
+METHOD_NAME_DICT = {method.get_selector(): method.name for method in APP_SPEC.contract.methods}
+
+
+def random_address() -> str:
+    """Get a random address (without using its private key).
+
+    Returns
+    -------
+    str
+        Address.
+    """
+    return account.generate_account()[1]
+
+
+def encode_user_info(
+    app_id_list: list
+) -> bytes:
+    """Encode a noticeboard user box, holding the user's app IDs.
+
+    Parameters
+    ----------
+    app_id_list : list
+        IDs of the user's apps.
+
+    Returns
+    -------
+    bytes
+        Box value.
+    """
+    app_ids = list(app_id_list) + [0] * (NUM_OF_USER_APP_IDS - len(app_id_list))
+    return bytes(4) + bytes(8) + bytes(32) + bytes(32) + struct.pack(f'>{NUM_OF_USER_APP_IDS}Q', *app_ids) + \
+        struct.pack('>Q', len(app_id_list))
+
+
+class ValarWorld(object):
+    """Synthetic Valar world: a noticeboard, ready validator ads, and their delegator contracts.
+
+    Notes
+    -----
+    The delegator contracts pay in ALGO and are mostly live, with none of the live reports due.
+    Ready delegator contracts get live a few rounds after their keys are submitted.
+
+    Attributes
+    ----------
+    current_round : int
+        Last round.
+    valown_address : str
+        Owner of all validator ads.
+    valad_id_list : list
+        IDs of the validator ads.
+    delco_id_list : list
+        IDs of the delegator contracts.
+    app_dict : dict
+        Global state of each app (keys and values), keyed by app ID.
+    box_dict : dict
+        Box values, keyed by app ID and box name.
+    account_dict : dict
+        ALGO balance of the accounts, keyed by address.
+    partkey_list : list
+        Participation keys on the node.
+    confirmed_txn_dict : dict
+        Confirmation round of the accepted transactions, keyed by transaction ID.
+    submitted_round_dict : dict
+        Round at which the keys were submitted, keyed by delco ID.
+    """
+
+    def __init__(
+        self,
+        num_of_delcos: int,
+        num_of_ready_delcos: int=0,
+        start_round: int=1000,
+        rounds_confirm: int=2
+    ):
+        """Create the world.
+
+        Parameters
+        ----------
+        num_of_delcos : int
+            Number of delegator contracts.
+        num_of_ready_delcos : int, optional
+            Number of these contracts that are waiting for keys, by default 0.
+        start_round : int, optional
+            Initial round, by default 1000.
+        rounds_confirm : int, optional
+            Number of rounds after the keys are submitted until the contract is live, by default 2.
+        """
+        self.lock = threading.Lock()
+        self.current_round = start_round
+        self.rounds_confirm = rounds_confirm
+        self.valown_address = random_address()
+        self.app_dict = dict()
+        self.box_dict = dict()
+        self.account_dict = dict()
+        self.partkey_list = []
+        self.confirmed_txn_dict = dict()
+        self.submitted_round_dict = dict()
+        self.delco_id_list = [FIRST_DELCO_ID + i for i in range(num_of_delcos)]
+        self.valad_id_list = [
+            FIRST_VALAD_ID + i for i in range((num_of_delcos + MAX_DELCOS_PER_VALAD - 1) // MAX_DELCOS_PER_VALAD)
+        ]
+        self.app_dict[NOTICEBOARD_ID] = {
+            b'noticeboard_terms_timing': struct.pack('>4Q', 0, 0, 100_000, 1_000)
+        }
+        self.box_dict[(NOTICEBOARD_ID, decode_address(self.valown_address))] = encode_user_info(self.valad_id_list)
+        for i, valad_id in enumerate(self.valad_id_list):
+            del_app_list = self.delco_id_list[i*MAX_DELCOS_PER_VALAD:(i+1)*MAX_DELCOS_PER_VALAD]
+            del_app_list += [0] * (MAX_DELCOS_PER_VALAD - len(del_app_list))
+            self.app_dict[valad_id] = {
+                b'noticeboard_app_id': NOTICEBOARD_ID,
+                b'val_owner': decode_address(self.valown_address),
+                b'state': VALAD_STATE_READY,
+                b'del_app_list': struct.pack(f'>{MAX_DELCOS_PER_VALAD}Q', *del_app_list)
+            }
+        for i, delco_id in enumerate(self.delco_id_list):
+            delman_address = random_address()
+            delben_address = random_address()
+            round_start = start_round + 10
+            self.app_dict[delco_id] = {
+                b'noticeboard_app_id': NOTICEBOARD_ID,
+                b'validator_ad_app_id': self.valad_id_list[i // MAX_DELCOS_PER_VALAD],
+                b'state': DELCO_STATE_READY if i < num_of_ready_delcos else DELCO_STATE_LIVE,
+                b'del_manager': decode_address(delman_address),
+                b'del_beneficiary': decode_address(delben_address),
+                b'round_start': round_start,
+                b'round_end': round_start + 1_000_000,
+                b'round_ended': 0,
+                b'round_breach_last': 0,
+                b'round_claim_last': round_start,
+                b'round_expiry_soon_last': 0,
+                b'sel_key': bytes(32),
+                b'vote_key': bytes(32),
+                b'state_proof_key': bytes(64),
+                b'tc_sha256': bytes(32),
+                b'G': struct.pack('>4Q', 0, 10, 0, ALGO_ASA_ID) + bytes(32) + struct.pack('>4Q', 0, 0, 1_000, 1_000),
+                b'B': struct.pack('>3Q', 10**15, 3, 100) + struct.pack('>4Q', 0, 0, 0, 0)
+            }
+            self.box_dict[(NOTICEBOARD_ID, decode_address(delman_address))] = encode_user_info([delco_id])
+            self.account_dict[delben_address] = 10**9
+
+    def advance_round(
+        self,
+        num_of_rounds: int=1
+    ) -> None:
+        """Advance the round, making the contracts with submitted keys live after the confirmation period.
+
+        Parameters
+        ----------
+        num_of_rounds : int, optional
+            Number of rounds, by default 1.
+        """
+        with self.lock:
+            self.current_round += num_of_rounds
+            for delco_id, submitted_round in list(self.submitted_round_dict.items()):
+                if submitted_round + self.rounds_confirm <= self.current_round:
+                    self.app_dict[delco_id][b'state'] = DELCO_STATE_LIVE
+                    del self.submitted_round_dict[delco_id]
+
+    def get_delco_state_list(self) -> list:
+        """Get the state of each delegator contract.
+
+        Returns
+        -------
+        list
+            States.
+        """
+        with self.lock:
+            return [self.app_dict[delco_id][b'state'] for delco_id in self.delco_id_list]
+
+    def evaluate_txn_group(
+        self,
+        signed_txn_list: list,
+        apply: bool
+    ) -> str | None:
+        """Evaluate a transaction group, optionally applying its effects.
+
+        Notes
+        -----
+        Only the submission of keys to a ready contract and setting an ad ready succeed.
+
+        Parameters
+        ----------
+        signed_txn_list : list
+            Signed (or unsigned) transactions, as decoded from msgpack.
+        apply : bool
+            Apply the effects if all transactions succeed.
+
+        Returns
+        -------
+        str | None
+            Failure message, None if the group succeeds.
+        """
+        effect_list = []
+        with self.lock:
+            for signed_txn in signed_txn_list:
+                txn = signed_txn['txn']
+                if txn.get('type', None) != 'appl':
+                    continue
+                app_arg_list = txn.get('apaa', [])
+                method_name = METHOD_NAME_DICT.get(app_arg_list[0] if len(app_arg_list) > 0 else None, None)
+                if method_name == 'keys_submit':
+                    app_id = ValarWorld.get_app_arg(txn, 2)
+                    expected_state = DELCO_STATE_READY
+                elif method_name == 'ad_ready':
+                    app_id = ValarWorld.get_app_arg(txn, 2)
+                    expected_state = VALAD_STATE_NOT_READY
+                else:
+                    return f'{method_name} is not applicable'
+                if self.app_dict.get(app_id, {}).get(b'state', None) != expected_state:
+                    return f'{method_name} is not applicable to app {app_id}'
+                effect_list.append((method_name, app_id))
+            if apply:
+                for method_name, app_id in effect_list:
+                    if method_name == 'keys_submit':
+                        self.app_dict[app_id][b'state'] = DELCO_STATE_SUBMITTED
+                        self.submitted_round_dict[app_id] = self.current_round
+                    else:
+                        self.app_dict[app_id][b'state'] = VALAD_STATE_READY
+                for signed_txn in signed_txn_list:
+                    self.confirmed_txn_dict[SignedTransaction.undictify(signed_txn).get_txid()] = self.current_round
+        return None
+
+    @staticmethod
+    def get_app_arg(
+        txn: dict,
+        arg_idx: int
+    ) -> int:
+        """Get the app ID referenced by an ABI `application` argument.
+
+        Parameters
+        ----------
+        txn : dict
+            App call transaction.
+        arg_idx : int
+            Index of the argument (the method selector is at zero).
+
+        Returns
+        -------
+        int
+            App ID.
+        """
+        app_idx = txn['apaa'][arg_idx][0]
+        if app_idx == 0:
+            return txn.get('apid', 0)
+        return txn['apfa'][app_idx - 1]
+
+
+class FakeAlgodRequestHandler(BaseHTTPRequestHandler):
+    """Serve the algod endpoints used by the daemon from the server's world model, keeping the connection alive.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True # As algod, otherwise a reused connection waits for the delayed ACK of the headers
+
+    def do_GET(self):
+        self.server.fake_algod.handle_request(self, 'GET')
+
+    def do_POST(self):
+        self.server.fake_algod.handle_request(self, 'POST')
+
+    def do_DELETE(self):
+        self.server.fake_algod.handle_request(self, 'DELETE')
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeAlgod(object):
+    """Fake algod, serving a world model on a local port.
+
+    Attributes
+    ----------
+    world : ValarWorld
+        World model.
+    latency_s : float
+        Delay of each response in seconds, e.g. to mimic a remote algod.
+    url : str
+        Algod URL.
+    request_count_dict : dict
+        Number of requests since the last pop, keyed by the method and endpoint (e.g. 'GET /v2/status').
+    """
+
+    def __init__(
+        self,
+        world: ValarWorld,
+        latency_s: float=0
+    ):
+        """Start serving the world model.
+
+        Parameters
+        ----------
+        world : ValarWorld
+            World model.
+        latency_s : float, optional
+            Delay of each response in seconds, by default 0.
+        """
+        self.world = world
+        self.latency_s = latency_s
+        self.request_count_dict = dict()
+        self.count_lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), FakeAlgodRequestHandler)
+        self.server.daemon_threads = True
+        self.server.fake_algod = self
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}'
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Stop serving.
+        """
+        self.server.shutdown()
+        self.server.server_close()
+
+    def pop_request_counts(self) -> dict:
+        """Get the number of requests per endpoint since the last call and reset them.
+
+        Returns
+        -------
+        dict
+            Number of requests, keyed by the method and endpoint.
+        """
+        with self.count_lock:
+            request_count_dict = self.request_count_dict
+            self.request_count_dict = dict()
+            return request_count_dict
+
+    def count_request(
+        self,
+        endpoint: str
+    ) -> None:
+        with self.count_lock:
+            self.request_count_dict[endpoint] = self.request_count_dict.get(endpoint, 0) + 1
+
+    def handle_request(
+        self,
+        handler: BaseHTTPRequestHandler,
+        method: str
+    ) -> None:
+        """Respond to a single request.
+
+        Parameters
+        ----------
+        handler : BaseHTTPRequestHandler
+            Request handler.
+        method : str
+            HTTP method.
+        """
+        if self.latency_s > 0:
+            time.sleep(self.latency_s)
+        url = urlparse(handler.path)
+        query = {key: value[0] for key, value in parse_qs(url.query).items()}
+        body = handler.rfile.read(int(handler.headers.get('Content-Length', 0)))
+        parts = url.path.strip('/').split('/')[1:] # Drop the API version
+        try:
+            endpoint, code, response = self.route(method, parts, query, body)
+        except Exception as e:
+            endpoint, code, response = 'unknown', 500, {'message': f'{type(e).__name__}: {e}'}
+        self.count_request(f'{method} {endpoint}')
+        response_bytes = json.dumps(response).encode('utf-8')
+        handler.send_response(code)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(response_bytes)))
+        handler.end_headers()
+        handler.wfile.write(response_bytes)
+
+    def route(
+        self,
+        method: str,
+        parts: list,
+        query: dict,
+        body: bytes
+    ) -> tuple:
+        """Get the response of an endpoint.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method.
+        parts : list
+            Path parts after the API version.
+        query : dict
+            Query parameters.
+        body : bytes
+            Request body.
+
+        Returns
+        -------
+        tuple
+            Endpoint name, status code, and the JSON response.
+        """
+        world = self.world
+        if method == 'GET' and parts[0] == 'status':
+            return '/status', 200, self.get_status()
+        if method == 'GET' and parts == ['transactions', 'params']:
+            return '/transactions/params', 200, {
+                'consensus-version': 'future',
+                'fee': 0,
+                'genesis-hash': GENESIS_HASH,
+                'genesis-id': 'benchmark-v1',
+                'last-round': world.current_round,
+                'min-fee': 1000
+            }
+        if method == 'GET' and parts[0] == 'applications' and len(parts) == 2:
+            return '/applications/{id}', *self.get_application(int(parts[1]))
+        if method == 'GET' and parts[0] == 'applications' and parts[2:] == ['box']:
+            return '/applications/{id}/box', *self.get_box(int(parts[1]), query['name'])
+        if method == 'GET' and parts[0] == 'accounts' and len(parts) == 2:
+            with world.lock:
+                amount = world.account_dict.get(parts[1], 0)
+            return '/accounts/{address}', 200, {'address': parts[1], 'amount': amount}
+        if parts[0] == 'participation':
+            return self.route_participation(method, parts, query)
+        if method == 'POST' and parts == ['transactions', 'simulate']:
+            request = msgpack.unpackb(body, raw=False, strict_map_key=False)
+            txn_group_list = []
+            for txn_group in request['txn-groups']:
+                failure_message = world.evaluate_txn_group(txn_group['txns'], apply=False)
+                result = {'txn-results': [{} for _ in txn_group['txns']]}
+                if failure_message is not None:
+                    result['failure-message'] = failure_message
+                txn_group_list.append(result)
+            return '/transactions/simulate', 200, {
+                'version': 2, 'last-round': world.current_round, 'txn-groups': txn_group_list
+            }
+        if method == 'POST' and parts == ['transactions']:
+            signed_txn_list = list(msgpack.Unpacker(io.BytesIO(body), raw=False, strict_map_key=False))
+            txid = SignedTransaction.undictify(signed_txn_list[0]).get_txid()
+            failure_message = world.evaluate_txn_group(signed_txn_list, apply=True)
+            if failure_message is not None:
+                return '/transactions', 400, {'message': f'TransactionPool.Remember: transaction {txid}: {failure_message}'}
+            return '/transactions', 200, {'txId': txid}
+        if method == 'GET' and parts[:2] == ['transactions', 'pending']:
+            with world.lock:
+                confirmed_round = world.confirmed_txn_dict.get(parts[2], None)
+            if confirmed_round is None:
+                return '/transactions/pending/{txid}', 404, {'message': 'txn does not exist'}
+            return '/transactions/pending/{txid}', 200, {'confirmed-round': confirmed_round, 'pool-error': ''}
+        return '/'.join([''] + parts), 404, {'message': 'endpoint not served by the fake algod'}
+
+    def get_status(self) -> dict:
+        return {
+            'last-round': self.world.current_round,
+            'last-version': 'future',
+            'next-version': 'future',
+            'next-version-round': self.world.current_round + 1,
+            'next-version-supported': True,
+            'time-since-last-round': 0,
+            'catchup-time': 0,
+            'stopped-at-unsupported-round': False
+        }
+
+    def get_application(
+        self,
+        app_id: int
+    ) -> tuple:
+        with self.world.lock:
+            global_state = self.world.app_dict.get(app_id, None)
+            if global_state is None:
+                return 404, {'message': 'application does not exist'}
+            global_state_list = []
+            for key, value in global_state.items():
+                if isinstance(value, int):
+                    value = {'type': 2, 'bytes': '', 'uint': value}
+                else:
+                    value = {'type': 1, 'bytes': base64.b64encode(value).decode('utf-8'), 'uint': 0}
+                global_state_list.append({'key': base64.b64encode(key).decode('utf-8'), 'value': value})
+        return 200, {'id': app_id, 'params': {'creator': self.world.valown_address, 'global-state': global_state_list}}
+
+    def get_box(
+        self,
+        app_id: int,
+        name: str
+    ) -> tuple:
+        box_name = base64.b64decode(unquote(name).removeprefix('b64:'))
+        with self.world.lock:
+            value = self.world.box_dict.get((app_id, box_name), None)
+        if value is None:
+            return 404, {'message': 'box not found'}
+        return 200, {
+            'name': base64.b64encode(box_name).decode('utf-8'),
+            'round': self.world.current_round,
+            'value': base64.b64encode(value).decode('utf-8')
+        }
+
+    def route_participation(
+        self,
+        method: str,
+        parts: list,
+        query: dict
+    ) -> tuple:
+        world = self.world
+        with world.lock:
+            if method == 'GET' and len(parts) == 1:
+                return '/participation', 200, world.partkey_list
+            if method == 'POST' and parts[1] == 'generate': # Generated immediately
+                address = parts[2]
+                first, last = int(query['first']), int(query['last'])
+                world.partkey_list.append({
+                    'address': address,
+                    'id': f'{address}-{first}-{last}',
+                    'key': {
+                        'vote-first-valid': first,
+                        'vote-last-valid': last,
+                        'vote-key-dilution': int(query.get('dilution', 1_000)),
+                        'selection-participation-key': base64.b64encode(bytes(32)).decode('utf-8'),
+                        'state-proof-key': base64.b64encode(bytes(64)).decode('utf-8'),
+                        'vote-participation-key': base64.b64encode(bytes(32)).decode('utf-8')
+                    }
+                })
+                return '/participation/generate/{address}', 200, 'Generating'
+            if method == 'DELETE' and len(parts) == 2:
+                world.partkey_list = [partkey for partkey in world.partkey_list if partkey['id'] != parts[1]]
+                return '/participation/{id}', 200, None
+        return '/participation', 404, {'message': 'endpoint not served by the fake algod'}
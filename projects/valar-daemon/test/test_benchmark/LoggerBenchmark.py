@@ -0,0 +1,71 @@
+"""Micro-benchmark of the logger's call-site lookup against the `inspect.stack()` lookup it replaced.
+
+Run from the daemon's directory with e.g.
+`PYTHONPATH=src python -m test.test_benchmark.LoggerBenchmark --num-of-calls 200`.
+"""
+import os
+import time
+import inspect
+import argparse
+import tempfile
+
+from valar_daemon.Logger import Logger
+
+
+# Minimal speedup of the frame-based call-site lookup over `inspect.stack()`, which is several thousand times slower
+MIN_CALL_SITE_SPEEDUP = 100
+
+
+def get_filename_and_lineno_inspect(call_stack_regression_levels: int=2) -> str:
+    """Reference call-site lookup based on `inspect.stack()`, as used before the frame-based lookup.
+
+    Parameters
+    ----------
+    call_stack_regression_levels : int, optional
+        Number of levels regresses on the call stack, by default 2.
+
+    Returns
+    -------
+    str
+        Format accoring to: '<file>:<line>'
+    """
+    caller_frame = inspect.stack()[call_stack_regression_levels]
+    return f'{os.path.basename(caller_frame.filename)}:{caller_frame.lineno}'
+
+
+def measure_per_call_s(function: callable, num_of_calls: int) -> float:
+    """Measure the average duration of a call.
+
+    Parameters
+    ----------
+    function : callable
+        Function without arguments.
+    num_of_calls : int
+        Number of calls to average over.
+
+    Returns
+    -------
+    float
+        Average duration in seconds.
+    """
+    start_time_s = time.perf_counter()
+    for _ in range(num_of_calls):
+        function()
+    return (time.perf_counter() - start_time_s) / num_of_calls
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the call-site lookup of the logger.')
+    parser.add_argument('--num-of-calls', type=int, default=200)
+    args = parser.parse_args()
+    inspect_s = measure_per_call_s(lambda: get_filename_and_lineno_inspect(1), args.num_of_calls)
+    frame_s = measure_per_call_s(lambda: Logger.get_filename_and_lineno(1), args.num_of_calls)
+    with tempfile.TemporaryDirectory() as log_dirpath:
+        logger = Logger(log_dirpath, 40*1024, 1)
+        message_s = measure_per_call_s(lambda: logger.log_delco_in_live_handler(app_id=0), args.num_of_calls)
+        logger.stop()
+    print(
+        f'Call-site lookup per message: inspect.stack() {inspect_s * 1e6:.1f} us, '
+        f'frame-based {frame_s * 1e6:.1f} us ({inspect_s / frame_s:.0f}x); '
+        f'complete pre-defined message {message_s * 1e6:.1f} us.'
+    )
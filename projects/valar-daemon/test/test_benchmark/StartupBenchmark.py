@@ -0,0 +1,117 @@
+"""Startup benchmark of the daemon's imports, based on `python -X importtime`.
+
+Run from the daemon's directory with e.g.
+`PYTHONPATH=src python -m test.test_benchmark.StartupBenchmark --num-of-modules 20`.
+"""
+import os
+import sys
+import argparse
+import subprocess
+from dataclasses import dataclass, field
+
+
+# Modules of the daemon whose import times are measured, i.e. everything needed to construct and run it
+STARTUP_MODULE_LIST = [
+    'valar_daemon.Daemon',
+    'valar_daemon.PrefetchDaemon'
+]
+
+# Modules that are not imported at startup, but on first use (see `valar_daemon.GeneratedClients` and `Logger`)
+LAZY_MODULE_LIST = [
+    'valar_daemon.ValidatorAdClient',
+    'valar_daemon.DelegatorContractClient',
+    'valar_daemon.NoticeboardClient',
+    'yaml'
+]
+
+# Maximal share of the daemon's own modules in the total import time, the remainder being its dependencies
+MAX_OWN_IMPORT_SHARE = 0.1
+
+
+@dataclass
+class ImportTimes:
+    """Import times of the modules imported by a fresh interpreter, indexed by the full module name.
+
+    Notes
+    -----
+    The self time excludes the nested imports, while the cumulative time includes them.
+    """
+    self_us_dict: dict = field(default_factory=dict)
+    cumulative_us_dict: dict = field(default_factory=dict)
+
+    def get_total_us(self) -> int:
+        """Get the total import time in microseconds.
+        """
+        return sum(self.self_us_dict.values())
+
+    def get_own_us(self) -> int:
+        """Get the import time of the daemon's own modules (excl. their dependencies) in microseconds.
+        """
+        return sum(
+            self_us for module_name, self_us in self.self_us_dict.items() if module_name.startswith('valar_daemon')
+        )
+
+
+def measure_import_times(
+    module_name_list: list=STARTUP_MODULE_LIST,
+    num_of_runs: int=3
+) -> ImportTimes:
+    """Measure the import times of the modules in fresh interpreters, keeping the fastest run of each module.
+
+    Notes
+    -----
+    The interpreters get the current `sys.path`, such that the modules resolve as in the calling process.
+    The fastest run excludes one-off costs, e.g. compiling the bytecode cache.
+
+    Parameters
+    ----------
+    module_name_list : list, optional
+        Full names of the imported modules, by default `STARTUP_MODULE_LIST`.
+    num_of_runs : int, optional
+        Number of runs, by default 3.
+
+    Returns
+    -------
+    ImportTimes
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))
+    import_times = ImportTimes()
+    for _ in range(num_of_runs):
+        stderr = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {", ".join(module_name_list)}'],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stderr
+        for line in stderr.splitlines():
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+            self_us, cumulative_us, module_name = line[len('import time:'):].split('|')
+            module_name = module_name.strip()
+            for time_us_dict, time_us in (
+                (import_times.self_us_dict, int(self_us)),
+                (import_times.cumulative_us_dict, int(cumulative_us))
+            ):
+                time_us_dict[module_name] = min(time_us, time_us_dict.get(module_name, time_us))
+    return import_times
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the import times of the daemon with `-X importtime`.')
+    parser.add_argument('--num-of-runs', type=int, default=3)
+    parser.add_argument('--num-of-modules', type=int, default=20)
+    args = parser.parse_args()
+    import_times = measure_import_times(num_of_runs=args.num_of_runs)
+    for module_name, self_us in sorted(import_times.self_us_dict.items(), key=lambda item: -item[1])[
+        :args.num_of_modules
+    ]:
+        print(f'{module_name:>60} | self {self_us / 1000:7.1f} ms')
+    print(
+        f'Total {import_times.get_total_us() / 1000:.1f} ms, '
+        f'of which the daemon\'s own modules {import_times.get_own_us() / 1000:.1f} ms '
+        f'({import_times.get_own_us() / import_times.get_total_us():.0%}, budget {MAX_OWN_IMPORT_SHARE:.0%})'
+    )
+    lazy_module_list = [name for name in LAZY_MODULE_LIST if name in import_times.self_us_dict]
+    if lazy_module_list:
+        print(f'Imported at startup instead of on first use: {", ".join(lazy_module_list)}')
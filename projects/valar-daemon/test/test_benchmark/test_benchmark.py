@@ -0,0 +1,34 @@
+"""Test the offline benchmark, i.e. that the daemon services a synthetic world served by the fake algod.
+"""
+from pathlib import Path
+
+from valar_daemon.constants import DELCO_STATE_LIVE
+
+from test.test_benchmark.Benchmark import run_benchmark
+
+
+class TestBenchmark():
+
+
+    @staticmethod
+    def test_small_world(
+        tmp_path: Path
+    ):
+        """Test that the ready delcos get live and that the steady-state loop stays within its algod request budget.
+
+        Notes
+        -----
+        Once all delcos are live, each loop needs the status, the global state of each app (incl. the noticeboard),
+        and the balance of each delegator beneficiary.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Config and log directory.
+        """
+        num_of_delcos = 20
+        result = run_benchmark(num_of_delcos, num_of_loops=10, num_of_ready_delcos=2, work_path=tmp_path)
+        assert result.delco_state_list == [DELCO_STATE_LIVE] * num_of_delcos
+        assert len(result.loop_duration_s_list) == 10
+        assert result.num_of_requests_list[-1] <= 1 + (result.num_of_contracts + 1) + num_of_delcos
+        assert result.request_count_dict['GET /status'] == 1
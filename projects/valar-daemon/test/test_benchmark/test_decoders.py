@@ -0,0 +1,53 @@
+"""Test that the precompiled struct decoders decode the same values as the generic ABI decoding.
+"""
+import struct
+
+import pytest
+
+from test.test_benchmark.DecoderBenchmark import DECODER_PAIR_DICT, make_sample_dict
+
+
+class TestDecoders():
+
+
+    @staticmethod
+    @pytest.mark.parametrize('seed', range(10))
+    def test_same_as_abi(
+        seed: int
+    ):
+        """Test that each struct decoder yields the same values as the ABI decoding of random data.
+
+        Parameters
+        ----------
+        seed : int
+            Seed of the random data.
+        """
+        sample_dict = make_sample_dict(seed)
+        for name, (decoder, abi_decoder) in DECODER_PAIR_DICT.items():
+            assert decoder(sample_dict[name]) == abi_decoder(sample_dict[name]), name
+
+
+    @staticmethod
+    def test_edge_values():
+        """Test that all-zero and all-one data (e.g. maximal uint64) are decoded as with the ABI decoding.
+        """
+        for fill_byte in (b'\x00', b'\xff'):
+            for name, (decoder, abi_decoder) in DECODER_PAIR_DICT.items():
+                if name == 'delco_global_state':
+                    continue
+                data = fill_byte * len(make_sample_dict()[name])
+                assert decoder(data) == abi_decoder(data), name
+
+
+    @staticmethod
+    def test_wrong_length():
+        """Test that data of a wrong length is rejected instead of being partially decoded.
+        """
+        for name, (decoder, _) in DECODER_PAIR_DICT.items():
+            if name == 'delco_global_state':
+                continue
+            data = make_sample_dict()[name]
+            with pytest.raises(struct.error):
+                decoder(data[:-1])
+            with pytest.raises(struct.error):
+                decoder(data + b'\x00')
@@ -0,0 +1,32 @@
+"""Test the daemon's startup time budget, i.e. that the slow-to-import modules are only imported on first use.
+"""
+from test.test_benchmark.StartupBenchmark import (
+    LAZY_MODULE_LIST,
+    MAX_OWN_IMPORT_SHARE,
+    measure_import_times
+)
+
+
+class TestStartup():
+
+
+    @staticmethod
+    def test_lazy_imports():
+        """Test that neither the generated clients nor PyYAML are imported at startup.
+        """
+        import_times = measure_import_times(num_of_runs=1)
+        assert 'valar_daemon.Daemon' in import_times.self_us_dict
+        for module_name in LAZY_MODULE_LIST:
+            assert module_name not in import_times.self_us_dict, module_name
+
+
+    @staticmethod
+    def test_own_import_share():
+        """Test that the daemon's own modules take up at most their share of the total import time.
+
+        Notes
+        -----
+        The share is used instead of the absolute time, which depends on the machine.
+        """
+        import_times = measure_import_times()
+        assert import_times.get_own_us() <= MAX_OWN_IMPORT_SHARE * import_times.get_total_us()
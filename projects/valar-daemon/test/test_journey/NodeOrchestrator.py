@@ -13,6 +13,10 @@ from valar_daemon.Daemon import Daemon
 from test.utils import default_config_params, create_daemon_config_file
 
 
+# Set to 1 to record the algod traffic of each daemon run for replay (see `Replayer.py`)
+RECORD_ALGOD_ENV_VAR = 'VALAR_JOURNEY_RECORD_ALGOD'
+
+
 def prep_daemon_config(
     valman: AddressAndSigner, 
     valad_id: int,
@@ -50,6 +54,9 @@ def prep_daemon_config(
     config_params['validator_ad_id_list']=[valad_id]
     config_params['validator_manager_mnemonic']=mne
     config_params['loop_period_s']=daemon_loop_period_s
+    # Record the algod traffic of each daemon run for replay, only if opted in (see `Replayer.py`)
+    if os.environ.get(RECORD_ALGOD_ENV_VAR, '0') == '1':
+        config_params['algod_record_path']=str(Path(config_path, 'algod-recording'))
     # Write config
     create_daemon_config_file(
         config_path,
@@ -0,0 +1,145 @@
+"""Replay of the daemon's algod traffic recorded during a journey, e.g. for comparing daemon versions.
+
+Run from the daemon's directory with e.g.
+`PYTHONPATH=src:../valar-smart-contracts python -m test.test_journey.Replayer <journey tmp_path>`.
+"""
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import List
+
+from valar_daemon.Daemon import Daemon
+from valar_daemon.DaemonConfig import DaemonConfig
+from valar_daemon.AlgodRecording import AlgodRecording, get_recording_path_list
+
+
+@dataclass
+class ReplayResult:
+    """Measurements of replaying a single recording.
+
+    Notes
+    -----
+    The CPU time only covers the thread that runs the loop, i.e. excludes the log writer and workers.
+    """
+    recording_path: Path
+    num_of_loops: int
+    num_of_recorded_exchanges: int
+    duration_s: float = 0
+    cpu_s: float = 0
+    num_of_requests: int = 0
+    num_of_misses: int = 0
+    num_of_repeats: int = 0
+    request_count_dict: dict = field(default_factory=dict)
+
+    def format(self) -> str:
+        """Format the result as a single line.
+
+        Returns
+        -------
+        str
+        """
+        return (
+            f'{self.recording_path.name} | {self.num_of_loops:>4} loops | '
+            f'{self.duration_s:7.3f} s wall, {self.cpu_s:7.3f} s CPU | '
+            f'{self.num_of_requests} requests ({self.num_of_recorded_exchanges} recorded, '
+            f'{self.num_of_misses} misses, {self.num_of_repeats} repeats)'
+        )
+
+
+def replay_recording(
+    config_full_path: Path,
+    recording_path: Path,
+    work_path: Path
+) -> ReplayResult:
+    """Run the daemon against a recording for as many loops as were recorded and measure it.
+
+    Notes
+    -----
+    The recorded config is used, apart from the recording and replay paths, retries, and the loop deadline.
+    The daemon loops are executed without waiting between them.
+
+    Parameters
+    ----------
+    config_full_path : Path
+        Path to the config used during the recording.
+    recording_path : Path
+        Path to the recording.
+    work_path : Path
+        Directory for the replay config and log (and state file, if enabled).
+
+    Returns
+    -------
+    ReplayResult
+    """
+    config_full_path = Path(config_full_path)
+    daemon_config = DaemonConfig(config_full_path.parent, config_full_path.name)
+    daemon_config.read_config()
+    daemon_config.algod_record_path = ''
+    daemon_config.algod_replay_path = str(recording_path)
+    daemon_config.algod_max_retries = 0 # Misses should not wait for a backoff
+    daemon_config.loop_deadline_s = 0
+    Path(work_path).mkdir(parents=True, exist_ok=True)
+    replay_config_full_path = Path(work_path, 'daemon.config')
+    daemon_config.write(str(replay_config_full_path))
+    start_time_s = time.time()
+    start_cpu_s = time.thread_time()
+    daemon = Daemon(str(Path(work_path, 'valar-daemon-log')), str(replay_config_full_path))
+    recording: AlgodRecording = daemon.algorand_client.client.algod.recording
+    for _ in range(recording.num_of_loops):
+        daemon.run_single_loop(time.time())
+    result = ReplayResult(
+        recording_path=Path(recording_path),
+        num_of_loops=recording.num_of_loops,
+        num_of_recorded_exchanges=recording.num_of_exchanges,
+        cpu_s=time.thread_time() - start_cpu_s,
+        duration_s=time.time() - start_time_s,
+        num_of_requests=sum(recording.request_count_dict.values()),
+        num_of_misses=recording.num_of_misses,
+        num_of_repeats=recording.num_of_repeats,
+        request_count_dict=dict(recording.request_count_dict)
+    )
+    daemon.close()
+    daemon.logger.stop()
+    return result
+
+
+def replay_journey(
+    config_path: Path,
+    work_path: Path=None
+) -> List[ReplayResult]:
+    """Replay all daemon runs recorded during a journey, in order.
+
+    Parameters
+    ----------
+    config_path : Path
+        Journey's config directory, holding `daemon.config` and the `algod-recording` directory.
+    work_path : Path, optional
+        Directory for the replay config and log, by default a temporary one.
+
+    Returns
+    -------
+    List[ReplayResult]
+        Result of each daemon run.
+    """
+    if work_path is None:
+        with tempfile.TemporaryDirectory() as tmp_path:
+            return replay_journey(config_path, Path(tmp_path))
+    return [
+        replay_recording(Path(config_path, 'daemon.config'), recording_path, work_path)
+        for recording_path in get_recording_path_list(Path(config_path, 'algod-recording'))
+    ]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Replay the algod traffic recorded during a journey.')
+    parser.add_argument('config_path', type=Path, nargs='+', help='Journey config directory (its `tmp_path`).')
+    args = parser.parse_args()
+    for config_path in args.config_path:
+        print(config_path)
+        for result in replay_journey(config_path):
+            print('    ' + result.format())
+            print(
+                '        ' + ', '.join(f'{endpoint}: {count}' for endpoint, count in sorted(result.request_count_dict.items()))
+            )
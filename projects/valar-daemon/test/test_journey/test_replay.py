@@ -0,0 +1,64 @@
+"""Test that the recorded algod traffic of a daemon run can be replayed without algod.
+"""
+from pathlib import Path
+
+import pytest
+
+from valar_daemon.AlgodRecording import AlgodRecorder, AlgodRecording, get_next_recording_path, get_recording_path_list
+
+from test.test_benchmark.Benchmark import run_benchmark
+from test.test_journey.Replayer import replay_recording
+
+
+class TestReplay():
+
+
+    @staticmethod
+    def test_replay_benchmark(
+        tmp_path: Path
+    ):
+        """Test that replaying a run against the fake algod issues the same requests over the same loops.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Config, log, and recording directory.
+        """
+        record_path = Path(tmp_path, 'record')
+        record_path.mkdir()
+        run_benchmark(
+            num_of_delcos=10,
+            num_of_loops=5,
+            num_of_ready_delcos=2,
+            work_path=record_path,
+            algod_record_path=str(Path(record_path, 'algod-recording'))
+        )
+        recording_path_list = get_recording_path_list(Path(record_path, 'algod-recording'))
+        assert len(recording_path_list) == 1
+        recording = AlgodRecording(recording_path_list[0])
+        assert recording.num_of_loops == 5
+        result = replay_recording(Path(record_path, 'daemon.config'), recording_path_list[0], Path(tmp_path, 'replay'))
+        assert result.num_of_loops == 5
+        assert result.num_of_misses == 0
+        assert result.num_of_repeats == 0
+        assert result.num_of_requests == recording.num_of_exchanges
+        assert 'POST /transactions' in result.request_count_dict # Submitted keys replayed
+
+
+    @staticmethod
+    def test_next_recording_path(
+        tmp_path: Path
+    ):
+        """Test that a new recording follows the highest existing one and never overwrites an existing recording.
+
+        Parameters
+        ----------
+        tmp_path : Path
+            Recording directory.
+        """
+        assert get_next_recording_path(tmp_path).name == 'algod-recording-000.jsonl.gz'
+        for index in (0, 2):
+            AlgodRecorder(Path(tmp_path, f'algod-recording-{index:03d}.jsonl.gz')).close()
+        assert get_next_recording_path(tmp_path).name == 'algod-recording-003.jsonl.gz'
+        with pytest.raises(FileExistsError):
+            AlgodRecorder(Path(tmp_path, 'algod-recording-002.jsonl.gz'))
@@ -687,14 +687,31 @@ default_config_params = {
     "claim_period_s": 10800,
     "claim_period_h": 3,
     "max_log_file_size_B": 40*1024,
-    "num_of_log_files_per_level": 3
+    "num_of_log_files_per_level": 3,
+    "max_workers": 1,
+    "loop_period_rounds": 0,
+    "partkey_poll_period_s": 0,
+    "simulate_first": 0,
+    "metrics_port": 0,
+    "persist_state": 0,
+    "prefetch_max_concurrency": 16,
+    "algod_connection_pool_size": 0,
+    "algod_timeout_s": 30,
+    "algod_max_retries": 0,
+    "algod_retry_backoff_s": 0.5,
+    "algod_record_path": "",
+    "algod_replay_path": "",
+    "loop_deadline_s": 0,
+    "min_log_level": 10,
+    "log_json": 0
 }
 
 def create_daemon_config_file(
     config_path: str | Path,
     config_filename: Path,
     config_params: dict,
-    include_claim_period: bool=True
+    include_claim_period: bool=True,
+    include_optional: bool=True
 ) -> None:
     """Make config string and write it to a file.
 
@@ -706,6 +723,8 @@ def create_daemon_config_file(
         Name of the config file.
     include_claim_period : bool, optional
         Indication whether to include the claim period in the config, by default True
+    include_optional : bool, optional
+        Indication whether to include the optional parameters (e.g. `max_workers`) in the config, by default True
     """
     config_content_string = '\n' + \
     '[validator_config] #####################################################################################################' + '\n' + \
@@ -716,12 +735,28 @@ def create_daemon_config_file(
     '[algo_client_config] ###################################################################################################' + '\n' + \
     '\n' + \
     f'algod_config_server = {config_params["algod_config_server"]}' + '\n' + \
-    f'algod_config_token = {config_params["algod_config_token"]}' + '\n' + \
+    f'algod_config_token = {config_params["algod_config_token"]}'
+
+    if include_optional:
+        config_content_string += '\n' + f'algod_connection_pool_size = {config_params["algod_connection_pool_size"]}'
+        config_content_string += '\n' + f'algod_timeout_s = {config_params["algod_timeout_s"]}'
+        config_content_string += '\n' + f'algod_max_retries = {config_params["algod_max_retries"]}'
+        config_content_string += '\n' + f'algod_retry_backoff_s = {config_params["algod_retry_backoff_s"]}'
+        config_content_string += '\n' + f'algod_record_path = {config_params["algod_record_path"]}'
+        config_content_string += '\n' + f'algod_replay_path = {config_params["algod_replay_path"]}'
+
+    config_content_string += '\n' + \
     '\n\n' + \
     '[logging_config] #######################################################################################################' + '\n' + \
     '\n' + \
     f'max_log_file_size_B = {config_params["max_log_file_size_B"]}' + '\n' \
-    f'num_of_log_files_per_level = {config_params["num_of_log_files_per_level"]}' + '\n' \
+    f'num_of_log_files_per_level = {config_params["num_of_log_files_per_level"]}'
+
+    if include_optional:
+        config_content_string += '\n' + f'min_log_level = {config_params["min_log_level"]}'
+        config_content_string += '\n' + f'log_json = {config_params["log_json"]}'
+
+    config_content_string += '\n' + \
     '\n\n' + \
     '[runtime_config] #######################################################################################################' + '\n' + \
     '\n' + \
@@ -729,6 +764,16 @@ def create_daemon_config_file(
     
     if include_claim_period: 
         config_content_string += '\n' + f'claim_period_h = {config_params["claim_period_h"]}' 
+
+    if include_optional:
+        config_content_string += '\n' + f'max_workers = {config_params["max_workers"]}'
+        config_content_string += '\n' + f'loop_period_rounds = {config_params["loop_period_rounds"]}'
+        config_content_string += '\n' + f'loop_deadline_s = {config_params["loop_deadline_s"]}'
+        config_content_string += '\n' + f'partkey_poll_period_s = {config_params["partkey_poll_period_s"]}'
+        config_content_string += '\n' + f'simulate_first = {config_params["simulate_first"]}'
+        config_content_string += '\n' + f'metrics_port = {config_params["metrics_port"]}'
+        config_content_string += '\n' + f'persist_state = {config_params["persist_state"]}'
+        config_content_string += '\n' + f'prefetch_max_concurrency = {config_params["prefetch_max_concurrency"]}'
         
     config_content_string += '\n'
 